@@ -0,0 +1 @@
+"""Benchmarks of the frame processing path of pyvlx, run with `python -m benchmarks`."""
@@ -0,0 +1,35 @@
+"""Run frame processing benchmarks against a fake KLF 200."""
+import argparse
+import asyncio
+from typing import List
+
+from .runner import BenchmarkResult
+from .scenarios import SCENARIOS, BenchmarkSettings
+
+
+async def run(settings: BenchmarkSettings, names: List[str]) -> List[BenchmarkResult]:
+    """Run benchmark scenarios."""
+    return [await SCENARIOS[name](settings) for name in names]
+
+
+def main() -> None:
+    """Parse arguments, run benchmarks and print result table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"scenarios to run, all if omitted: {', '.join(SCENARIOS)}")
+    parser.add_argument("--nodes", type=int, default=100, help="number of nodes of the fake KLF 200")
+    parser.add_argument("--scenes", type=int, default=50, help="number of scenes of the fake KLF 200")
+    parser.add_argument("--frames", type=int, default=5000, help="number of position notifications")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed rounds, the fastest is reported")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    settings = BenchmarkSettings(node_count=args.nodes, scene_count=args.scenes, frame_count=args.frames, repeat=args.repeat)
+    results = asyncio.run(run(settings, args.scenarios or list(SCENARIOS)))
+    print(BenchmarkResult.HEADER)
+    for result in results:
+        print(result.format())
+
+
+if __name__ == "__main__":
+    main()
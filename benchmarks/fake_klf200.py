@@ -0,0 +1,156 @@
+"""Fake KLF 200 peer producing realistic gateway traffic for benchmarks."""
+import asyncio
+import random
+from typing import TYPE_CHECKING, Iterable, List
+
+from pyvlx.api.frames import (
+    FrameBase, FrameGetAllNodesInformationConfirmation,
+    FrameGetAllNodesInformationFinishedNotification,
+    FrameGetAllNodesInformationNotification,
+    FrameGetAllNodesInformationRequest, FrameGetSceneListConfirmation,
+    FrameGetSceneListNotification, FrameGetSceneListRequest,
+    FrameGetStateConfirmation, FrameGetStateRequest,
+    FrameNodeStatePositionChangedNotification,
+    FrameSessionFinishedNotification, FrameStatusRequestConfirmation,
+    FrameStatusRequestNotification, FrameStatusRequestRequest)
+from pyvlx.api.frames.frame_status_request import StatusRequestStatus
+from pyvlx.connection import TCPTransport
+from pyvlx.const import (
+    GatewayState, GatewaySubState, NodeParameter, NodeTypeWithSubtype,
+    OperatingState, StatusType)
+from pyvlx.parameter import Parameter, Position
+from pyvlx.slip import slip_pack
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+NODE_TYPES = (
+    NodeTypeWithSubtype.WINDOW_OPENER,
+    NodeTypeWithSubtype.ROLLER_SHUTTER,
+    NodeTypeWithSubtype.INTERIOR_VENETIAN_BLIND,
+    NodeTypeWithSubtype.VERTICAL_EXTERIOR_AWNING,
+)
+
+# Maximum segment size of a TCP segment on ethernet
+TCP_SEGMENT_SIZE = 1460
+
+
+class FakeKLF200:
+    """Fake KLF 200 gateway.
+
+    The fake gateway knows node_count nodes and scene_count scenes and
+    produces the frames a real gateway would send: node information
+    bursts, scene lists, house monitor position notifications and answers
+    to get state and status requests. Positions are pseudo random but
+    deterministic for a given seed.
+    """
+
+    def __init__(self, node_count: int = 100, scene_count: int = 50, seed: int = 0):
+        """Initialize FakeKLF200."""
+        self.node_count = node_count
+        self.scene_count = scene_count
+        self.random = random.Random(seed)
+        self.frames_sent = 0
+
+    def _position(self) -> Parameter:
+        """Return random position."""
+        return Position(position_percent=self.random.randint(0, 100))
+
+    def node_information(self, node_id: int) -> FrameGetAllNodesInformationNotification:
+        """Return node information notification of node."""
+        frame = FrameGetAllNodesInformationNotification()
+        frame.node_id = node_id
+        frame.order = node_id
+        frame.name = f"Node {node_id}"
+        frame.node_type = NODE_TYPES[node_id % len(NODE_TYPES)]
+        frame.serial_number = ":".join(f"{b:02x}" for b in bytes([0x53, 0x4E, 0, 0, 0, 0, node_id >> 8, node_id & 255]))
+        frame.state = OperatingState.DONE
+        frame.current_position = self._position()
+        frame.target = frame.current_position
+        return frame
+
+    def nodes_information_burst(self) -> List[FrameBase]:
+        """Return frames answering GW_GET_ALL_NODES_INFORMATION_REQ."""
+        frames: List[FrameBase] = [FrameGetAllNodesInformationConfirmation(number_of_nodes=self.node_count)]
+        frames.extend(self.node_information(node_id) for node_id in range(self.node_count))
+        frames.append(FrameGetAllNodesInformationFinishedNotification())
+        return frames
+
+    def scene_list(self) -> List[FrameBase]:
+        """Return frames answering GW_GET_SCENE_LIST_REQ, three scenes per notification."""
+        frames: List[FrameBase] = [FrameGetSceneListConfirmation(count_scenes=self.scene_count)]
+        for first in range(0, self.scene_count, 3):
+            frame = FrameGetSceneListNotification()
+            frame.scenes = [(scene_id, f"Scene {scene_id}") for scene_id in range(first, min(first + 3, self.scene_count))]
+            frame.remaining_scenes = max(self.scene_count - first - 3, 0)
+            frames.append(frame)
+        return frames
+
+    def position_notifications(self, count: int) -> List[FrameBase]:
+        """Return house monitor notifications of moving nodes."""
+        frames: List[FrameBase] = []
+        for _ in range(count):
+            frame = FrameNodeStatePositionChangedNotification()
+            frame.node_id = self.random.randrange(self.node_count)
+            frame.state = OperatingState.EXECUTING
+            frame.current_position = self._position()
+            frame.target = self._position()
+            frame.remaining_time = self.random.randint(0, 30)
+            frames.append(frame)
+        return frames
+
+    def status_notification(self, session_id: int, node_id: int) -> FrameStatusRequestNotification:
+        """Return status request notification of node."""
+        frame = FrameStatusRequestNotification()
+        frame.session_id = session_id
+        frame.node_id = node_id
+        frame.status_type = StatusType.REQUEST_CURRENT_POSITION
+        frame.parameter_data = {
+            NodeParameter.MP: self._position(),
+            NodeParameter.FP1: self._position(),
+            NodeParameter.FP2: self._position(),
+            NodeParameter.FP3: self._position(),
+        }
+        frame.status_count = len(frame.parameter_data)
+        return frame
+
+    def respond(self, frame: FrameBase) -> List[FrameBase]:
+        """Return frames answering request frame."""
+        if isinstance(frame, FrameGetStateRequest):
+            return [FrameGetStateConfirmation(GatewayState.GATEWAY_MODE_WITH_ACTUATORS, GatewaySubState.IDLE)]
+        if isinstance(frame, FrameStatusRequestRequest):
+            assert frame.session_id is not None
+            frames: List[FrameBase] = [FrameStatusRequestConfirmation(session_id=frame.session_id, status=StatusRequestStatus.ACCEPTED)]
+            frames.extend(self.status_notification(frame.session_id, node_id) for node_id in frame.node_ids)
+            frames.append(FrameSessionFinishedNotification(session_id=frame.session_id))
+            return frames
+        if isinstance(frame, FrameGetAllNodesInformationRequest):
+            return self.nodes_information_burst()
+        if isinstance(frame, FrameGetSceneListRequest):
+            return self.scene_list()
+        return []
+
+    @staticmethod
+    def encode(frames: Iterable[FrameBase]) -> List[bytes]:
+        """Return SLIP packets of frames."""
+        return [slip_pack(bytes(frame)) for frame in frames]
+
+    @staticmethod
+    def segments(packets: Iterable[bytes], segment_size: int = TCP_SEGMENT_SIZE) -> List[bytes]:
+        """Return byte stream of packets split into TCP segments."""
+        stream = b"".join(packets)
+        return [stream[i:i + segment_size] for i in range(0, len(stream), segment_size)]
+
+    def attach(self, pyvlx: "PyVLX") -> None:
+        """Answer frames written by pyvlx through the receive path of its connection."""
+        transport = TCPTransport(pyvlx.connection.frame_received_cb, lambda: None, frame_wanted=pyvlx.connection.frame_router.wants)
+        loop = asyncio.get_running_loop()
+
+        def write(frame: FrameBase) -> None:
+            answer = self.respond(frame)
+            self.frames_sent += len(answer)
+            for segment in self.segments(self.encode(answer)):
+                loop.call_soon(transport.data_received, segment)
+
+        pyvlx.connection.connected = True
+        pyvlx.connection.write = write  # type: ignore[method-assign]
@@ -0,0 +1,111 @@
+"""Measurement helpers for benchmarks."""
+import asyncio
+import gc
+import inspect
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, List, Sequence
+
+ItemCallable = Callable[[Any], Any]
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of one benchmark scenario."""
+
+    name: str
+    count: int
+    seconds: float
+    latencies_ns: List[int] = field(repr=False)
+    peak_bytes: int = 0
+    allocated_blocks: int = 0
+
+    @property
+    def fps(self) -> float:
+        """Return processed frames per second."""
+        return self.count / self.seconds if self.seconds else float("inf")
+
+    def percentile(self, percent: float) -> float:
+        """Return latency percentile of one call in microseconds."""
+        if not self.latencies_ns:
+            return 0.0
+        latencies = sorted(self.latencies_ns)
+        index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+        return latencies[index] / 1000
+
+    HEADER = f"{'scenario':<28}{'frames':>8}{'frames/s':>12}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'peak KiB':>10}{'blocks':>8}"
+
+    def format(self) -> str:
+        """Return result as row of the result table."""
+        return (
+            f"{self.name:<28}{self.count:>8}{self.fps:>12.0f}"
+            f"{self.percentile(50):>10.1f}{self.percentile(90):>10.1f}{self.percentile(99):>10.1f}"
+            f"{self.peak_bytes / 1024:>10.1f}{self.allocated_blocks:>8}"
+        )
+
+
+async def _run(function: ItemCallable, items: Sequence[Any], latencies_ns: List[int] | None) -> None:
+    """Call function for every item, awaiting awaitable results."""
+    perf_counter_ns = time.perf_counter_ns
+    for item in items:
+        start = perf_counter_ns()
+        result = function(item)
+        if inspect.isawaitable(result):
+            await result
+        if latencies_ns is not None:
+            latencies_ns.append(perf_counter_ns() - start)
+
+
+async def measure(
+    name: str,
+    function: ItemCallable,
+    items: Sequence[Any],
+    setup: Callable[[], Awaitable[None] | None] | None = None,
+    repeat: int = 3,
+    frames_per_item: int = 1,
+) -> BenchmarkResult:
+    """Measure throughput, latency per item and allocations of function.
+
+    function is called once for every item, setup is called before every
+    round. Throughput is reported in frames, frames_per_item is the number
+    of frames processed by one call of function. The fastest of repeat
+    timed rounds is reported. Allocations are measured with tracemalloc in
+    a separate round, as tracing slows down the interpreter considerably.
+    """
+
+    async def prepare() -> None:
+        if setup is not None:
+            result = setup()
+            if inspect.isawaitable(result):
+                await result
+
+    best: BenchmarkResult | None = None
+    for _ in range(max(repeat, 1)):
+        await prepare()
+        latencies_ns: List[int] = []
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            await _run(function, items, latencies_ns)
+            seconds = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or seconds < best.seconds:
+            best = BenchmarkResult(name=name, count=len(items) * frames_per_item, seconds=seconds, latencies_ns=latencies_ns)
+    assert best is not None
+
+    await prepare()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        await _run(function, items, None)
+        after = tracemalloc.take_snapshot()
+        _, best.peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best.allocated_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    # Let callbacks scheduled by the last round run before the next scenario starts
+    await asyncio.sleep(0)
+    return best
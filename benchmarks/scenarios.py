@@ -0,0 +1,175 @@
+"""Benchmark scenarios of the frame processing path."""
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+from pyvlx import Position, PyVLX
+from pyvlx.api import CommandSend
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import FrameBase
+from pyvlx.connection import TCPTransport
+from pyvlx.heartbeat import Heartbeat
+from pyvlx.simulator import KLF200Simulator
+
+from .fake_klf200 import FakeKLF200
+from .runner import BenchmarkResult, measure
+
+
+class BenchmarkSettings:
+    """Sizes of the benchmark scenarios."""
+
+    def __init__(self, node_count: int = 100, scene_count: int = 50, frame_count: int = 5000, repeat: int = 3):
+        """Initialize BenchmarkSettings."""
+        self.node_count = node_count
+        self.scene_count = scene_count
+        self.frame_count = frame_count
+        self.repeat = repeat
+
+    def klf200(self) -> FakeKLF200:
+        """Return fake gateway of this size."""
+        return FakeKLF200(node_count=self.node_count, scene_count=self.scene_count)
+
+
+def _recorded_traffic(klf200: FakeKLF200, frame_count: int) -> List[FrameBase]:
+    """Return node information burst, scene list and position notifications."""
+    return [*klf200.nodes_information_burst(), *klf200.scene_list(), *klf200.position_notifications(frame_count)]
+
+
+async def _connected_pyvlx(settings: BenchmarkSettings) -> PyVLX:
+    """Return PyVLX connected to a fake gateway, with nodes and scenes loaded."""
+    pyvlx = PyVLX(host="127.0.0.1", password="velux123", heartbeat_batch_status_requests=True)
+    settings.klf200().attach(pyvlx)
+    await pyvlx.load_nodes()
+    await pyvlx.load_scenes()
+    return pyvlx
+
+
+async def bench_data_received(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Tokenize and decode recorded traffic as it arrives in TCP segments."""
+    klf200 = settings.klf200()
+    packets = klf200.encode(_recorded_traffic(klf200, settings.frame_count))
+    segments = klf200.segments(packets)
+    transport = TCPTransport(lambda frame: None, lambda: None)
+    result = await measure("data_received", transport.data_received, segments, repeat=settings.repeat)
+    # Latencies are measured per TCP segment, throughput is reported in frames
+    result.count = len(packets)
+    return result
+
+
+async def bench_data_received_unsubscribed(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Tokenize recorded traffic nobody subscribed to, dropping frames before decoding their payload."""
+    klf200 = settings.klf200()
+    packets = klf200.encode(_recorded_traffic(klf200, settings.frame_count))
+    segments = klf200.segments(packets)
+    transport = TCPTransport(lambda frame: None, lambda: None, frame_wanted=lambda frame_type: False)
+    result = await measure("data_received.unsubscribed", transport.data_received, segments, repeat=settings.repeat)
+    result.count = len(packets)
+    return result
+
+
+async def bench_frame_from_raw(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Decode unescaped frames of recorded traffic."""
+    klf200 = settings.klf200()
+    raws = [bytes(frame) for frame in _recorded_traffic(klf200, settings.frame_count)]
+    return await measure("frame_from_raw", frame_from_raw, raws, repeat=settings.repeat)
+
+
+async def bench_position_notifications(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Update nodes from high rate house monitor position notifications."""
+    pyvlx = await _connected_pyvlx(settings)
+    frames = settings.klf200().position_notifications(settings.frame_count)
+    return await measure("node_updater.positions", pyvlx.node_updater.process_frame, frames, repeat=settings.repeat)
+
+
+async def bench_status_notifications(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Update nodes from status request notifications."""
+    pyvlx = await _connected_pyvlx(settings)
+    klf200 = settings.klf200()
+    frames = [klf200.status_notification(1, i % settings.node_count) for i in range(settings.frame_count)]
+    return await measure("node_updater.status", pyvlx.node_updater.process_frame, frames, repeat=settings.repeat)
+
+
+async def bench_load_nodes(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Load all nodes from a GetAllNodesInformation burst received through the connection."""
+    pyvlx = await _connected_pyvlx(settings)
+
+    async def load(_: object) -> None:
+        await pyvlx.load_nodes()
+
+    return await measure("load_nodes", load, range(10), repeat=settings.repeat, frames_per_item=settings.node_count + 2)
+
+
+async def bench_load_scenes(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Load the scene list received through the connection."""
+    pyvlx = await _connected_pyvlx(settings)
+    frames_per_load = len(settings.klf200().scene_list())
+
+    async def load(_: object) -> None:
+        await pyvlx.load_scenes()
+
+    return await measure("load_scenes", load, range(10), repeat=settings.repeat, frames_per_item=frames_per_load)
+
+
+async def bench_heartbeat_pulse(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Run heartbeat pulses polling all nodes with batched status requests."""
+    pyvlx = await _connected_pyvlx(settings)
+    heartbeat = Heartbeat(pyvlx, batch_status_requests=True)
+    batches = -(-settings.node_count // 20)
+    frames_per_pulse = 1 + settings.node_count + 2 * batches
+
+    async def pulse(_: object) -> None:
+        await heartbeat.pulse()
+
+    return await measure("heartbeat.pulse", pulse, range(10), repeat=settings.repeat, frames_per_item=frames_per_pulse)
+
+
+async def bench_simulator_commands(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Move all nodes of a KLF 200 simulator over TLS, every node in its own pipelined command session."""
+    async with KLF200Simulator(settings.node_count, settings.scene_count, travel_time=0) as simulator:
+        pyvlx = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port)
+        await pyvlx.connect()
+        try:
+            await pyvlx.load_nodes()
+            position = Position(position_percent=50)
+
+            async def move_all(_: object) -> None:
+                await asyncio.gather(*(
+                    CommandSend(pyvlx=pyvlx, node_id=node.node_id, parameter=position).send() for node in pyvlx.nodes
+                ))
+
+            frames_sent = simulator.frames_sent
+            await move_all(None)
+            frames_per_round = simulator.frames_sent - frames_sent
+            return await measure("simulator.commands", move_all, range(5), repeat=settings.repeat, frames_per_item=frames_per_round)
+        finally:
+            await pyvlx.disconnect()
+
+
+async def bench_simulator_reconnect(settings: BenchmarkSettings) -> BenchmarkResult:
+    """Reconnect to a KLF 200 simulator answering after 5ms, with cached gateway facts and pipelined handshake."""
+    async with KLF200Simulator(settings.node_count, settings.scene_count, response_latency=0.005) as simulator:
+        pyvlx = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port, fast_reconnect=True)
+        await pyvlx.connect()
+        try:
+
+            async def reconnect(_: object) -> None:
+                await pyvlx.heartbeat.stop()
+                pyvlx.connection.disconnect()
+                await pyvlx.connect()
+
+            return await measure("simulator.reconnect", reconnect, range(5), repeat=settings.repeat)
+        finally:
+            await pyvlx.disconnect()
+
+
+SCENARIOS: Dict[str, Callable[[BenchmarkSettings], Awaitable[BenchmarkResult]]] = {
+    "data_received": bench_data_received,
+    "unsubscribed": bench_data_received_unsubscribed,
+    "frame_from_raw": bench_frame_from_raw,
+    "positions": bench_position_notifications,
+    "status": bench_status_notifications,
+    "load_nodes": bench_load_nodes,
+    "load_scenes": bench_load_scenes,
+    "pulse": bench_heartbeat_pulse,
+    "simulator": bench_simulator_commands,
+    "reconnect": bench_simulator_reconnect,
+}
@@ -3,10 +3,12 @@
 from .dimmable_device import DimmableDevice, ExteriorHeating, Light, OnOffLight
 from .discovery import VeluxDiscovery
 from .exception import PyVLXException
+from .group import Group
+from .groups import Groups
 from .klf200gateway import Klf200Gateway
 from .log import PYVLXLOG
 from .node import Node
-from .nodes import Nodes
+from .nodes import NodeChanges, Nodes
 from .on_off_switch import OnOffSwitch
 from .opening_device import (
     Awning, Blade, Blind, DualRollerShutter, GarageDoor, Gate, OpeningDevice,
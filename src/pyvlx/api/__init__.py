@@ -1,25 +1,33 @@
 """Module for all KLF 200 API frames."""
 # flake8: noqa
 
+from .activate_product_group import ActivateProductGroup
 from .activate_scene import ActivateScene
+from .api_dispatcher import ApiDispatcher, RequestPriority
 from .api_event import ApiEvent
 from .command_send import CommandSend
 from .completable_api_event import CompletableApiEvent
 from .factory_default import FactoryDefault
+from .get_all_groups_information import GetAllGroupsInformation
 from .get_all_nodes_information import GetAllNodesInformation
+from .get_group_information import GetGroupInformation
 from .get_local_time import (
     FrameGetLocalTimeConfirmation, FrameGetLocalTimeRequest, GetLocalTime)
 from .get_network_setup import GetNetworkSetup
 from .get_node_information import GetNodeInformation
 from .get_protocol_version import GetProtocolVersion
+from .get_scene_information import GetSceneInformation
 from .get_scene_list import GetSceneList
 from .get_state import GetState
+from .get_system_table import GetSystemTable
 from .get_version import GetVersion
 from .house_status_monitor import (
     HouseStatusMonitorDisable, HouseStatusMonitorEnable)
 from .leave_learn_state import LeaveLearnState
+from .new_group import NewGroup
 from .password_enter import PasswordEnter
 from .reboot import Reboot
+from .session_registry import SessionHandle, SessionRegistry
 from .set_node_name import SetNodeName
 from .set_utc import SetUTC
 from .wink_send import WinkSend
@@ -0,0 +1,62 @@
+"""Module for activating product groups via API."""
+from typing import TYPE_CHECKING
+
+from ..const import NodeParameter, Velocity
+from ..parameter import Parameter
+from .completable_api_event import CompletableApiEvent
+from .frames import (
+    ActivateProductGroupConfirmationStatus,
+    FrameActivateProductGroupConfirmation, FrameActivateProductGroupRequest,
+    FrameBase, FrameCommandRunStatusNotification,
+    FrameSessionFinishedNotification)
+from .session_id import get_new_session_id
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class ActivateProductGroup(CompletableApiEvent):
+    """Class for moving all nodes of a product group with one command via API.
+
+    The gateway sends the command once for all members of the group, which
+    have to be actuators of the same kind. The run status notifications of
+    the session are tracked per node in node_run_status.
+    """
+
+    RESPONSE_FRAMES = (FrameActivateProductGroupConfirmation, FrameCommandRunStatusNotification, FrameSessionFinishedNotification)
+
+    def __init__(
+            self,
+            pyvlx: "PyVLX",
+            group_id: int,
+            parameter: Parameter,
+            velocity: Velocity = Velocity.DEFAULT,
+            node_parameter: NodeParameter = NodeParameter.MP,
+            wait_for_completion: bool = True,
+            timeout_in_seconds: int = 2,
+    ):
+        """Initialize ActivateProductGroup class."""
+        super().__init__(pyvlx=pyvlx, timeout_in_seconds=timeout_in_seconds, wait_for_completion=wait_for_completion)
+        self.group_id = group_id
+        self.parameter = parameter
+        self.velocity = velocity
+        self.node_parameter = node_parameter
+        self.status: ActivateProductGroupConfirmationStatus | None = None
+
+    def check_confirmation(self, frame: FrameBase) -> bool | None:
+        """Check if frame is an ActivateProductGroupConfirmation for this session."""
+        if isinstance(frame, FrameActivateProductGroupConfirmation) and frame.session_id == self.session_id:
+            self.status = frame.status
+            return frame.status == ActivateProductGroupConfirmationStatus.OK
+        return None
+
+    def request_frame(self) -> FrameActivateProductGroupRequest:
+        """Construct initiating frame."""
+        self.session_id = get_new_session_id()
+        return FrameActivateProductGroupRequest(
+            group_id=self.group_id,
+            parameter=self.parameter,
+            velocity=self.velocity,
+            node_parameter=self.node_parameter,
+            session_id=self.session_id,
+        )
@@ -1,10 +1,11 @@
 """Module for activating scenes via API."""
 from typing import TYPE_CHECKING
 
+from .api_dispatcher import RequestPriority
 from .completable_api_event import CompletableApiEvent
 from .frames import (
     ActivateSceneConfirmationStatus, FrameActivateSceneConfirmation,
-    FrameActivateSceneRequest, FrameBase)
+    FrameActivateSceneRequest, FrameBase, FrameSessionFinishedNotification)
 from .session_id import get_new_session_id
 
 if TYPE_CHECKING:
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 class ActivateScene(CompletableApiEvent):
     """Class for activating scene via API."""
 
+    PRIORITY = RequestPriority.SCENE
+    RESPONSE_FRAMES = (FrameActivateSceneConfirmation, FrameSessionFinishedNotification)
+
     def __init__(
             self, pyvlx: "PyVLX", scene_id: int, wait_for_completion: bool = True, timeout_in_seconds: int = 60
     ):
@@ -27,6 +31,10 @@ class ActivateScene(CompletableApiEvent):
             return frame.status == ActivateSceneConfirmationStatus.ACCEPTED
         return None
 
+    def session_accepted(self) -> None:
+        """Predict the states of the nodes of the scene and refresh them once the scene finished."""
+        self.pyvlx.scenes.scene_activated(self.scene_id, self.completion)
+
     def request_frame(self) -> FrameActivateSceneRequest:
         """Construct initiating frame."""
         self.session_id = get_new_session_id()
@@ -0,0 +1,303 @@
+"""Module for dispatching API calls to the gateway."""
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import (
+    TYPE_CHECKING, AsyncIterator, Deque, Dict, FrozenSet, List, Mapping, Tuple,
+    Type)
+
+from ..exception import PyVLXException
+from ..log import PYVLXLOG
+from .frames import FrameBase
+from .session_registry import SessionRegistry
+
+if TYPE_CHECKING:
+    from .api_event import ApiEvent
+
+
+class RequestPriority(IntEnum):
+    """Priority class of API calls, lower values are started first."""
+
+    INTERACTIVE = 0
+    SCENE = 1
+    STATE_REFRESH = 2
+    MAINTENANCE = 3
+
+
+WaitingEntry = Tuple["ApiEvent", asyncio.Future[None]]
+
+
+class ApiDispatcher:
+    """Class for dispatching API calls and routing received frames to them.
+
+    API calls of classes with SESSION_BASED set are matched with their
+    confirmations and notifications by session id. Several of them are kept in
+    flight at the same time, limited by max_in_flight and by the window
+    configured per API call class. Received frames are routed by
+    (frame class, session id) to the running API call of this session only.
+
+    API calls without session id can only be matched by frame type, so they are
+    dispatched strictly serial: they wait until no other API call is in flight
+    and no other API call is started while they are running. Received frames
+    are routed to them by frame class. Classes with PIPELINABLE set are the
+    exception, they are kept in flight together with other pipelinable API
+    calls as long as their RESPONSE_FRAMES do not overlap, e.g. the
+    independent requests of the handshake.
+
+    Only frame classes listed in RESPONSE_FRAMES of an API call are routed to
+    it, or all frames if RESPONSE_FRAMES is empty.
+
+    Sessions which outlive their API call, like commands whose completion is
+    awaited after the confirmation freed the slot of the dispatcher, are
+    tracked by the SessionRegistry sessions. Frames not routed to an API call
+    in flight are routed to it.
+
+    wants_frame() tells the connection which frame classes an API call in
+    flight or a tracked session may be interested in, so other frames can be
+    dropped undecoded.
+
+    Waiting API calls are queued per RequestPriority of the API call. Without
+    weights the queues are served in strict priority order, with weights each
+    queue gets a share of the started API calls proportional to its weight
+    while it has API calls waiting. Within a queue API calls are started in
+    order. An API call waiting for a full window of its class does not block
+    API calls of other classes, but no API call is started before a waiting
+    serial API call which is served first. Preemption happens at request
+    granularity: API calls in flight are never interrupted, but a waiting
+    interactive command is started before any queued background request.
+
+    reserved_slots of max_in_flight are kept free for INTERACTIVE and SCENE
+    API calls, so background polling never fills all slots.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 4
+    DEFAULT_RESERVED_SLOTS = 1
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        weights: Mapping[RequestPriority, int] | None = None,
+        reserved_slots: int = DEFAULT_RESERVED_SLOTS,
+    ):
+        """Initialize ApiDispatcher."""
+        if max_in_flight < 1:
+            raise PyVLXException("max_in_flight_too_small", max_in_flight=max_in_flight)
+        if reserved_slots < 0:
+            raise PyVLXException("reserved_slots_too_small", reserved_slots=reserved_slots)
+        if weights is not None and any(weights.get(priority, 0) < 1 for priority in RequestPriority):
+            raise PyVLXException("priority_weight_too_small", weights=dict(weights))
+        self.max_in_flight = max_in_flight
+        self.weights = dict(weights) if weights is not None else None
+        self.reserved_slots = reserved_slots
+        self.windows: Dict[Type["ApiEvent"], int] = {}
+        self._waiting: Dict[RequestPriority, Deque[WaitingEntry]] = {priority: deque() for priority in RequestPriority}
+        self._virtual_time: Dict[RequestPriority, float] = {priority: 0.0 for priority in RequestPriority}
+        self._last_virtual_time = 0.0
+        self._in_flight: List["ApiEvent"] = []
+        self._in_flight_per_class: Dict[Type["ApiEvent"], int] = {}
+        self._serial_in_flight = 0
+        self._pipelined_in_flight = 0
+        self._sessions: Dict[Tuple[type | None, int], "ApiEvent"] = {}
+        self._serial_routes: Dict[type | None, "ApiEvent"] = {}
+        self._wanted_frame_types: FrozenSet[type | None] | None = None
+        self.sessions = SessionRegistry()
+
+    def set_window(self, api_event_class: Type["ApiEvent"], window: int) -> None:
+        """Set number of API calls of a class which may be in flight at the same time."""
+        if window < 1:
+            raise PyVLXException("window_too_small", api_event_class=api_event_class.__name__, window=window)
+        self.windows[api_event_class] = window
+
+    def get_window(self, api_event_class: Type["ApiEvent"]) -> int:
+        """Return number of API calls of a class which may be in flight at the same time."""
+        if not api_event_class.SESSION_BASED:
+            return 1
+        for cls in api_event_class.__mro__:
+            if cls in self.windows:
+                return min(self.windows[cls], self.max_in_flight)
+        return self.max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """Return number of API calls currently in flight."""
+        return len(self._in_flight)
+
+    @property
+    def waiting(self) -> int:
+        """Return number of API calls waiting to be started."""
+        return sum(len(queue) for queue in self._waiting.values())
+
+    def waiting_with_priority(self, priority: RequestPriority) -> int:
+        """Return number of API calls of priority waiting to be started."""
+        return len(self._waiting[priority])
+
+    def _can_start(self, api_event: "ApiEvent") -> bool:
+        """Return True if api_event can be started right now."""
+        if not self._in_flight:
+            return True
+        if not api_event.SESSION_BASED:
+            return self._can_pipeline(api_event)
+        if self._serial_in_flight:
+            return False
+        if len(self._in_flight) >= self._slots(api_event.priority):
+            return False
+        return self._in_flight_per_class.get(type(api_event), 0) < self.get_window(type(api_event))
+
+    def _can_pipeline(self, api_event: "ApiEvent") -> bool:
+        """Return True if the serial api_event may join the pipelinable API calls in flight."""
+        return (
+            self._pipelined(api_event)
+            and self._pipelined_in_flight == len(self._in_flight) < self.max_in_flight
+            and not any(frame_type in self._serial_routes for frame_type in api_event.RESPONSE_FRAMES)
+        )
+
+    @staticmethod
+    def _pipelined(api_event: "ApiEvent") -> bool:
+        """Return True if api_event is a serial API call which may be pipelined."""
+        return api_event.PIPELINABLE and not api_event.SESSION_BASED and bool(api_event.RESPONSE_FRAMES)
+
+    def _slots(self, priority: RequestPriority) -> int:
+        """Return number of in flight slots API calls of priority may use."""
+        if priority <= RequestPriority.SCENE:
+            return self.max_in_flight
+        return max(self.max_in_flight - self.reserved_slots, 1)
+
+    def _blocks(self, api_event: "ApiEvent") -> bool:
+        """Return True if no API call queued behind the waiting api_event may be started."""
+        return self._serial_in_flight > 0 or not api_event.SESSION_BASED or len(self._in_flight) >= self.max_in_flight
+
+    def _service_order(self) -> List[RequestPriority]:
+        """Return priorities with waiting API calls in the order they are served."""
+        priorities = [priority for priority in RequestPriority if self._waiting[priority]]
+        if self.weights is None:
+            return priorities
+        return sorted(priorities, key=lambda priority: (self._virtual_time[priority], priority))
+
+    def _charge(self, priority: RequestPriority) -> None:
+        """Account a started API call of priority for weighted scheduling."""
+        if self.weights is None:
+            return
+        start = max(self._virtual_time[priority], self._last_virtual_time)
+        self._last_virtual_time = start
+        self._virtual_time[priority] = start + 1 / self.weights[priority]
+
+    def _start(self, api_event: "ApiEvent") -> None:
+        """Mark api_event as in flight."""
+        self._in_flight.append(api_event)
+        api_event_class = type(api_event)
+        self._in_flight_per_class[api_event_class] = self._in_flight_per_class.get(api_event_class, 0) + 1
+        if not api_event.SESSION_BASED:
+            self._serial_in_flight += 1
+            self._pipelined_in_flight += self._pipelined(api_event)
+            for frame_type in api_event.RESPONSE_FRAMES or (None,):
+                self._serial_routes[frame_type] = api_event
+            self._wanted_frame_types = None
+
+    def _finish(self, api_event: "ApiEvent") -> None:
+        """Remove api_event from API calls in flight and start waiting API calls."""
+        if api_event not in self._in_flight:
+            return
+        self._in_flight.remove(api_event)
+        api_event_class = type(api_event)
+        self._in_flight_per_class[api_event_class] -= 1
+        if not self._in_flight_per_class[api_event_class]:
+            del self._in_flight_per_class[api_event_class]
+        if not api_event.SESSION_BASED:
+            self._serial_in_flight -= 1
+            self._pipelined_in_flight -= self._pipelined(api_event)
+            for frame_type in api_event.RESPONSE_FRAMES or (None,):
+                if self._serial_routes.get(frame_type) is api_event:
+                    del self._serial_routes[frame_type]
+        for key in [key for key, session_event in self._sessions.items() if session_event is api_event]:
+            del self._sessions[key]
+        self._wanted_frame_types = None
+        self._start_waiting()
+
+    def _start_next(self) -> bool:
+        """Start the next waiting API call the windows allow, return False if none could be started."""
+        for priority in self._service_order():
+            queue = self._waiting[priority]
+            for entry in list(queue):
+                api_event, future = entry
+                if future.done():
+                    # Waiting API call was cancelled
+                    queue.remove(entry)
+                    continue
+                if self._can_start(api_event):
+                    queue.remove(entry)
+                    self._charge(priority)
+                    self._start(api_event)
+                    future.set_result(None)
+                    return True
+                if self._blocks(api_event):
+                    return False
+        return False
+
+    def _start_waiting(self) -> None:
+        """Start waiting API calls by priority, as far as windows allow."""
+        while self._start_next():
+            pass
+
+    @asynccontextmanager
+    async def api_call(self, api_event: "ApiEvent") -> AsyncIterator[None]:
+        """Wait until api_event may be sent and keep it in flight within the context."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (api_event, future)
+        queue = self._waiting[api_event.priority]
+        if not queue:
+            # Idle queues do not save up a share for later
+            self._virtual_time[api_event.priority] = max(self._virtual_time[api_event.priority], self._last_virtual_time)
+        queue.append(entry)
+        self._start_waiting()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if entry in queue:
+                queue.remove(entry)
+            self._finish(api_event)
+            raise
+        try:
+            yield
+        finally:
+            self._finish(api_event)
+
+    def bind_session(self, api_event: "ApiEvent", frame: FrameBase) -> None:
+        """Route frames with the session id of the request frame to api_event."""
+        session_id = getattr(frame, "session_id", None)
+        if session_id is None:
+            return
+        for frame_type in api_event.RESPONSE_FRAMES or (None,):
+            key = (frame_type, session_id)
+            if key in self._sessions and self._sessions[key] is not api_event:
+                PYVLXLOG.warning("Session id %s is already in use by another API call", session_id)
+            self._sessions[key] = api_event
+        self._wanted_frame_types = None
+
+    def wants_frame(self, frame_type: type) -> bool:
+        """Return True if an API call in flight or a tracked session may be interested in frames of frame_type."""
+        wanted = self._wanted_frame_types
+        if wanted is None:
+            wanted = frozenset(self._serial_routes).union(frame_type for frame_type, _ in self._sessions)
+            self._wanted_frame_types = wanted
+        return frame_type in wanted or None in wanted or self.sessions.wants_frame(frame_type)
+
+    def _route(self, frame: FrameBase) -> "ApiEvent | None":
+        """Return the API call in flight interested in frame, if any."""
+        if self._sessions:
+            session_id = getattr(frame, "session_id", None)
+            if session_id is not None:
+                api_event = self._sessions.get((type(frame), session_id)) or self._sessions.get((None, session_id))
+                if api_event is not None:
+                    return api_event
+        if self._serial_routes:
+            return self._serial_routes.get(type(frame)) or self._serial_routes.get(None)
+        return None
+
+    def process_frame(self, frame: FrameBase) -> None:
+        """Route received frame to the API call in flight or the tracked session interested in it."""
+        api_event = self._route(frame)
+        if api_event is not None:
+            api_event.frame_received(frame)
+        else:
+            self.sessions.process_frame(frame)
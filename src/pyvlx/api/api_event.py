@@ -1,8 +1,9 @@
 """Base class for waiting for a specific answer frame from Velux API."""
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Tuple, Type
 
 from ..log import PYVLXLOG
+from .api_dispatcher import RequestPriority
 from .frames import FrameBase
 
 if TYPE_CHECKING:
@@ -14,15 +15,40 @@ class ApiEvent:
 
     Objects of this class are single-use only, i.e. after one
     call to do_api_call() they must be discarded.
+
+    API calls are dispatched via the ApiDispatcher of the PyVLX object.
+    Classes whose request, confirmation and notification frames carry a
+    session id set SESSION_BASED, which allows the dispatcher to keep
+    several of them in flight at the same time.
+
+    RESPONSE_FRAMES lists the frame classes handle_frame is interested in.
+    The dispatcher only delivers frames of these classes, or all frames if
+    RESPONSE_FRAMES is empty. Received frames are queued by frame_received()
+    and handled within do_api_call().
+
+    Classes without session id set PIPELINABLE if their request does not
+    depend on the state changed by other pipelinable requests, so the
+    dispatcher may send them without waiting for the previous confirmation.
+
+    PRIORITY is the RequestPriority the dispatcher schedules API calls of the
+    class with. It can be overridden per API call by setting priority before
+    calling do_api_call().
     """
 
+    SESSION_BASED: ClassVar[bool] = False
+    RESPONSE_FRAMES: ClassVar[Tuple[Type[FrameBase], ...]] = ()
+    PIPELINABLE: ClassVar[bool] = False
+    PRIORITY: ClassVar[RequestPriority] = RequestPriority.INTERACTIVE
+
     def __init__(self, pyvlx: "PyVLX", timeout_in_seconds: int = 10):
         """Initialize ApiEvent."""
         self.pyvlx = pyvlx
         self.response_received_or_timeout = asyncio.Event()
+        self.received_frames: asyncio.Queue[FrameBase] = asyncio.Queue()
 
         self.success = False
         self.timeout_in_seconds = timeout_in_seconds
+        self.priority = self.PRIORITY
 
         self.used = False
 
@@ -31,31 +57,27 @@ class ApiEvent:
         assert not self.used, "ApiEvent objects are single-use only"
         self.used = True
 
-        # We check for connection before entering the semaphore section
-        # because otherwise we might try to connect, which calls this, and we get stuck on
-        # the semaphore.
+        # We check for connection before waiting for the dispatcher
+        # because otherwise we might try to connect, which calls this, and we get stuck
+        # waiting for our own API call to finish.
         await self.pyvlx.ensure_connected()
 
         if self.pyvlx.get_connected():
-            async with self.pyvlx.api_call_semaphore:
-                self.pyvlx.connection.register_frame_received_cb(self.response_rec_callback)
+            async with self.pyvlx.api_dispatcher.api_call(self):
+                await self.send_frame()
                 try:
-                    await self.send_frame()
-                    try:
-                        async with asyncio.timeout(self.timeout_in_seconds):
-                            await self.response_received_or_timeout.wait()
-
-                    except TimeoutError:
-                        # timeout does not change the result of self.success (which at this point can be true or false)
-                        # it just finishes waiting for completion if set to true
-                        PYVLXLOG.debug(
-                            "ApiEvent %s: wait ended on timeout after %ss (success=%s); "
-                            "the operation is not aborted by this",
-                            type(self).__name__, self.timeout_in_seconds, self.success,
-                        )
-
-                finally:
-                    self.pyvlx.connection.unregister_frame_received_cb(self.response_rec_callback)
+                    async with asyncio.timeout(self.timeout_in_seconds):
+                        while not self.response_received_or_timeout.is_set():
+                            await self.response_rec_callback(await self.received_frames.get())
+
+                except TimeoutError:
+                    # timeout does not change the result of self.success (which at this point can be true or false)
+                    # it just finishes waiting for completion if set to true
+                    PYVLXLOG.debug(
+                        "ApiEvent %s: wait ended on timeout after %ss (success=%s); "
+                        "the operation is not aborted by this",
+                        type(self).__name__, self.timeout_in_seconds, self.success,
+                    )
         else:
             self.success = False
 
@@ -70,12 +92,18 @@ class ApiEvent:
 
     async def send_frame(self) -> None:
         """Send frame to API connection."""
-        await self.pyvlx.send_frame(self.request_frame())
+        frame = self.request_frame()
+        self.pyvlx.api_dispatcher.bind_session(self, frame)
+        await self.pyvlx.send_frame(frame)
 
     def request_frame(self) -> FrameBase:
         """Construct initiating frame."""
         raise NotImplementedError("request_frame has to be implemented")
 
+    def frame_received(self, frame: FrameBase) -> None:
+        """Queue received frame for handling within do_api_call()."""
+        self.received_frames.put_nowait(frame)
+
     async def response_rec_callback(self, frame: FrameBase) -> None:
         """Handle frame. Callback from internal api connection."""
         if await self.handle_frame(frame):
@@ -1,11 +1,13 @@
 """Module for sending commands to API."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Sequence
 
+from ..exception import PyVLXException
 from ..parameter import FunctionalParams, Parameter
 from .completable_api_event import CompletableApiEvent
 from .frames import (
-    CommandSendConfirmationStatus, FrameBase, FrameCommandSendConfirmation,
-    FrameCommandSendRequest)
+    CommandSendConfirmationStatus, FrameBase,
+    FrameCommandRunStatusNotification, FrameCommandSendConfirmation,
+    FrameCommandSendRequest, FrameSessionFinishedNotification)
 from .session_id import get_new_session_id
 
 if TYPE_CHECKING:
@@ -13,22 +15,36 @@ if TYPE_CHECKING:
 
 
 class CommandSend(CompletableApiEvent):
-    """Class for sending command to API."""
+    """Class for sending command to API.
+
+    The command is sent either to a single node (node_id) or to up to
+    MAX_NODE_IDS nodes at once within one session (node_ids). The run status
+    notifications of the session are tracked per node in node_run_status.
+    """
+
+    RESPONSE_FRAMES = (FrameCommandSendConfirmation, FrameCommandRunStatusNotification, FrameSessionFinishedNotification)
+    MAX_NODE_IDS = FrameCommandSendRequest.MAX_NODE_IDS
 
     def __init__(
             self,
             *,
             pyvlx: "PyVLX",
-            node_id: int,
+            node_id: int | None = None,
             parameter: Parameter,
             functional_parameter: FunctionalParams | None = None,
             active_parameter: int = 0,
             wait_for_completion: bool = True,
             timeout_in_seconds: int = 2,
+            node_ids: Sequence[int] | None = None,
     ):
         """Initialize CommandSend class."""
         super().__init__(pyvlx=pyvlx, timeout_in_seconds=timeout_in_seconds, wait_for_completion=wait_for_completion)
-        self.node_id = node_id
+        if (node_id is None) == (node_ids is None):
+            raise PyVLXException("command_send_requires_either_node_id_or_node_ids")
+        self.node_ids: List[int] = [node_id] if node_id is not None else list(node_ids or [])
+        if not 0 < len(self.node_ids) <= self.MAX_NODE_IDS:
+            raise PyVLXException("command_send_wrong_number_of_node_ids", node_ids=self.node_ids)
+        self.node_id = self.node_ids[0]
         self.parameter = parameter
         self.active_parameter = active_parameter
         self.functional_parameter = functional_parameter
@@ -43,7 +59,7 @@ class CommandSend(CompletableApiEvent):
         """Construct initiating frame."""
         self.session_id = get_new_session_id()
         return FrameCommandSendRequest(
-            node_ids=[self.node_id],
+            node_ids=self.node_ids,
             parameter=self.parameter,
             active_parameter=self.active_parameter,
             session_id=self.session_id,
@@ -1,9 +1,13 @@
 """Base class for completable API calls with confirmation + completion pattern."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Tuple, Type
 
+from ..const import RunStatus
 from ..exception import PyVLXException
 from .api_event import ApiEvent
-from .frames import FrameBase, FrameSessionFinishedNotification
+from .frames import (
+    FrameBase, FrameCommandRunStatusNotification,
+    FrameSessionFinishedNotification)
+from .session_registry import SessionHandle
 
 if TYPE_CHECKING:
     from pyvlx import PyVLX
@@ -17,28 +21,42 @@ class CompletableApiEvent(ApiEvent):
 
     While the device is performing the action (e.g. window close, which takes time),
     incoming FrameCommandRunStatusNotification and FrameCommandRemainingTimeNotification
-    frames can be received, they are ignored.
-
-    If wait_for_completion is True, the API call normally waits until a
-    session finished notification is received, usually indicating the action
-    is completed on the device side. However, ApiEvent.do_api_call() will
-    also stop waiting when the timeout expires, in which case the call ends
-    without having seen a completion notification.
-
-    If wait_for_completion is False, the API call is considered complete right
-    after receiving the confirmation frame. In this case, any frames received
-    after the confirmation frame are ignored.
+    frames can be received. If subclasses list FrameCommandRunStatusNotification
+    within RESPONSE_FRAMES, the last run status of every node of the session
+    is tracked in node_run_status, other frames are ignored.
+
+    The API call occupies a slot of the ApiDispatcher only until the
+    confirmation frame is received. After an accepted confirmation the
+    session is tracked by the SessionRegistry of the dispatcher, which routes
+    the following frames of the session to handle_session_frame() and
+    resolves the awaitable completion handle when the session is finished or
+    timeout_in_seconds after the confirmation. This way waiting for a long
+    running action does not hold back unrelated API calls.
+
+    If wait_for_completion is True, do_api_call() awaits completion, i.e.
+    until a session finished notification is received, usually indicating
+    the action is completed on the device side, or until the timeout expires,
+    in which case the call ends without having seen a completion notification.
+
+    If wait_for_completion is False, do_api_call() returns right after
+    receiving the confirmation frame. The completion can still be awaited
+    later on.
 
     The flow is:
     1. Send a request frame with a session ID (sending is handled by the base class,
        subclasses just need to implement request_frame() including the session ID in the frame)
-    2. Receive a confirmation frame (accepted or rejected)
-    3. Optionally wait for a completion frame signaling the end of the session
-       (e.g. FrameSessionFinishedNotification) until the timeout is reached.
+    2. Receive a confirmation frame (accepted or rejected), which releases the dispatcher
+    3. Track the session until a completion frame signals its end
+       (e.g. FrameSessionFinishedNotification) or the timeout is reached,
+       optionally waiting for it.
 
     Subclasses implement check_confirmation() to identify their specific
     confirmation frame type. The default check_completion() handles the
     standard FrameSessionFinishedNotification; override if needed.
+    Subclasses interested in other frames of the session, e.g. run status
+    notifications, override handle_session_frame(). Subclasses acting on
+    the accepted confirmation, before the completion is awaited, override
+    session_accepted().
 
     The ``success`` attribute reflects whether an accepted confirmation frame was
     received within the timeout. Completion notifications do not change the
@@ -50,11 +68,26 @@ class CompletableApiEvent(ApiEvent):
     the timeout.
     """
 
+    SESSION_BASED = True
+    RESPONSE_FRAMES: ClassVar[Tuple[Type[FrameBase], ...]] = (FrameSessionFinishedNotification,)
+
     def __init__(self, pyvlx: "PyVLX", timeout_in_seconds: int = 10, wait_for_completion: bool = True):
         """Initialize CompletableApiEvent."""
         super().__init__(pyvlx=pyvlx, timeout_in_seconds=timeout_in_seconds)
         self.wait_for_completion = wait_for_completion
         self.session_id: int | None = None
+        self.completion: SessionHandle | None = None
+        self.node_run_status: Dict[int, RunStatus] = {}
+
+    @property
+    def completed_node_ids(self) -> List[int]:
+        """Return ids of nodes which reported the command as executed."""
+        return [node_id for node_id, run_status in self.node_run_status.items() if run_status == RunStatus.EXECUTION_COMPLETED]
+
+    @property
+    def failed_node_ids(self) -> List[int]:
+        """Return ids of nodes which reported the command as failed."""
+        return [node_id for node_id, run_status in self.node_run_status.items() if run_status == RunStatus.EXECUTION_FAILED]
 
     def check_confirmation(self, frame: FrameBase) -> bool | None:
         """Check if frame is a confirmation for this session.
@@ -71,15 +104,46 @@ class CompletableApiEvent(ApiEvent):
         )
 
     async def handle_frame(self, frame: FrameBase) -> bool:
-        """Handle incoming frame. Return True if this frame completes the API call."""
+        """Handle incoming frame. Return True if this frame completes the API call.
+
+        The API call is completed by the confirmation, the completion of the
+        session is tracked afterwards.
+        """
         confirmation = self.check_confirmation(frame)
         if confirmation is not None:
             self.success = confirmation
-            if not confirmation:
-                return True  # Rejected means done, no point waiting
-            return not self.wait_for_completion
+            return True
+        return self.handle_session_frame(frame)
+
+    def handle_session_frame(self, frame: FrameBase) -> bool:
+        """Handle frame of the session other than the confirmation, track run status per node. Return True if it completes the session."""
+        if isinstance(frame, FrameCommandRunStatusNotification) and frame.session_id == self.session_id:
+            node_id = getattr(frame, "index_id", None)
+            run_status = getattr(frame, "run_status", None)
+            if node_id is not None and run_status is not None:
+                self.node_run_status[node_id] = run_status
+            return False
         return self.check_completion(frame)
 
+    def session_accepted(self) -> None:
+        """Handle the accepted confirmation, called before waiting for completion. Does nothing by default."""
+
+    async def do_api_call(self) -> None:
+        """Send request and wait for confirmation, track completion and wait for it if wait_for_completion is set."""
+        await super().do_api_call()
+        if not self.success or self.session_id is None:
+            return
+        sessions = self.pyvlx.api_dispatcher.sessions
+        self.completion = sessions.track(self.session_id, self.RESPONSE_FRAMES, self.handle_session_frame, self.timeout_in_seconds)
+        # Frames of the session received along with the confirmation are still queued
+        while not self.received_frames.empty():
+            if self.handle_session_frame(self.received_frames.get_nowait()):
+                sessions.complete(self.session_id)
+                break
+        self.session_accepted()
+        if self.wait_for_completion:
+            await self.completion
+
     async def send(self) -> None:
         """Send request, wait for confirmation and (optionally) completion, and raise if no accepted confirmation is received."""
         await self.do_api_call()
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class FactoryDefault(ApiEvent):
     """Class for handling Factory reset API."""
 
+    RESPONSE_FRAMES = (FrameGatewayFactoryDefaultConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize facotry default class."""
         super().__init__(pyvlx=pyvlx)
@@ -1,9 +1,14 @@
 """Helper module for creating a frame out of raw data."""
 
+from typing import Callable, Dict, Set, Tuple, Type
+
 from pyvlx.const import Command
+from pyvlx.exception import PyVLXException
 from pyvlx.log import PYVLXLOG
 
 from .frames import (
+    FrameActivateProductGroupConfirmation,
+    FrameActivateProductGroupNotification, FrameActivateProductGroupRequest,
     FrameActivateSceneConfirmation, FrameActivateSceneRequest,
     FrameActivationLogUpdatedNotification, FrameBase,
     FrameCommandRemainingTimeNotification, FrameCommandRunStatusNotification,
@@ -12,203 +17,201 @@ from .frames import (
     FrameDiscoverNodesRequest, FrameErrorNotification,
     FrameGatewayFactoryDefaultConfirmation, FrameGatewayFactoryDefaultRequest,
     FrameGatewayRebootConfirmation, FrameGatewayRebootRequest,
+    FrameGetAllGroupsInformationConfirmation,
+    FrameGetAllGroupsInformationFinishedNotification,
+    FrameGetAllGroupsInformationNotification,
+    FrameGetAllGroupsInformationRequest,
     FrameGetAllNodesInformationConfirmation,
     FrameGetAllNodesInformationFinishedNotification,
     FrameGetAllNodesInformationNotification,
-    FrameGetAllNodesInformationRequest, FrameGetLimitationStatus,
-    FrameGetLimitationStatusConfirmation, FrameGetLimitationStatusNotification,
-    FrameGetLocalTimeConfirmation, FrameGetLocalTimeRequest,
-    FrameGetNetworkSetupConfirmation, FrameGetNetworkSetupRequest,
-    FrameGetNodeInformationConfirmation, FrameGetNodeInformationNotification,
-    FrameGetNodeInformationRequest, FrameGetProtocolVersionConfirmation,
-    FrameGetProtocolVersionRequest, FrameGetSceneListConfirmation,
+    FrameGetAllNodesInformationRequest, FrameGetGroupInformationConfirmation,
+    FrameGetGroupInformationNotification, FrameGetGroupInformationRequest,
+    FrameGetLimitationStatus, FrameGetLimitationStatusConfirmation,
+    FrameGetLimitationStatusNotification, FrameGetLocalTimeConfirmation,
+    FrameGetLocalTimeRequest, FrameGetNetworkSetupConfirmation,
+    FrameGetNetworkSetupRequest, FrameGetNodeInformationConfirmation,
+    FrameGetNodeInformationNotification, FrameGetNodeInformationRequest,
+    FrameGetProtocolVersionConfirmation, FrameGetProtocolVersionRequest,
+    FrameGetSceneInformationConfirmation, FrameGetSceneInformationNotification,
+    FrameGetSceneInformationRequest, FrameGetSceneListConfirmation,
     FrameGetSceneListNotification, FrameGetSceneListRequest,
     FrameGetStateConfirmation, FrameGetStateRequest,
-    FrameGetVersionConfirmation, FrameGetVersionRequest,
+    FrameGetSystemTableDataConfirmation, FrameGetSystemTableDataNotification,
+    FrameGetSystemTableDataRequest, FrameGetVersionConfirmation,
+    FrameGetVersionRequest, FrameGroupDeletedNotification,
+    FrameGroupInformationChangedNotification,
     FrameHouseStatusMonitorDisableConfirmation,
     FrameHouseStatusMonitorDisableRequest,
     FrameHouseStatusMonitorEnableConfirmation,
     FrameHouseStatusMonitorEnableRequest, FrameLeaveLearnStateConfirmation,
-    FrameLeaveLearnStateRequest, FrameNodeInformationChangedNotification,
+    FrameLeaveLearnStateRequest, FrameNewGroupConfirmation,
+    FrameNewGroupRequest, FrameNodeInformationChangedNotification,
     FrameNodeStatePositionChangedNotification, FramePasswordChangeConfirmation,
     FramePasswordChangeNotification, FramePasswordChangeRequest,
     FramePasswordEnterConfirmation, FramePasswordEnterRequest,
-    FrameSessionFinishedNotification, FrameSetLimitationConfirmation,
-    FrameSetLimitationRequest, FrameSetNodeNameConfirmation,
-    FrameSetNodeNameRequest, FrameSetUTCConfirmation, FrameSetUTCRequest,
+    FrameSceneInformationChangedNotification, FrameSessionFinishedNotification,
+    FrameSetLimitationConfirmation, FrameSetLimitationRequest,
+    FrameSetNodeNameConfirmation, FrameSetNodeNameRequest,
+    FrameSetUTCConfirmation, FrameSetUTCRequest,
     FrameStatusRequestConfirmation, FrameStatusRequestNotification,
-    FrameStatusRequestRequest, FrameWinkSendConfirmation,
-    FrameWinkSendNotification, FrameWinkSendRequest, extract_from_frame)
-
-
-def frame_from_raw(raw: bytes) -> FrameBase | None:
-    """Create and return frame from raw bytes."""
-    command, payload = extract_from_frame(raw)
-    frame = create_frame(command)
-    if frame is None:
+    FrameStatusRequestRequest, FrameSystemTableUpdateNotification,
+    FrameWinkSendConfirmation, FrameWinkSendNotification, FrameWinkSendRequest,
+    extract_command_value_from_frame)
+
+FRAME_CLASSES: Tuple[Type[FrameBase], ...] = (
+    FrameErrorNotification,
+    FrameWinkSendRequest,
+    FrameWinkSendConfirmation,
+    FrameWinkSendNotification,
+    FrameCommandSendRequest,
+    FrameCommandSendConfirmation,
+    FrameCommandRunStatusNotification,
+    FrameCommandRemainingTimeNotification,
+    FrameSessionFinishedNotification,
+    FramePasswordEnterRequest,
+    FramePasswordEnterConfirmation,
+    FramePasswordChangeRequest,
+    FramePasswordChangeConfirmation,
+    FramePasswordChangeNotification,
+    FrameGatewayRebootRequest,
+    FrameGatewayRebootConfirmation,
+    FrameGatewayFactoryDefaultRequest,
+    FrameGatewayFactoryDefaultConfirmation,
+    FrameGetLocalTimeRequest,
+    FrameGetLocalTimeConfirmation,
+    FrameDiscoverNodesRequest,
+    FrameDiscoverNodesConfirmation,
+    FrameDiscoverNodesNotification,
+    FrameGetSceneListRequest,
+    FrameGetSceneListConfirmation,
+    FrameGetSceneListNotification,
+    FrameGetSceneInformationRequest,
+    FrameGetSceneInformationConfirmation,
+    FrameGetSceneInformationNotification,
+    FrameSceneInformationChangedNotification,
+    FrameGetNodeInformationRequest,
+    FrameGetNodeInformationConfirmation,
+    FrameGetNodeInformationNotification,
+    FrameGetAllNodesInformationRequest,
+    FrameGetAllNodesInformationConfirmation,
+    FrameGetAllNodesInformationNotification,
+    FrameGetAllNodesInformationFinishedNotification,
+    FrameActivateSceneRequest,
+    FrameActivateSceneConfirmation,
+    FrameActivateProductGroupRequest,
+    FrameActivateProductGroupConfirmation,
+    FrameActivateProductGroupNotification,
+    FrameGetVersionRequest,
+    FrameGetVersionConfirmation,
+    FrameGetProtocolVersionRequest,
+    FrameGetProtocolVersionConfirmation,
+    FrameSetNodeNameRequest,
+    FrameSetNodeNameConfirmation,
+    FrameNodeInformationChangedNotification,
+    FrameGetStateRequest,
+    FrameGetStateConfirmation,
+    FrameGetLimitationStatus,
+    FrameGetLimitationStatusConfirmation,
+    FrameGetLimitationStatusNotification,
+    FrameGetNetworkSetupRequest,
+    FrameGetNetworkSetupConfirmation,
+    FrameSetUTCRequest,
+    FrameSetUTCConfirmation,
+    FrameActivationLogUpdatedNotification,
+    FrameHouseStatusMonitorEnableRequest,
+    FrameHouseStatusMonitorEnableConfirmation,
+    FrameHouseStatusMonitorDisableRequest,
+    FrameHouseStatusMonitorDisableConfirmation,
+    FrameNodeStatePositionChangedNotification,
+    FrameLeaveLearnStateConfirmation,
+    FrameLeaveLearnStateRequest,
+    FrameStatusRequestRequest,
+    FrameStatusRequestConfirmation,
+    FrameStatusRequestNotification,
+    FrameSetLimitationRequest,
+    FrameSetLimitationConfirmation,
+    FrameSystemTableUpdateNotification,
+    FrameGetSystemTableDataRequest,
+    FrameGetSystemTableDataConfirmation,
+    FrameGetSystemTableDataNotification,
+    FrameGetGroupInformationRequest,
+    FrameGetGroupInformationConfirmation,
+    FrameGetGroupInformationNotification,
+    FrameGetAllGroupsInformationRequest,
+    FrameGetAllGroupsInformationConfirmation,
+    FrameGetAllGroupsInformationNotification,
+    FrameGetAllGroupsInformationFinishedNotification,
+    FrameNewGroupRequest,
+    FrameNewGroupConfirmation,
+    FrameGroupInformationChangedNotification,
+    FrameGroupDeletedNotification,
+)
+
+_FRAME_CLASSES_BY_COMMAND: Dict[int, Type[FrameBase]] = {}
+_LAZY_FRAME_CLASSES: Set[Type[FrameBase]] = set()
+
+
+def register_frame_class(frame_class: Type[FrameBase]) -> None:
+    """Register frame class for creating frames of its COMMAND out of raw data.
+
+    Frame classes have to be constructible without arguments. A frame class
+    registered later for the same command replaces the former one.
+    """
+    if not issubclass(frame_class, FrameBase) or not isinstance(getattr(frame_class, "COMMAND", None), Command):
+        raise PyVLXException("frame_class_without_command", frame_class=frame_class)
+    _FRAME_CLASSES_BY_COMMAND[frame_class.COMMAND.value] = frame_class
+    if frame_class.decodes_lazily():
+        _LAZY_FRAME_CLASSES.add(frame_class)
+
+
+def unregister_frame_class(frame_class: Type[FrameBase]) -> None:
+    """Unregister frame class."""
+    if _FRAME_CLASSES_BY_COMMAND.get(frame_class.COMMAND.value) is frame_class:
+        del _FRAME_CLASSES_BY_COMMAND[frame_class.COMMAND.value]
+        _LAZY_FRAME_CLASSES.discard(frame_class)
+
+
+for _frame_class in FRAME_CLASSES:
+    register_frame_class(_frame_class)
+
+
+def frame_from_raw(raw: bytes, wanted: Callable[[Type[FrameBase]], bool] | None = None) -> FrameBase | None:
+    """Create and return frame from raw bytes.
+
+    Only the header and the strict fields are decoded right away. Frames whose
+    state is their LAYOUT decode their other fields on first access. If wanted is given, None is returned without
+    decoding the payload for frame classes it rejects.
+    """
+    command_value, payload = extract_command_value_from_frame(raw)
+    frame_class = _FRAME_CLASSES_BY_COMMAND.get(command_value)
+    if frame_class is not None and wanted is not None and not wanted(frame_class):
+        return None
+    if frame_class is None:
         PYVLXLOG.warning(
             "Command %s not implemented, raw: %s",
-            command,
+            _command_name(command_value),
             ":".join(f"{c:02x}" for c in raw),
         )
         return None
+    if frame_class in _LAZY_FRAME_CLASSES:
+        return frame_class.from_payload_lazy(payload)
+    frame = frame_class()
     frame.validate_payload_len(payload)
     frame.from_payload(payload)
     return frame
 
 
+def _command_name(command_value: int) -> str:
+    """Return name of command for logging, hex value if command is unknown."""
+    try:
+        return str(Command(command_value))
+    except ValueError:
+        return f"0x{command_value:04x}"
+
+
 def create_frame(command: Command) -> FrameBase | None:
     """Create and return empty Frame from Command."""
-    # pylint: disable=too-many-branches,too-many-return-statements,too-many-statements
-    if command == Command.GW_ERROR_NTF:
-        return FrameErrorNotification()
-    if command == Command.GW_WINK_SEND_REQ:
-        return FrameWinkSendRequest()
-    if command == Command.GW_WINK_SEND_CFM:
-        return FrameWinkSendConfirmation()
-    if command == Command.GW_WINK_SEND_NTF:
-        return FrameWinkSendNotification()
-    if command == Command.GW_COMMAND_SEND_REQ:
-        return FrameCommandSendRequest()
-    if command == Command.GW_COMMAND_SEND_CFM:
-        return FrameCommandSendConfirmation()
-    if command == Command.GW_COMMAND_RUN_STATUS_NTF:
-        return FrameCommandRunStatusNotification()
-    if command == Command.GW_COMMAND_REMAINING_TIME_NTF:
-        return FrameCommandRemainingTimeNotification()
-    if command == Command.GW_SESSION_FINISHED_NTF:
-        return FrameSessionFinishedNotification()
-
-    if command == Command.GW_PASSWORD_ENTER_REQ:
-        return FramePasswordEnterRequest()
-    if command == Command.GW_PASSWORD_ENTER_CFM:
-        return FramePasswordEnterConfirmation()
-
-    if command == Command.GW_PASSWORD_CHANGE_REQ:
-        return FramePasswordChangeRequest()
-    if command == Command.GW_PASSWORD_CHANGE_CFM:
-        return FramePasswordChangeConfirmation()
-    if command == Command.GW_PASSWORD_CHANGE_NTF:
-        return FramePasswordChangeNotification()
-
-    if command == Command.GW_REBOOT_REQ:
-        return FrameGatewayRebootRequest()
-    if command == Command.GW_REBOOT_CFM:
-        return FrameGatewayRebootConfirmation()
-
-    if command == Command.GW_SET_FACTORY_DEFAULT_REQ:
-        return FrameGatewayFactoryDefaultRequest()
-    if command == Command.GW_SET_FACTORY_DEFAULT_CFM:
-        return FrameGatewayFactoryDefaultConfirmation()
-
-    if command == Command.GW_GET_LOCAL_TIME_REQ:
-        return FrameGetLocalTimeRequest()
-    if command == Command.GW_GET_LOCAL_TIME_CFM:
-        return FrameGetLocalTimeConfirmation()
-
-    if command == Command.GW_CS_DISCOVER_NODES_REQ:
-        return FrameDiscoverNodesRequest()
-    if command == Command.GW_CS_DISCOVER_NODES_CFM:
-        return FrameDiscoverNodesConfirmation()
-    if command == Command.GW_CS_DISCOVER_NODES_NTF:
-        return FrameDiscoverNodesNotification()
-
-    if command == Command.GW_GET_SCENE_LIST_REQ:
-        return FrameGetSceneListRequest()
-    if command == Command.GW_GET_SCENE_LIST_CFM:
-        return FrameGetSceneListConfirmation()
-    if command == Command.GW_GET_SCENE_LIST_NTF:
-        return FrameGetSceneListNotification()
-
-    if command == Command.GW_GET_NODE_INFORMATION_REQ:
-        return FrameGetNodeInformationRequest()
-    if command == Command.GW_GET_NODE_INFORMATION_CFM:
-        return FrameGetNodeInformationConfirmation()
-    if command == Command.GW_GET_NODE_INFORMATION_NTF:
-        return FrameGetNodeInformationNotification()
-
-    if command == Command.GW_GET_ALL_NODES_INFORMATION_REQ:
-        return FrameGetAllNodesInformationRequest()
-    if command == Command.GW_GET_ALL_NODES_INFORMATION_CFM:
-        return FrameGetAllNodesInformationConfirmation()
-    if command == Command.GW_GET_ALL_NODES_INFORMATION_NTF:
-        return FrameGetAllNodesInformationNotification()
-    if command == Command.GW_GET_ALL_NODES_INFORMATION_FINISHED_NTF:
-        return FrameGetAllNodesInformationFinishedNotification()
-
-    if command == Command.GW_ACTIVATE_SCENE_REQ:
-        return FrameActivateSceneRequest()
-    if command == Command.GW_ACTIVATE_SCENE_CFM:
-        return FrameActivateSceneConfirmation()
-
-    if command == Command.GW_GET_VERSION_REQ:
-        return FrameGetVersionRequest()
-    if command == Command.GW_GET_VERSION_CFM:
-        return FrameGetVersionConfirmation()
-    if command == Command.GW_GET_PROTOCOL_VERSION_REQ:
-        return FrameGetProtocolVersionRequest()
-    if command == Command.GW_GET_PROTOCOL_VERSION_CFM:
-        return FrameGetProtocolVersionConfirmation()
-
-    if command == Command.GW_SET_NODE_NAME_REQ:
-        return FrameSetNodeNameRequest()
-    if command == Command.GW_SET_NODE_NAME_CFM:
-        return FrameSetNodeNameConfirmation()
-
-    if command == Command.GW_NODE_INFORMATION_CHANGED_NTF:
-        return FrameNodeInformationChangedNotification()
-
-    if command == Command.GW_GET_STATE_REQ:
-        return FrameGetStateRequest()
-    if command == Command.GW_GET_STATE_CFM:
-        return FrameGetStateConfirmation()
-
-    if command == Command.GW_GET_LIMITATION_STATUS_REQ:
-        return FrameGetLimitationStatus()
-    if command == Command.GW_GET_LIMITATION_STATUS_CFM:
-        return FrameGetLimitationStatusConfirmation()
-    if command == Command.GW_LIMITATION_STATUS_NTF:
-        return FrameGetLimitationStatusNotification()
-
-    if command == Command.GW_GET_NETWORK_SETUP_REQ:
-        return FrameGetNetworkSetupRequest()
-    if command == Command.GW_GET_NETWORK_SETUP_CFM:
-        return FrameGetNetworkSetupConfirmation()
-
-    if command == Command.GW_SET_UTC_REQ:
-        return FrameSetUTCRequest()
-    if command == Command.GW_SET_UTC_CFM:
-        return FrameSetUTCConfirmation()
-
-    if command == Command.GW_ACTIVATION_LOG_UPDATED_NTF:
-        return FrameActivationLogUpdatedNotification()
-
-    if command == Command.GW_HOUSE_STATUS_MONITOR_ENABLE_REQ:
-        return FrameHouseStatusMonitorEnableRequest()
-    if command == Command.GW_HOUSE_STATUS_MONITOR_ENABLE_CFM:
-        return FrameHouseStatusMonitorEnableConfirmation()
-    if command == Command.GW_HOUSE_STATUS_MONITOR_DISABLE_REQ:
-        return FrameHouseStatusMonitorDisableRequest()
-    if command == Command.GW_HOUSE_STATUS_MONITOR_DISABLE_CFM:
-        return FrameHouseStatusMonitorDisableConfirmation()
-
-    if command == Command.GW_NODE_STATE_POSITION_CHANGED_NTF:
-        return FrameNodeStatePositionChangedNotification()
-    if command == Command.GW_LEAVE_LEARN_STATE_CFM:
-        return FrameLeaveLearnStateConfirmation()
-    if command == Command.GW_LEAVE_LEARN_STATE_REQ:
-        return FrameLeaveLearnStateRequest()
-
-    if command == Command.GW_STATUS_REQUEST_REQ:
-        return FrameStatusRequestRequest()
-    if command == Command.GW_STATUS_REQUEST_CFM:
-        return FrameStatusRequestConfirmation()
-    if command == Command.GW_STATUS_REQUEST_NTF:
-        return FrameStatusRequestNotification()
-
-    if command == Command.GW_SET_LIMITATION_REQ:
-        return FrameSetLimitationRequest()
-    if command == Command.GW_SET_LIMITATION_CFM:
-        return FrameSetLimitationConfirmation()
-
-    return None
+    frame_class = _FRAME_CLASSES_BY_COMMAND.get(command.value)
+    if frame_class is None:
+        return None
+    return frame_class()
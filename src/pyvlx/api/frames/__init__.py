@@ -3,6 +3,10 @@
 from .alias_array import AliasArray
 # flake8: noqa
 from .frame import FrameBase
+from .frame_activate_product_group import (
+    ActivateProductGroupConfirmationStatus,
+    FrameActivateProductGroupConfirmation,
+    FrameActivateProductGroupNotification, FrameActivateProductGroupRequest)
 from .frame_activate_scene import (
     ActivateSceneConfirmationStatus, FrameActivateSceneConfirmation,
     FrameActivateSceneRequest)
@@ -17,11 +21,20 @@ from .frame_discover_nodes import (
 from .frame_error_notification import ErrorType, FrameErrorNotification
 from .frame_factory_default import (
     FrameGatewayFactoryDefaultConfirmation, FrameGatewayFactoryDefaultRequest)
+from .frame_get_all_groups_information import (
+    AllGroupsInformationStatus, FrameGetAllGroupsInformationConfirmation,
+    FrameGetAllGroupsInformationFinishedNotification,
+    FrameGetAllGroupsInformationNotification,
+    FrameGetAllGroupsInformationRequest)
 from .frame_get_all_nodes_information import (
     FrameGetAllNodesInformationConfirmation,
     FrameGetAllNodesInformationFinishedNotification,
     FrameGetAllNodesInformationNotification,
     FrameGetAllNodesInformationRequest)
+from .frame_get_group_information import (
+    FrameGetGroupInformationConfirmation, FrameGetGroupInformationNotification,
+    FrameGetGroupInformationRequest, FrameGroupInformationBase,
+    GroupInformationStatus)
 from .frame_get_limitation import (
     FrameGetLimitationStatus, FrameGetLimitationStatusConfirmation,
     FrameGetLimitationStatusNotification)
@@ -35,15 +48,25 @@ from .frame_get_node_information import (
     FrameGetNodeInformationRequest)
 from .frame_get_protocol_version import (
     FrameGetProtocolVersionConfirmation, FrameGetProtocolVersionRequest)
+from .frame_get_scene_information import (
+    FrameGetSceneInformationConfirmation, FrameGetSceneInformationNotification,
+    FrameGetSceneInformationRequest, FrameSceneInformationChangedNotification,
+    SceneInformationStatus, SceneNode)
 from .frame_get_scene_list import (
     FrameGetSceneListConfirmation, FrameGetSceneListNotification,
     FrameGetSceneListRequest)
 from .frame_get_state import (
     FrameGetStateConfirmation, FrameGetStateRequest, GatewayState,
     GatewaySubState)
+from .frame_get_system_table_data import (
+    FrameGetSystemTableDataConfirmation, FrameGetSystemTableDataNotification,
+    FrameGetSystemTableDataRequest, SystemTableEntry)
 from .frame_get_version import (
     FrameGetVersionConfirmation, FrameGetVersionRequest)
-from .frame_helper import calc_crc, extract_from_frame
+from .frame_group_information_changed import (
+    FrameGroupDeletedNotification, FrameGroupInformationChangedNotification)
+from .frame_helper import (
+    calc_crc, extract_command_value_from_frame, extract_from_frame)
 from .frame_house_status_monitor_disable_cfm import (
     FrameHouseStatusMonitorDisableConfirmation)
 from .frame_house_status_monitor_disable_req import (
@@ -55,6 +78,9 @@ from .frame_house_status_monitor_enable_req import (
 from .frame_leave_learn_state import (
     FrameLeaveLearnStateConfirmation, FrameLeaveLearnStateRequest,
     LeaveLearnStateConfirmationStatus)
+from .frame_new_group import (
+    FrameNewGroupConfirmation, FrameNewGroupRequest,
+    NewGroupConfirmationStatus)
 from .frame_node_information_changed import (
     FrameNodeInformationChangedNotification)
 from .frame_node_state_position_changed_notification import (
@@ -77,6 +103,7 @@ from .frame_set_utc import FrameSetUTCConfirmation, FrameSetUTCRequest
 from .frame_status_request import (
     FrameStatusRequestConfirmation, FrameStatusRequestNotification,
     FrameStatusRequestRequest)
+from .frame_system_table_update import FrameSystemTableUpdateNotification
 from .frame_wink_send import (
     FrameWinkSendConfirmation, FrameWinkSendNotification, FrameWinkSendRequest,
     WinkSendConfirmationStatus)
@@ -1,18 +1,46 @@
 """Module for Frames."""
 import struct
+from typing import TYPE_CHECKING, Any, ClassVar, Type, TypeVar
 
 from pyvlx.const import Command
 from pyvlx.exception import PyVLXException
 
 from .frame_helper import calc_crc
+from .frame_layout import FrameLayout
+
+_HEADER = struct.Struct(">BBH")
+FrameT = TypeVar("FrameT", bound="FrameBase")
 
 
 class FrameBase:
-    """Class for Base Frame."""
+    """Class for Base Frame.
+
+    Derived frames declare the API command they implement within COMMAND.
+    Frames with a fixed payload may declare its fields within LAYOUT instead
+    of implementing get_payload() and from_payload(). Received frames whose
+    state consists of the fields of their LAYOUT only are decoded lazily, see
+    from_payload_lazy().
+    """
+
+    COMMAND: ClassVar[Command]
+    LAYOUT: ClassVar[FrameLayout | None] = None
+    _lazy_payload: bytes
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """Verify the layout of derived frames matches their PAYLOAD_LEN."""
+        super().__init_subclass__(**kwargs)
+        layout = cls.__dict__.get("LAYOUT")
+        if layout is not None and getattr(cls, "PAYLOAD_LEN", layout.size) != layout.size:
+            raise PyVLXException(
+                "frame_layout_size_mismatch",
+                frame_type=cls.__name__,
+                payload_len=getattr(cls, "PAYLOAD_LEN"),
+                layout_size=layout.size,
+            )
 
-    def __init__(self, command: Command):
+    def __init__(self, command: Command | None = None):
         """Initialize Base Frame."""
-        self.command = command
+        self.command = command if command is not None else self.COMMAND
 
     def __bytes__(self) -> bytes:
         """Get raw bytes of Frame."""
@@ -35,10 +63,56 @@ class FrameBase:
 
     def get_payload(self) -> bytes:
         """Return Payload."""
+        if self.LAYOUT is not None:
+            return self.LAYOUT.pack(self)
         return b""
 
     def from_payload(self, payload: bytes) -> None:
         """Init frame from binary data."""
+        if self.LAYOUT is not None:
+            self.LAYOUT.unpack_into(self, payload)
+
+    @classmethod
+    def decodes_lazily(cls) -> bool:
+        """Return True if frames of this class can be decoded by from_payload_lazy().
+
+        This requires a LAYOUT, no custom from_payload() and no attributes
+        set by __init__ besides command and the fields of the LAYOUT.
+        """
+        if cls.LAYOUT is None or cls.from_payload is not FrameBase.from_payload:
+            return False
+        return set(vars(cls())) <= {"command", *cls.LAYOUT.names}
+
+    @classmethod
+    def from_payload_lazy(cls: Type[FrameT], payload: bytes) -> FrameT:
+        """Return frame keeping payload, fields of LAYOUT are decoded on first access and cached.
+
+        __init__ is not called, so this is only suitable for frame classes
+        for which decodes_lazily() is True. Strict fields of the LAYOUT are
+        checked right away, along with the payload length, so invalid payloads
+        are rejected here as well.
+        """
+        assert cls.LAYOUT is not None
+        frame = cls.__new__(cls)
+        frame.command = cls.COMMAND
+        frame._lazy_payload = payload
+        frame.validate_payload_len(payload)
+        cls.LAYOUT.check(payload)
+        return frame
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Decode field of a lazily decoded frame on first access."""
+            payload = self.__dict__.get("_lazy_payload")
+            if payload is None or name.startswith("__"):
+                raise AttributeError(name)
+            try:
+                value = self.LAYOUT.unpack_field(name, payload)
+            except KeyError:
+                raise AttributeError(name) from None
+            setattr(self, name, value)
+            return value
 
     def __str__(self) -> str:
         """Return human readable string."""
@@ -48,8 +122,5 @@ class FrameBase:
     def build_frame(command: Command, payload: bytes) -> bytes:
         """Build raw bytes from command and payload."""
         packet_length = 2 + len(payload) + 1
-        ret = struct.pack("BB", 0, packet_length)
-        ret += struct.pack(">H", command.value)
-        ret += payload
-        ret += struct.pack("B", calc_crc(ret))
-        return ret
+        ret = _HEADER.pack(0, packet_length, command.value) + payload
+        return ret + bytes([calc_crc(ret)])
@@ -0,0 +1,112 @@
+"""Module for product group activation frames."""
+from enum import Enum
+
+from pyvlx.const import Command, NodeParameter, Originator, Priority, Velocity
+from pyvlx.parameter import Parameter
+
+from .frame import FrameBase
+from .frame_layout import FrameLayout, enum8, padding, param, uint8, uint16
+
+
+class FrameActivateProductGroupRequest(FrameBase):
+    """Frame for moving all nodes of a product group to the same parameter value with one command."""
+
+    COMMAND = Command.GW_ACTIVATE_PRODUCTGROUP_REQ
+    PAYLOAD_LEN = 13
+    LAYOUT = FrameLayout(
+        uint16("session_id"),
+        enum8("originator", Originator),
+        enum8("priority", Priority),
+        uint8("group_id"),
+        enum8("node_parameter", NodeParameter),
+        param("parameter"),
+        enum8("velocity", Velocity),
+        padding(4),  # Priority level lock, priority level information 1+2, lock time
+    )
+
+    def __init__(
+            self,
+            group_id: int = 0,
+            parameter: Parameter = Parameter(),
+            velocity: Velocity = Velocity.DEFAULT,
+            session_id: int | None = None,
+            node_parameter: NodeParameter = NodeParameter.MP,
+            originator: Originator = Originator.USER,
+    ):
+        """Init Frame."""
+        super().__init__()
+        self.session_id = session_id
+        self.originator = originator
+        self.priority = Priority.USER_LEVEL_2
+        self.group_id = group_id
+        self.node_parameter = node_parameter
+        self.parameter = parameter
+        self.velocity = velocity
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return (
+            f'<{type(self).__name__} group_id="{self.group_id}" node_parameter="{self.node_parameter}" '
+            f'parameter="{self.parameter}" velocity="{self.velocity}" session_id="{self.session_id}" '
+            f'originator="{self.originator}"/>'
+        )
+
+
+class ActivateProductGroupConfirmationStatus(Enum):
+    """Enum class for status of product group activation confirmation."""
+
+    OK = 0
+    ERROR_UNKNOWN_PRODUCT_GROUP = 1
+    ERROR_SESSION_ID_IN_USE = 2
+    ERROR_BUSY = 3
+    ERROR_WRONG_GROUP_TYPE = 4
+    ERROR_FAILED = 5
+    ERROR_INVALID_PARAMETER = 6
+
+
+class FrameActivateProductGroupConfirmation(FrameBase):
+    """Frame for confirmation of product group activation."""
+
+    COMMAND = Command.GW_ACTIVATE_PRODUCTGROUP_CFM
+    PAYLOAD_LEN = 3
+    LAYOUT = FrameLayout(uint16("session_id"), enum8("status", ActivateProductGroupConfirmationStatus))
+
+    def __init__(self, session_id: int | None = None, status: ActivateProductGroupConfirmationStatus | None = None):
+        """Init Frame."""
+        super().__init__()
+        self.session_id = session_id
+        self.status = status
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} session_id="{self.session_id}" status="{self.status}"/>'
+
+
+class FrameActivateProductGroupNotification(FrameBase):
+    """Frame for notification in scope of a product group activation.
+
+    Only the session id is decoded, further data is kept in data as it is.
+    The results per node are reported with GW_COMMAND_RUN_STATUS_NTF.
+    """
+
+    COMMAND = Command.GW_ACTIVATE_PRODUCTGROUP_NTF
+
+    def __init__(self, session_id: int | None = None, data: bytes = b""):
+        """Init Frame."""
+        super().__init__()
+        self.session_id = session_id
+        self.data = data
+
+    def get_payload(self) -> bytes:
+        """Return Payload."""
+        assert self.session_id is not None
+        return self.session_id.to_bytes(2, "big") + self.data
+
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        self.session_id = int.from_bytes(payload[0:2], "big")
+        self.data = payload[2:]
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} session_id="{self.session_id}" data="{self.data.hex()}"/>'
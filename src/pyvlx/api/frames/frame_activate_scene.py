@@ -9,6 +9,7 @@ from .frame import FrameBase
 class FrameActivateSceneRequest(FrameBase):
     """Frame for sending command to gw."""
 
+    COMMAND = Command.GW_ACTIVATE_SCENE_REQ
     PAYLOAD_LEN = 6
 
     def __init__(
@@ -19,7 +20,7 @@ class FrameActivateSceneRequest(FrameBase):
             velocity: Velocity = Velocity.DEFAULT,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_ACTIVATE_SCENE_REQ)
+        super().__init__()
         self.scene_id = scene_id
         self.session_id = session_id
         self.originator = originator
@@ -64,11 +65,12 @@ class ActivateSceneConfirmationStatus(Enum):
 class FrameActivateSceneConfirmation(FrameBase):
     """Frame for confirmation of command send frame."""
 
+    COMMAND = Command.GW_ACTIVATE_SCENE_CFM
     PAYLOAD_LEN = 3
 
     def __init__(self, session_id: int | None = None, status: ActivateSceneConfirmationStatus | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_ACTIVATE_SCENE_CFM)
+        super().__init__()
         self.session_id = session_id
         self.status = status
 
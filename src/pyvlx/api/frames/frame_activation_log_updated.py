@@ -7,8 +7,9 @@ from .frame import FrameBase
 class FrameActivationLogUpdatedNotification(FrameBase):
     """Frame for error notification."""
 
+    COMMAND = Command.GW_ACTIVATION_LOG_UPDATED_NTF
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_ACTIVATION_LOG_UPDATED_NTF)
+        super().__init__()
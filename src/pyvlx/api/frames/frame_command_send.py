@@ -4,16 +4,33 @@ from typing import List
 
 from pyvlx.const import (
     Command, NodeParameter, Originator, Priority, RunStatus, StatusReply)
-from pyvlx.exception import PyVLXException
 from pyvlx.parameter import FunctionalParams, Parameter, Position
 
 from .frame import FrameBase
+from .frame_layout import (
+    FrameLayout, enum8, functional_parameters, node_array, padding, param,
+    uint8, uint16)
 
 
 class FrameCommandSendRequest(FrameBase):
     """Frame for sending command to gw."""
 
+    COMMAND = Command.GW_COMMAND_SEND_REQ
     PAYLOAD_LEN = 66
+    MAX_NODE_IDS = 20
+    LAYOUT = FrameLayout(
+        uint16("session_id"),
+        enum8("originator", Originator),
+        enum8("priority", Priority),
+        uint8("active_parameter"),  # ParameterActive pointing to main parameter (MP)
+        uint8("fpi1"),
+        uint8("fpi2"),
+        param("parameter"),
+        functional_parameters("functional_parameter", (NodeParameter.FP1, NodeParameter.FP2, NodeParameter.FP3)),
+        padding(26),  # Functional parameter FP4 to FP16 are ignored for now
+        node_array("node_ids", MAX_NODE_IDS, "command_send_request_wrong_node_length"),
+        padding(4),  # Priority level lock, priority level information 1+2, lock time
+    )
 
     def __init__(
             self,
@@ -25,7 +42,7 @@ class FrameCommandSendRequest(FrameBase):
             originator: Originator = Originator.USER,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_COMMAND_SEND_REQ)
+        super().__init__()
         self.node_ids = node_ids if node_ids is not None else []
         self.parameter = parameter
         self.active_parameter = active_parameter
@@ -55,54 +72,6 @@ class FrameCommandSendRequest(FrameBase):
             else:
                 self.functional_parameter[fp] = Parameter(raw=bytes(2))
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        # Session id
-        assert self.session_id is not None
-        ret = bytes([self.session_id >> 8 & 255, self.session_id & 255])
-        ret += bytes([self.originator.value])
-        ret += bytes([self.priority.value])
-        ret += bytes(
-            [self.active_parameter]
-        )  # ParameterActive pointing to main parameter (MP)
-        # FPI 1+2
-        ret += bytes([self.fpi1])
-        ret += bytes([self.fpi2])
-        # Main parameter + functional parameter FP1 to FP3
-        ret += bytes(self.parameter)
-        ret += bytes(self.functional_parameter[NodeParameter.FP1])
-        ret += bytes(self.functional_parameter[NodeParameter.FP2])
-        ret += bytes(self.functional_parameter[NodeParameter.FP3])
-        # Functional parameter FP4 to FP16 are ignored for now
-        ret += bytes(26)
-
-        # Nodes array: Number of nodes + node array + padding
-        ret += bytes([len(self.node_ids)])  # index array count
-        ret += bytes(self.node_ids) + bytes(20 - len(self.node_ids))
-
-        # Priority  Level Lock
-        ret += bytes([0])
-        # Priority Level information 1+2
-        ret += bytes([0, 0])
-        # Locktime
-        ret += bytes([0])
-        return ret
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.session_id = payload[0] * 256 + payload[1]
-        self.originator = Originator(payload[2])
-        self.priority = Priority(payload[3])
-
-        len_node_ids = payload[41]
-        if len_node_ids > 20:
-            raise PyVLXException("command_send_request_wrong_node_length")
-        self.node_ids = []
-        for i in range(len_node_ids):
-            self.node_ids.append(payload[42] + i)
-
-        self.parameter = Parameter(payload[7:9])
-
     def __str__(self) -> str:
         """Return human readable string."""
         functional_parameter = ""
@@ -125,27 +94,16 @@ class CommandSendConfirmationStatus(Enum):
 class FrameCommandSendConfirmation(FrameBase):
     """Frame for confirmation of command send frame."""
 
+    COMMAND = Command.GW_COMMAND_SEND_CFM
     PAYLOAD_LEN = 3
+    LAYOUT = FrameLayout(uint16("session_id"), enum8("status", CommandSendConfirmationStatus))
 
     def __init__(self, session_id: int | None = None, status: CommandSendConfirmationStatus | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_COMMAND_SEND_CFM)
+        super().__init__()
         self.session_id = session_id
         self.status = status
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        assert self.session_id is not None
-        assert self.status is not None
-        ret = bytes([self.session_id >> 8 & 255, self.session_id & 255])
-        ret += bytes([self.status.value])
-        return ret
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.session_id = payload[0] * 256 + payload[1]
-        self.status = CommandSendConfirmationStatus(payload[2])
-
     def __str__(self) -> str:
         """Return human readable string."""
         return f'<{type(self).__name__} session_id="{self.session_id}" status="{self.status}"/>'
@@ -154,7 +112,18 @@ class FrameCommandSendConfirmation(FrameBase):
 class FrameCommandRunStatusNotification(FrameBase):
     """Frame for run status notification in scope of command send frame."""
 
+    COMMAND = Command.GW_COMMAND_RUN_STATUS_NTF
     PAYLOAD_LEN = 13
+    LAYOUT = FrameLayout(
+        uint16("session_id"),
+        uint8("status_id"),
+        uint8("index_id"),
+        uint8("node_parameter"),
+        uint16("parameter_value"),
+        enum8("run_status", RunStatus),
+        enum8("status_reply", StatusReply),
+        padding(4),  # XXX: Missing implementation of information_code
+    )
 
     def __init__(
             self,
@@ -168,7 +137,7 @@ class FrameCommandRunStatusNotification(FrameBase):
             status_reply: StatusReply | None = None,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_COMMAND_RUN_STATUS_NTF)
+        super().__init__()
         self.session_id = session_id
         self.status_id = status_id
         self.index_id = index_id
@@ -177,37 +146,6 @@ class FrameCommandRunStatusNotification(FrameBase):
         self.run_status = run_status
         self.status_reply = status_reply
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        assert self.session_id is not None
-        ret = bytes([self.session_id >> 8 & 255, self.session_id & 255])
-        assert self.status_id is not None
-        ret += bytes([self.status_id])
-        assert self.index_id is not None
-        ret += bytes([self.index_id])
-        assert self.node_parameter is not None
-        ret += bytes([self.node_parameter])
-        assert self.parameter_value is not None
-        ret += bytes([self.parameter_value >> 8 & 255, self.parameter_value & 255])
-        assert self.run_status is not None
-        ret += bytes([self.run_status.value])
-        assert self.status_reply is not None
-        ret += bytes([self.status_reply.value])
-
-        # XXX: Missing implementation of information_code
-        ret += bytes(4)
-        return ret
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.session_id = payload[0] * 256 + payload[1]
-        self.status_id = payload[2]
-        self.index_id = payload[3]
-        self.node_parameter = payload[4]
-        self.parameter_value = payload[5] * 256 + payload[6]
-        self.run_status = RunStatus(payload[7])
-        self.status_reply = StatusReply(payload[8])
-
     def __str__(self) -> str:
         """Return human readable string."""
         return (
@@ -220,34 +158,18 @@ class FrameCommandRunStatusNotification(FrameBase):
 class FrameCommandRemainingTimeNotification(FrameBase):
     """Frame for notification of remaining time in scope of command send frame."""
 
+    COMMAND = Command.GW_COMMAND_REMAINING_TIME_NTF
     PAYLOAD_LEN = 6
+    LAYOUT = FrameLayout(uint16("session_id"), uint8("index_id"), uint8("node_parameter"), uint16("seconds"))
 
     def __init__(self, session_id: int | None = None, index_id: int | None = None, node_parameter: int | None = None, seconds: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_COMMAND_REMAINING_TIME_NTF)
+        super().__init__()
         self.session_id = session_id
         self.index_id = index_id
         self.node_parameter = node_parameter
         self.seconds = seconds
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        assert self.session_id is not None
-        ret = bytes([self.session_id >> 8 & 255, self.session_id & 255])
-        assert self.index_id is not None
-        ret += bytes([self.index_id])
-        assert self.node_parameter is not None
-        ret += bytes([self.node_parameter])
-        ret += bytes([self.seconds >> 8 & 255, self.seconds & 255])
-        return ret
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.session_id = payload[0] * 256 + payload[1]
-        self.index_id = payload[2]
-        self.node_parameter = payload[3]
-        self.seconds = payload[4] * 256 + payload[5]
-
     def __str__(self) -> str:
         """Return human readable string."""
         return (
@@ -259,23 +181,15 @@ class FrameCommandRemainingTimeNotification(FrameBase):
 class FrameSessionFinishedNotification(FrameBase):
     """Frame for notification of session finishid in scope of command send frame."""
 
+    COMMAND = Command.GW_SESSION_FINISHED_NTF
     PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(uint16("session_id"))
 
     def __init__(self, session_id: int | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_SESSION_FINISHED_NTF)
+        super().__init__()
         self.session_id = session_id
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        assert self.session_id is not None
-        ret = bytes([self.session_id >> 8 & 255, self.session_id & 255])
-        return ret
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.session_id = payload[0] * 256 + payload[1]
-
     def __str__(self) -> str:
         """Return human readable string."""
         return f'<{type(self).__name__} session_id="{self.session_id}"/>'
@@ -7,11 +7,12 @@ from .frame import FrameBase
 class FrameDiscoverNodesRequest(FrameBase):
     """Frame for discover nodes request."""
 
+    COMMAND = Command.GW_CS_DISCOVER_NODES_REQ
     PAYLOAD_LEN = 1
 
     def __init__(self, node_type: NodeType = NodeType.NO_TYPE):
         """Init Frame."""
-        super().__init__(Command.GW_CS_DISCOVER_NODES_REQ)
+        super().__init__()
         self.node_type = node_type
 
     def get_payload(self) -> bytes:
@@ -31,21 +32,23 @@ class FrameDiscoverNodesRequest(FrameBase):
 class FrameDiscoverNodesConfirmation(FrameBase):
     """Frame for discover nodes confirmation."""
 
+    COMMAND = Command.GW_CS_DISCOVER_NODES_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_CS_DISCOVER_NODES_CFM)
+        super().__init__()
 
 
 class FrameDiscoverNodesNotification(FrameBase):
     """Frame for discover nodes notification."""
 
+    COMMAND = Command.GW_CS_DISCOVER_NODES_NTF
     PAYLOAD_LEN = 131
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_CS_DISCOVER_NODES_NTF)
+        super().__init__()
         self.payload = b"\0" * 131
 
     def get_payload(self) -> bytes:
@@ -21,11 +21,12 @@ class ErrorType(Enum):
 class FrameErrorNotification(FrameBase):
     """Frame for error notification."""
 
+    COMMAND = Command.GW_ERROR_NTF
     PAYLOAD_LEN = 1
 
     def __init__(self, error_type: ErrorType = ErrorType.NotFurtherDefined):
         """Init Frame."""
-        super().__init__(Command.GW_ERROR_NTF)
+        super().__init__()
         self.error_type = error_type
 
     def get_payload(self) -> bytes:
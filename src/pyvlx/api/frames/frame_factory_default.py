@@ -7,11 +7,12 @@ from .frame import FrameBase
 class FrameGatewayFactoryDefaultRequest(FrameBase):
     """Frame for requesting factory reset."""
 
+    COMMAND = Command.GW_SET_FACTORY_DEFAULT_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_SET_FACTORY_DEFAULT_REQ)
+        super().__init__()
 
     def __str__(self) -> str:
         """Return human readable string."""
@@ -21,11 +22,12 @@ class FrameGatewayFactoryDefaultRequest(FrameBase):
 class FrameGatewayFactoryDefaultConfirmation(FrameBase):
     """Frame for response for factory reset."""
 
+    COMMAND = Command.GW_SET_FACTORY_DEFAULT_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_SET_FACTORY_DEFAULT_CFM)
+        super().__init__()
 
     def __str__(self) -> str:
         """Return human readable string."""
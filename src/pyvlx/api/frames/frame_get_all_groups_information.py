@@ -0,0 +1,71 @@
+"""Module for get all groups information frames."""
+from enum import Enum
+
+from pyvlx.const import Command, GroupType
+
+from .frame import FrameBase
+from .frame_get_group_information import (
+    GROUP_INFORMATION_LAYOUT, FrameGroupInformationBase)
+from .frame_layout import FrameLayout, enum8, uint8
+
+
+class FrameGetAllGroupsInformationRequest(FrameBase):
+    """Frame for get all groups information request, optionally filtered by group type."""
+
+    COMMAND = Command.GW_GET_ALL_GROUPS_INFORMATION_REQ
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(uint8("use_filter"), enum8("group_type", GroupType))
+
+    def __init__(self, group_type: GroupType | None = None):
+        """Init Frame."""
+        super().__init__()
+        self.use_filter = int(group_type is not None)
+        self.group_type = group_type if group_type is not None else GroupType.USER_GROUP
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} use_filter="{bool(self.use_filter)}" group_type="{self.group_type}"/>'
+
+
+class AllGroupsInformationStatus(Enum):
+    """Enum for status of get all groups information confirmation."""
+
+    OK = 0
+    ERROR_NO_GROUPS = 1
+
+
+class FrameGetAllGroupsInformationConfirmation(FrameBase):
+    """Frame for get all groups information confirmation."""
+
+    COMMAND = Command.GW_GET_ALL_GROUPS_INFORMATION_CFM
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(enum8("status", AllGroupsInformationStatus), uint8("number_of_groups"))
+
+    def __init__(self, status: AllGroupsInformationStatus = AllGroupsInformationStatus.OK, number_of_groups: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.status = status
+        self.number_of_groups = number_of_groups
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} status="{self.status}" number_of_groups="{self.number_of_groups}"/>'
+
+
+class FrameGetAllGroupsInformationNotification(FrameGroupInformationBase):
+    """Frame for get all groups information notification, sent once per group."""
+
+    COMMAND = Command.GW_GET_ALL_GROUPS_INFORMATION_NTF
+    PAYLOAD_LEN = 99
+    LAYOUT = GROUP_INFORMATION_LAYOUT
+
+
+class FrameGetAllGroupsInformationFinishedNotification(FrameBase):
+    """Frame for notification that all groups information was sent."""
+
+    COMMAND = Command.GW_GET_ALL_GROUPS_INFORMATION_FINISHED_NTF
+    PAYLOAD_LEN = 0
+
+    def __init__(self) -> None:
+        """Init Frame."""
+        super().__init__()
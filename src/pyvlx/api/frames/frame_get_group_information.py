@@ -0,0 +1,102 @@
+"""Module for get group information frames."""
+from enum import Enum
+from typing import List
+
+from pyvlx.const import Command, GroupType, NodeVariation, Velocity
+
+from .frame import FrameBase
+from .frame_layout import (
+    FrameLayout, enum8, node_bitmap, string, uint8, uint16)
+
+GROUP_INFORMATION_FIELDS = (
+    uint16("order"),
+    uint8("placement"),
+    string("name", 64),
+    enum8("velocity", Velocity),
+    enum8("node_variation", NodeVariation),
+    enum8("group_type", GroupType),
+    node_bitmap("node_ids", 25, counted=True),
+    uint16("revision"),
+)
+GROUP_INFORMATION_LAYOUT = FrameLayout(uint8("group_id"), *GROUP_INFORMATION_FIELDS)
+
+
+class FrameGroupInformationBase(FrameBase):
+    """Base class for frames carrying the information of a group."""
+
+    def __init__(
+        self,
+        group_id: int = 0,
+        name: str = "",
+        group_type: GroupType = GroupType.USER_GROUP,
+        node_ids: List[int] | None = None,
+    ):
+        """Init Frame."""
+        super().__init__()
+        self.group_id = group_id
+        self.order = 0
+        self.placement = 0
+        self.name = name
+        self.velocity = Velocity.DEFAULT
+        self.node_variation = NodeVariation.NOT_SET
+        self.group_type = group_type
+        self.node_ids = node_ids if node_ids is not None else []
+        self.revision = 0
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return (
+            f'<{type(self).__name__} group_id="{self.group_id}" name="{self.name}" '
+            f'group_type="{self.group_type}" node_ids="{self.node_ids}" revision="{self.revision}"/>'
+        )
+
+
+class FrameGetGroupInformationRequest(FrameBase):
+    """Frame for get group information request."""
+
+    COMMAND = Command.GW_GET_GROUP_INFORMATION_REQ
+    PAYLOAD_LEN = 1
+    LAYOUT = FrameLayout(uint8("group_id"))
+
+    def __init__(self, group_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.group_id = group_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} group_id="{self.group_id}"/>'
+
+
+class GroupInformationStatus(Enum):
+    """Enum for status of get group information confirmation."""
+
+    OK = 0
+    ERROR_REQUEST_FAILED = 1
+    ERROR_INVALID_GROUP_INDEX = 2
+
+
+class FrameGetGroupInformationConfirmation(FrameBase):
+    """Frame for get group information confirmation."""
+
+    COMMAND = Command.GW_GET_GROUP_INFORMATION_CFM
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(enum8("status", GroupInformationStatus), uint8("group_id"))
+
+    def __init__(self, status: GroupInformationStatus = GroupInformationStatus.OK, group_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.status = status
+        self.group_id = group_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} status="{self.status}" group_id="{self.group_id}"/>'
+
+
+class FrameGetGroupInformationNotification(FrameGroupInformationBase):
+    """Frame for get group information notification."""
+
+    COMMAND = Command.GW_GET_GROUP_INFORMATION_NTF
+    PAYLOAD_LEN = 99
+    LAYOUT = GROUP_INFORMATION_LAYOUT
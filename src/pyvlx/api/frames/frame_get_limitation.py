@@ -2,6 +2,7 @@
 from typing import List
 
 from pyvlx.const import Command, LimitationType, Originator, Priority
+from pyvlx.exception import PyVLXException
 
 from .frame import FrameBase
 
@@ -9,6 +10,7 @@ from .frame import FrameBase
 class FrameGetLimitationStatus(FrameBase):
     """Frame for requesting limitation status."""
 
+    COMMAND = Command.GW_GET_LIMITATION_STATUS_REQ
     PAYLOAD_LEN = 25
 
     def __init__(self,
@@ -16,7 +18,7 @@ class FrameGetLimitationStatus(FrameBase):
                  session_id: int | None = None,
                  limitation_type: LimitationType = LimitationType.MIN_LIMITATION):
         """Init Frame."""
-        super().__init__(Command.GW_GET_LIMITATION_STATUS_REQ)
+        super().__init__()
         self.session_id = session_id
         self.originator = Originator.USER
         self.priority = Priority.USER_LEVEL_2
@@ -35,6 +37,16 @@ class FrameGetLimitationStatus(FrameBase):
         ret += bytes([self.limitation_type.value])
         return ret
 
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        self.session_id = payload[0] * 256 + payload[1]
+        len_node_ids = payload[2]
+        if len_node_ids > 20:
+            raise PyVLXException("get_limitation_status_wrong_node_length")
+        self.node_ids = list(payload[3:3 + len_node_ids])
+        self.parameter_id = payload[23]
+        self.limitation_type = LimitationType(payload[24])
+
     def __str__(self) -> str:
         """Return human readable string."""
         return f'<{type(self).__name__} node_ids="{self.node_ids}" ' \
@@ -44,11 +56,12 @@ class FrameGetLimitationStatus(FrameBase):
 class FrameGetLimitationStatusConfirmation(FrameBase):
     """Frame for response for get limitation requests."""
 
+    COMMAND = Command.GW_GET_LIMITATION_STATUS_CFM
     PAYLOAD_LEN = 3
 
     def __init__(self, session_id: int | None = None, data: int | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_GET_LIMITATION_STATUS_CFM)
+        super().__init__()
         self.session_id = session_id
         self.data = data
 
@@ -73,11 +86,12 @@ class FrameGetLimitationStatusConfirmation(FrameBase):
 class FrameGetLimitationStatusNotification(FrameBase):
     """Frame for notification of note information request."""
 
+    COMMAND = Command.GW_LIMITATION_STATUS_NTF
     PAYLOAD_LEN = 10
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_LIMITATION_STATUS_NTF)
+        super().__init__()
         self.session_id: int | None = None
         self.node_id = 0
         self.parameter_id = 0
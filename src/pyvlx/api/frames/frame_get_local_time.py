@@ -8,21 +8,23 @@ from .frame import FrameBase
 class FrameGetLocalTimeRequest(FrameBase):
     """Frame for requesting local time."""
 
+    COMMAND = Command.GW_GET_LOCAL_TIME_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_LOCAL_TIME_REQ)
+        super().__init__()
 
 
 class FrameGetLocalTimeConfirmation(FrameBase):
     """Frame for response for get local time requests."""
 
+    COMMAND = Command.GW_GET_LOCAL_TIME_CFM
     PAYLOAD_LEN = 15
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_LOCAL_TIME_CFM)
+        super().__init__()
         self.time = DtoLocalTime()
 
     def get_payload(self) -> bytes:
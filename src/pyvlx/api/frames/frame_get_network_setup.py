@@ -7,22 +7,24 @@ from .frame import FrameBase
 class FrameGetNetworkSetupRequest(FrameBase):
     """Frame for requesting network setup."""
 
+    COMMAND = Command.GW_GET_NETWORK_SETUP_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_NETWORK_SETUP_REQ)
+        super().__init__()
 
 
 class FrameGetNetworkSetupConfirmation(FrameBase):
     """Frame for confirmation for get network setup requests."""
 
+    COMMAND = Command.GW_GET_NETWORK_SETUP_CFM
     PAYLOAD_LEN = 13
 
     def __init__(self, ipaddress: bytes = bytes(4), netmask: bytes = bytes(4), gateway: bytes = bytes(4),
                  dhcp: DHCPParameter = DHCPParameter.DISABLE):
         """Init Frame."""
-        super().__init__(Command.GW_GET_NETWORK_SETUP_CFM)
+        super().__init__()
         self._ipaddress = ipaddress
         self._netmask = netmask
         self._gateway = gateway
@@ -48,7 +50,7 @@ class FrameGetNetworkSetupConfirmation(FrameBase):
         payload = self._ipaddress
         payload += self._netmask
         payload += self._gateway
-        payload += bytes(self.dhcp.value)
+        payload += bytes([self.dhcp.value])
         return payload
 
     def from_payload(self, payload: bytes) -> None:
@@ -1,5 +1,4 @@
 """Module for get node information from gateway."""
-import struct
 from datetime import datetime
 from enum import Enum
 
@@ -7,20 +6,21 @@ from pyvlx.const import (
     Command, NodeTypeWithSubtype, NodeVariation, OperatingState, Velocity)
 from pyvlx.exception import PyVLXException
 from pyvlx.parameter import Parameter
-from pyvlx.string_helper import bytes_to_string, string_to_bytes
 
 from .alias_array import AliasArray
 from .frame import FrameBase
+from .frame_get_all_nodes_information import NODE_INFORMATION_LAYOUT
 
 
 class FrameGetNodeInformationRequest(FrameBase):
     """Frame for get node information request."""
 
+    COMMAND = Command.GW_GET_NODE_INFORMATION_REQ
     PAYLOAD_LEN = 1
 
     def __init__(self, node_id: int | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_GET_NODE_INFORMATION_REQ)
+        super().__init__()
         self.node_id = node_id
 
     def get_payload(self) -> bytes:
@@ -49,11 +49,12 @@ class NodeInformationStatus(Enum):
 class FrameGetNodeInformationConfirmation(FrameBase):
     """Frame for confirmation for node information request."""
 
+    COMMAND = Command.GW_GET_NODE_INFORMATION_CFM
     PAYLOAD_LEN = 2
 
     def __init__(self, status: NodeInformationStatus = NodeInformationStatus.OK, node_id: int | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_GET_NODE_INFORMATION_CFM)
+        super().__init__()
         self.status = status
         self.node_id = node_id
 
@@ -75,11 +76,13 @@ class FrameGetNodeInformationConfirmation(FrameBase):
 class FrameGetNodeInformationNotification(FrameBase):
     """Frame for notification of node information request."""
 
+    COMMAND = Command.GW_GET_NODE_INFORMATION_NTF
     PAYLOAD_LEN = 124
+    LAYOUT = NODE_INFORMATION_LAYOUT
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_NODE_INFORMATION_NTF)
+        super().__init__()
         self.node_id = 0
         self.order = 0
         self.placement = 0
@@ -122,62 +125,6 @@ class FrameGetNodeInformationNotification(FrameBase):
         if len(self._serial_number) != 8:
             raise PyVLXException("could_not_parse_serial_number")
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        payload = bytes()
-        payload += bytes([self.node_id])
-        payload += bytes([self.order >> 8 & 255, self.order & 255])
-        payload += bytes([self.placement])
-        payload += bytes(string_to_bytes(self.name, 64))
-        payload += bytes([self.velocity.value])
-        payload += bytes([self.node_type.value >> 8 & 255, self.node_type.value & 255])
-        payload += bytes([self.product_group])
-        payload += bytes([self.product_type])
-        payload += bytes([self.node_variation.value])
-        payload += bytes([self.power_mode])
-        payload += bytes(
-            [self.build_number]
-        )  # <-- hey @VELUX: your documentation is wrong here
-        payload += bytes(self._serial_number)
-        payload += bytes([self.state.value])
-        payload += bytes(self.current_position.raw)
-        payload += bytes(self.target.raw)
-        payload += bytes(self.current_position_fp1.raw)
-        payload += bytes(self.current_position_fp2.raw)
-        payload += bytes(self.current_position_fp3.raw)
-        payload += bytes(self.current_position_fp4.raw)
-        payload += bytes([self.remaining_time >> 8 & 255, self.remaining_time & 255])
-        payload += struct.pack(">I", self.timestamp)
-        payload += bytes(self.alias_array)
-        return payload
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.node_id = payload[0]
-        self.order = payload[1] * 256 + payload[2]
-        self.placement = payload[3]
-        self.name = bytes_to_string(payload[4:68])
-        self.velocity = Velocity(payload[68])
-        self.node_type = NodeTypeWithSubtype(payload[69] * 256 + payload[70])
-        self.product_group = payload[71]
-        self.product_type = payload[72]
-        self.node_variation = NodeVariation(payload[73])
-        self.power_mode = payload[74]
-        self.build_number = payload[
-            75
-        ]  # <-- hey @VELUX: your documentation is wrong here
-        self._serial_number = payload[76:84]
-        self.state = OperatingState(payload[84])
-        self.current_position = Parameter(payload[85:87])
-        self.target = Parameter(payload[87:89])
-        self.current_position_fp1 = Parameter(payload[89:91])
-        self.current_position_fp2 = Parameter(payload[91:93])
-        self.current_position_fp3 = Parameter(payload[93:95])
-        self.current_position_fp4 = Parameter(payload[95:97])
-        self.remaining_time = payload[97] * 256 + payload[98]
-        self.timestamp = struct.unpack(">I", payload[99:103])[0]
-        self.alias_array = AliasArray(payload[103:125])
-
     @property
     def timestamp_formatted(self) -> str:
         """Return time as human readable string."""
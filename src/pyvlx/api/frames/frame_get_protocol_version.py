@@ -7,21 +7,23 @@ from .frame import FrameBase
 class FrameGetProtocolVersionRequest(FrameBase):
     """Frame for requesting protocol version."""
 
+    COMMAND = Command.GW_GET_PROTOCOL_VERSION_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_PROTOCOL_VERSION_REQ)
+        super().__init__()
 
 
 class FrameGetProtocolVersionConfirmation(FrameBase):
     """Frame for response for get protocol version requests."""
 
+    COMMAND = Command.GW_GET_PROTOCOL_VERSION_CFM
     PAYLOAD_LEN = 4
 
     def __init__(self, major_version: int = 0, minor_version: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_GET_PROTOCOL_VERSION_CFM)
+        super().__init__()
         self.major_version = major_version
         self.minor_version = minor_version
 
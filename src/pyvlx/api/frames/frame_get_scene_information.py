@@ -0,0 +1,120 @@
+"""Module for get scene information frames."""
+from enum import Enum
+from typing import List, Tuple
+
+from pyvlx.const import ChangeType, Command, NodeParameter
+from pyvlx.exception import PyVLXException
+from pyvlx.parameter import Parameter
+from pyvlx.string_helper import bytes_to_string, string_to_bytes
+
+from .frame import FrameBase
+from .frame_layout import FrameLayout, enum8, uint8
+
+SceneNode = Tuple[int, NodeParameter, Parameter]
+
+
+class FrameGetSceneInformationRequest(FrameBase):
+    """Frame for get scene information request."""
+
+    COMMAND = Command.GW_GET_SCENE_INFORMATION_REQ
+    PAYLOAD_LEN = 1
+    LAYOUT = FrameLayout(uint8("scene_id"))
+
+    def __init__(self, scene_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.scene_id = scene_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} scene_id="{self.scene_id}"/>'
+
+
+class SceneInformationStatus(Enum):
+    """Enum for status of get scene information confirmation."""
+
+    OK = 0
+    ERROR_INVALID_SCENE_ID = 1
+
+
+class FrameGetSceneInformationConfirmation(FrameBase):
+    """Frame for get scene information confirmation."""
+
+    COMMAND = Command.GW_GET_SCENE_INFORMATION_CFM
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(enum8("status", SceneInformationStatus), uint8("scene_id"))
+
+    def __init__(self, status: SceneInformationStatus = SceneInformationStatus.OK, scene_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.status = status
+        self.scene_id = scene_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} status="{self.status}" scene_id="{self.scene_id}"/>'
+
+
+class FrameGetSceneInformationNotification(FrameBase):
+    """Frame for scene information notification.
+
+    The nodes of a scene are listed as node id, parameter id and parameter
+    value. Scenes with many nodes are split into several notifications.
+    """
+
+    COMMAND = Command.GW_GET_SCENE_INFORMATION_NTF
+    NODE_SIZE = 4
+
+    def __init__(self, scene_id: int = 0, name: str = "", nodes: List[SceneNode] | None = None, remaining_nodes: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.scene_id = scene_id
+        self.name = name
+        self.nodes: List[SceneNode] = nodes if nodes is not None else []
+        self.remaining_nodes = remaining_nodes
+
+    def get_payload(self) -> bytes:
+        """Return Payload."""
+        ret = bytes([self.scene_id]) + string_to_bytes(self.name, 64) + bytes([len(self.nodes)])
+        for node_id, node_parameter, parameter in self.nodes:
+            ret += bytes([node_id, node_parameter.value]) + bytes(parameter)
+        ret += bytes([self.remaining_nodes])
+        return ret
+
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        number_of_nodes = payload[65]
+        if len(payload) != 67 + number_of_nodes * self.NODE_SIZE:
+            raise PyVLXException("scene_information_notification_wrong_length", length=len(payload))
+        self.scene_id = payload[0]
+        self.name = bytes_to_string(payload[1:65])
+        self.nodes = []
+        for offset in range(66, 66 + number_of_nodes * self.NODE_SIZE, self.NODE_SIZE):
+            self.nodes.append((payload[offset], NodeParameter(payload[offset + 1]), Parameter(payload[offset + 2:offset + 4])))
+        self.remaining_nodes = payload[-1]
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        nodes = ", ".join(f"{node_id}/{node_parameter.name}: {parameter}" for node_id, node_parameter, parameter in self.nodes)
+        return (
+            f'<{type(self).__name__} scene_id="{self.scene_id}" name="{self.name}" '
+            f'nodes="{nodes}" remaining_nodes="{self.remaining_nodes}"/>'
+        )
+
+
+class FrameSceneInformationChangedNotification(FrameBase):
+    """Frame for notification of a modified or deleted scene."""
+
+    COMMAND = Command.GW_SCENE_INFORMATION_CHANGED_NTF
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(enum8("change_type", ChangeType), uint8("scene_id"))
+
+    def __init__(self, change_type: ChangeType = ChangeType.MODIFIED, scene_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.change_type = change_type
+        self.scene_id = scene_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} change_type="{self.change_type}" scene_id="{self.scene_id}"/>'
@@ -11,21 +11,23 @@ from .frame import FrameBase
 class FrameGetSceneListRequest(FrameBase):
     """Frame for get scene list request."""
 
+    COMMAND = Command.GW_GET_SCENE_LIST_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_SCENE_LIST_REQ)
+        super().__init__()
 
 
 class FrameGetSceneListConfirmation(FrameBase):
     """Frame for confirmation for scene list request."""
 
+    COMMAND = Command.GW_GET_SCENE_LIST_CFM
     PAYLOAD_LEN = 1
 
     def __init__(self, count_scenes: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_GET_SCENE_LIST_CFM)
+        super().__init__()
         self.count_scenes = count_scenes
 
     def get_payload(self) -> bytes:
@@ -44,9 +46,11 @@ class FrameGetSceneListConfirmation(FrameBase):
 class FrameGetSceneListNotification(FrameBase):
     """Frame for scene list notification."""
 
+    COMMAND = Command.GW_GET_SCENE_LIST_NTF
+
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_SCENE_LIST_NTF)
+        super().__init__()
         self.scenes: List[Tuple[int, str]] = []
         self.remaining_scenes = 0
 
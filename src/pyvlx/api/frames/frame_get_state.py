@@ -7,16 +7,18 @@ from .frame import FrameBase
 class FrameGetStateRequest(FrameBase):
     """Frame for requesting state."""
 
+    COMMAND = Command.GW_GET_STATE_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_STATE_REQ)
+        super().__init__()
 
 
 class FrameGetStateConfirmation(FrameBase):
     """Frame for confirmation for get state requests."""
 
+    COMMAND = Command.GW_GET_STATE_CFM
     PAYLOAD_LEN = 6
 
     def __init__(
@@ -25,7 +27,7 @@ class FrameGetStateConfirmation(FrameBase):
             gateway_sub_state: GatewaySubState = GatewaySubState.IDLE,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_GET_STATE_CFM)
+        super().__init__()
         self.gateway_state = gateway_state
         self.gateway_sub_state = gateway_sub_state
 
@@ -0,0 +1,131 @@
+"""Module for get system table data frames."""
+from typing import List
+
+from pyvlx.const import Command, NodeTypeWithSubtype
+from pyvlx.exception import PyVLXException
+
+from .frame import FrameBase
+from .frame_layout import FrameLayout, enum16, uint8, uint24
+
+
+class SystemTableEntry:
+    """Class for an actuator within the system table of the gateway."""
+
+    LAYOUT = FrameLayout(
+        uint8("node_id"),
+        uint24("address"),
+        enum16("node_type", NodeTypeWithSubtype),
+        uint8("flags"),
+        uint8("manufacturer_id"),
+        uint24("backbone_reference_number"),
+    )
+
+    def __init__(
+        self,
+        node_id: int = 0,
+        address: int = 0,
+        node_type: NodeTypeWithSubtype = NodeTypeWithSubtype.NO_TYPE,
+        flags: int = 0,
+        manufacturer_id: int = 0,
+        backbone_reference_number: int = 0,
+    ):
+        """Initialize SystemTableEntry."""
+        self.node_id = node_id
+        self.address = address
+        self.node_type = node_type
+        self.flags = flags
+        self.manufacturer_id = manufacturer_id
+        self.backbone_reference_number = backbone_reference_number
+
+    @property
+    def power_mode(self) -> int:
+        """Return power save mode, stored within bit 0 and 1 of flags."""
+        return self.flags & 0x03
+
+    @property
+    def io_membership(self) -> bool:
+        """Return True if the actuator is an io-homecontrol member."""
+        return bool(self.flags & 0x04)
+
+    @property
+    def rf_support(self) -> bool:
+        """Return True if the actuator supports RF."""
+        return bool(self.flags & 0x08)
+
+    @property
+    def turnaround_time(self) -> int:
+        """Return actuator turnaround time, stored within bit 6 and 7 of flags."""
+        return self.flags >> 6
+
+    def __eq__(self, other: object) -> bool:
+        """Equal operator."""
+        return isinstance(other, SystemTableEntry) and self.__dict__ == other.__dict__
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return (
+            f'<{type(self).__name__} node_id="{self.node_id}" address="{self.address:06x}" '
+            f'node_type="{self.node_type}" power_mode="{self.power_mode}" manufacturer_id="{self.manufacturer_id}"/>'
+        )
+
+
+class FrameGetSystemTableDataRequest(FrameBase):
+    """Frame for get system table data request."""
+
+    COMMAND = Command.GW_CS_GET_SYSTEMTABLE_DATA_REQ
+    PAYLOAD_LEN = 0
+
+    def __init__(self) -> None:
+        """Init Frame."""
+        super().__init__()
+
+
+class FrameGetSystemTableDataConfirmation(FrameBase):
+    """Frame for get system table data confirmation."""
+
+    COMMAND = Command.GW_CS_GET_SYSTEMTABLE_DATA_CFM
+    PAYLOAD_LEN = 0
+
+    def __init__(self) -> None:
+        """Init Frame."""
+        super().__init__()
+
+
+class FrameGetSystemTableDataNotification(FrameBase):
+    """Frame for system table data notification, the system table may be split into several notifications."""
+
+    COMMAND = Command.GW_CS_GET_SYSTEMTABLE_DATA_NTF
+    ENTRY_SIZE = SystemTableEntry.LAYOUT.size
+
+    def __init__(self, entries: List[SystemTableEntry] | None = None, remaining_entries: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.entries = entries if entries is not None else []
+        self.remaining_entries = remaining_entries
+
+    def get_payload(self) -> bytes:
+        """Return Payload."""
+        return b"".join([
+            bytes([len(self.entries)]),
+            *(SystemTableEntry.LAYOUT.pack(entry) for entry in self.entries),
+            bytes([self.remaining_entries]),
+        ])
+
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        number_of_entries = payload[0]
+        if len(payload) != number_of_entries * self.ENTRY_SIZE + 2:
+            raise PyVLXException("system_table_data_notification_wrong_length")
+        self.entries = []
+        for i in range(number_of_entries):
+            entry = SystemTableEntry()
+            SystemTableEntry.LAYOUT.unpack_into(entry, payload, offset=1 + i * self.ENTRY_SIZE)
+            self.entries.append(entry)
+        self.remaining_entries = payload[-1]
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return (
+            f'<{type(self).__name__} entries="[{", ".join(str(entry) for entry in self.entries)}]" '
+            f'remaining_entries="{self.remaining_entries}"/>'
+        )
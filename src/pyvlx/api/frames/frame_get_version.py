@@ -7,21 +7,23 @@ from .frame import FrameBase
 class FrameGetVersionRequest(FrameBase):
     """Frame for requesting version."""
 
+    COMMAND = Command.GW_GET_VERSION_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_GET_VERSION_REQ)
+        super().__init__()
 
 
 class FrameGetVersionConfirmation(FrameBase):
     """Frame for response for get version requests."""
 
+    COMMAND = Command.GW_GET_VERSION_CFM
     PAYLOAD_LEN = 9
 
     def __init__(self, software_version: bytes | str = bytes(6), hardware_version: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_GET_VERSION_CFM)
+        super().__init__()
         if isinstance(software_version, str):
             software_version = bytes(int(c) for c in software_version.split("."))
         self._software_version = software_version
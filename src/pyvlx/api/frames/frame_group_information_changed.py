@@ -0,0 +1,70 @@
+"""Module for group information changed and group deleted notifications."""
+from typing import List
+
+from pyvlx.const import ChangeType, Command, GroupType
+from pyvlx.exception import PyVLXException
+
+from .frame import FrameBase
+from .frame_get_group_information import (
+    GROUP_INFORMATION_LAYOUT, FrameGroupInformationBase)
+from .frame_layout import FrameLayout, uint8
+
+
+class FrameGroupInformationChangedNotification(FrameGroupInformationBase):
+    """Frame for notification of a modified or deleted group.
+
+    The group information is only included if the group was modified.
+    """
+
+    COMMAND = Command.GW_GROUP_INFORMATION_CHANGED_NTF
+
+    def __init__(
+        self,
+        change_type: ChangeType = ChangeType.MODIFIED,
+        group_id: int = 0,
+        name: str = "",
+        group_type: GroupType = GroupType.USER_GROUP,
+        node_ids: List[int] | None = None,
+    ):
+        """Init Frame."""
+        super().__init__(group_id=group_id, name=name, group_type=group_type, node_ids=node_ids)
+        self.change_type = change_type
+
+    def get_payload(self) -> bytes:
+        """Return Payload."""
+        if self.change_type == ChangeType.DELETED:
+            return bytes([self.change_type.value, self.group_id])
+        return bytes([self.change_type.value]) + GROUP_INFORMATION_LAYOUT.pack(self)
+
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        self.change_type = ChangeType(payload[0])
+        if self.change_type == ChangeType.DELETED:
+            self.group_id = payload[1]
+            return
+        if len(payload) != 1 + GROUP_INFORMATION_LAYOUT.size:
+            raise PyVLXException("group_information_changed_notification_wrong_length", length=len(payload))
+        GROUP_INFORMATION_LAYOUT.unpack_into(self, payload, offset=1)
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        if self.change_type == ChangeType.DELETED:
+            return f'<{type(self).__name__} change_type="{self.change_type}" group_id="{self.group_id}"/>'
+        return super().__str__()[:-2] + f' change_type="{self.change_type}"/>'
+
+
+class FrameGroupDeletedNotification(FrameBase):
+    """Frame for notification of a deleted group."""
+
+    COMMAND = Command.GW_GROUP_DELETED_NTF
+    PAYLOAD_LEN = 1
+    LAYOUT = FrameLayout(uint8("group_id"))
+
+    def __init__(self, group_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.group_id = group_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} group_id="{self.group_id}"/>'
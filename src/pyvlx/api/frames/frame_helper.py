@@ -13,8 +13,8 @@ def calc_crc(raw: bytes) -> int:
     return crc
 
 
-def extract_from_frame(data: bytes) -> Tuple[Command, bytes]:
-    """Extract payload and command from frame."""
+def extract_command_value_from_frame(data: bytes) -> Tuple[int, bytes]:
+    """Extract payload and raw command value from frame."""
     if len(data) <= 4:
         raise PyVLXException("could_not_extract_from_frame_too_short", data=data)
     length = data[0] * 256 + data[1] - 1
@@ -32,9 +32,14 @@ def extract_from_frame(data: bytes) -> Tuple[Command, bytes]:
             expected_crc=calc_crc(data[:-1]),
             current_crc=data[-1],
         )
-    payload = data[4:-1]
+    return data[2] * 256 + data[3], data[4:-1]
+
+
+def extract_from_frame(data: bytes) -> Tuple[Command, bytes]:
+    """Extract payload and command from frame."""
+    command_value, payload = extract_command_value_from_frame(data)
     try:
-        command = Command(data[2] * 256 + data[3])
+        command = Command(command_value)
     except ValueError as type_error:
         raise PyVLXException("could_not_extract_from_frame_command", data=data) from type_error
     return command, payload
@@ -7,8 +7,9 @@ from .frame import FrameBase
 class FrameHouseStatusMonitorDisableConfirmation(FrameBase):
     """Frame for requesting enabling the house status monitor."""
 
+    COMMAND = Command.GW_HOUSE_STATUS_MONITOR_DISABLE_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_HOUSE_STATUS_MONITOR_DISABLE_CFM)
+        super().__init__()
@@ -7,8 +7,9 @@ from .frame import FrameBase
 class FrameHouseStatusMonitorEnableConfirmation(FrameBase):
     """Frame for confirmation for enabling the house status monitor."""
 
+    COMMAND = Command.GW_HOUSE_STATUS_MONITOR_ENABLE_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_HOUSE_STATUS_MONITOR_ENABLE_CFM)
+        super().__init__()
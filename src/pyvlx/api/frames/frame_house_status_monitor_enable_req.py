@@ -7,8 +7,9 @@ from .frame import FrameBase
 class FrameHouseStatusMonitorEnableRequest(FrameBase):
     """Frame for requesting enabling the house status monitor."""
 
+    COMMAND = Command.GW_HOUSE_STATUS_MONITOR_ENABLE_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_HOUSE_STATUS_MONITOR_ENABLE_REQ)
+        super().__init__()
@@ -0,0 +1,207 @@
+"""Module for declarative payload layouts of frames.
+
+A FrameLayout lists the fields of a fixed size payload in wire order. It is
+compiled into a single big endian struct.Struct when the frame module is
+imported, so encoding and decoding a payload is one pack() or unpack_from()
+call plus the conversion of the values into the attributes of the frame.
+"""
+import struct
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from pyvlx.const import NodeParameter
+from pyvlx.exception import PyVLXException
+from pyvlx.parameter import Parameter
+from pyvlx.string_helper import bytes_to_string, string_to_bytes
+
+Converter = Callable[[Any], Any]
+
+
+class Field:
+    """Field of a payload layout.
+
+    A field occupies exactly one item of the struct format fmt, or none for
+    padding. encode converts the attribute of the frame to the struct item,
+    decode converts the unpacked struct item back. Without converters the
+    attribute is packed as it is. Fields whose decode may reject a payload,
+    e.g. unknown enum values, set strict so they are checked right away even
+    if the frame is decoded lazily.
+    """
+
+    __slots__ = ("name", "fmt", "encode", "decode", "strict")
+
+    def __init__(
+            self, name: str | None, fmt: str, encode: Converter | None = None, decode: Converter | None = None, strict: bool = False
+    ):
+        """Initialize Field."""
+        self.name = name
+        self.fmt = fmt
+        self.encode = encode
+        self.decode = decode
+        self.strict = strict
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} name="{self.name}" fmt="{self.fmt}"/>'
+
+
+class FrameLayout:
+    """Precompiled codec of a fixed size payload."""
+
+    def __init__(self, *fields: Field):
+        """Initialize FrameLayout and compile the struct of all fields."""
+        self.fields = fields
+        self.struct = struct.Struct(">" + "".join(field.fmt for field in fields))
+        self.size = self.struct.size
+        self._encoders = [(field.name, field.encode) for field in fields if field.name is not None]
+        self._decoders = [(field.name, field.decode) for field in fields if field.name is not None]
+        self._field_codecs: Dict[str, Tuple[struct.Struct, int, Converter | None]] = {}
+        offset = 0
+        for field in fields:
+            field_struct = struct.Struct(">" + field.fmt)
+            if field.name is not None:
+                self._field_codecs[field.name] = (field_struct, offset, field.decode)
+            offset += field_struct.size
+        self._strict_names = tuple(field.name for field in fields if field.name is not None and field.strict)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Return names of all fields carrying values."""
+        return tuple(self._field_codecs)
+
+    def pack(self, frame: object) -> bytes:
+        """Return payload of frame."""
+        return self.struct.pack(*[
+            getattr(frame, name) if encode is None else encode(getattr(frame, name))
+            for name, encode in self._encoders
+        ])
+
+    def unpack_into(self, frame: object, payload: bytes | memoryview, offset: int = 0) -> None:
+        """Set attributes of frame from payload, payload may be any buffer like a memoryview."""
+        for (name, decode), value in zip(self._decoders, self.struct.unpack_from(payload, offset)):
+            setattr(frame, name, value if decode is None else decode(value))
+
+    def unpack_field(self, name: str, payload: bytes | memoryview) -> Any:
+        """Decode and return the single field name from payload, raise KeyError for unknown fields."""
+        field_struct, offset, decode = self._field_codecs[name]
+        value = field_struct.unpack_from(payload, offset)[0]
+        return value if decode is None else decode(value)
+
+    def check(self, payload: bytes | memoryview) -> None:
+        """Decode strict fields of payload, raising the errors of their decoders, other fields are not decoded."""
+        for name in self._strict_names:
+            self.unpack_field(name, payload)
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} format="{self.struct.format}" size="{self.size}"/>'
+
+
+def _enum_value(member: Enum) -> Any:
+    """Return value of enum member."""
+    return member.value
+
+
+def uint8(name: str) -> Field:
+    """Return field for an unsigned 8 bit integer."""
+    return Field(name, "B")
+
+
+def uint16(name: str) -> Field:
+    """Return field for an unsigned 16 bit integer."""
+    return Field(name, "H")
+
+
+def uint24(name: str) -> Field:
+    """Return field for an unsigned 24 bit integer."""
+    return Field(name, "3s", encode=lambda value: value.to_bytes(3, "big"), decode=lambda raw: int.from_bytes(raw, "big"))
+
+
+def uint32(name: str) -> Field:
+    """Return field for an unsigned 32 bit integer."""
+    return Field(name, "I")
+
+
+def enum8(name: str, enum: Type[Enum]) -> Field:
+    """Return field for an enum stored within 8 bits."""
+    return Field(name, "B", encode=_enum_value, decode=enum, strict=True)
+
+
+def enum16(name: str, enum: Type[Enum]) -> Field:
+    """Return field for an enum stored within 16 bits."""
+    return Field(name, "H", encode=_enum_value, decode=enum, strict=True)
+
+
+def param(name: str) -> Field:
+    """Return field for a Parameter."""
+    return Field(name, "2s", encode=bytes, decode=Parameter)
+
+
+def raw_bytes(name: str, size: int) -> Field:
+    """Return field for raw bytes, shorter values are padded with zeros."""
+    return Field(name, f"{size}s")
+
+
+def string(name: str, size: int) -> Field:
+    """Return field for a zero padded utf-8 string."""
+    return Field(name, f"{size}s", encode=lambda value: string_to_bytes(value, size), decode=bytes_to_string)
+
+
+def padding(size: int) -> Field:
+    """Return field for reserved bytes, written as zeros and ignored when reading."""
+    return Field(None, f"{size}x")
+
+
+def node_array(name: str, max_count: int, error: str) -> Field:
+    """Return field for a list of node ids, stored as count followed by a zero padded array.
+
+    PyVLXException(error) is raised if the list exceeds max_count entries.
+    """
+
+    def encode(node_ids: List[int]) -> bytes:
+        if len(node_ids) > max_count:
+            raise PyVLXException(error, node_ids=node_ids)
+        return bytes([len(node_ids)]) + bytes(node_ids)
+
+    def decode(raw: bytes) -> List[int]:
+        if raw[0] > max_count:
+            raise PyVLXException(error, count=raw[0])
+        return list(raw[1:1 + raw[0]])
+
+    return Field(name, f"{max_count + 1}s", encode=encode, decode=decode, strict=True)
+
+
+def node_bitmap(name: str, size: int, counted: bool = False) -> Field:
+    """Return field for a set of node ids, stored as bitmap of size bytes with bit 0 of the first byte for node 0.
+
+    If counted is set, the bitmap is preceded by the number of node ids.
+    """
+    prefix = 1 if counted else 0
+
+    def encode(node_ids: List[int]) -> bytes:
+        bitmap = bytearray(prefix + size)
+        for node_id in node_ids:
+            bitmap[prefix + (node_id >> 3)] |= 1 << (node_id & 7)
+        if counted:
+            bitmap[0] = len(node_ids)
+        return bytes(bitmap)
+
+    def decode(raw: bytes) -> List[int]:
+        return [index * 8 + bit for index, byte in enumerate(raw[prefix:]) for bit in range(8) if byte >> bit & 1]
+
+    return Field(name, f"{prefix + size}s", encode=encode, decode=decode)
+
+
+def functional_parameters(name: str, node_parameters: Tuple[NodeParameter, ...]) -> Field:
+    """Return field for a dict of functional parameters, stored in the given order."""
+
+    def encode(values: Dict[NodeParameter, Parameter]) -> bytes:
+        return b"".join(bytes(values[node_parameter]) for node_parameter in node_parameters)
+
+    def decode(raw: bytes) -> Dict[NodeParameter, Parameter]:
+        return {
+            node_parameter: Parameter(raw[index * 2:index * 2 + 2])
+            for index, node_parameter in enumerate(node_parameters)
+        }
+
+    return Field(name, f"{len(node_parameters) * 2}s", encode=encode, decode=decode)
@@ -7,11 +7,12 @@ from .frame import FrameBase
 class FrameLeaveLearnStateRequest(FrameBase):
     """Frame for leaving learn state request."""
 
+    COMMAND = Command.GW_LEAVE_LEARN_STATE_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_LEAVE_LEARN_STATE_REQ)
+        super().__init__()
 
     def __str__(self) -> str:
         """Return human readable string."""
@@ -21,11 +22,12 @@ class FrameLeaveLearnStateRequest(FrameBase):
 class FrameLeaveLearnStateConfirmation(FrameBase):
     """Frame for confirmation for leaving learn State."""
 
+    COMMAND = Command.GW_LEAVE_LEARN_STATE_CFM
     PAYLOAD_LEN = 1
 
     def __init__(self, status: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_LEAVE_LEARN_STATE_CFM)
+        super().__init__()
         self.status = LeaveLearnStateConfirmationStatus(status)
 
     def get_payload(self) -> bytes:
@@ -0,0 +1,51 @@
+"""Module for new group frames."""
+from enum import Enum
+from typing import List
+
+from pyvlx.const import Command, GroupType
+
+from .frame import FrameBase
+from .frame_get_group_information import (
+    GROUP_INFORMATION_FIELDS, FrameGroupInformationBase)
+from .frame_layout import FrameLayout, enum8, uint8
+
+
+class FrameNewGroupRequest(FrameGroupInformationBase):
+    """Frame for request to create a group, the gateway assigns the group id."""
+
+    COMMAND = Command.GW_NEW_GROUP_REQ
+    PAYLOAD_LEN = 98
+    LAYOUT = FrameLayout(*GROUP_INFORMATION_FIELDS)
+
+    def __init__(self, name: str = "", group_type: GroupType = GroupType.USER_GROUP, node_ids: List[int] | None = None):
+        """Init Frame."""
+        super().__init__(name=name, group_type=group_type, node_ids=node_ids)
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} name="{self.name}" group_type="{self.group_type}" node_ids="{self.node_ids}"/>'
+
+
+class NewGroupConfirmationStatus(Enum):
+    """Enum for status of new group confirmation."""
+
+    OK = 0
+    ERROR_REQUEST_FAILED = 1
+
+
+class FrameNewGroupConfirmation(FrameBase):
+    """Frame for new group confirmation."""
+
+    COMMAND = Command.GW_NEW_GROUP_CFM
+    PAYLOAD_LEN = 2
+    LAYOUT = FrameLayout(enum8("status", NewGroupConfirmationStatus), uint8("group_id"))
+
+    def __init__(self, status: NewGroupConfirmationStatus = NewGroupConfirmationStatus.OK, group_id: int = 0):
+        """Init Frame."""
+        super().__init__()
+        self.status = status
+        self.group_id = group_id
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} status="{self.status}" group_id="{self.group_id}"/>'
@@ -9,6 +9,7 @@ from .frame import FrameBase
 class FrameNodeInformationChangedNotification(FrameBase):
     """Frame for notification for set node name."""
 
+    COMMAND = Command.GW_NODE_INFORMATION_CHANGED_NTF
     PAYLOAD_LEN = 69
 
     def __init__(
@@ -20,7 +21,7 @@ class FrameNodeInformationChangedNotification(FrameBase):
             node_variation: NodeVariation = NodeVariation.NOT_SET,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_NODE_INFORMATION_CHANGED_NTF)
+        super().__init__()
         self.node_id = node_id
         self.name = name
         self.order = order
@@ -1,21 +1,36 @@
 """Module for get node information from gateway."""
-import struct
 from datetime import datetime
 
 from pyvlx.const import Command, OperatingState
 from pyvlx.parameter import Parameter
 
 from .frame import FrameBase
+from .frame_layout import FrameLayout, enum8, param, uint8, uint16, uint32
 
 
 class FrameNodeStatePositionChangedNotification(FrameBase):
     """Frame for notification of note information request."""
 
+    COMMAND = Command.GW_NODE_STATE_POSITION_CHANGED_NTF
     PAYLOAD_LEN = 20
+    LAYOUT = FrameLayout(
+        uint8("node_id"),
+        enum8("state", OperatingState),
+        param("current_position"),
+        param("target"),
+        param("current_position_fp1"),
+        param("current_position_fp2"),
+        param("current_position_fp3"),
+        param("current_position_fp4"),
+        uint16("remaining_time"),
+        # @VELUX: looks like your timestamp is wrong. Looks like
+        # you are only transmitting the two lower bytes.
+        uint32("timestamp"),
+    )
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_NODE_STATE_POSITION_CHANGED_NTF)
+        super().__init__()
         self.node_id = 0
         self.state: OperatingState = OperatingState.NON_EXECUTING
         self.current_position = Parameter()
@@ -27,35 +42,6 @@ class FrameNodeStatePositionChangedNotification(FrameBase):
         self.remaining_time = 0
         self.timestamp = 0
 
-    def get_payload(self) -> bytes:
-        """Return Payload."""
-        payload = bytes([self.node_id])
-        payload += bytes([self.state.value])
-        payload += bytes(self.current_position.raw)
-        payload += bytes(self.target.raw)
-        payload += bytes(self.current_position_fp1.raw)
-        payload += bytes(self.current_position_fp2.raw)
-        payload += bytes(self.current_position_fp3.raw)
-        payload += bytes(self.current_position_fp4.raw)
-        payload += bytes([self.remaining_time >> 8 & 255, self.remaining_time & 255])
-        payload += struct.pack(">I", self.timestamp)
-        return payload
-
-    def from_payload(self, payload: bytes) -> None:
-        """Init frame from binary data."""
-        self.node_id = payload[0]
-        self.state = OperatingState(payload[1])
-        self.current_position = Parameter(payload[2:4])
-        self.target = Parameter(payload[4:6])
-        self.current_position_fp1 = Parameter(payload[6:8])
-        self.current_position_fp2 = Parameter(payload[8:10])
-        self.current_position_fp3 = Parameter(payload[10:12])
-        self.current_position_fp4 = Parameter(payload[12:14])
-        self.remaining_time = payload[14] * 256 + payload[15]
-        # @VELUX: looks like your timestamp is wrong. Looks like
-        # you are only transmitting the two lower bytes.
-        self.timestamp = struct.unpack(">I", payload[16:20])[0]
-
     @property
     def timestamp_formatted(self) -> str:
         """Return time as human readable string."""
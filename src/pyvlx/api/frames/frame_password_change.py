@@ -11,12 +11,13 @@ from .frame import FrameBase
 class FramePasswordChangeRequest(FrameBase):
     """Frame for sending password enter request."""
 
+    COMMAND = Command.GW_PASSWORD_CHANGE_REQ
     MAX_SIZE = 32
     PAYLOAD_LEN = 64
 
     def __init__(self, currentpassword: str | None = None, newpassword: str | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_PASSWORD_CHANGE_REQ)
+        super().__init__()
         self.currentpassword = currentpassword
         self.newpassword = newpassword
 
@@ -60,11 +61,12 @@ class PasswordChangeConfirmationStatus(Enum):
 class FramePasswordChangeConfirmation(FrameBase):
     """Frame for confirmation for sent password."""
 
+    COMMAND = Command.GW_PASSWORD_CHANGE_CFM
     PAYLOAD_LEN = 1
 
     def __init__(self, status: PasswordChangeConfirmationStatus = PasswordChangeConfirmationStatus.SUCCESSFUL):
         """Init Frame."""
-        super().__init__(Command.GW_PASSWORD_CHANGE_CFM)
+        super().__init__()
         self.status = status
 
     def get_payload(self) -> bytes:
@@ -83,12 +85,13 @@ class FramePasswordChangeConfirmation(FrameBase):
 class FramePasswordChangeNotification(FrameBase):
     """Frame for sending password changed notification request."""
 
+    COMMAND = Command.GW_PASSWORD_CHANGE_NTF
     MAX_SIZE = 32
     PAYLOAD_LEN = 32
 
     def __init__(self, newpassword: str | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_PASSWORD_CHANGE_NTF)
+        super().__init__()
         self.newpassword = newpassword
 
     def get_payload(self) -> bytes:
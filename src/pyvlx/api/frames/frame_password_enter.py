@@ -11,12 +11,13 @@ from .frame import FrameBase
 class FramePasswordEnterRequest(FrameBase):
     """Frame for sending password enter request."""
 
+    COMMAND = Command.GW_PASSWORD_ENTER_REQ
     MAX_SIZE = 32
     PAYLOAD_LEN = 32
 
     def __init__(self, password: str | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_PASSWORD_ENTER_REQ)
+        super().__init__()
         self.password = password
 
     def get_payload(self) -> bytes:
@@ -49,11 +50,12 @@ class PasswordEnterConfirmationStatus(Enum):
 class FramePasswordEnterConfirmation(FrameBase):
     """Frame for confirmation for sent password."""
 
+    COMMAND = Command.GW_PASSWORD_ENTER_CFM
     PAYLOAD_LEN = 1
 
     def __init__(self, status: PasswordEnterConfirmationStatus = PasswordEnterConfirmationStatus.SUCCESSFUL):
         """Init Frame."""
-        super().__init__(Command.GW_PASSWORD_ENTER_CFM)
+        super().__init__()
         self.status = status
 
     def get_payload(self) -> bytes:
@@ -7,11 +7,12 @@ from .frame import FrameBase
 class FrameGatewayRebootRequest(FrameBase):
     """Frame for requesting reboot."""
 
+    COMMAND = Command.GW_REBOOT_REQ
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_REBOOT_REQ)
+        super().__init__()
 
     def __str__(self) -> str:
         """Return human readable string."""
@@ -21,11 +22,12 @@ class FrameGatewayRebootRequest(FrameBase):
 class FrameGatewayRebootConfirmation(FrameBase):
     """Frame for response for reboot requests."""
 
+    COMMAND = Command.GW_REBOOT_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_REBOOT_CFM)
+        super().__init__()
 
     def __str__(self) -> str:
         """Return human readable string."""
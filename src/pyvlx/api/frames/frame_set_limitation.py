@@ -3,7 +3,8 @@
 from enum import Enum
 
 from pyvlx.const import Command, LimitationTime, Originator, Priority
-from pyvlx.parameter import Position
+from pyvlx.exception import PyVLXException
+from pyvlx.parameter import Parameter, Position
 
 from .frame import FrameBase
 
@@ -11,6 +12,7 @@ from .frame import FrameBase
 class FrameSetLimitationRequest(FrameBase):
     """Frame for setting limitation."""
 
+    COMMAND = Command.GW_SET_LIMITATION_REQ
     PAYLOAD_LEN = 31
 
     def __init__(self,
@@ -20,7 +22,7 @@ class FrameSetLimitationRequest(FrameBase):
                  limitation_value_max: Position | None = None,
                  limitation_time: LimitationTime | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_SET_LIMITATION_REQ)
+        super().__init__()
         self.session_id = session_id
         self.originator = Originator.USER
         self.priority = Priority.USER_LEVEL_2
@@ -50,6 +52,21 @@ class FrameSetLimitationRequest(FrameBase):
         ret += bytes([self.limitation_time.value])
         return ret
 
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        self.session_id = payload[0] * 256 + payload[1]
+        self.originator = Originator(payload[2])
+        self.priority = Priority(payload[3])
+        len_node_ids = payload[4]
+        if len_node_ids > 20:
+            raise PyVLXException("set_limitation_request_wrong_node_length")
+        self.node_ids = list(payload[5:5 + len_node_ids])
+        self.parameter_id = payload[25]
+        self.limitation_value_min = Position(Parameter(payload[26:28]))
+        self.limitation_value_max = Position(Parameter(payload[28:30]))
+        # Limitation times other than the special values are not modelled by LimitationTime
+        self.limitation_time = next((time for time in LimitationTime if time.value == payload[30]), None)
+
     def __str__(self) -> str:
         """Return human readable string."""
         return f'<{type(self).__name__} node_ids="{self.node_ids}" ' \
@@ -69,11 +86,12 @@ class SetLimitationRequestStatus(Enum):
 class FrameSetLimitationConfirmation(FrameBase):
     """Frame for response for set limitation requests."""
 
+    COMMAND = Command.GW_SET_LIMITATION_CFM
     PAYLOAD_LEN = 3
 
     def __init__(self, session_id: int | None = None, status: SetLimitationRequestStatus | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_SET_LIMITATION_CFM)
+        super().__init__()
         self.session_id = session_id
         self.status = status
 
@@ -10,11 +10,12 @@ from .frame import FrameBase
 class FrameSetNodeNameRequest(FrameBase):
     """Frame for requesting node name change."""
 
+    COMMAND = Command.GW_SET_NODE_NAME_REQ
     PAYLOAD_LEN = 65
 
     def __init__(self, node_id: int = 0, name: str | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_SET_NODE_NAME_REQ)
+        super().__init__()
         self.node_id = node_id
         self.name = name
 
@@ -46,11 +47,12 @@ class SetNodeNameConfirmationStatus(Enum):
 class FrameSetNodeNameConfirmation(FrameBase):
     """Frame for confirmation for set node name."""
 
+    COMMAND = Command.GW_SET_NODE_NAME_CFM
     PAYLOAD_LEN = 2
 
     def __init__(self, status: SetNodeNameConfirmationStatus = SetNodeNameConfirmationStatus.OK, node_id: int = 0):
         """Init Frame."""
-        super().__init__(Command.GW_SET_NODE_NAME_CFM)
+        super().__init__()
         self.status = status
         self.node_id = node_id
 
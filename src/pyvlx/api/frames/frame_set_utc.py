@@ -10,21 +10,23 @@ from .frame import FrameBase
 class FrameSetUTCConfirmation(FrameBase):
     """Frame for confirmation for setting UTC time."""
 
+    COMMAND = Command.GW_SET_UTC_CFM
     PAYLOAD_LEN = 0
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_SET_UTC_CFM)
+        super().__init__()
 
 
 class FrameSetUTCRequest(FrameBase):
     """Frame for command for setting UTC time."""
 
+    COMMAND = Command.GW_SET_UTC_REQ
     PAYLOAD_LEN = 4
 
     def __init__(self, timestamp: float = 0):
         """Init Frame."""
-        super().__init__(Command.GW_SET_UTC_REQ)
+        super().__init__()
         self.timestamp = timestamp
 
     @property
@@ -13,11 +13,12 @@ from .frame import FrameBase
 class FrameStatusRequestRequest(FrameBase):
     """Frame for status request request."""
 
+    COMMAND = Command.GW_STATUS_REQUEST_REQ
     PAYLOAD_LEN = 26
 
     def __init__(self, session_id: int | None = None, node_ids: List[int] | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_STATUS_REQUEST_REQ)
+        super().__init__()
         self.session_id = session_id
         self.node_ids = node_ids if node_ids is not None else []
         self.status_type = StatusType.REQUEST_CURRENT_POSITION
@@ -67,11 +68,12 @@ class StatusRequestStatus(Enum):
 class FrameStatusRequestConfirmation(FrameBase):
     """Frame for confirmation for status request request."""
 
+    COMMAND = Command.GW_STATUS_REQUEST_CFM
     PAYLOAD_LEN = 3
 
     def __init__(self, session_id: int | None = None, status: StatusRequestStatus | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_STATUS_REQUEST_CFM)
+        super().__init__()
         self.session_id = session_id
         self.status = status
 
@@ -96,12 +98,13 @@ class FrameStatusRequestConfirmation(FrameBase):
 class FrameStatusRequestNotification(FrameBase):
     """Frame for notification of status request request."""
 
+    COMMAND = Command.GW_STATUS_REQUEST_NTF
     # PAYLOAD_LEN = 59
     # No PAYLOAD_LEN because it is variable depending on StatusType
 
     def __init__(self) -> None:
         """Init Frame."""
-        super().__init__(Command.GW_STATUS_REQUEST_NTF)
+        super().__init__()
         self.session_id = 0
         self.status_id = 0
         self.node_id = 0
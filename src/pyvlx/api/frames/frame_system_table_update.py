@@ -0,0 +1,31 @@
+"""Module for system table update notification."""
+from typing import List
+
+from pyvlx.const import Command
+
+from .frame import FrameBase
+from .frame_layout import FrameLayout, node_bitmap
+
+
+class FrameSystemTableUpdateNotification(FrameBase):
+    """Frame for notification of nodes added to or removed from the system table."""
+
+    COMMAND = Command.GW_CS_SYSTEM_TABLE_UPDATE_NTF
+    PAYLOAD_LEN = 52
+    LAYOUT = FrameLayout(
+        node_bitmap("added_node_ids", 26),
+        node_bitmap("removed_node_ids", 26),
+    )
+
+    def __init__(self, added_node_ids: List[int] | None = None, removed_node_ids: List[int] | None = None):
+        """Init Frame."""
+        super().__init__()
+        self.added_node_ids = added_node_ids if added_node_ids is not None else []
+        self.removed_node_ids = removed_node_ids if removed_node_ids is not None else []
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return (
+            f'<{type(self).__name__} added_node_ids="{self.added_node_ids}" '
+            f'removed_node_ids="{self.removed_node_ids}"/>'
+        )
@@ -11,6 +11,7 @@ from .frame import FrameBase
 class FrameWinkSendRequest(FrameBase):
     """Frame for sending wink request."""
 
+    COMMAND = Command.GW_WINK_SEND_REQ
     PAYLOAD_LEN = 27
 
     def __init__(
@@ -22,7 +23,7 @@ class FrameWinkSendRequest(FrameBase):
             priority: Priority = Priority.USER_LEVEL_2,
     ):
         """Init Frame."""
-        super().__init__(Command.GW_WINK_SEND_REQ)
+        super().__init__()
         self.node_ids = node_ids if node_ids is not None else []
         self.wink_time = wink_time
         self.session_id = session_id
@@ -78,11 +79,12 @@ class WinkSendConfirmationStatus(Enum):
 class FrameWinkSendConfirmation(FrameBase):
     """Frame for confirmation of wink send frame."""
 
+    COMMAND = Command.GW_WINK_SEND_CFM
     PAYLOAD_LEN = 3
 
     def __init__(self, session_id: int | None = None, status: WinkSendConfirmationStatus | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_WINK_SEND_CFM)
+        super().__init__()
         self.session_id = session_id
         self.status = status
 
@@ -107,11 +109,12 @@ class FrameWinkSendConfirmation(FrameBase):
 class FrameWinkSendNotification(FrameBase):
     """Frame for notification of wink send frame."""
 
+    COMMAND = Command.GW_WINK_SEND_NTF
     PAYLOAD_LEN = 2
 
     def __init__(self, session_id: int | None = None):
         """Init Frame."""
-        super().__init__(Command.GW_WINK_SEND_NTF)
+        super().__init__()
         self.session_id = session_id
 
     def get_payload(self) -> bytes:
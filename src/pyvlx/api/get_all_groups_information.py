@@ -0,0 +1,58 @@
+"""Module for retrieving the information of all groups from API."""
+from typing import TYPE_CHECKING, List
+
+from pyvlx.const import GroupType
+from pyvlx.log import PYVLXLOG
+
+from .api_dispatcher import RequestPriority
+from .api_event import ApiEvent
+from .frames import (
+    AllGroupsInformationStatus, FrameBase,
+    FrameGetAllGroupsInformationConfirmation,
+    FrameGetAllGroupsInformationFinishedNotification,
+    FrameGetAllGroupsInformationNotification,
+    FrameGetAllGroupsInformationRequest)
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class GetAllGroupsInformation(ApiEvent):
+    """Class for retrieving the information of all groups, optionally of one group type only, from API."""
+
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (
+        FrameGetAllGroupsInformationConfirmation,
+        FrameGetAllGroupsInformationNotification,
+        FrameGetAllGroupsInformationFinishedNotification,
+    )
+
+    def __init__(self, pyvlx: "PyVLX", group_type: GroupType | None = None):
+        """Initialize GetAllGroupsInformation class."""
+        super().__init__(pyvlx=pyvlx)
+        self.group_type = group_type
+        self.number_of_groups = 0
+        self.success = False
+        self.notification_frames: List[FrameGetAllGroupsInformationNotification] = []
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming API frame, return True if this was the expected frame."""
+        if isinstance(frame, FrameGetAllGroupsInformationConfirmation):
+            if frame.status == AllGroupsInformationStatus.ERROR_NO_GROUPS:
+                # No notifications follow
+                self.success = True
+                return True
+            self.number_of_groups = frame.number_of_groups
+            return False
+        if isinstance(frame, FrameGetAllGroupsInformationNotification):
+            self.notification_frames.append(frame)
+        if isinstance(frame, FrameGetAllGroupsInformationFinishedNotification):
+            if self.number_of_groups != len(self.notification_frames):
+                PYVLXLOG.warning("Number of received groups does not match expected number")
+            self.success = True
+            return True
+        return False
+
+    def request_frame(self) -> FrameGetAllGroupsInformationRequest:
+        """Construct initiating frame."""
+        return FrameGetAllGroupsInformationRequest(group_type=self.group_type)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List
 
 from pyvlx.log import PYVLXLOG
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
     FrameBase, FrameGetAllNodesInformationConfirmation,
@@ -17,6 +18,13 @@ if TYPE_CHECKING:
 class GetAllNodesInformation(ApiEvent):
     """Class for retrieving node information from API."""
 
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (
+        FrameGetAllNodesInformationConfirmation,
+        FrameGetAllNodesInformationNotification,
+        FrameGetAllNodesInformationFinishedNotification,
+    )
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetAllNodesInformation class."""
         super().__init__(pyvlx=pyvlx)
@@ -0,0 +1,41 @@
+"""Module for retrieving the information of a group from API."""
+from typing import TYPE_CHECKING
+
+from .api_dispatcher import RequestPriority
+from .api_event import ApiEvent
+from .frames import (
+    FrameBase, FrameGetGroupInformationConfirmation,
+    FrameGetGroupInformationNotification, FrameGetGroupInformationRequest,
+    GroupInformationStatus)
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class GetGroupInformation(ApiEvent):
+    """Class for retrieving the information of a group from API."""
+
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameGetGroupInformationConfirmation, FrameGetGroupInformationNotification)
+
+    def __init__(self, pyvlx: "PyVLX", group_id: int):
+        """Initialize GetGroupInformation class."""
+        super().__init__(pyvlx=pyvlx)
+        self.group_id = group_id
+        self.success = False
+        self.notification_frame: FrameGetGroupInformationNotification | None = None
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming API frame, return True if this was the expected frame."""
+        if isinstance(frame, FrameGetGroupInformationConfirmation) and frame.group_id == self.group_id:
+            # On success we are still waiting for FrameGetGroupInformationNotification
+            return frame.status != GroupInformationStatus.OK
+        if isinstance(frame, FrameGetGroupInformationNotification) and frame.group_id == self.group_id:
+            self.notification_frame = frame
+            self.success = True
+            return True
+        return False
+
+    def request_frame(self) -> FrameGetGroupInformationRequest:
+        """Construct initiating frame."""
+        return FrameGetGroupInformationRequest(group_id=self.group_id)
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 class GetLimitation(ApiEvent):
     """Class for retrieving limitation values from API."""
 
+    SESSION_BASED = True
+    RESPONSE_FRAMES = (FrameGetLimitationStatusConfirmation, FrameGetLimitationStatusNotification)
+
     def __init__(self, pyvlx: "PyVLX", node_id: int, limitation_type: LimitationType = LimitationType.MIN_LIMITATION):
         """Initialize GetLimitation class."""
         super().__init__(pyvlx=pyvlx)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from pyvlx.dataobjects import DtoLocalTime
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
     FrameBase, FrameGetLocalTimeConfirmation, FrameGetLocalTimeRequest)
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 class GetLocalTime(ApiEvent):
     """Class for retrieving local time from API."""
 
+    PRIORITY = RequestPriority.MAINTENANCE
+    RESPONSE_FRAMES = (FrameGetLocalTimeConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetLocalTime class."""
         super().__init__(pyvlx=pyvlx)
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 class GetNetworkSetup(ApiEvent):
     """Class for retrieving gateway state from API."""
 
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameGetNetworkSetupConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetNetworkSetup class."""
         super().__init__(pyvlx=pyvlx)
@@ -1,10 +1,12 @@
 """Module for retrieving node information from API."""
 from typing import TYPE_CHECKING
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
     FrameBase, FrameGetNodeInformationConfirmation,
     FrameGetNodeInformationNotification, FrameGetNodeInformationRequest)
+from .frames.frame_get_node_information import NodeInformationStatus
 
 if TYPE_CHECKING:
     from pyvlx import PyVLX
@@ -13,6 +15,9 @@ if TYPE_CHECKING:
 class GetNodeInformation(ApiEvent):
     """Class for retrieving node informationfrom API."""
 
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameGetNodeInformationConfirmation, FrameGetNodeInformationNotification)
+
     def __init__(self, pyvlx: "PyVLX", node_id: int):
         """Initialize GetNodeInformation class."""
         super().__init__(pyvlx=pyvlx)
@@ -26,8 +31,9 @@ class GetNodeInformation(ApiEvent):
                 isinstance(frame, FrameGetNodeInformationConfirmation)
                 and frame.node_id == self.node_id
         ):
-            # We are still waiting for GetNodeInformationNotification
-            return False
+            # On success we are still waiting for GetNodeInformationNotification,
+            # a rejected request ends the API call right away.
+            return frame.status != NodeInformationStatus.OK
         if (
                 isinstance(frame, FrameGetNodeInformationNotification)
                 and frame.node_id == self.node_id
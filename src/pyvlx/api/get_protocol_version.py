@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 class GetProtocolVersion(ApiEvent):
     """Class for retrieving protocol version from API."""
 
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameGetProtocolVersionConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetProtocolVersion class."""
         super().__init__(pyvlx=pyvlx)
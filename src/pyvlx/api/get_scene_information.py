@@ -0,0 +1,45 @@
+"""Module for retrieving the nodes of a scene from API."""
+from typing import TYPE_CHECKING, List
+
+from .api_dispatcher import RequestPriority
+from .api_event import ApiEvent
+from .frames import (
+    FrameBase, FrameGetSceneInformationConfirmation,
+    FrameGetSceneInformationNotification, FrameGetSceneInformationRequest,
+    SceneInformationStatus, SceneNode)
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class GetSceneInformation(ApiEvent):
+    """Class for retrieving the nodes of a scene and their stored parameters from API."""
+
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameGetSceneInformationConfirmation, FrameGetSceneInformationNotification)
+
+    def __init__(self, pyvlx: "PyVLX", scene_id: int):
+        """Initialize GetSceneInformation class."""
+        super().__init__(pyvlx=pyvlx)
+        self.scene_id = scene_id
+        self.success = False
+        self.name: str | None = None
+        self.nodes: List[SceneNode] = []
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming API frame, return True if this was the expected frame."""
+        if isinstance(frame, FrameGetSceneInformationConfirmation) and frame.scene_id == self.scene_id:
+            # On success we are still waiting for FrameGetSceneInformationNotification(s)
+            return frame.status != SceneInformationStatus.OK
+        if isinstance(frame, FrameGetSceneInformationNotification) and frame.scene_id == self.scene_id:
+            self.name = frame.name
+            self.nodes.extend(frame.nodes)
+            if frame.remaining_nodes != 0:
+                return False
+            self.success = True
+            return True
+        return False
+
+    def request_frame(self) -> FrameGetSceneInformationRequest:
+        """Construct initiating frame."""
+        return FrameGetSceneInformationRequest(scene_id=self.scene_id)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List, Tuple
 
 from pyvlx.log import PYVLXLOG
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
     FrameBase, FrameGetSceneListConfirmation, FrameGetSceneListNotification,
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
 class GetSceneList(ApiEvent):
     """Class for retrieving scene list from API."""
 
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameGetSceneListConfirmation, FrameGetSceneListNotification)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize SceneList class."""
         super().__init__(pyvlx=pyvlx)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 from pyvlx.dataobjects import DtoState
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import FrameBase, FrameGetStateConfirmation, FrameGetStateRequest
 
@@ -13,6 +14,10 @@ if TYPE_CHECKING:
 class GetState(ApiEvent):
     """Class for retrieving gateway state from API."""
 
+    PRIORITY = RequestPriority.MAINTENANCE
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameGetStateConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetState class."""
         super().__init__(pyvlx=pyvlx)
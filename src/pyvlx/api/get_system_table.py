@@ -0,0 +1,42 @@
+"""Module for retrieving the system table from API."""
+from typing import TYPE_CHECKING, List
+
+from .api_dispatcher import RequestPriority
+from .api_event import ApiEvent
+from .frames import (
+    FrameBase, FrameGetSystemTableDataConfirmation,
+    FrameGetSystemTableDataNotification, FrameGetSystemTableDataRequest,
+    SystemTableEntry)
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class GetSystemTable(ApiEvent):
+    """Class for retrieving the system table, i.e. address, type and power mode of all actuators, from API."""
+
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameGetSystemTableDataConfirmation, FrameGetSystemTableDataNotification)
+
+    def __init__(self, pyvlx: "PyVLX"):
+        """Initialize GetSystemTable class."""
+        super().__init__(pyvlx=pyvlx)
+        self.success = False
+        self.entries: List[SystemTableEntry] = []
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming API frame, return True if this was the expected frame."""
+        if isinstance(frame, FrameGetSystemTableDataConfirmation):
+            # We are still waiting for FrameGetSystemTableDataNotification(s)
+            return False
+        if isinstance(frame, FrameGetSystemTableDataNotification):
+            self.entries.extend(frame.entries)
+            if frame.remaining_entries != 0:
+                return False
+            self.success = True
+            return True
+        return False
+
+    def request_frame(self) -> FrameGetSystemTableDataRequest:
+        """Construct initiating frame."""
+        return FrameGetSystemTableDataRequest()
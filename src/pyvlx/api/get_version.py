@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 class GetVersion(ApiEvent):
     """Class for retrieving firmware version from API."""
 
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameGetVersionConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize GetVersion class."""
         super().__init__(pyvlx=pyvlx)
@@ -1,6 +1,7 @@
 """Module for house status monitor."""
 from typing import TYPE_CHECKING
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
     FrameBase, FrameHouseStatusMonitorDisableConfirmation,
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
 class HouseStatusMonitorEnable(ApiEvent):
     """Class for enabling house status monotor."""
 
+    PRIORITY = RequestPriority.MAINTENANCE
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameHouseStatusMonitorEnableConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize HouseStatusMonitorEnable class."""
         super().__init__(pyvlx=pyvlx)
@@ -35,6 +40,10 @@ class HouseStatusMonitorEnable(ApiEvent):
 class HouseStatusMonitorDisable(ApiEvent):
     """Class for disabling house status monotor."""
 
+    PRIORITY = RequestPriority.MAINTENANCE
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameHouseStatusMonitorDisableConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize HouseStatusMonitorDisable class."""
         super().__init__(pyvlx=pyvlx)
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class LeaveLearnState(ApiEvent):
     """Class for handling leave learn state to API."""
 
+    RESPONSE_FRAMES = (FrameLeaveLearnStateConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize leave learn state class."""
         super().__init__(pyvlx=pyvlx)
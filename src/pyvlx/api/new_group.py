@@ -0,0 +1,40 @@
+"""Module for creating a group."""
+from typing import TYPE_CHECKING, List
+
+from pyvlx.const import GroupType
+
+from .api_event import ApiEvent
+from .frames import (
+    FrameBase, FrameNewGroupConfirmation, FrameNewGroupRequest,
+    NewGroupConfirmationStatus)
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class NewGroup(ApiEvent):
+    """Class for creating a group of nodes via API."""
+
+    RESPONSE_FRAMES = (FrameNewGroupConfirmation,)
+
+    def __init__(self, pyvlx: "PyVLX", name: str, node_ids: List[int], group_type: GroupType = GroupType.USER_GROUP):
+        """Initialize NewGroup class."""
+        super().__init__(pyvlx=pyvlx)
+        self.name = name
+        self.node_ids = node_ids
+        self.group_type = group_type
+        self.success = False
+        self.group_id: int | None = None
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming API frame, return True if this was the expected frame."""
+        if not isinstance(frame, FrameNewGroupConfirmation):
+            return False
+        self.success = frame.status == NewGroupConfirmationStatus.OK
+        if self.success:
+            self.group_id = frame.group_id
+        return True
+
+    def request_frame(self) -> FrameNewGroupRequest:
+        """Construct initiating frame."""
+        return FrameNewGroupRequest(name=self.name, group_type=self.group_type, node_ids=self.node_ids)
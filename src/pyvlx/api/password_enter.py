@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class PasswordEnter(ApiEvent):
     """Class for handling login to API."""
 
+    RESPONSE_FRAMES = (FramePasswordEnterConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX", password: str):
         """Initialize login class."""
         super().__init__(pyvlx=pyvlx)
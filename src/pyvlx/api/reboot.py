@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class Reboot(ApiEvent):
     """Class for handling Reboot to API."""
 
+    RESPONSE_FRAMES = (FrameGatewayRebootConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize Reboot class."""
         super().__init__(pyvlx=pyvlx)
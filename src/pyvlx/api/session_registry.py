@@ -0,0 +1,129 @@
+"""Module for tracking the completion of gateway sessions."""
+import asyncio
+from typing import Any, Callable, Dict, Generator, Tuple, Type
+
+from ..log import PYVLXLOG
+from .frames import FrameBase
+
+SessionFrameHandler = Callable[[FrameBase], bool]
+
+
+class SessionHandle:
+    """Awaitable completion of a gateway session.
+
+    Awaiting the handle returns True if the session was finished by the
+    gateway, or False if it expired or was cancelled before. Cancelling an
+    awaiting task does not cancel the handle, so it can be awaited again.
+    """
+
+    def __init__(self, session_id: int, frame_types: Tuple[Type[FrameBase], ...], frame_handler: SessionFrameHandler):
+        """Initialize SessionHandle."""
+        self.session_id = session_id
+        self.frame_types = frame_types
+        self.frame_handler = frame_handler
+        self._future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+
+    @property
+    def done(self) -> bool:
+        """Return True if the session was finished, expired or cancelled."""
+        return self._future.done()
+
+    @property
+    def completed(self) -> bool:
+        """Return True if the session was finished by the gateway."""
+        return self._future.done() and self._future.result()
+
+    def resolve(self, completed: bool) -> None:
+        """Resolve handle, completed tells if the session was finished by the gateway."""
+        if not self._future.done():
+            self._future.set_result(completed)
+
+    def __await__(self) -> Generator[Any, None, bool]:
+        """Wait until the session is finished, expired or cancelled."""
+        return asyncio.shield(self._future).__await__()
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} session_id="{self.session_id}" done="{self.done}" completed="{self.completed}"/>'
+
+
+class SessionRegistry:
+    """Class for routing frames of sessions whose API call already returned.
+
+    A session is tracked from the confirmation of its request until the
+    frame handler reports the completion, or until the timeout expires. This
+    way an API call only occupies a slot of the dispatcher until its
+    confirmation is received, while its completion can still be awaited.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SessionRegistry."""
+        self._handles: Dict[int, SessionHandle] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._frame_types: Dict[Type[FrameBase], int] = {}
+
+    def __len__(self) -> int:
+        """Return number of tracked sessions."""
+        return len(self._handles)
+
+    def __contains__(self, session_id: int) -> bool:
+        """Return True if session_id is tracked."""
+        return session_id in self._handles
+
+    def track(
+        self,
+        session_id: int,
+        frame_types: Tuple[Type[FrameBase], ...],
+        frame_handler: SessionFrameHandler,
+        timeout: float,
+    ) -> SessionHandle:
+        """Track session until frame_handler returns True for a frame of frame_types, or timeout expires."""
+        if session_id in self._handles:
+            PYVLXLOG.warning("Session id %s is already tracked, replacing previous session", session_id)
+            self._remove(session_id).resolve(False)
+        handle = SessionHandle(session_id, frame_types, frame_handler)
+        self._handles[session_id] = handle
+        self._timers[session_id] = asyncio.get_running_loop().call_later(timeout, self._expire, session_id)
+        for frame_type in frame_types:
+            self._frame_types[frame_type] = self._frame_types.get(frame_type, 0) + 1
+        return handle
+
+    def _remove(self, session_id: int) -> SessionHandle:
+        """Stop tracking session and return its handle."""
+        handle = self._handles.pop(session_id)
+        self._timers.pop(session_id).cancel()
+        for frame_type in handle.frame_types:
+            self._frame_types[frame_type] -= 1
+            if not self._frame_types[frame_type]:
+                del self._frame_types[frame_type]
+        return handle
+
+    def complete(self, session_id: int) -> None:
+        """Stop tracking session, which was finished by the gateway."""
+        if session_id in self._handles:
+            self._remove(session_id).resolve(True)
+
+    def _expire(self, session_id: int) -> None:
+        """Stop tracking session after its timeout."""
+        PYVLXLOG.debug("Session %s expired without completion", session_id)
+        self._remove(session_id).resolve(False)
+
+    def cancel_all(self) -> None:
+        """Stop tracking all sessions, e.g. because the connection was closed."""
+        for session_id in list(self._handles):
+            self._remove(session_id).resolve(False)
+
+    def wants_frame(self, frame_type: type) -> bool:
+        """Return True if a tracked session may be interested in frames of frame_type."""
+        return frame_type in self._frame_types
+
+    def process_frame(self, frame: FrameBase) -> bool:
+        """Route frame to its tracked session, return True if a session was interested in it."""
+        if type(frame) not in self._frame_types:
+            return False
+        handle = self._handles.get(getattr(frame, "session_id", None))  # type: ignore[arg-type]
+        if handle is None or type(frame) not in handle.frame_types:
+            return False
+        if handle.frame_handler(frame):
+            self.complete(handle.session_id)
+        return True
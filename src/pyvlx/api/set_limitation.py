@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 class SetLimitation(ApiEvent):
     """Class for setting limitation."""
 
+    SESSION_BASED = True
+    RESPONSE_FRAMES = (FrameSetLimitationConfirmation, FrameGetLimitationStatusNotification, FrameSessionFinishedNotification)
+
     # NOTE: Required to always set both limits at the same time.
     # If setting only one limit to a value, the other to Ignore, Default or Current, the gateway will reject the Frame.
     def __init__(self, pyvlx: "PyVLX", node_id: int, limitation_value_min: Position = IgnorePosition(),
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class SetNodeName(ApiEvent):
     """Class for changing the name of a node via API."""
 
+    RESPONSE_FRAMES = (FrameSetNodeNameConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX", node_id: int, name: str):
         """Initialize class."""
         super().__init__(pyvlx=pyvlx)
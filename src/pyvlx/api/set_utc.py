@@ -2,6 +2,7 @@
 import time
 from typing import TYPE_CHECKING
 
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import FrameBase, FrameSetUTCConfirmation, FrameSetUTCRequest
 
@@ -12,6 +13,10 @@ if TYPE_CHECKING:
 class SetUTC(ApiEvent):
     """Class for setting UTC time within gateway."""
 
+    PRIORITY = RequestPriority.MAINTENANCE
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameSetUTCConfirmation,)
+
     def __init__(self, pyvlx: "PyVLX", timestamp: float | None = None):
         """Initialize SetUTC class."""
         super().__init__(pyvlx=pyvlx)
@@ -1,9 +1,12 @@
 """Module for retrieving node information from API."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Sequence
 
+from ..exception import PyVLXException
+from .api_dispatcher import RequestPriority
 from .api_event import ApiEvent
 from .frames import (
-    FrameBase, FrameStatusRequestConfirmation, FrameStatusRequestNotification,
+    FrameBase, FrameSessionFinishedNotification,
+    FrameStatusRequestConfirmation, FrameStatusRequestNotification,
     FrameStatusRequestRequest)
 from .session_id import get_new_session_id
 
@@ -12,14 +15,37 @@ if TYPE_CHECKING:
 
 
 class StatusRequest(ApiEvent):
-    """Class for retrieving node informationfrom API."""
+    """Class for retrieving node informationfrom API.
 
-    def __init__(self, pyvlx: "PyVLX", node_id: int):
+    The status is requested either for a single node (node_id) or for up to
+    MAX_NODE_IDS nodes within one session (node_ids). The API call is
+    completed when a notification for every node was received or the gateway
+    finished the session.
+    """
+
+    SESSION_BASED = True
+    PRIORITY = RequestPriority.STATE_REFRESH
+    RESPONSE_FRAMES = (FrameStatusRequestConfirmation, FrameStatusRequestNotification, FrameSessionFinishedNotification)
+    MAX_NODE_IDS = 20
+
+    def __init__(
+            self,
+            pyvlx: "PyVLX",
+            node_id: int | None = None,
+            node_ids: Sequence[int] | None = None,
+            timeout_in_seconds: int = 10,
+    ):
         """Initialize StatusRequest class."""
-        super().__init__(pyvlx=pyvlx)
-        self.node_id = node_id
+        super().__init__(pyvlx=pyvlx, timeout_in_seconds=timeout_in_seconds)
+        if (node_id is None) == (node_ids is None):
+            raise PyVLXException("status_request_requires_either_node_id_or_node_ids")
+        self.node_ids: List[int] = [node_id] if node_id is not None else list(node_ids or [])
+        if not 0 < len(self.node_ids) <= self.MAX_NODE_IDS:
+            raise PyVLXException("status_request_wrong_number_of_node_ids", node_ids=self.node_ids)
+        self.node_id = self.node_ids[0]
         self.success = False
         self.notification_frame: FrameStatusRequestNotification | None = None
+        self.notification_frames: Dict[int, FrameStatusRequestNotification] = {}
         self.session_id: int | None = None
 
     async def handle_frame(self, frame: FrameBase) -> bool:
@@ -35,7 +61,14 @@ class StatusRequest(ApiEvent):
                 and frame.session_id == self.session_id
         ):
             self.notification_frame = frame
-            self.success = True
+            self.notification_frames[frame.node_id] = frame
+            self.success = all(node_id in self.notification_frames for node_id in self.node_ids)
+            return self.success
+        if (
+                isinstance(frame, FrameSessionFinishedNotification)
+                and frame.session_id == self.session_id
+        ):
+            # Notifications of nodes which did not answer are not sent anymore
             return True
         return False
 
@@ -44,5 +77,5 @@ class StatusRequest(ApiEvent):
         self.session_id = get_new_session_id()
         return FrameStatusRequestRequest(
             session_id=self.session_id,
-            node_ids=[self.node_id]
+            node_ids=self.node_ids
         )
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class WinkSend(CompletableApiEvent):
     """Class for sending wink request to API."""
 
+    RESPONSE_FRAMES = (FrameWinkSendConfirmation, FrameWinkSendNotification)
+
     def __init__(
             self,
             pyvlx: "PyVLX",
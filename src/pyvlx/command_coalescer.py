@@ -0,0 +1,101 @@
+"""Module for coalescing rapid commands to the same node."""
+import asyncio
+from typing import Dict, FrozenSet, Set, Tuple
+
+from .api import CommandSend
+from .const import NodeParameter
+from .log import PYVLXLOG
+from .parameter import Parameter
+
+CoalescingKey = Tuple[int, FrozenSet[NodeParameter]]
+
+
+class _PendingCommand:
+    """Command waiting for the end of its debounce window."""
+
+    def __init__(self, command: CommandSend):
+        """Initialize _PendingCommand."""
+        self.command = command
+        self.future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def resolve(self, task: "asyncio.Task[None]") -> None:
+        """Pass the outcome of the sent command to everybody waiting for it."""
+        if self.future.done():
+            return
+        if task.cancelled():
+            self.future.cancel()
+        elif task.exception() is not None:
+            self.future.set_exception(task.exception())  # type: ignore[arg-type]
+        else:
+            self.future.set_result(None)
+
+
+class CommandCoalescer:
+    """Class for coalescing commands to one node, keyed by the parameters they set.
+
+    UI sliders and automations tend to send many commands per second to
+    the same node, each of them overruling the previous one on the gateway.
+    If debounce is set, a command is held back for debounce seconds. A
+    command setting the same main parameter and the same functional
+    parameters within this window replaces the pending one before it reaches
+    the wire. Functional parameters set to IGNORE are not taken into
+    account, so e.g. moving a blind does not supersede changing its
+    orientation. The window starts with the first
+    pending command, so a continuous stream still sends the latest target
+    every debounce seconds.
+
+    Last writer wins: everybody who submitted a command within a window
+    waits for the command which is finally sent and gets its outcome,
+    including the PyVLXException raised if it was rejected.
+
+    Without debounce, or for commands addressing several nodes, commands are
+    sent right away.
+    """
+
+    def __init__(self, debounce: float | None = None):
+        """Initialize CommandCoalescer."""
+        self.debounce = debounce
+        self.superseded = 0
+        self._pending: Dict[CoalescingKey, _PendingCommand] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Return number of commands waiting for the end of their debounce window."""
+        return len(self._pending)
+
+    async def send(self, command: CommandSend) -> None:
+        """Send command, coalesced with other commands setting the same parameters within the debounce window."""
+        if self.debounce is None or len(command.node_ids) != 1:
+            await command.send()
+            return
+        key = self.key(command)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingCommand(command)
+            self._pending[key] = pending
+            asyncio.get_running_loop().call_later(self.debounce, self._flush, key)
+        else:
+            PYVLXLOG.debug("Command to node %s superseded by a newer command", command.node_id)
+            pending.command = command
+            self.superseded += 1
+        # Cancelling one caller must not cancel the command the others wait for
+        await asyncio.shield(pending.future)
+
+    @staticmethod
+    def key(command: CommandSend) -> CoalescingKey:
+        """Return the main parameter and the functional parameters which are set by command."""
+        functional_parameter = command.functional_parameter or {}
+        return command.active_parameter, frozenset(
+            node_parameter
+            for node_parameter, parameter in functional_parameter.items()
+            if Parameter.to_int(bytes(parameter)) != Parameter.IGNORE
+        )
+
+    def _flush(self, key: CoalescingKey) -> None:
+        """Send the latest command of a debounce window."""
+        pending = self._pending.pop(key)
+        task = asyncio.create_task(pending.command.send())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(pending.resolve)
@@ -2,22 +2,38 @@
 import asyncio
 import ssl
 import sys
-from typing import Any, Callable, Coroutine, List, Set
+import time
+import weakref
+from collections import deque
+from typing import (
+    Any, Callable, Coroutine, Deque, Iterable, List, Set, Tuple, Type)
 
 from .api.frame_creation import frame_from_raw
 from .api.frames import FrameBase
 from .config import Config
 from .exception import PyVLXException
+from .frame_router import (
+    CallbackType, FrameFilterType, FrameHandlerType, FrameRouter)
 from .log import PYVLXLOG
-from .slip import get_next_slip, is_slip, slip_pack
+from .slip import SLIP_END, SLIP_ESC, decode, slip_pack
 
 
 class SlipTokenizer:
-    """Helper class for splitting up binary stream to slip packets."""
+    """Helper class for splitting up binary stream to slip packets.
+
+    Incoming chunks are appended to a growable buffer. The position up to
+    which the buffer was already searched for SLIP_END is kept between calls,
+    so every received byte is scanned only once, and consumed packets are
+    dropped from the front of the buffer without copying the remaining stream.
+    Data received before the first SLIP_END cannot be framed and is skipped.
+    """
 
     def __init__(self) -> None:
         """Init Tokenizer."""
-        self.data = bytes()
+        self.data = bytearray()
+        self._synced = False
+        self._scan_offset = 0
+        self._token_end: int | None = None
 
     def feed(self, chunk: bytes) -> None:
         """Feed chunk to tokenizer."""
@@ -25,14 +41,170 @@ class SlipTokenizer:
             return
         self.data += chunk
 
+    def _sync(self) -> bool:
+        """Skip data up to and including the first SLIP_END. Return True if synced."""
+        start = self.data.find(SLIP_END, self._scan_offset)
+        if start == -1:
+            if self.data:
+                PYVLXLOG.debug("Skipping %s bytes without SLIP_END", len(self.data))
+                del self.data[:]
+            self._scan_offset = 0
+            return False
+        if start:
+            PYVLXLOG.debug("Skipping %s bytes before SLIP_END", start)
+        del self.data[: start + 1]
+        self._scan_offset = 0
+        self._synced = True
+        return True
+
+    def _find_token_end(self) -> int | None:
+        """Return position of SLIP_END terminating the next non empty packet."""
+        if self._token_end is not None:
+            return self._token_end
+        if not self._synced and not self._sync():
+            return None
+        while True:
+            end = self.data.find(SLIP_END, self._scan_offset)
+            if end == -1:
+                self._scan_offset = len(self.data)
+                return None
+            if end:
+                self._token_end = end
+                return end
+            # Empty packet, e.g. closing and opening SLIP_END of two adjacent packets
+            del self.data[:1]
+            self._scan_offset = 0
+
     def has_tokens(self) -> bool:
         """Return True if Tokenizer has tokens."""
-        return is_slip(self.data)
+        return self._find_token_end() is not None
 
     def get_next_token(self) -> bytes | None:
         """Get next token from Tokenizer."""
-        slip, self.data = get_next_slip(self.data)
-        return slip
+        end = self._find_token_end()
+        if end is None:
+            return None
+        with memoryview(self.data) as view, view[:end] as packet_view:
+            packet = bytes(packet_view)
+        del self.data[: end + 1]
+        self._scan_offset = 0
+        self._token_end = None
+        if SLIP_ESC in packet:
+            return decode(packet)
+        return packet
+
+
+class SendQueue:
+    """Queue of outgoing packets, written to the transport in batches.
+
+    Packets queued within the same iteration of the event loop are coalesced
+    into one writelines() call. While the transport is paused because its
+    write buffer exceeds the high water mark, packets stay within the queue
+    until the transport resumes writing below the low water mark. flush()
+    waits until all packets queued so far were handed to the transport.
+    """
+
+    def __init__(self, writelines: Callable[[List[bytes]], None]):
+        """Initialize SendQueue."""
+        self.writelines = writelines
+        self.paused = False
+        self._queue: Deque[Tuple[bytes, float]] = deque()
+        self._flush_handle: asyncio.Handle | None = None
+        self._queued_count = 0
+        self._written_count = 0
+        self._waiters: List[Tuple[int, asyncio.Future[None]]] = []
+        # Statistics
+        self.packets_written = 0
+        self.writes = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Return number of packets waiting to be written."""
+        return len(self._queue)
+
+    @property
+    def average_wait(self) -> float:
+        """Return average seconds packets waited within the queue."""
+        return self.total_wait / self.packets_written if self.packets_written else 0.0
+
+    def put(self, packet: bytes) -> None:
+        """Queue packet, it is written with all packets queued within the same loop iteration."""
+        self._queue.append((packet, time.monotonic()))
+        self._queued_count += 1
+        self.max_depth = max(self.max_depth, len(self._queue))
+        if self._flush_handle is None and not self.paused:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Write all queued packets unless the transport is paused."""
+        self._flush_handle = None
+        if self.paused or not self._queue:
+            return
+        self._write_queued()
+        self._wake_waiters()
+
+    def _write_queued(self) -> None:
+        """Write all queued packets with one call and update statistics."""
+        now = time.monotonic()
+        packets = []
+        for packet, queued_at in self._queue:
+            wait = now - queued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            packets.append(packet)
+        self._queue.clear()
+        self.writelines(packets)
+        self._written_count += len(packets)
+        self.packets_written += len(packets)
+        self.writes += 1
+
+    def _wake_waiters(self) -> None:
+        """Resolve flush() calls whose packets were written."""
+        if self.paused:
+            return
+        remaining = []
+        for count, future in self._waiters:
+            if count > self._written_count:
+                remaining.append((count, future))
+            elif not future.done():
+                future.set_result(None)
+        self._waiters = remaining
+
+    def pause_writing(self) -> None:
+        """Stop writing, the write buffer of the transport is above the high water mark."""
+        self.paused = True
+
+    def resume_writing(self) -> None:
+        """Continue writing, the write buffer of the transport drained below the low water mark."""
+        self.paused = False
+        if self._queue and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+        self._wake_waiters()
+
+    async def flush(self) -> None:
+        """Wait until all packets queued so far are written and the transport is not paused."""
+        if self._written_count >= self._queued_count and not self.paused:
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((self._queued_count, future))
+        await future
+
+    def close(self, write_pending: bool = True) -> None:
+        """Write or drop pending packets and release all waiting flush() calls."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._queue:
+            if write_pending:
+                self._write_queued()
+            else:
+                self._queue.clear()
+                self._written_count = self._queued_count
+        self.paused = False
+        self._wake_waiters()
 
 
 class TCPTransport(asyncio.Protocol):
@@ -42,10 +214,19 @@ class TCPTransport(asyncio.Protocol):
         self,
         frame_received_cb: Callable[[FrameBase], None],
         connection_lost_cb: Callable[[], None],
+        frame_wanted: FrameFilterType | None = None,
+        send_queue: SendQueue | None = None,
     ):
-        """Init TCPTransport."""
+        """Init TCPTransport.
+
+        Received frames of classes frame_wanted rejects are dropped without
+        decoding their payload. Flow control of the transport is forwarded
+        to send_queue.
+        """
         self.frame_received_cb = frame_received_cb
         self.connection_lost_cb = connection_lost_cb
+        self.frame_wanted = frame_wanted
+        self.send_queue = send_queue
         self.tokenizer = SlipTokenizer()
 
     def connection_made(self, transport: object) -> None:
@@ -60,36 +241,93 @@ class TCPTransport(asyncio.Protocol):
             assert raw is not None
 
             try:
-                frame = frame_from_raw(raw)
+                frame = frame_from_raw(raw, self.frame_wanted)
                 if frame is not None:
                     self.frame_received_cb(frame)
             except PyVLXException:
                 PYVLXLOG.error("Error in data_received", exc_info=sys.exc_info())
 
+    def pause_writing(self) -> None:
+        """Handle write buffer of transport exceeding the high water mark."""
+        PYVLXLOG.debug("Pausing writing to KLF 200")
+        if self.send_queue is not None:
+            self.send_queue.pause_writing()
+
+    def resume_writing(self) -> None:
+        """Handle write buffer of transport drained below the low water mark."""
+        PYVLXLOG.debug("Resuming writing to KLF 200")
+        if self.send_queue is not None:
+            self.send_queue.resume_writing()
+
     def connection_lost(self, exc: object) -> None:
         """Handle lost connection."""
         PYVLXLOG.debug("Socket connection to KLF 200 has been lost")
         self.connection_lost_cb()
 
 
-CallbackType = Callable[[FrameBase], Coroutine[Any, Any, None]]
+class ResumingSSLContext(ssl.SSLContext):
+    """SSL context offering the TLS session of the previous connection.
+
+    asyncio does not allow to pass a session to create_connection(), so the
+    session is offered when asyncio wraps the connection. The gateway may
+    accept it and resume the session with an abbreviated handshake, or
+    perform a full handshake.
+    """
+
+    session: ssl.SSLSession | None = None
+
+    def wrap_bio(
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        """Wrap BIO pair, offering the stored session for client connections."""
+        if session is None and not server_side:
+            session = self.session
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
 
 
 class Connection:
-    """Class for handling TCP connection."""
+    """Class for handling TCP connection.
+
+    One SSL context is kept per connection, i.e. per gateway. The TLS
+    session of a connection is stored when it is closed and offered when
+    connecting again, which saves the slow gateway a full handshake.
+    handshake_duration holds the seconds it took to open the last
+    connection including the TLS handshake, session_reused whether the TLS
+    session was resumed and sessions_reused how often this happened.
+    """
 
     CONNECT_TIMEOUT = 10.0
+    WRITE_BUFFER_HIGH = 16 * 1024
+    WRITE_BUFFER_LOW = 4 * 1024
 
     def __init__(self, config: Config):
         """Init TCP connection."""
         self.config = config
         self.transport: asyncio.Transport | None = None
-        self.frame_received_cbs: List[CallbackType] = []
+        self.frame_router = FrameRouter()
+        # The queue must not keep the connection alive, otherwise __del__ would not close the transport
+        connection = weakref.ref(self)
+
+        def writelines(packets: List[bytes]) -> None:
+            alive = connection()
+            if alive is not None:
+                alive._writelines(packets)  # pylint: disable=protected-access
+
+        self.send_queue = SendQueue(writelines)
         self.connection_closed_cbs: List[Callable[[], Coroutine[Any, Any, None]]] = []
         self.connection_opened_cbs: List[Callable[[], Coroutine[Any, Any, None]]] = []
         self.connected = False
         self.connection_counter = 0
         self.tasks: Set[asyncio.Task[None]] = set()
+        self.ssl_context = self.create_ssl_context()
+        self.handshake_duration: float | None = None
+        self.session_reused = False
+        self.sessions_reused = 0
 
     def __del__(self) -> None:
         """Destruct connection."""
@@ -102,7 +340,9 @@ class Connection:
         so it it can be skipped, mostly for the case of destructor
         being called during shutdown when loop is already closed.
         """
+        self.send_queue.close(write_pending=self.transport is not None and not self.transport.is_closing())
         if self.transport is not None:
+            self._store_tls_session()
             self.transport.close()
             self.transport = None
         self.connected = False
@@ -121,16 +361,22 @@ class Connection:
 
     async def connect(self) -> None:
         """Connect to gateway via SSL."""
-        tcp_client = TCPTransport(self.frame_received_cb, connection_lost_cb=self.on_connection_lost)
+        tcp_client = TCPTransport(
+            self.frame_received_cb,
+            connection_lost_cb=self.on_connection_lost,
+            frame_wanted=self.frame_router.wants,
+            send_queue=self.send_queue,
+        )
         loop = asyncio.get_running_loop()
         assert self.config.host is not None
+        started = time.monotonic()
         try:
             async with asyncio.timeout(self.CONNECT_TIMEOUT):
                 self.transport, _ = await loop.create_connection(
                     lambda: tcp_client,
                     host=self.config.host,
                     port=self.config.port,
-                    ssl=self.create_ssl_context(),
+                    ssl=self.ssl_context,
                 )
         except asyncio.TimeoutError as error:
             self.transport = None
@@ -142,6 +388,13 @@ class Connection:
             self.transport = None
             self.connected = False
             raise PyVLXException(f"Failed to open socket connection to KLF 200: {error}") from error
+        self.handshake_duration = time.monotonic() - started
+        ssl_object = self.transport.get_extra_info("ssl_object")
+        self.session_reused = isinstance(ssl_object, ssl.SSLObject) and ssl_object.session_reused
+        self.sessions_reused += self.session_reused
+        PYVLXLOG.debug("TLS handshake took %.3fs, session reused: %s", self.handshake_duration, self.session_reused)
+        self._store_tls_session()
+        self.transport.set_write_buffer_limits(high=self.WRITE_BUFFER_HIGH, low=self.WRITE_BUFFER_LOW)
         self.connected = True
         self.connection_counter += 1
         PYVLXLOG.debug(
@@ -152,13 +405,37 @@ class Connection:
             self.tasks.add(task)
             task.add_done_callback(self.tasks.remove)
 
-    def register_frame_received_cb(self, callback: CallbackType) -> None:
-        """Register frame received callback."""
-        self.frame_received_cbs.append(callback)
+    def register_frame_received_cb(
+        self, callback: CallbackType, frame_types: Iterable[Type[FrameBase]] | None = None
+    ) -> None:
+        """Register frame received callback, for all frames if no frame_types are specified.
+
+        Callbacks are coroutines, every call is run as separate task.
+        """
+        self.frame_router.add_callback(callback, frame_types)
 
     def unregister_frame_received_cb(self, callback: CallbackType) -> None:
         """Unregister frame received callback."""
-        self.frame_received_cbs.remove(callback)
+        self.frame_router.remove_callback(callback)
+
+    def register_frame_handler(
+        self,
+        handler: FrameHandlerType,
+        frame_types: Iterable[Type[FrameBase]] | None = None,
+        accepts: FrameFilterType | None = None,
+    ) -> None:
+        """Register frame handler, for all frames if no frame_types are specified.
+
+        Frame handlers are called directly when a frame is received, so they
+        must not block. If accepts is given, it is asked for the frame class
+        before a received frame is decoded, whether the handler is interested
+        in it right now. Frames no subscriber is interested in are dropped.
+        """
+        self.frame_router.add_handler(handler, frame_types, accepts)
+
+    def unregister_frame_handler(self, handler: FrameHandlerType) -> None:
+        """Unregister frame handler."""
+        self.frame_router.remove_handler(handler)
 
     def register_connection_closed_cb(self, callback: Callable[[], Coroutine[Any, Any, None]]) -> None:
         """Register connection closed callback."""
@@ -177,17 +454,40 @@ class Connection:
         self.connection_opened_cbs.remove(callback)
 
     def write(self, frame: FrameBase) -> None:
-        """Write frame to Bus."""
+        """Write frame to Bus.
+
+        The frame is queued and written together with all frames written
+        within the same iteration of the event loop, await flush() to wait
+        until it was handed to the transport.
+        """
         if not isinstance(frame, FrameBase):
             raise PyVLXException("Frame not of type FrameBase", *type(frame))
         PYVLXLOG.debug("SEND: %s", frame)
         assert self.transport is not None
-        self.transport.write(slip_pack(bytes(frame)))
+        self.send_queue.put(slip_pack(bytes(frame)))
+
+    async def flush(self) -> None:
+        """Wait until all frames written so far were handed to the transport and it accepts more data."""
+        await self.send_queue.flush()
+
+    def _writelines(self, packets: List[bytes]) -> None:
+        """Write packets of the send queue to the transport."""
+        if self.transport is None:
+            PYVLXLOG.debug("Dropping %s packets, connection is closed", len(packets))
+            return
+        self.transport.writelines(packets)
+
+    def _store_tls_session(self) -> None:
+        """Store TLS session of the transport to offer it on the next connect."""
+        assert self.transport is not None
+        ssl_object = self.transport.get_extra_info("ssl_object")
+        if isinstance(ssl_object, ssl.SSLObject) and isinstance(ssl_object.session, ssl.SSLSession) and isinstance(self.ssl_context, ResumingSSLContext):
+            self.ssl_context.session = ssl_object.session
 
     @staticmethod
     def create_ssl_context() -> ssl.SSLContext:
         """Create and return SSL Context."""
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context = ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
         return ssl_context
@@ -195,7 +495,13 @@ class Connection:
     def frame_received_cb(self, frame: FrameBase) -> None:
         """Received message."""
         PYVLXLOG.debug("REC: %s", frame)
-        for frame_received_cb in self.frame_received_cbs:
+        handlers, callbacks = self.frame_router.subscribers(type(frame))
+        for handler in handlers:
+            try:
+                handler(frame)
+            except Exception:  # pylint: disable=broad-exception-caught
+                PYVLXLOG.exception("Error in frame handler %s", handler)
+        for frame_received_cb in callbacks:
             task = asyncio.create_task(frame_received_cb(frame))
             self.tasks.add(task)
             task.add_done_callback(self.tasks.remove)
@@ -32,6 +32,8 @@ class Command(Enum):
     GW_SET_NETWORK_SETUP_REQ = 0x00E2
     GW_SET_NETWORK_SETUP_CFM = 0x00E3
 
+    GW_CS_GET_SYSTEMTABLE_DATA_REQ = 0x0100
+    # Misspelled alias, kept for compatibility
     GW_CS_GET_SYSTEMTABLE_DATQ_REQ = 0x0100
     GW_CS_GET_SYSTEMTABLE_DATA_CFM = 0x0101
     GW_CS_GET_SYSTEMTABLE_DATA_NTF = 0x0102
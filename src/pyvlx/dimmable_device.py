@@ -2,6 +2,7 @@
 from typing import TYPE_CHECKING
 
 from .api import CommandSend
+from .command_coalescer import CommandCoalescer
 from .node import Node
 from .parameter import Intensity
 
@@ -27,6 +28,7 @@ class DimmableDevice(Node):
             pyvlx=pyvlx, node_id=node_id, name=name, serial_number=serial_number
         )
         self.intensity = Intensity()
+        self.command_coalescer = CommandCoalescer()
 
     async def set_intensity(self, intensity: Intensity, wait_for_completion: bool = True) -> None:
         """Set light to desired intensity.
@@ -44,7 +46,7 @@ class DimmableDevice(Node):
             node_id=self.node_id,
             parameter=intensity,
         )
-        await command.send()
+        await self.command_coalescer.send(command)
         await self.after_update()
 
     async def turn_on(self, wait_for_completion: bool = True) -> None:
@@ -0,0 +1,127 @@
+"""Module for routing received frames to their subscribers."""
+from typing import (
+    Any, Callable, Coroutine, Dict, Iterable, List, Tuple, Type, TypeVar)
+
+from .api.frames import FrameBase
+
+CallbackType = Callable[[FrameBase], Coroutine[Any, Any, None]]
+FrameHandlerType = Callable[[FrameBase], None]
+FrameFilterType = Callable[[type], bool]
+SubscriberT = TypeVar("SubscriberT")
+
+
+class FrameRouter:
+    """Class for looking up the subscribers of received frames by frame type.
+
+    Subscribers register either for a list of frame types, in which case they
+    also receive frames of derived frame classes, or for all frames. Handlers
+    are plain functions which are called directly, callbacks are coroutine
+    functions. The subscribers of a frame type are resolved once and cached
+    until the subscriptions change.
+
+    Handlers may pass accepts, a function telling whether they are interested
+    in frames of a type right now. wants() is asked before a received frame is
+    decoded, frames no subscriber wants are dropped undecoded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize FrameRouter."""
+        self._handlers: Dict[Type[FrameBase] | None, List[FrameHandlerType]] = {}
+        self._callbacks: Dict[Type[FrameBase] | None, List[CallbackType]] = {}
+        self._routes: Dict[type, Tuple[Tuple[FrameHandlerType, ...], Tuple[CallbackType, ...]]] = {}
+        self._accepts: Dict[FrameHandlerType, FrameFilterType] = {}
+        self._interests: Dict[type, Tuple[bool, Tuple[FrameFilterType, ...]]] = {}
+
+    @staticmethod
+    def _add(
+        subscriptions: Dict[Type[FrameBase] | None, List[SubscriberT]],
+        subscriber: SubscriberT,
+        frame_types: Iterable[Type[FrameBase]] | None,
+    ) -> None:
+        """Add subscriber for frame types, or for all frames if frame_types is None."""
+        for frame_type in (None,) if frame_types is None else frame_types:
+            subscriptions.setdefault(frame_type, []).append(subscriber)
+
+    @staticmethod
+    def _remove(
+        subscriptions: Dict[Type[FrameBase] | None, List[SubscriberT]],
+        subscriber: SubscriberT,
+    ) -> None:
+        """Remove all subscriptions of subscriber, raise ValueError if there are none."""
+        found = False
+        for frame_type, subscribers in list(subscriptions.items()):
+            while subscriber in subscribers:
+                subscribers.remove(subscriber)
+                found = True
+            if not subscribers:
+                del subscriptions[frame_type]
+        if not found:
+            raise ValueError(f"{subscriber} is not subscribed")
+
+    def _clear_cache(self) -> None:
+        """Clear resolved subscribers after subscriptions changed."""
+        self._routes.clear()
+        self._interests.clear()
+
+    def add_handler(
+        self,
+        handler: FrameHandlerType,
+        frame_types: Iterable[Type[FrameBase]] | None = None,
+        accepts: FrameFilterType | None = None,
+    ) -> None:
+        """Subscribe handler to frame types, or to all frames if frame_types is None."""
+        self._add(self._handlers, handler, frame_types)
+        if accepts is not None:
+            self._accepts[handler] = accepts
+        self._clear_cache()
+
+    def remove_handler(self, handler: FrameHandlerType) -> None:
+        """Unsubscribe handler."""
+        self._remove(self._handlers, handler)
+        self._accepts.pop(handler, None)
+        self._clear_cache()
+
+    def add_callback(self, callback: CallbackType, frame_types: Iterable[Type[FrameBase]] | None = None) -> None:
+        """Subscribe callback to frame types, or to all frames if frame_types is None."""
+        self._add(self._callbacks, callback, frame_types)
+        self._clear_cache()
+
+    def remove_callback(self, callback: CallbackType) -> None:
+        """Unsubscribe callback."""
+        self._remove(self._callbacks, callback)
+        self._clear_cache()
+
+    def wants(self, frame_type: type) -> bool:
+        """Return True if any subscriber is interested in frames of frame_type right now."""
+        interest = self._interests.get(frame_type)
+        if interest is None:
+            handlers, callbacks = self.subscribers(frame_type)
+            filters = tuple(self._accepts[handler] for handler in handlers if handler in self._accepts)
+            interest = (bool(callbacks) or len(filters) < len(handlers), filters)
+            self._interests[frame_type] = interest
+        unconditional, filters = interest
+        return unconditional or any(accepts(frame_type) for accepts in filters)
+
+    def subscribers(self, frame_type: type) -> Tuple[Tuple[FrameHandlerType, ...], Tuple[CallbackType, ...]]:
+        """Return handlers and callbacks subscribed to frames of frame_type."""
+        route = self._routes.get(frame_type)
+        if route is None:
+            route = (
+                self._resolve(self._handlers, frame_type),
+                self._resolve(self._callbacks, frame_type),
+            )
+            self._routes[frame_type] = route
+        return route
+
+    @staticmethod
+    def _resolve(
+        subscriptions: Dict[Type[FrameBase] | None, List[SubscriberT]],
+        frame_type: type,
+    ) -> Tuple[SubscriberT, ...]:
+        """Collect subscribers of frame_type, subscribers to all frames first."""
+        subscribers: List[SubscriberT] = []
+        for key in (None, *frame_type.__mro__):
+            for subscriber in subscriptions.get(key, ()):
+                if subscriber not in subscribers:
+                    subscribers.append(subscriber)
+        return tuple(subscribers)
@@ -0,0 +1,150 @@
+"""Module for group of nodes."""
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from .api.frames import (
+    ActivateProductGroupConfirmationStatus, FrameGroupInformationBase)
+from .const import GroupType, NodeParameter, RunStatus, Velocity
+from .exception import PyVLXException
+from .log import PYVLXLOG
+from .node import Node
+from .parameter import CurrentPosition, FunctionalParams, Parameter, Position
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class Group:
+    """Object for a group of nodes, defined within the KLF 200."""
+
+    def __init__(
+        self,
+        pyvlx: "PyVLX",
+        group_id: int,
+        name: str,
+        group_type: GroupType = GroupType.USER_GROUP,
+        node_ids: List[int] | None = None,
+        revision: int = 0,
+    ):
+        """Initialize Group object.
+
+        Parameters:
+            * pyvlx: PyVLX object
+            * group_id: internal id for addressing groups.
+                Provided by KLF 200 device
+            * name: group name
+            * group_type: user group, room, house or all-group
+            * node_ids: ids of the member nodes
+            * revision: revision of the group, increased by the gateway on changes
+
+        """
+        self.pyvlx = pyvlx
+        self.group_id = group_id
+        self.name = name
+        self.group_type = group_type
+        self.node_ids = node_ids if node_ids is not None else []
+        self.revision = revision
+        # False once the gateway refused to activate the group as product group
+        self.product_group: bool | None = None
+
+    @classmethod
+    def from_frame(cls, pyvlx: "PyVLX", frame: FrameGroupInformationBase) -> "Group":
+        """Create group from group information frame."""
+        return cls(
+            pyvlx=pyvlx,
+            group_id=frame.group_id,
+            name=frame.name,
+            group_type=frame.group_type,
+            node_ids=list(frame.node_ids),
+            revision=frame.revision,
+        )
+
+    @property
+    def nodes(self) -> List[Node]:
+        """Return the loaded member nodes."""
+        return [self.pyvlx.nodes[node_id] for node_id in self.node_ids if node_id in self.pyvlx.nodes]
+
+    async def set_position(
+        self,
+        position: Parameter,
+        velocity: Velocity | int | None = Velocity.DEFAULT,
+        wait_for_completion: bool = True,
+        timeout_in_seconds: int = 2,
+    ) -> Dict[int, RunStatus]:
+        """Set all members of the group to position with as few commands as possible.
+
+        The group is activated as product group with a single command. If the
+        gateway refuses that because the members are actuators of different
+        kinds, or if velocity is given in percent, the members are moved via
+        Nodes.set_position() instead.
+
+        Parameters:
+            * position: Position or other main parameter to be set.
+            * velocity: Velocity to be used during transition.
+            * wait_for_completion: If True, also wait for the gateway's
+                session-finished notification; bounded by ``timeout_in_seconds``.
+            * timeout_in_seconds: Maximum wait time in seconds.
+
+        Returns the last run status reported per node id.
+        """
+        if self.product_group is not False and not isinstance(velocity, int):
+            try:
+                node_run_status = await self.pyvlx.activate_product_group(
+                    self.group_id,
+                    position,
+                    velocity=velocity if velocity is not None else Velocity.DEFAULT,
+                    wait_for_completion=wait_for_completion,
+                    timeout_in_seconds=timeout_in_seconds,
+                )
+            except PyVLXException as error:
+                if error.parameter.get("status") != ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE:
+                    raise
+                PYVLXLOG.debug("Group %s is no product group, moving its nodes one command per batch", self.group_id)
+                self.product_group = False
+            else:
+                self.product_group = True
+                return node_run_status
+        functional_parameter: FunctionalParams = {}
+        if isinstance(velocity, Velocity):
+            if velocity is not Velocity.DEFAULT:
+                if velocity is Velocity.SILENT:
+                    functional_parameter[NodeParameter.FP1] = Parameter(raw=b"\x00\x00")
+                else:
+                    functional_parameter[NodeParameter.FP1] = Parameter(raw=b"\xC8\x00")
+        elif isinstance(velocity, int):
+            functional_parameter[NodeParameter.FP1] = Position(position_percent=velocity)
+        return await self.pyvlx.nodes.set_position(
+            self.node_ids,
+            position,
+            functional_parameter=functional_parameter or None,
+            wait_for_completion=wait_for_completion,
+            timeout_in_seconds=timeout_in_seconds,
+        )
+
+    async def open(self, wait_for_completion: bool = True, timeout_in_seconds: int = 2) -> Dict[int, RunStatus]:
+        """Open all members of the group."""
+        return await self.set_position(
+            Position(position_percent=0), wait_for_completion=wait_for_completion, timeout_in_seconds=timeout_in_seconds
+        )
+
+    async def close(self, wait_for_completion: bool = True, timeout_in_seconds: int = 2) -> Dict[int, RunStatus]:
+        """Close all members of the group."""
+        return await self.set_position(
+            Position(position_percent=100), wait_for_completion=wait_for_completion, timeout_in_seconds=timeout_in_seconds
+        )
+
+    async def stop(self, wait_for_completion: bool = True, timeout_in_seconds: int = 2) -> Dict[int, RunStatus]:
+        """Stop all members of the group."""
+        return await self.set_position(
+            CurrentPosition(), wait_for_completion=wait_for_completion, timeout_in_seconds=timeout_in_seconds
+        )
+
+    def __str__(self) -> str:
+        """Return object as readable string."""
+        return (
+            f'<{type(self).__name__} name="{self.name}" id="{self.group_id}" '
+            f'group_type="{self.group_type}" node_ids="{self.node_ids}"/>'
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Equal operator."""
+        return self.__dict__ == other.__dict__
@@ -0,0 +1,139 @@
+"""Module for storing and accessing group list."""
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+from .api import GetAllGroupsInformation, GetGroupInformation, NewGroup
+from .api.frames import (
+    FrameBase, FrameGroupDeletedNotification,
+    FrameGroupInformationChangedNotification)
+from .const import ChangeType, GroupType
+from .exception import PyVLXException
+from .group import Group
+from .indexed_items import IndexedItems
+from .log import PYVLXLOG
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class Groups:
+    """Class for storing and accessing groups.
+
+    Groups are indexed by group_id and name, and the groups of a node by
+    node id. Memberships are kept current from the group information
+    changed and group deleted notifications of the gateway, see process_frame().
+    """
+
+    FRAME_TYPES = (FrameGroupInformationChangedNotification, FrameGroupDeletedNotification)
+
+    def __init__(self, pyvlx: "PyVLX"):
+        """Initialize Groups class."""
+        self.pyvlx = pyvlx
+        self.__groups: IndexedItems[Group] = IndexedItems("group_id", "name")
+        self.__groups_of_node: Dict[int, List[Group]] | None = None
+
+    def __iter__(self) -> Iterator[Group]:
+        """Iterate."""
+        yield from self.__groups
+
+    def __getitem__(self, key: str | int) -> Group:
+        """Return group by name or by index."""
+        group = self.__groups.get(key) if isinstance(key, int) else self.__groups.get_by("name", key)
+        if group is None:
+            raise KeyError
+        return group
+
+    def __contains__(self, key: str | int) -> bool:
+        """Check if key is in index."""
+        if isinstance(key, int):
+            return self.__groups.get(key) is not None
+        return self.__groups.get_by("name", key) is not None
+
+    def __len__(self) -> int:
+        """Return number of groups."""
+        return len(self.__groups)
+
+    def add(self, group: Group) -> None:
+        """Add group, replace existing group if group with group_id is present."""
+        if not isinstance(group, Group):
+            raise TypeError()
+        self.__groups.add(group)
+        self.__groups_of_node = None
+
+    def remove(self, group_id: int) -> None:
+        """Remove group with group_id, raise KeyError if it is not present."""
+        self.__groups.remove(self[group_id])
+        self.__groups_of_node = None
+        PYVLXLOG.debug("Removed group with group_id %s", group_id)
+
+    def clear(self) -> None:
+        """Clear internal groups array."""
+        self.__groups.replace_all([])
+        self.__groups_of_node = None
+
+    def groups_of_node(self, node_id: int) -> List[Group]:
+        """Return the groups node_id is member of."""
+        if self.__groups_of_node is None:
+            groups_of_node: Dict[int, List[Group]] = {}
+            for group in self.__groups:
+                for member in group.node_ids:
+                    groups_of_node.setdefault(member, []).append(group)
+            self.__groups_of_node = groups_of_node
+        return list(self.__groups_of_node.get(node_id, []))
+
+    def update(self, group: Group) -> Group:
+        """Merge group into the existing group with the same group_id, so references stay valid, or add it."""
+        existing = self.__groups.get(group.group_id)
+        if existing is None:
+            self.add(group)
+            return group
+        renamed = existing.name != group.name
+        existing.name = group.name
+        existing.group_type = group.group_type
+        if existing.node_ids != group.node_ids:
+            existing.node_ids = group.node_ids
+            existing.product_group = None
+        existing.revision = group.revision
+        if renamed:
+            self.__groups.reindex()
+        self.__groups_of_node = None
+        return existing
+
+    async def load(self, group_id: int | None = None, group_type: GroupType | None = None) -> None:
+        """Load groups from KLF 200, if no group_id is specified all groups, optionally of group_type only, are loaded."""
+        if group_id is not None:
+            get_group_information = GetGroupInformation(pyvlx=self.pyvlx, group_id=group_id)
+            await get_group_information.do_api_call()
+            if not get_group_information.success or get_group_information.notification_frame is None:
+                raise PyVLXException("Unable to retrieve group information", group_id=group_id)
+            self.update(Group.from_frame(self.pyvlx, get_group_information.notification_frame))
+            return
+        get_all_groups_information = GetAllGroupsInformation(pyvlx=self.pyvlx, group_type=group_type)
+        await get_all_groups_information.do_api_call()
+        if not get_all_groups_information.success:
+            raise PyVLXException("Unable to retrieve group information")
+        loaded = [
+            self.update(Group.from_frame(self.pyvlx, frame))
+            for frame in get_all_groups_information.notification_frames
+        ]
+        if group_type is None:
+            self.__groups.replace_all(loaded)
+            self.__groups_of_node = None
+
+    async def create(self, name: str, node_ids: List[int], group_type: GroupType = GroupType.USER_GROUP) -> Group:
+        """Create group of node_ids within KLF 200 and return it."""
+        new_group = NewGroup(pyvlx=self.pyvlx, name=name, node_ids=node_ids, group_type=group_type)
+        await new_group.do_api_call()
+        if not new_group.success or new_group.group_id is None:
+            raise PyVLXException("Unable to create group", name=name)
+        return self.update(Group(pyvlx=self.pyvlx, group_id=new_group.group_id, name=name, group_type=group_type, node_ids=list(node_ids)))
+
+    async def process_frame(self, frame: FrameBase) -> None:
+        """Update groups from group information changed or group deleted notification."""
+        if isinstance(frame, FrameGroupInformationChangedNotification):
+            if frame.change_type == ChangeType.MODIFIED:
+                self.update(Group.from_frame(self.pyvlx, frame))
+                return
+        elif not isinstance(frame, FrameGroupDeletedNotification):
+            return
+        if frame.group_id in self:
+            self.remove(frame.group_id)
@@ -1,12 +1,15 @@
 """Module for sending get state requests to API in regular periods."""
 import asyncio
+import math
+import time
 from contextlib import suppress
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 
-from .api import GetState
+from .api import GetState, RequestPriority
 from .api.status_request import StatusRequest
 from .exception import PyVLXException
 from .log import PYVLXLOG
+from .node import Node
 from .opening_device import Blind, DualRollerShutter, OpeningDevice
 
 if TYPE_CHECKING:
@@ -14,16 +17,50 @@ if TYPE_CHECKING:
 
 
 class Heartbeat:
-    """Class for sending heartbeats to API."""
+    """Class for sending heartbeats to API.
+
+    By default the status of the nodes is requested one node after the other.
+    With batch_status_requests enabled, the status of up to 20 nodes is
+    requested per session instead, and the whole sweep is aborted after
+    sweep_time_budget seconds.
+
+    If max_state_age is set, the heartbeat is adaptive: only nodes whose last
+    received state is older than max_state_age seconds are polled, stalest
+    first, and the heartbeat wakes up when the next node gets stale, but not
+    more often than every min_interval seconds. A poll counts as fresh state
+    as well, so a node which does not answer, e.g. because it is powered
+    off, is polled again after max_state_age seconds only. The state received by house
+    monitor counts as fresh, except for Blind and DualRollerShutter nodes
+    which need a status request for correct functional parameters. Polling
+    backs off while other API calls are in flight or waiting, and the get
+    state request is only sent once per interval.
+
+    All requests of the heartbeat are dispatched with MAINTENANCE priority,
+    so commands of the user are started before the next queued status
+    request, however large the sweep is.
+    """
 
     def __init__(
-        self, pyvlx: "PyVLX", interval: int = 30, load_all_states: bool = True
+        self,
+        pyvlx: "PyVLX",
+        interval: int = 30,
+        load_all_states: bool = True,
+        batch_status_requests: bool = False,
+        sweep_time_budget: float = 20,
+        max_state_age: float | None = None,
+        min_interval: float = 5,
     ):
         """Initialize Heartbeat object."""
         PYVLXLOG.debug("Heartbeat: initialize")
         self.pyvlx = pyvlx
         self.interval = interval
         self.load_all_states = load_all_states
+        self.batch_status_requests = batch_status_requests
+        self.sweep_time_budget = sweep_time_budget
+        self.max_state_age = max_state_age
+        self.min_interval = min_interval
+        self._last_get_state: float | None = None
+        self._last_polled: Dict[int, float] = {}
         self.heartbeat_task: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
 
@@ -31,7 +68,7 @@ class Heartbeat:
         PYVLXLOG.debug("Heartbeat: started")
         while True:
             PYVLXLOG.debug("Heartbeat: sleeping")
-            await asyncio.sleep(self.interval)
+            await asyncio.sleep(self.next_delay())
             PYVLXLOG.debug("Heartbeat: pulsing")
             try:
                 await self.pulse()
@@ -74,13 +111,78 @@ class Heartbeat:
     async def pulse(self) -> None:
         """Send get state request to API to keep the connection alive."""
         PYVLXLOG.debug("Heartbeat: pulse")
-        get_state = GetState(pyvlx=self.pyvlx)
-        await get_state.do_api_call()
-        if not get_state.success:
-            raise PyVLXException("Unable to send get state.")
+        if self._get_state_due():
+            get_state = GetState(pyvlx=self.pyvlx)
+            get_state.priority = RequestPriority.MAINTENANCE
+            await get_state.do_api_call()
+            if not get_state.success:
+                raise PyVLXException("Unable to send get state.")
+            self._last_get_state = time.monotonic()
 
         # If nodes contain Blind or DualRollerShutter device, refresh orientation or upper/lower curtain positions because House Monitoring
         # delivers wrong values for FP1, FP2 and FP3 parameter
+        nodes = self._nodes_to_poll()
+        if self.max_state_age is not None:
+            nodes = self.stale_nodes(nodes)
+        if self.batch_status_requests:
+            await self.sweep(nodes)
+            return
+        for node in nodes:
+            if self._back_off():
+                return
+            status_request = StatusRequest(self.pyvlx, node.node_id)
+            status_request.priority = RequestPriority.MAINTENANCE
+            self._last_polled[node.node_id] = time.monotonic()
+            await status_request.do_api_call()
+
+    def _get_state_due(self) -> bool:
+        """Return True if the get state request has to be sent in this pulse."""
+        if self.max_state_age is None or self._last_get_state is None:
+            return True
+        return time.monotonic() - self._last_get_state >= self.interval
+
+    def _back_off(self) -> bool:
+        """Return True if polling should be postponed because other API calls are pending."""
+        if self.max_state_age is None:
+            return False
+        dispatcher = self.pyvlx.api_dispatcher
+        if dispatcher.in_flight or dispatcher.waiting:
+            PYVLXLOG.debug("Heartbeat: backing off, API calls are pending")
+            return True
+        return False
+
+    def _state_age(self, node: Node, now: float) -> float:
+        """Return seconds since the last state of node was received or since it was polled the last time."""
+        if isinstance(node, (Blind, DualRollerShutter)):
+            last_seen = self.pyvlx.node_updater.last_status_received.get(node.node_id)
+        else:
+            last_seen = self.pyvlx.node_updater.last_seen.get(node.node_id)
+        last_polled = self._last_polled.get(node.node_id)
+        if last_polled is not None:
+            last_seen = last_polled if last_seen is None else max(last_seen, last_polled)
+        return math.inf if last_seen is None else now - last_seen
+
+    def stale_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Return nodes whose state is older than max_state_age, stalest first."""
+        assert self.max_state_age is not None
+        now = time.monotonic()
+        ages = {node.node_id: self._state_age(node, now) for node in nodes}
+        stale = [node for node in nodes if ages[node.node_id] >= self.max_state_age]
+        return sorted(stale, key=lambda node: ages[node.node_id], reverse=True)
+
+    def next_delay(self) -> float:
+        """Return seconds until the next pulse."""
+        if self.max_state_age is None:
+            return self.interval
+        now = time.monotonic()
+        delay: float = self.interval
+        for node in self._nodes_to_poll():
+            delay = min(delay, self.max_state_age - self._state_age(node, now))
+        return max(delay, self.min_interval)
+
+    def _nodes_to_poll(self) -> List[Node]:
+        """Return nodes whose status should be requested."""
+        nodes = []
         for node in self.pyvlx.nodes:
             # A StatusRequest issued to a node mid-travel can make the
             # KLF200 emit a run_status = EXECUTION_COMPLETED notification
@@ -100,7 +202,34 @@ class Heartbeat:
                 )
                 continue
             if isinstance(node, (Blind, DualRollerShutter)) or self.load_all_states:
-                status_request = StatusRequest(self.pyvlx, node.node_id)
-                await status_request.do_api_call()
-                # give user requests a chance
-                await asyncio.sleep(0.5)
+                nodes.append(node)
+        return nodes
+
+    async def sweep(self, nodes: List[Node]) -> List[int]:
+        """Request status of nodes in batches of up to 20 nodes per session.
+
+        The sweep is aborted if it takes longer than sweep_time_budget.
+        Returns the ids of the nodes whose status was received. The
+        notifications themselves are processed by the NodeUpdater.
+        """
+        node_ids = [node.node_id for node in nodes]
+        received: List[int] = []
+        batch_size = StatusRequest.MAX_NODE_IDS
+        try:
+            async with asyncio.timeout(self.sweep_time_budget):
+                for i in range(0, len(node_ids), batch_size):
+                    if self._back_off():
+                        break
+                    batch = node_ids[i:i + batch_size]
+                    status_request = StatusRequest(self.pyvlx, node_ids=batch)
+                    status_request.priority = RequestPriority.MAINTENANCE
+                    polled_at = time.monotonic()
+                    self._last_polled.update((node_id, polled_at) for node_id in batch)
+                    await status_request.do_api_call()
+                    received.extend(status_request.notification_frames)
+        except TimeoutError:
+            PYVLXLOG.debug(
+                "Heartbeat: sweep exceeded time budget of %ss, received status of %d of %d nodes",
+                self.sweep_time_budget, len(received), len(node_ids),
+            )
+        return received
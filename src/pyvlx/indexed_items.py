@@ -0,0 +1,105 @@
+"""Module for ordered collections of items with dict indexes."""
+from typing import Any, Dict, Generic, Iterable, Iterator, List, TypeVar
+
+from .log import PYVLXLOG
+
+ItemT = TypeVar("ItemT")
+
+
+class IndexedItems(Generic[ItemT]):
+    """Ordered collection of items indexed by the values of some of their attributes.
+
+    Items are stored by the value of their key attribute, which has to be
+    unique. Secondary indexes map the values of further attributes to the
+    first item with this value, items whose value is None are not indexed.
+
+    Attributes of stored items may be changed from outside, e.g. when a node
+    is renamed. Changes of the key or secondary attributes require a call of
+    reindex(). Until then, lookups verify the attribute of the found item and
+    return None rather than an item which does not match.
+    """
+
+    def __init__(self, key: str, *secondary: str):
+        """Initialize IndexedItems."""
+        self.key = key
+        self.secondary = secondary
+        self._items: Dict[Any, ItemT] = {}
+        self._indexes: Dict[str, Dict[Any, ItemT]] = {attribute: {} for attribute in secondary}
+        self._indexes_outdated = False
+
+    def __iter__(self) -> Iterator[ItemT]:
+        """Iterate items in order of insertion."""
+        return iter(list(self._items.values()))
+
+    def __len__(self) -> int:
+        """Return number of items."""
+        return len(self._items)
+
+    def get(self, value: Any) -> ItemT | None:
+        """Return item by value of key attribute."""
+        item = self._items.get(value)
+        if item is not None and getattr(item, self.key) != value:
+            return None
+        return item
+
+    def get_by(self, attribute: str, value: Any) -> ItemT | None:
+        """Return first item by value of a secondary attribute."""
+        if self._indexes_outdated:
+            self._rebuild_indexes()
+        item = self._indexes[attribute].get(value)
+        if item is not None and getattr(item, attribute) != value:
+            return None
+        return item
+
+    def add(self, item: ItemT) -> ItemT | None:
+        """Add item, return the replaced item with the same key if present."""
+        value = getattr(item, self.key)
+        replaced = self._items.get(value)
+        self._items[value] = item
+        if replaced is not None:
+            self._indexes_outdated = True
+        elif not self._indexes_outdated:
+            self._index(item)
+        return replaced
+
+    def remove(self, item: ItemT) -> None:
+        """Remove item, raise KeyError if it is not present."""
+        value = getattr(item, self.key)
+        if self._items.get(value) is not item:
+            raise KeyError(value)
+        del self._items[value]
+        self._indexes_outdated = True
+
+    def replace_all(self, items: Iterable[ItemT]) -> None:
+        """Replace all items, of items with the same key the first one is kept."""
+        self._items = {}
+        for item in items:
+            value = getattr(item, self.key)
+            if value in self._items:
+                PYVLXLOG.warning("Ignoring item with duplicate %s %s: %s", self.key, value, item)
+                continue
+            self._items[value] = item
+        self._rebuild_indexes()
+
+    def reindex(self) -> None:
+        """Rebuild all indexes, required after key or secondary attributes of items have been changed."""
+        self.replace_all(list(self._items.values()))
+
+    def values(self) -> List[ItemT]:
+        """Return list of items."""
+        return list(self._items.values())
+
+    def _index(self, item: ItemT) -> None:
+        """Add item to secondary indexes."""
+        for attribute, index in self._indexes.items():
+            value = getattr(item, attribute)
+            if value is not None:
+                index.setdefault(value, item)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild secondary indexes."""
+        for index in self._indexes.values():
+            index.clear()
+        for item in self._items.values():
+            self._index(item)
+        self._indexes_outdated = False
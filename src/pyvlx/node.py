@@ -5,7 +5,7 @@ Node object is an interface class and should
 be derived by other objects like window openers
 and roller shutters.
 """
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, List
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Tuple
 
 from .api import SetNodeName, WinkSend
 from .const import OperatingState, RunStatus, StatusReply, WinkTime
@@ -71,13 +71,16 @@ class Node:
         """
         if not isinstance(other, Node):
             return False
-        if type(self) is not type(other):
-            return False
-        if self.serial_number and other.serial_number:
-            return self.serial_number == other.serial_number
-        if self.serial_number or other.serial_number:
-            return False
-        return self.node_id == other.node_id
+        return self.identity_key() == other.identity_key()
+
+    def identity_key(self) -> Tuple[type, str | None, int | None]:
+        """Return hashable key which is equal for nodes representing the same physical node.
+
+        See represents_same_node() for the matching rules.
+        """
+        if self.serial_number:
+            return (type(self), self.serial_number, None)
+        return (type(self), None, self.node_id)
 
     async def rename(self, name: str) -> None:
         """Change name of node."""
@@ -86,6 +89,7 @@ class Node:
         if not set_node_name.success:
             raise PyVLXException("Unable to rename node")
         self.name = name
+        self.pyvlx.nodes.reindex()
 
     async def wink(self, wink_time: WinkTime = WinkTime.BY_MANUFACTURER, wait_for_completion: bool = True) -> None:
         """Identify node by making it wink."""
@@ -113,8 +117,12 @@ class Node:
         )
 
     def __eq__(self, other: Any) -> bool:
-        """Equal operator."""
+        """Equal operator, the command coalescer of a node is runtime state and not compared."""
         return (
             type(self).__name__ == type(other).__name__
-            and self.__dict__ == other.__dict__
+            and self._compared_state() == other._compared_state()
         )
+
+    def _compared_state(self) -> Dict[str, Any]:
+        """Return the attributes compared by __eq__."""
+        return {key: value for key, value in self.__dict__.items() if key != "command_coalescer"}
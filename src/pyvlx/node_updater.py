@@ -1,6 +1,7 @@
 """Module for updating nodes via frames."""
 import datetime
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Dict
 
 from .api.frames import (
     FrameBase, FrameCommandRunStatusNotification,
@@ -36,9 +37,20 @@ def _set_node_property(node: Node, prop_name: str, new_value: Any, log_unchanged
 class NodeUpdater:
     """Class for updating nodes via incoming frames,  usually received by house monitor."""
 
+    FRAME_TYPES = (
+        FrameGetAllNodesInformationNotification,
+        FrameNodeStatePositionChangedNotification,
+        FrameStatusRequestNotification,
+        FrameCommandRunStatusNotification,
+    )
+
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize NodeUpdater object."""
         self.pyvlx = pyvlx
+        # time.monotonic() timestamps per node id of the last frame received for a node,
+        # and of the last frame containing the full status including functional parameters.
+        self.last_seen: Dict[int, float] = {}
+        self.last_status_received: Dict[int, float] = {}
 
     @staticmethod
     def _is_concrete_position(position: Position) -> bool:
@@ -392,9 +404,21 @@ class NodeUpdater:
         if node_changed:
             await node.after_update()
 
+    def _record_seen(self, frame: FrameBase) -> None:
+        """Record the time a frame for a node was received."""
+        now = time.monotonic()
+        if isinstance(frame, (FrameGetAllNodesInformationNotification, FrameStatusRequestNotification)):
+            self.last_seen[frame.node_id] = now
+            self.last_status_received[frame.node_id] = now
+        elif isinstance(frame, FrameNodeStatePositionChangedNotification):
+            self.last_seen[frame.node_id] = now
+        elif isinstance(frame, FrameCommandRunStatusNotification) and frame.index_id is not None:
+            self.last_seen[frame.index_id] = now
+
     async def process_frame(self, frame: FrameBase) -> None:
         """Update nodes via frame, usually received by house monitor."""
         PYVLXLOG.debug("NodeUpdater process frame: %s", frame.__class__.__name__)
+        self._record_seen(frame)
 
         if isinstance(frame, (FrameGetAllNodesInformationNotification, FrameNodeStatePositionChangedNotification)):
             await self._process_node_state_frame(frame)
@@ -1,23 +1,56 @@
 """Module for storing nodes."""
-from typing import TYPE_CHECKING, Iterator, List
+import asyncio
+import hashlib
+import struct
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Set, Tuple)
 
-from .api import GetAllNodesInformation, GetNodeInformation
+from .api import (
+    CommandSend, GetAllNodesInformation, GetNodeInformation, GetSystemTable)
+from .api.frames import SystemTableEntry
+from .const import RunStatus
 from .exception import PyVLXException
+from .indexed_items import IndexedItems
 from .log import PYVLXLOG
 from .node import Node
-from .node_helper import convert_frame_to_node
+from .node_helper import FrameNodeInformation, convert_frame_to_node
+from .parameter import FunctionalParams, Parameter
 
 if TYPE_CHECKING:
     from pyvlx import PyVLX
 
 
+@dataclass
+class NodeChanges:
+    """Nodes which were added or removed, or whose name or node_id changed, when loading all nodes."""
+
+    added: List[Node] = field(default_factory=list)
+    removed: List[Node] = field(default_factory=list)
+    changed: List[Node] = field(default_factory=list)
+
+
 class Nodes:
-    """Object for storing node objects."""
+    """Object for storing node objects.
+
+    Nodes are indexed by node_id, name and serial_number, so lookups take
+    constant time. The node information frames the nodes were created from
+    are kept in node_information, so they can be stored in a snapshot.
+
+    system_table_fingerprint identifies the system table of the gateway the
+    nodes were loaded from, see load().
+    """
+
+    # Fields of node information which are taken over into Node objects when they are created
+    TOPOLOGY_FIELDS = ("node_id", "name", "node_type", "serial_number")
 
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize Nodes object."""
         self.pyvlx = pyvlx
-        self.__nodes: List[Node] = []
+        self.__nodes: IndexedItems[Node] = IndexedItems("node_id", "name", "serial_number")
+        self.node_information: Dict[int, FrameNodeInformation] = {}
+        self.system_table_fingerprint: bytes | None = None
 
     def __iter__(self) -> Iterator[Node]:
         """Iterate."""
@@ -25,58 +58,65 @@ class Nodes:
 
     def __getitem__(self, key: str | int) -> Node:
         """Return node by name or by index."""
-        if isinstance(key, int):
-            for node in self.__nodes:
-                if node.node_id == key:
-                    return node
-        for node in self.__nodes:
-            if node.name == key:
-                return node
-        raise KeyError
+        node = self.__nodes.get(key) if isinstance(key, int) else self.__nodes.get_by("name", key)
+        if node is None:
+            raise KeyError
+        return node
 
     def __contains__(self, key: str | int | Node) -> bool:
         """Check if key is in index."""
         if isinstance(key, int):
-            for node in self.__nodes:
-                if node.node_id == key:
-                    return True
+            return self.__nodes.get(key) is not None
         if isinstance(key, Node):
-            for node in self.__nodes:
-                if node == key:
-                    return True
-        for node in self.__nodes:
-            if node.name == key:
-                return True
-        return False
+            node = self.__nodes.get(key.node_id)
+            return node is not None and (node is key or node == key)
+        return self.__nodes.get_by("name", key) is not None
 
     def __len__(self) -> int:
         """Return number of nodes."""
         return len(self.__nodes)
 
+    def get_by_serial_number(self, serial_number: str) -> Node | None:
+        """Return node by serial number, None if not found."""
+        return self.__nodes.get_by("serial_number", serial_number)
+
     def add(self, node: Node) -> None:
         """Add Node, replace existing node if node with node_id is present."""
         if not isinstance(node, Node):
             raise TypeError()
-        for i, j in enumerate(self.__nodes):
-            if j.node_id == node.node_id:
-                if j is node:
-                    PYVLXLOG.debug(
-                        "Node with node_id %s already present; skipping re-add",
-                        node.node_id,
-                    )
-                    return
-                j.dispose()
-                self.__nodes[i] = node
-                PYVLXLOG.debug("Replaced node with node_id %s", node.node_id)
-                return
-        self.__nodes.append(node)
+        existing = self.__nodes.get(node.node_id)
+        if existing is node:
+            PYVLXLOG.debug(
+                "Node with node_id %s already present; skipping re-add",
+                node.node_id,
+            )
+            return
+        self.__nodes.add(node)
+        if existing is not None:
+            existing.dispose()
+            PYVLXLOG.debug("Replaced node with node_id %s", node.node_id)
+            return
         PYVLXLOG.debug("Added node with node_id %s", node.node_id)
 
+    def remove(self, node_id: int) -> None:
+        """Dispose and remove node with node_id, raise KeyError if it is not present."""
+        node = self[node_id]
+        self.__nodes.remove(node)
+        self.node_information.pop(node_id, None)
+        node.dispose()
+        PYVLXLOG.debug("Removed node with node_id %s", node_id)
+
+    def reindex(self) -> None:
+        """Update the indexes, required after node_id, name or serial_number of nodes have been changed."""
+        self.__nodes.reindex()
+
     def clear(self) -> None:
         """Clear internal node array."""
         for node in self.__nodes:
             node.dispose()
-        self.__nodes = []
+        self.__nodes.replace_all([])
+        self.node_information = {}
+        self.system_table_fingerprint = None
 
     @staticmethod
     def _update_node_metadata(existing: Node, loaded: Node) -> None:
@@ -93,30 +133,104 @@ class Nodes:
         existing.node_id = loaded.node_id
         existing.name = loaded.name
 
-    def _find_matching_existing(
+    @staticmethod
+    def _same_topology(known: FrameNodeInformation, received: FrameNodeInformation) -> bool:
+        """Return True if received node information does not change the node created from known node information."""
+        return all(getattr(known, name) == getattr(received, name) for name in Nodes.TOPOLOGY_FIELDS)
+
+    def _find_matching_existing(self, loaded: Node) -> Node | None:
+        """Find existing node matching loaded node identity."""
+        if loaded.serial_number:
+            existing = self.get_by_serial_number(loaded.serial_number)
+        else:
+            existing = self.__nodes.get(loaded.node_id)
+        if existing is not None and existing.represents_same_node(loaded):
+            return existing
+        return None
+
+    def _existing_by_identity(self) -> Dict[Tuple[type, str | None, int | None], Deque[Node]]:
+        """Return existing nodes by identity key, in order."""
+        existing_by_identity: Dict[Tuple[type, str | None, int | None], Deque[Node]] = {}
+        for existing in self.__nodes:
+            existing_by_identity.setdefault(existing.identity_key(), deque()).append(existing)
+        return existing_by_identity
+
+    async def set_position(
         self,
-        loaded: Node,
-        used_existing: List[Node],
-    ) -> Node | None:
-        """Find existing node matching loaded node identity.
+        nodes: Iterable[Node | int],
+        position: Parameter,
+        functional_parameter: FunctionalParams | None = None,
+        wait_for_completion: bool = True,
+        timeout_in_seconds: int = 2,
+    ) -> Dict[int, RunStatus]:
+        """Set several nodes to the same position with as few commands as possible.
+
+        The nodes are split into batches of CommandSend.MAX_NODE_IDS nodes,
+        each batch is sent as one command session. Raises PyVLXException if a
+        batch was not accepted by the gateway.
 
-        Already matched existing nodes are skipped.
+        Parameters:
+            * nodes: Nodes or node ids to be moved.
+            * position: Position or other main parameter to be set.
+            * functional_parameter: Functional parameters, e.g. velocity.
+            * wait_for_completion: If True, also wait for the gateway's
+                session-finished notification of every batch; bounded by
+                ``timeout_in_seconds``.
+            * timeout_in_seconds: Maximum wait time in seconds per batch.
+
+        Returns the last run status reported per node id.
         """
-        for existing in self.__nodes:
-            # Avoid deep equality checks when determining if an existing node
-            # has already been used; compare by identity instead.
-            if any(existing is used for used in used_existing):
-                continue
-            if existing.represents_same_node(loaded):
-                return existing
-        return None
+        node_ids = list(dict.fromkeys(node.node_id if isinstance(node, Node) else node for node in nodes))
+        commands = [
+            CommandSend(
+                pyvlx=self.pyvlx,
+                node_ids=node_ids[i:i + CommandSend.MAX_NODE_IDS],
+                parameter=position,
+                functional_parameter=functional_parameter,
+                wait_for_completion=wait_for_completion,
+                timeout_in_seconds=timeout_in_seconds,
+            )
+            for i in range(0, len(node_ids), CommandSend.MAX_NODE_IDS)
+        ]
+        await asyncio.gather(*(command.send() for command in commands))
+        node_run_status: Dict[int, RunStatus] = {}
+        for command in commands:
+            node_run_status.update(command.node_run_status)
+        return node_run_status
+
+    @staticmethod
+    def fingerprint(entries: Iterable[SystemTableEntry]) -> bytes:
+        """Return fingerprint of the system table from node ids, addresses, types and power modes of its entries."""
+        digest = hashlib.blake2b(digest_size=8)
+        for entry in sorted(entries, key=lambda entry: entry.node_id):
+            digest.update(struct.pack(">BIHB", entry.node_id, entry.address, entry.node_type.value, entry.power_mode))
+        return digest.digest()
 
-    async def load(self, node_id: int | None = None) -> None:
-        """Load nodes from KLF 200, if no node_id is specified all nodes are loaded."""
+    async def load(self, node_id: int | None = None, only_if_changed: bool = False) -> None:
+        """Load nodes from KLF 200, if no node_id is specified all nodes are loaded.
+
+        With only_if_changed, the system table is requested first, which is
+        much smaller than the information of all nodes. All nodes are only
+        reloaded if the fingerprint of the system table differs from the one
+        of the last load. Renamed nodes do not change the system table, they
+        are picked up by the TopologySync from notifications while connected
+        only. Nodes renamed while not connected keep their old name until all
+        nodes are loaded without only_if_changed, or reconciled.
+        """
         if node_id is not None:
             await self._load_node(node_id=node_id)
-        else:
-            await self._load_all_nodes()
+            return
+        fingerprint = None
+        if only_if_changed:
+            get_system_table = GetSystemTable(pyvlx=self.pyvlx)
+            await get_system_table.do_api_call()
+            if get_system_table.success:
+                fingerprint = self.fingerprint(get_system_table.entries)
+                if fingerprint == self.system_table_fingerprint:
+                    PYVLXLOG.debug("System table unchanged, skipping reload of nodes")
+                    return
+        await self._load_all_nodes()
+        self.system_table_fingerprint = fingerprint
 
     async def _load_node(self, node_id: int) -> None:
         """Load single node via API."""
@@ -128,17 +242,67 @@ class Nodes:
         if notification_frame is None:
             return
         loaded = convert_frame_to_node(self.pyvlx, notification_frame)
-        if loaded is None:
-            return
-        existing = self._find_matching_existing(loaded, [])
-        if existing is not None:
-            self._update_node_metadata(existing, loaded)
-            loaded.dispose()
-        else:
+        if loaded is not None:
+            self._merge_loaded_node(loaded, notification_frame)
+
+    async def refresh(self, node_ids: Iterable[int]) -> List[Node]:
+        """Reload the nodes with node_ids only, return the nodes which were added or whose metadata changed.
+
+        Node information is requested per node id, all requests are in flight
+        at once. The received node information is compared with the one the
+        node was created from, so Node objects are only constructed for new
+        or changed nodes. Node ids the gateway does not know are skipped.
+        """
+        events = [GetNodeInformation(pyvlx=self.pyvlx, node_id=node_id) for node_id in dict.fromkeys(node_ids)]
+        await asyncio.gather(*(event.do_api_call() for event in events))
+        changed: List[Node] = []
+        for event in events:
+            if not event.success or event.notification_frame is None:
+                PYVLXLOG.warning("Unable to retrieve node information of node_id %s", event.node_id)
+                continue
+            frame = event.notification_frame
+            known = self.node_information.get(frame.node_id)
+            if known is not None and frame.node_id in self and self._same_topology(known, frame):
+                self.node_information[frame.node_id] = frame
+                continue
+            loaded = convert_frame_to_node(self.pyvlx, frame)
+            if loaded is not None:
+                changed.append(self._merge_loaded_node(loaded, frame))
+        return changed
+
+    def _merge_loaded_node(self, loaded: Node, frame: FrameNodeInformation) -> Node:
+        """Add loaded node or merge it into the matching existing node, return the node which is kept."""
+        self.node_information[loaded.node_id] = frame
+        existing = self._find_matching_existing(loaded)
+        if existing is None:
             self.add(loaded)
+            return loaded
+        old_node_id = existing.node_id
+        self._update_node_metadata(existing, loaded)
+        self.__nodes.reindex()
+        # Node information of the former node id is stale unless another node moved there
+        if old_node_id != existing.node_id and self.__nodes.get(old_node_id) is None:
+            self.node_information.pop(old_node_id, None)
+        loaded.dispose()
+        return existing
+
+    async def reconcile(self) -> NodeChanges:
+        """Reconcile nodes, e.g. restored from a snapshot, with the gateway.
+
+        Returns the nodes which were added or removed, and the existing nodes
+        whose name or node_id changed. Removed nodes are already disposed.
+        Changed states are published by the NodeUpdater while the node
+        information is received, like for every other state update.
+
+        The system table is not requested, so system_table_fingerprint is reset
+        and the next load(only_if_changed=True) reloads all nodes.
+        """
+        changes = await self._load_all_nodes()
+        self.system_table_fingerprint = None
+        return changes
 
-    async def _load_all_nodes(self) -> None:
-        """Load and merge a full gateway node snapshot.
+    async def _load_all_nodes(self) -> NodeChanges:
+        """Load and merge a full gateway node snapshot, return the added, removed and changed nodes.
 
         Matching existing nodes are kept and updated with current gateway metadata,
         newly discovered nodes are added, and previously known nodes missing from
@@ -150,27 +314,38 @@ class Nodes:
             raise PyVLXException("Unable to retrieve node information")
 
         loaded_nodes: List[Node] = []
+        node_information: Dict[int, FrameNodeInformation] = {}
         for notification_frame in get_all_nodes_information.notification_frames:
             node = convert_frame_to_node(self.pyvlx, notification_frame)
             if node is not None:
                 loaded_nodes.append(node)
+                node_information[node.node_id] = notification_frame
 
+        existing_by_identity = self._existing_by_identity()
         next_nodes: List[Node] = []
-        used_existing: List[Node] = []
+        used_existing: Set[int] = set()
+        changes = NodeChanges()
 
         for loaded_node in loaded_nodes:
-            existing = self._find_matching_existing(loaded_node, used_existing)
-            if existing is None:
+            matching = existing_by_identity.get(loaded_node.identity_key())
+            if not matching:
                 next_nodes.append(loaded_node)
+                changes.added.append(loaded_node)
                 continue
 
-            used_existing.append(existing)
+            existing = matching.popleft()
+            used_existing.add(id(existing))
+            if (existing.node_id, existing.name) != (loaded_node.node_id, loaded_node.name):
+                changes.changed.append(existing)
             self._update_node_metadata(existing, loaded_node)
             loaded_node.dispose()
             next_nodes.append(existing)
 
         for existing in self.__nodes:
-            if existing not in used_existing:
+            if id(existing) not in used_existing:
                 existing.dispose()
+                changes.removed.append(existing)
 
-        self.__nodes = next_nodes
+        self.__nodes.replace_all(next_nodes)
+        self.node_information = node_information
+        return changes
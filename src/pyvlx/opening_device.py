@@ -8,6 +8,7 @@ from pyvlx.api.get_limitation import GetLimitation
 
 from .api.command_send import CommandSend
 from .api.set_limitation import SetLimitation
+from .command_coalescer import CommandCoalescer
 from .const import (
     LimitationTime, LimitationType, NodeParameter, Originator, Velocity)
 from .exception import PyVLXException
@@ -63,6 +64,7 @@ class OpeningDevice(Node):
         self.open_position_target: int = 0
         self.close_position_target: int = 100
         self._update_task: Task | None = None
+        self.command_coalescer = CommandCoalescer()
 
     async def _update_calls(self) -> None:
         """While cover are moving, perform periodically update calls."""
@@ -120,7 +122,7 @@ class OpeningDevice(Node):
             functional_parameter=fp,
             timeout_in_seconds=timeout_in_seconds,
         )
-        await command.send()
+        await self.command_coalescer.send(command)
 
     async def open(
         self,
@@ -446,7 +448,7 @@ class Blind(OpeningDevice):
             functional_parameter=fp,
             timeout_in_seconds=timeout_in_seconds,
         )
-        await command.send()
+        await self.command_coalescer.send(command)
         await self.after_update()
 
     async def set_position(
@@ -594,7 +596,7 @@ class Blind(OpeningDevice):
             functional_parameter=fp,
             timeout_in_seconds=timeout_in_seconds,
         )
-        await command.send()
+        await self.command_coalescer.send(command)
         await self.after_update()
         # KLF200 always send UNKNOWN position for functional parameter,
         # so orientation is set directly and not via GW_NODE_STATE_POSITION_CHANGED_NTF
@@ -727,7 +729,7 @@ class DualRollerShutter(OpeningDevice):
             functional_parameter=fp,
             timeout_in_seconds=timeout_in_seconds,
         )
-        await command.send()
+        await self.command_coalescer.send(command)
         if position.position <= Position.MAX:
             if curtain == "upper":
                 self.position_upper_curtain = position
@@ -6,7 +6,14 @@ from .exception import PyVLXException
 
 
 class Parameter:
-    """General object for storing parameters."""
+    """General object for storing parameters.
+
+    The parameter is stored as a single int, raw bytes are only created on
+    demand. Comparisons, validation and percent conversion are integer
+    operations, as parameters are created for every received state frame.
+    """
+
+    __slots__ = ("_value",)
 
     UNKNOWN_VALUE = 0xF7FF  # F7 FF
     CURRENT = 0xD200  # D2 00
@@ -20,28 +27,41 @@ class Parameter:
 
     def __init__(self, raw: bytes | None = None):
         """Initialize Parameter class."""
-        self.raw = self.from_int(Position.UNKNOWN_VALUE)
-        if raw is not None:
-            self.raw = self.from_raw(raw)
+        self._value = self.UNKNOWN_VALUE if raw is None else self._value_from_raw(raw)
+
+    @property
+    def raw(self) -> bytes:
+        """Return raw bytes of parameter."""
+        return self._value.to_bytes(2, "big")
+
+    @raw.setter
+    def raw(self, raw: bytes) -> None:
+        """Set parameter from raw bytes."""
+        self._value = raw[0] << 8 | raw[1]
 
     def __bytes__(self) -> bytes:
         """Convert object in byte representation."""
-        return self.raw
+        return self._value.to_bytes(2, "big")
 
     def from_parameter(self, parameter: "Parameter") -> None:
         """Set internal raw state from parameter."""
         if not isinstance(parameter, Parameter):
             raise PyVLXException("parameter::from_parameter_wrong_object")
-        self.raw = parameter.raw
+        self._value = parameter._value  # pylint: disable=protected-access
 
     @staticmethod
-    def from_int(value: int) -> bytes:
-        """Create raw out of position value."""
+    def _validate_int(value: int) -> int:
+        """Return value if it can be rendered as parameter."""
         if not isinstance(value, int):
             raise PyVLXException("value_has_to_be_int")
         if not Parameter.is_valid_int(value):
             raise PyVLXException("value_out_of_range")
-        return bytes([value >> 8 & 255, value & 255])
+        return value
+
+    @staticmethod
+    def from_int(value: int) -> bytes:
+        """Create raw out of position value."""
+        return Parameter._validate_int(value).to_bytes(2, "big")
 
     @staticmethod
     def to_int(raw: bytes) -> int:
@@ -51,34 +71,27 @@ class Parameter:
     @staticmethod
     def is_valid_int(value: int) -> bool:
         """Test if value can be rendered out of int."""
-        if 0 <= value <= Parameter.MAX:  # This includes ON and OFF
-            return True
-        valid_values = {
-            Parameter.UNKNOWN_VALUE,
-            Parameter.IGNORE,
-            Parameter.CURRENT,
-            Parameter.TARGET,
-            Parameter.DUAL_SHUTTER_CURTAINS,
-        }
-        if value in valid_values:
-            return True
-        return False
+        # This includes ON and OFF
+        return 0 <= value <= Parameter.MAX or value in _SPECIAL_VALUES
 
     @staticmethod
-    def from_raw(raw: bytes) -> bytes:
-        """Test if raw packets are valid for initialization of Position."""
+    def _value_from_raw(raw: bytes) -> int:
+        """Return validated int value of raw, values beyond MAX other than the known special values are UNKNOWN."""
         if not isinstance(raw, bytes):
             raise PyVLXException("Position::raw_must_be_bytes")
         if len(raw) != 2:
             raise PyVLXException("Position::raw_must_be_two_bytes")
-        if (
-            raw != Position.from_int(Position.CURRENT)
-            and raw != Position.from_int(Position.IGNORE)
-            and raw != Position.from_int(Position.TARGET)
-            and raw != Position.from_int(Position.UNKNOWN_VALUE)
-            and Position.to_int(raw) > Position.MAX
-        ):
-            return Position.from_int(Position.UNKNOWN_VALUE)
+        value = raw[0] << 8 | raw[1]
+        if value > Parameter.MAX and value not in _RECEIVABLE_SPECIAL_VALUES:
+            return Parameter.UNKNOWN_VALUE
+        return value
+
+    @staticmethod
+    def from_raw(raw: bytes) -> bytes:
+        """Test if raw packets are valid for initialization of Position."""
+        value = Parameter._value_from_raw(raw)
+        if value == Parameter.UNKNOWN_VALUE:
+            return _UNKNOWN_RAW
         return raw
 
     @staticmethod
@@ -104,26 +117,35 @@ class Parameter:
         """Equal operator."""
         if not isinstance(other, Parameter):
             return NotImplemented
-        return self.raw == other.raw
+        return self._value == other._value
 
     def __str__(self) -> str:
         """Return string representation of object."""
-        if self.raw == self.from_int(Position.UNKNOWN_VALUE):
-            return "UNKNOWN"
-        if self.raw == self.from_int(Position.CURRENT):
-            return "CURRENT"
-        if self.raw == self.from_int(Position.TARGET):
-            return "TARGET"
-        if self.raw == self.from_int(Position.IGNORE):
-            return "IGNORE"
-        if self.raw == self.from_int(Position.DUAL_SHUTTER_CURTAINS):
-            return "DUAL"
-        return f"{int(self.to_percent(self.raw))} %"
+        name = _SPECIAL_NAMES.get(self._value)
+        if name is not None:
+            return name
+        return f"{int((self._value >> 8) / 2 + 0.5)} %"
+
+
+# Special values are interned once, instead of being compared as freshly created raw bytes
+_SPECIAL_NAMES = {
+    Parameter.UNKNOWN_VALUE: "UNKNOWN",
+    Parameter.CURRENT: "CURRENT",
+    Parameter.TARGET: "TARGET",
+    Parameter.IGNORE: "IGNORE",
+    Parameter.DUAL_SHUTTER_CURTAINS: "DUAL",
+}
+_SPECIAL_VALUES = frozenset(_SPECIAL_NAMES)
+# DUAL_SHUTTER_CURTAINS may be sent but is not expected within received parameters
+_RECEIVABLE_SPECIAL_VALUES = _SPECIAL_VALUES - {Parameter.DUAL_SHUTTER_CURTAINS}
+_UNKNOWN_RAW = Parameter.UNKNOWN_VALUE.to_bytes(2, "big")
 
 
 class SwitchParameter(Parameter):
     """Class for storing On or Off values."""
 
+    __slots__ = ()
+
     def __init__(
         self, parameter: Parameter | None = None, state: int | None = None
     ):
@@ -137,34 +159,34 @@ class SwitchParameter(Parameter):
     @property
     def state(self) -> int:
         """Position property."""
-        return self.to_int(self.raw)
+        return self._value
 
     @state.setter
     def state(self, state: int) -> None:
         """Setter of internal raw via state."""
-        self.raw = self.from_int(state)
+        self._value = self._validate_int(state)
 
     def set_on(self) -> None:
         """Set parameter to 'on' state."""
-        self.raw = self.from_int(Parameter.ON)
+        self._value = Parameter.ON
 
     def set_off(self) -> None:
         """Set parameter to 'off' state."""
-        self.raw = self.from_int(Parameter.OFF)
+        self._value = Parameter.OFF
 
     def is_on(self) -> bool:
         """Return True if parameter is in 'on' state."""
-        return self.raw == self.from_int(Parameter.ON)
+        return self._value == Parameter.ON
 
     def is_off(self) -> bool:
         """Return True if parameter is in 'off' state."""
-        return self.raw == self.from_int(Parameter.OFF)
+        return self._value == Parameter.OFF
 
     def __str__(self) -> str:
         """Return string representation of object."""
-        if self.raw == self.from_int(Parameter.ON):
+        if self._value == Parameter.ON:
             return "ON"
-        if self.raw == self.from_int(Parameter.OFF):
+        if self._value == Parameter.OFF:
             return "OFF"
         return "UNKNOWN"
 
@@ -172,6 +194,8 @@ class SwitchParameter(Parameter):
 class SwitchParameterOn(SwitchParameter):
     """Switch Parameter in switched 'on' state."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize SwitchParameterOn class."""
         super().__init__(state=Parameter.ON)
@@ -180,6 +204,8 @@ class SwitchParameterOn(SwitchParameter):
 class SwitchParameterOff(SwitchParameter):
     """Switch Parameter in switched 'off' state."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize SwitchParameterOff class."""
         super().__init__(state=Parameter.OFF)
@@ -188,6 +214,8 @@ class SwitchParameterOff(SwitchParameter):
 class Position(Parameter):
     """Class for storing a position."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         parameter: Parameter | None = None,
@@ -206,34 +234,33 @@ class Position(Parameter):
     @property
     def known(self) -> bool:
         """Known property, true if position is not in an unknown position."""
-        return self.raw != self.from_int(Position.UNKNOWN_VALUE)
+        return self._value != Position.UNKNOWN_VALUE
 
     @property
     def open(self) -> bool:
         """Return true if position is set to fully open."""
-        return self.raw == self.from_int(Position.MIN)
+        return self._value == Position.MIN
 
     @property
     def closed(self) -> bool:
         """Return true if position is set to fully closed."""
         # Consider closed even if raw is not exactly 51200 (tolerance for devices like Velux SML)
-        return self.to_percent(self.raw) == self.to_percent(self.from_int(Position.MAX))
+        return self.position_percent == 100
 
     @property
     def position(self) -> int:
         """Position property."""
-        return self.to_int(self.raw)
+        return self._value
 
     @position.setter
     def position(self, position: int) -> None:
         """Setter of internal raw via position."""
-        self.raw = self.from_int(position)
+        self._value = self._validate_int(position)
 
     @property
     def position_percent(self) -> int:
         """Position percent property."""
-        # unclear why it returns a <property object> here
-        return int(self.to_percent(self.raw))
+        return int((self._value >> 8) / 2 + 0.5)
 
     @position_percent.setter
     def position_percent(self, position_percent: int) -> None:
@@ -244,6 +271,8 @@ class Position(Parameter):
 class UnknownPosition(Position):
     """Unknown position."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize UnknownPosition class."""
         super().__init__(position=Position.UNKNOWN_VALUE)
@@ -252,6 +281,8 @@ class UnknownPosition(Position):
 class CurrentPosition(Position):
     """Current position, used to stop devices."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize CurrentPosition class."""
         super().__init__(position=Position.CURRENT)
@@ -260,6 +291,8 @@ class CurrentPosition(Position):
 class TargetPosition(Position):
     """Class for using a target position."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize TargetPosition class."""
         super().__init__(position=Position.TARGET)
@@ -268,6 +301,8 @@ class TargetPosition(Position):
 class IgnorePosition(Position):
     """The Ignore is used where a parameter in the frame is to be ignored."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize IgnorePosition class."""
         super().__init__(position=Position.IGNORE)
@@ -280,6 +315,8 @@ class Intensity(Parameter):
     - 100% means fully on
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parameter: Parameter | None = None,
@@ -298,27 +335,27 @@ class Intensity(Parameter):
     @property
     def known(self) -> bool:
         """Known property, true if intensity is not in an unknown intensity."""
-        return self.raw != self.from_int(Intensity.UNKNOWN_VALUE)
+        return self._value != Intensity.UNKNOWN_VALUE
 
     @property
     def on(self) -> bool:
         """Intensity at maximum power (fully on)."""
-        return self.raw == self.from_int(Intensity.ON)
+        return self._value == Intensity.ON
 
     @property
     def off(self) -> bool:
         """Intensity off state (no power)."""
-        return self.raw == self.from_int(Intensity.OFF)
+        return self._value == Intensity.OFF
 
     @property
     def intensity(self) -> int:
         """Intensity property."""
-        return self.to_int(self.raw)
+        return self._value
 
     @intensity.setter
     def intensity(self, intensity: int) -> None:
         """Setter of internal raw via intensity."""
-        self.raw = self.from_int(intensity)
+        self._value = self._validate_int(intensity)
 
     @staticmethod
     def from_percent(percent: int) -> bytes:
@@ -348,7 +385,7 @@ class Intensity(Parameter):
     @property
     def intensity_percent(self) -> int:
         """Intensity percent property."""
-        return int(self.to_percent(self.raw))
+        return int(100 - (self._value >> 8) / 2 + 0.5)
 
     @intensity_percent.setter
     def intensity_percent(self, intensity_percent: int) -> None:
@@ -357,20 +394,16 @@ class Intensity(Parameter):
 
     def __str__(self) -> str:
         """Return string representation of object."""
-        if self.raw == self.from_int(Intensity.UNKNOWN_VALUE):
-            return "UNKNOWN"
-        if self.raw == self.from_int(Intensity.CURRENT):
-            return "CURRENT"
-        if self.raw == self.from_int(Intensity.TARGET):
-            return "TARGET"
-        if self.raw == self.from_int(Intensity.IGNORE):
-            return "IGNORE"
+        if self._value != Intensity.DUAL_SHUTTER_CURTAINS and self._value in _SPECIAL_NAMES:
+            return _SPECIAL_NAMES[self._value]
         return f"{self.intensity_percent} %"
 
 
 class UnknownIntensity(Intensity):
     """Unknown intensity."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize UnknownIntensity class."""
         super().__init__(intensity=Intensity.UNKNOWN_VALUE)
@@ -379,6 +412,8 @@ class UnknownIntensity(Intensity):
 class CurrentIntensity(Intensity):
     """Current intensity, used to stop devices."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize CurrentIntensity class."""
         super().__init__(intensity=Intensity.CURRENT)
@@ -387,6 +422,8 @@ class CurrentIntensity(Intensity):
 class DualRollerShutterPosition(Position):
     """Position to be provided when addressing the upper or lower curtain of a dual roller shutter by using FP1 or FP2."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize DualRollerShutterPosition class."""
         super().__init__(position=Position.DUAL_SHUTTER_CURTAINS)
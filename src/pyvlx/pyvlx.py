@@ -6,23 +6,31 @@ a VELUX KLF 200 device for controlling window openers
 and roller shutters.
 """
 import asyncio
+import time
+import warnings
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Mapping
 
 try:
     from ._version import version as v
 except ImportError:
     v = "unknown"
-from .api import get_limitation
+from .api import (
+    ActivateProductGroup, ApiDispatcher, RequestPriority, get_limitation)
 from .api.frames import FrameBase
 from .config import Config
 from .connection import Connection
-from .const import LimitationType
+from .const import GroupType, LimitationType, RunStatus, Velocity
 from .exception import PyVLXException
+from .groups import Groups
 from .heartbeat import Heartbeat
 from .klf200gateway import Klf200Gateway
 from .log import PYVLXLOG
 from .node_updater import NodeUpdater
-from .nodes import Nodes
+from .nodes import NodeChanges, Nodes
+from .parameter import Parameter
 from .scenes import Scenes
+from .snapshot import Snapshot
+from .topology_sync import TopologySync
 
 
 class PyVLX:
@@ -35,45 +43,116 @@ class PyVLX:
         password: str | None = None,
         heartbeat_interval: int = 30,
         heartbeat_load_all_states: bool = True,
+        *,
+        heartbeat_batch_status_requests: bool = False,
+        heartbeat_max_state_age: float | None = None,
+        max_api_calls_in_flight: int = ApiDispatcher.DEFAULT_MAX_IN_FLIGHT,
+        api_priority_weights: Mapping[RequestPriority, int] | None = None,
+        fast_reconnect: bool = False,
+        snapshot_path: str | None = None,
+        port: int | None = None,
     ):
         """Initialize PyVLX class."""
-        self.config = Config(self, path, host, password)
+        self.config = Config(self, path, host, password, port)
         self.connection = Connection(config=self.config)
+        self.api_dispatcher = ApiDispatcher(max_in_flight=max_api_calls_in_flight, weights=api_priority_weights)
+        self.connection.register_frame_handler(self.api_dispatcher.process_frame, accepts=self.api_dispatcher.wants_frame)
         self.heartbeat = Heartbeat(
             pyvlx=self,
             interval=heartbeat_interval,
             load_all_states=heartbeat_load_all_states,
+            batch_status_requests=heartbeat_batch_status_requests,
+            max_state_age=heartbeat_max_state_age,
         )
         self.node_updater = NodeUpdater(pyvlx=self)
         self.nodes = Nodes(self)
-        self.connection.register_frame_received_cb(self.node_updater.process_frame)
+        self.connection.register_frame_received_cb(self.node_updater.process_frame, NodeUpdater.FRAME_TYPES)
+        self.topology_sync = TopologySync(pyvlx=self)
+        self.connection.register_frame_received_cb(self.topology_sync.process_frame, TopologySync.FRAME_TYPES)
 
         self.scenes = Scenes(self)
+        self.connection.register_frame_received_cb(self.scenes.process_frame, Scenes.FRAME_TYPES)
+        self.groups = Groups(self)
+        self.connection.register_frame_received_cb(self.groups.process_frame, Groups.FRAME_TYPES)
         self.version = None
         self.protocol_version = None
         self.klf200 = Klf200Gateway(pyvlx=self)
-        self.api_call_semaphore = asyncio.Semaphore(1)  # Limit parallel commands
+        self.fast_reconnect = fast_reconnect
+        self.time_to_ready: float | None = None
+        self.snapshot_path = snapshot_path
+        self._reconcile_task: asyncio.Task[NodeChanges] | None = None
+        self._api_call_semaphore: asyncio.Semaphore | None = None
+        self.nodes_reconciled_cbs: List[Callable[[NodeChanges], Coroutine[Any, Any, None]]] = []
         PYVLXLOG.debug("Initialized pyvlx %s", v)
 
+    @property
+    def api_call_semaphore(self) -> asyncio.Semaphore:
+        """Return semaphore which limited API calls to one at a time, deprecated.
+
+        API calls are dispatched by api_dispatcher, which keeps several of them
+        in flight. The semaphore is not used by pyvlx anymore, so acquiring it
+        does not keep pyvlx from sending requests.
+        """
+        warnings.warn(
+            "PyVLX.api_call_semaphore is deprecated and not used anymore, API calls are dispatched by PyVLX.api_dispatcher",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if self._api_call_semaphore is None:
+            self._api_call_semaphore = asyncio.Semaphore(1)
+        return self._api_call_semaphore
+
     async def connect(self) -> None:
-        """Connect to KLF 200."""
+        """Connect to KLF 200.
+
+        With fast_reconnect, version, protocol version and network setup of
+        the gateway are retrieved on the first connect only, and the requests
+        of the handshake after the password are pipelined. time_to_ready holds
+        the seconds from opening the connection until the gateway was ready
+        for commands.
+        """
         PYVLXLOG.debug("Connecting to KLF 200")
+        started = time.monotonic()
         await self.connection.connect()
         assert self.config.password is not None
         await self.klf200.password_enter(password=self.config.password)
-        await self.klf200.get_version()
-        await self.klf200.get_protocol_version()
+        if self.fast_reconnect:
+            await self._pipelined_handshake()
+        else:
+            await self.klf200.get_version()
+            await self.klf200.get_protocol_version()
+            self._log_connected()
+            await self.klf200.house_status_monitor_disable(pyvlx=self)
+            await self.klf200.get_state()
+            await self.klf200.set_utc()
+            await self.klf200.get_network_setup()
+            await self.klf200.house_status_monitor_enable(pyvlx=self)
+        self.time_to_ready = time.monotonic() - started
+        PYVLXLOG.debug("KLF 200 ready for commands after %.3fs", self.time_to_ready)
+        await self.heartbeat.start()
+
+    async def _pipelined_handshake(self) -> None:
+        """Send the handshake requests without waiting for each confirmation, skip gateway facts known from a previous connection."""
+        klf200 = self.klf200
+        cached = klf200.version is not None and klf200.protocol_version is not None and klf200.network_setup is not None
+        steps: List[Awaitable[object]] = []
+        if not cached:
+            steps += [klf200.get_version(), klf200.get_protocol_version()]
+        steps += [klf200.house_status_monitor_disable(pyvlx=self), klf200.get_state(), klf200.set_utc()]
+        if not cached:
+            steps.append(klf200.get_network_setup())
+        steps.append(klf200.house_status_monitor_enable(pyvlx=self))
+        # The tasks are started in order, so the requests are written in order
+        await asyncio.gather(*steps)
+        self._log_connected()
+
+    def _log_connected(self) -> None:
+        """Log version of the connected gateway."""
         PYVLXLOG.debug(
             "Connected to: %s,  %s",
             str(self.klf200.version),
             str(self.klf200.protocol_version),
         )
-        await self.klf200.house_status_monitor_disable(pyvlx=self)
-        await self.klf200.get_state()
-        await self.klf200.set_utc()
-        await self.klf200.get_network_setup()
-        await self.klf200.house_status_monitor_enable(pyvlx=self)
-        await self.heartbeat.start()
 
     async def reboot_gateway(self) -> None:
         """For Compatibility: Reboot the KLF 200."""
@@ -93,13 +172,24 @@ class PyVLX:
             await self.connect()
 
     async def send_frame(self, frame: FrameBase) -> None:
-        """Send frame to API via connection."""
+        """Send frame to API via connection and wait until it was written."""
         await self.ensure_connected()
         self.connection.write(frame)
+        await self.connection.flush()
 
     async def disconnect(self) -> None:
-        """Disconnect from KLF 200."""
+        """Disconnect from KLF 200, the last known states are saved if snapshot_path is set."""
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            self._reconcile_task.cancel()
         await self.heartbeat.stop()
+        await self.topology_sync.stop()
+        await self.scenes.stop()
+        # Nodes which were never loaded must not overwrite a snapshot
+        if self.snapshot_path is not None and len(self.nodes):
+            try:
+                self.save_snapshot()
+            except OSError:
+                PYVLXLOG.exception("Unable to save snapshot")
         if self.connection.connected:
             try:
                 # If the connection will be closed while house status monitor is enabled, a reconnection will fail on SSL handshake.
@@ -110,17 +200,140 @@ class PyVLX:
             except (OSError, PyVLXException):
                 PYVLXLOG.exception("Error during disconnect preparations")
             self.connection.disconnect()
+            self.api_dispatcher.sessions.cancel_all()
             if self.connection.tasks:
                 await asyncio.gather(*self.connection.tasks)  # Wait for all tasks to finish
 
-    async def load_nodes(self, node_id: int | None = None) -> None:
-        """Load devices from KLF 200, if no node_id is specified all nodes are loaded."""
-        await self.nodes.load(node_id)
+    def restore_snapshot(self) -> bool:
+        """Build nodes and scenes from the snapshot at snapshot_path, return True if a snapshot was restored.
+
+        Restoring needs no connection to the gateway. Missing, outdated or
+        corrupt snapshots are ignored.
+        """
+        if self.snapshot_path is None:
+            return False
+        snapshot = Snapshot.load(self.snapshot_path)
+        if snapshot is None:
+            return False
+        snapshot.restore(self)
+        PYVLXLOG.debug("Restored %s nodes and %s scenes from snapshot", len(self.nodes), len(self.scenes))
+        return True
+
+    def save_snapshot(self) -> None:
+        """Write nodes, scenes and their last known states to snapshot_path."""
+        if self.snapshot_path is None:
+            raise PyVLXException("snapshot_path_not_set")
+        Snapshot.from_pyvlx(self).save(self.snapshot_path)
+
+    async def warm_start(self) -> bool:
+        """Load nodes and scenes, from the snapshot if available.
+
+        If a snapshot was restored, True is returned right away and the
+        nodes and scenes are reconciled with the gateway in the background.
+        Otherwise they are loaded from the gateway and a snapshot is saved.
+        """
+        if self.restore_snapshot():
+            self._reconcile_task = asyncio.create_task(self.reconcile())
+            self._reconcile_task.add_done_callback(self._reconcile_done)
+            return True
+        await self.load_nodes()
+        await self.load_scenes()
+        if self.snapshot_path is not None:
+            self.save_snapshot()
+        return False
+
+    @staticmethod
+    def _reconcile_done(task: "asyncio.Task[NodeChanges]") -> None:
+        """Log failure of reconciling in the background, nodes and scenes of the snapshot stay in place."""
+        if not task.cancelled() and task.exception() is not None:
+            PYVLXLOG.error("Unable to reconcile snapshot with gateway: %s", task.exception())
+
+    async def reconcile(self) -> NodeChanges:
+        """Reconcile nodes and scenes with the gateway, only nodes which changed are published to their callbacks.
+
+        State changes are published by the NodeUpdater while the node
+        information is received, added and renamed nodes are published
+        afterwards. Scenes which are gone are dropped. The added, removed and
+        changed nodes are returned and passed to the nodes reconciled
+        callbacks, e.g. to add or remove entities for the nodes.
+        """
+        changes = await self.nodes.reconcile()
+        await self.load_scenes()
+        PYVLXLOG.debug(
+            "Reconciled snapshot with gateway, %s nodes added, %s removed, %s changed",
+            len(changes.added), len(changes.removed), len(changes.changed),
+        )
+        for node in changes.added + changes.changed:
+            await node.after_update()
+        for nodes_reconciled_cb in self.nodes_reconciled_cbs:
+            await nodes_reconciled_cb(changes)
+        if self.snapshot_path is not None:
+            self.save_snapshot()
+        return changes
+
+    def register_nodes_reconciled_cb(self, callback: Callable[[NodeChanges], Coroutine[Any, Any, None]]) -> None:
+        """Register callback which is called with the added, removed and changed nodes after reconciling."""
+        self.nodes_reconciled_cbs.append(callback)
+
+    def unregister_nodes_reconciled_cb(self, callback: Callable[[NodeChanges], Coroutine[Any, Any, None]]) -> None:
+        """Unregister callback which is called after reconciling."""
+        self.nodes_reconciled_cbs.remove(callback)
+
+    async def load_nodes(self, node_id: int | None = None, only_if_changed: bool = False) -> None:
+        """Load devices from KLF 200, if no node_id is specified all nodes are loaded.
+
+        With only_if_changed, all nodes are only reloaded if the system table
+        changed since the last load, see Nodes.load(). Renaming a node does not
+        change the system table, so nodes renamed while not connected are not
+        picked up; use load_nodes() without only_if_changed or reconcile() then.
+        """
+        await self.nodes.load(node_id, only_if_changed=only_if_changed)
 
     async def load_scenes(self) -> None:
         """Load scenes from KLF 200."""
         await self.scenes.load()
 
+    async def load_groups(self, group_id: int | None = None, group_type: GroupType | None = None) -> None:
+        """Load groups from KLF 200, if no group_id is specified all groups, optionally of group_type only, are loaded."""
+        await self.groups.load(group_id, group_type=group_type)
+
+    async def activate_product_group(
+        self,
+        group_id: int,
+        parameter: Parameter,
+        velocity: Velocity = Velocity.DEFAULT,
+        wait_for_completion: bool = True,
+        timeout_in_seconds: int = 2,
+    ) -> Dict[int, RunStatus]:
+        """Move all nodes of the group with group_id to parameter with a single command.
+
+        All members of the group have to be actuators of the same kind, see
+        Groups. Raises PyVLXException if the gateway rejects the activation;
+        its status parameter holds the ActivateProductGroupConfirmationStatus.
+
+        Parameters:
+            * group_id: Id of the group within the KLF 200.
+            * parameter: Position or other main parameter to be set.
+            * velocity: Velocity to be used during transition.
+            * wait_for_completion: If True, also wait for the gateway's
+                session-finished notification; bounded by ``timeout_in_seconds``.
+            * timeout_in_seconds: Maximum wait time in seconds.
+
+        Returns the last run status reported per node id.
+        """
+        activate_product_group = ActivateProductGroup(
+            pyvlx=self,
+            group_id=group_id,
+            parameter=parameter,
+            velocity=velocity,
+            wait_for_completion=wait_for_completion,
+            timeout_in_seconds=timeout_in_seconds,
+        )
+        await activate_product_group.do_api_call()
+        if not activate_product_group.success:
+            raise PyVLXException("activate_product_group_rejected", group_id=group_id, status=activate_product_group.status)
+        return activate_product_group.node_run_status
+
     async def get_limitation(self, node_id: int) -> None:
         """Return limitation."""
         limit = get_limitation.GetLimitation(self, node_id, limitation_type=LimitationType.MIN_LIMITATION)
@@ -1,21 +1,48 @@
 """Module for storing and accessing scene list."""
-from typing import TYPE_CHECKING, Iterator, List
+import asyncio
+import datetime
+from contextlib import suppress
+from typing import TYPE_CHECKING, Dict, Iterator, List, Set
 
-from .api import GetSceneList
+from .api import GetSceneInformation, GetSceneList, SessionHandle
+from .api.frames import FrameBase, FrameSceneInformationChangedNotification
+from .api.status_request import StatusRequest
+from .const import ChangeType, NodeParameter
 from .exception import PyVLXException
+from .indexed_items import IndexedItems
+from .log import PYVLXLOG
+from .opening_device import OpeningDevice
+from .parameter import Parameter, Position
 from .scene import Scene
 
 if TYPE_CHECKING:
     from pyvlx import PyVLX
 
+SceneMembers = Dict[int, Dict[NodeParameter, Parameter]]
+
 
 class Scenes:
-    """Class for storing and accessing ."""
+    """Class for storing and accessing scenes.
+
+    The nodes of a scene and the parameters stored for them are loaded on
+    demand via members() and cached until the gateway notifies a change of
+    the scene, see process_frame().
+
+    When a scene with cached members is activated, opening devices of the
+    scene get their motion flags right away, before the gateway reports any
+    movement. Target and estimated completion are left to the gateway's
+    notifications. After the scene finished, the status of the members of
+    the scene is requested, only.
+    """
+
+    FRAME_TYPES = (FrameSceneInformationChangedNotification,)
 
     def __init__(self, pyvlx: "PyVLX"):
         """Initialize Scenes class."""
         self.pyvlx = pyvlx
-        self.__scenes: List[Scene] = []
+        self.__scenes: IndexedItems[Scene] = IndexedItems("scene_id", "name")
+        self.__members: Dict[int, SceneMembers] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
 
     def __iter__(self) -> Iterator[Scene]:
         """Iterate."""
@@ -23,14 +50,10 @@ class Scenes:
 
     def __getitem__(self, key: str | int) -> Scene:
         """Return scene by name or by index."""
-        if isinstance(key, int):
-            for scene in self.__scenes:
-                if scene.scene_id == key:
-                    return scene
-        for scene in self.__scenes:
-            if scene.name == key:
-                return scene
-        raise KeyError
+        scene = self.__scenes.get(key) if isinstance(key, int) else self.__scenes.get_by("name", key)
+        if scene is None:
+            raise KeyError
+        return scene
 
     def __len__(self) -> int:
         """Return number of scenes."""
@@ -40,21 +63,117 @@ class Scenes:
         """Add scene, replace existing scene if scene with scene_id is present."""
         if not isinstance(scene, Scene):
             raise TypeError()
-        for i, j in enumerate(self.__scenes):
-            if j.scene_id == scene.scene_id:
-                self.__scenes[i] = scene
-                return
-        self.__scenes.append(scene)
+        self.__scenes.add(scene)
 
     def clear(self) -> None:
         """Clear internal scenes array."""
-        self.__scenes = []
+        self.__scenes.replace_all([])
+        self.__members.clear()
 
     async def load(self) -> None:
-        """Load scenes from KLF 200."""
+        """Load scenes from KLF 200, scenes which are gone and cached members of scenes are dropped."""
         get_scene_list = GetSceneList(pyvlx=self.pyvlx)
         await get_scene_list.do_api_call()
         if not get_scene_list.success:
             raise PyVLXException("Unable to retrieve scene information")
-        for scene in get_scene_list.scenes:
-            self.add(Scene(pyvlx=self.pyvlx, scene_id=scene[0], name=scene[1]))
+        self.__members.clear()
+        self.__scenes.replace_all(Scene(pyvlx=self.pyvlx, scene_id=scene_id, name=name) for scene_id, name in get_scene_list.scenes)
+
+    def cached_members(self, scene_id: int) -> SceneMembers | None:
+        """Return cached nodes of scene_id and their stored parameters, None if they were not loaded yet."""
+        return self.__members.get(scene_id)
+
+    async def members(self, scene_id: int) -> SceneMembers:
+        """Return nodes of scene_id and their stored parameters, loaded from KLF 200 if not cached."""
+        members = self.__members.get(scene_id)
+        if members is not None:
+            return members
+        get_scene_information = GetSceneInformation(pyvlx=self.pyvlx, scene_id=scene_id)
+        await get_scene_information.do_api_call()
+        if not get_scene_information.success:
+            raise PyVLXException("Unable to retrieve scene information", scene_id=scene_id)
+        members = {}
+        for node_id, node_parameter, parameter in get_scene_information.nodes:
+            members.setdefault(node_id, {})[node_parameter] = parameter
+        self.__members[scene_id] = members
+        return members
+
+    def invalidate(self, scene_id: int) -> None:
+        """Drop cached members of scene_id."""
+        self.__members.pop(scene_id, None)
+
+    async def process_frame(self, frame: FrameBase) -> None:
+        """Invalidate cached members of modified scenes and remove deleted scenes."""
+        if not isinstance(frame, FrameSceneInformationChangedNotification):
+            return
+        self.invalidate(frame.scene_id)
+        if frame.change_type == ChangeType.DELETED:
+            scene = self.__scenes.get(frame.scene_id)
+            if scene is not None:
+                self.__scenes.remove(scene)
+                PYVLXLOG.debug("Removed scene with scene_id %s", frame.scene_id)
+
+    def scene_activated(self, scene_id: int, completion: SessionHandle | None) -> None:
+        """Predict the motion of the cached members of activated scene_id and refresh them once the scene finished."""
+        if completion is None:
+            return
+        members = self.__members.get(scene_id)
+        predicted_at = datetime.datetime.now()
+        changed = self.predict(members, predicted_at) if members is not None else []
+        task = asyncio.create_task(self._follow(scene_id, completion, predicted_at, changed))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def predict(self, members: SceneMembers, predicted_at: datetime.datetime) -> List[OpeningDevice]:
+        """Set motion flags of opening devices moving to the stored main parameter, return changed nodes."""
+        changed = []
+        for node_id, parameters in members.items():
+            parameter = parameters.get(NodeParameter.MP)
+            if parameter is None or node_id not in self.pyvlx.nodes:
+                continue
+            node = self.pyvlx.nodes[node_id]
+            target = Position(parameter)
+            if not isinstance(node, OpeningDevice) or target.position > Parameter.MAX:
+                continue
+            if node.position.position > Parameter.MAX or node.position.position == target.position:
+                continue
+            node.is_opening = target.position < node.position.position
+            node.is_closing = not node.is_opening
+            node.state_received_at = predicted_at
+            changed.append(node)
+        return changed
+
+    async def _follow(self, scene_id: int, completion: SessionHandle, predicted_at: datetime.datetime, changed: List[OpeningDevice]) -> None:
+        """Publish predicted states, wait for the scene and request the status of its members if the scene finished."""
+        try:
+            for node in changed:
+                await node.after_update()
+            if await completion:
+                await self.refresh_states(scene_id)
+        except (OSError, PyVLXException):
+            PYVLXLOG.exception("Unable to refresh the nodes of scene %s", scene_id)
+        # Nodes the gateway did not report on since the prediction are not moving anymore
+        for node in changed:
+            if node.is_moving() and node.state_received_at == predicted_at:
+                node.is_opening = node.is_closing = False
+                node.state_received_at = None
+                await node.after_update()
+
+    async def refresh_states(self, scene_id: int) -> None:
+        """Request status of the nodes of scene_id, in batches of up to 20 nodes per session."""
+        members = await self.members(scene_id)
+        node_ids = [node_id for node_id in sorted(members) if node_id in self.pyvlx.nodes]
+        batch_size = StatusRequest.MAX_NODE_IDS
+        for i in range(0, len(node_ids), batch_size):
+            status_request = StatusRequest(self.pyvlx, node_ids=node_ids[i:i + batch_size])
+            await status_request.do_api_call()
+
+    async def stop(self) -> None:
+        """Cancel predictions and status requests still pending for activated scenes."""
+        tasks = list(self._tasks)
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
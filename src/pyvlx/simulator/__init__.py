@@ -0,0 +1,5 @@
+"""KLF 200 gateway simulator for load and latency testing without hardware."""
+# flake8: noqa
+from .model import (
+    SimulatedGroup, SimulatedNode, SimulatedScene, create_nodes, create_scenes)
+from .server import KLF200Simulator, SimulatorConnection
@@ -0,0 +1,52 @@
+"""Run a KLF 200 simulator until interrupted."""
+import argparse
+import asyncio
+import logging
+import ssl
+
+from ..log import PYVLXLOG
+from .server import KLF200Simulator
+
+
+async def serve(simulator: KLF200Simulator) -> None:
+    """Run simulator forever."""
+    async with simulator:
+        print(f"KLF 200 simulator with {len(simulator.nodes)} nodes listening on {simulator.host}:{simulator.port}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Parse arguments and run simulator."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=51200)
+    parser.add_argument("--password", default="velux123")
+    parser.add_argument("--nodes", type=int, default=10, help="number of simulated nodes")
+    parser.add_argument("--scenes", type=int, default=5, help="number of simulated scenes")
+    parser.add_argument("--travel-time", type=float, default=20.0, help="seconds for a movement over the full range")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds until requests are answered")
+    parser.add_argument("--rate-limit", type=float, default=None, help="maximum number of requests per second")
+    parser.add_argument("--certificate", help="PEM file with certificate and key, a self signed certificate is generated if omitted")
+    parser.add_argument("--key", help="PEM file with the key, if not contained within the certificate file")
+    parser.add_argument("--debug", action="store_true", help="log frames")
+    args = parser.parse_args()
+    if args.debug:
+        logging.basicConfig()
+        PYVLXLOG.setLevel(logging.DEBUG)
+    ssl_context = None
+    if args.certificate is not None:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(args.certificate, args.key)
+    simulator = KLF200Simulator(
+        args.nodes, args.scenes, password=args.password, host=args.host, port=args.port,
+        travel_time=args.travel_time, response_latency=args.latency, max_requests_per_second=args.rate_limit,
+        ssl_context=ssl_context,
+    )
+    try:
+        asyncio.run(serve(simulator))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Module for the nodes, scenes and groups of a simulated KLF 200."""
+from typing import Dict, List
+
+from ..const import NodeTypeWithSubtype, OperatingState, Originator
+from ..parameter import Parameter
+
+NODE_TYPES = (
+    NodeTypeWithSubtype.WINDOW_OPENER,
+    NodeTypeWithSubtype.ROLLER_SHUTTER,
+    NodeTypeWithSubtype.INTERIOR_VENETIAN_BLIND,
+    NodeTypeWithSubtype.VERTICAL_EXTERIOR_AWNING,
+    NodeTypeWithSubtype.HORIZONTAL_AWNING,
+)
+
+
+class SimulatedNode:
+    """Class for a simulated actuator.
+
+    Positions are raw parameter values between Parameter.MIN and
+    Parameter.MAX. A movement is modelled as linear motion from the position
+    at the start of the movement to the target, travel_time is the duration
+    of a movement over the full range. The current position is calculated
+    from the monotonic time passed in, so moving nodes need no timers.
+    """
+
+    def __init__(
+        self,
+        node_id: int,
+        name: str | None = None,
+        node_type: NodeTypeWithSubtype = NodeTypeWithSubtype.WINDOW_OPENER,
+        serial_number: str | None = None,
+        position: int = Parameter.MAX,
+        travel_time: float = 20.0,
+    ):
+        """Initialize SimulatedNode."""
+        self.node_id = node_id
+        self.name = name if name is not None else f"Node {node_id}"
+        self.node_type = node_type
+        self.serial_number = serial_number
+        self.travel_time = travel_time
+        self.limitation_min = Parameter.MIN
+        self.limitation_max = Parameter.MAX
+        self.limitation_originator = Originator.USER
+        self.limitation_time = 253  # unlimited
+        self._start_position = position
+        self._start_time = 0.0
+        self.target = position
+        self.end_time = 0.0
+
+    def position(self, now: float) -> int:
+        """Return position at monotonic time now."""
+        if now >= self.end_time:
+            return self.target
+        progress = (now - self._start_time) / (self.end_time - self._start_time)
+        return round(self._start_position + (self.target - self._start_position) * progress)
+
+    def remaining_time(self, now: float) -> float:
+        """Return seconds until the current movement is finished."""
+        return max(self.end_time - now, 0.0)
+
+    def state(self, now: float) -> OperatingState:
+        """Return operating state at monotonic time now."""
+        return OperatingState.EXECUTING if now < self.end_time else OperatingState.DONE
+
+    def limit(self, target: int) -> int:
+        """Return target restricted to the current limitation."""
+        return min(max(target, self.limitation_min), self.limitation_max)
+
+    def move(self, target: int, now: float) -> float:
+        """Start movement to target within limitations, return duration of the movement.
+
+        Special parameter values like Parameter.CURRENT stop the node at its
+        current position.
+        """
+        position = self.position(now)
+        target = self.limit(target) if target <= Parameter.MAX else position
+        self._start_position = position
+        self._start_time = now
+        self.target = target
+        self.end_time = now + abs(target - position) / Parameter.MAX * self.travel_time
+        return self.end_time - now
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} node_id="{self.node_id}" name="{self.name}" target="{self.target}"/>'
+
+
+class SimulatedScene:
+    """Class for a simulated scene, moving its member nodes to stored positions."""
+
+    def __init__(self, scene_id: int, name: str | None = None, targets: Dict[int, int] | None = None):
+        """Initialize SimulatedScene."""
+        self.scene_id = scene_id
+        self.name = name if name is not None else f"Scene {scene_id}"
+        self.targets: Dict[int, int] = targets if targets is not None else {}
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} scene_id="{self.scene_id}" name="{self.name}" targets="{self.targets}"/>'
+
+
+class SimulatedGroup:
+    """Class for a simulated group of nodes."""
+
+    def __init__(self, group_id: int, name: str | None = None, node_ids: List[int] | None = None):
+        """Initialize SimulatedGroup."""
+        self.group_id = group_id
+        self.name = name if name is not None else f"Group {group_id}"
+        self.node_ids: List[int] = node_ids if node_ids is not None else []
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} group_id="{self.group_id}" name="{self.name}" node_ids="{self.node_ids}"/>'
+
+
+def create_nodes(node_count: int, travel_time: float = 20.0) -> List[SimulatedNode]:
+    """Return node_count nodes of mixed node types with unique serial numbers."""
+    return [
+        SimulatedNode(
+            node_id=node_id,
+            node_type=NODE_TYPES[node_id % len(NODE_TYPES)],
+            serial_number=f"53:4e:00:00:00:00:{node_id >> 8:02x}:{node_id & 255:02x}",
+            position=(node_id * 0x0A00) % (Parameter.MAX + 1),
+            travel_time=travel_time,
+        )
+        for node_id in range(node_count)
+    ]
+
+
+def create_scenes(scene_count: int, nodes: List[SimulatedNode], nodes_per_scene: int = 5) -> List[SimulatedScene]:
+    """Return scene_count scenes, each opening or closing some of the nodes."""
+    scenes = []
+    for scene_id in range(scene_count):
+        members = nodes[scene_id * nodes_per_scene % max(len(nodes), 1):][:nodes_per_scene]
+        target = Parameter.MIN if scene_id % 2 == 0 else Parameter.MAX
+        scenes.append(SimulatedScene(scene_id=scene_id, targets={node.node_id: target for node in members}))
+    return scenes
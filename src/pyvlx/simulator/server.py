@@ -0,0 +1,621 @@
+"""Module for the KLF 200 simulator server."""
+import asyncio
+import math
+import socket
+import ssl
+import tempfile
+import time
+from pathlib import Path
+from typing import (
+    Any, Callable, ClassVar, Coroutine, Dict, Iterable, List, Set, Type)
+
+from ..api.frame_creation import frame_from_raw
+from ..api.frames import (
+    ActivateProductGroupConfirmationStatus, ActivateSceneConfirmationStatus,
+    CommandSendConfirmationStatus, ErrorType,
+    FrameActivateProductGroupConfirmation, FrameActivateProductGroupRequest,
+    FrameActivateSceneConfirmation, FrameActivateSceneRequest, FrameBase,
+    FrameCommandRemainingTimeNotification, FrameCommandRunStatusNotification,
+    FrameCommandSendConfirmation, FrameCommandSendRequest,
+    FrameErrorNotification, FrameGatewayRebootConfirmation,
+    FrameGatewayRebootRequest, FrameGetAllNodesInformationConfirmation,
+    FrameGetAllNodesInformationFinishedNotification,
+    FrameGetAllNodesInformationNotification,
+    FrameGetAllNodesInformationRequest, FrameGetLimitationStatus,
+    FrameGetLimitationStatusConfirmation, FrameGetLimitationStatusNotification,
+    FrameGetLocalTimeConfirmation, FrameGetLocalTimeRequest,
+    FrameGetNetworkSetupConfirmation, FrameGetNetworkSetupRequest,
+    FrameGetNodeInformationConfirmation, FrameGetNodeInformationNotification,
+    FrameGetNodeInformationRequest, FrameGetProtocolVersionConfirmation,
+    FrameGetProtocolVersionRequest, FrameGetSceneInformationConfirmation,
+    FrameGetSceneInformationNotification, FrameGetSceneInformationRequest,
+    FrameGetSceneListConfirmation, FrameGetSceneListNotification,
+    FrameGetSceneListRequest, FrameGetStateConfirmation, FrameGetStateRequest,
+    FrameGetSystemTableDataConfirmation, FrameGetSystemTableDataNotification,
+    FrameGetSystemTableDataRequest, FrameGetVersionConfirmation,
+    FrameGetVersionRequest, FrameHouseStatusMonitorDisableConfirmation,
+    FrameHouseStatusMonitorDisableRequest,
+    FrameHouseStatusMonitorEnableConfirmation,
+    FrameHouseStatusMonitorEnableRequest,
+    FrameNodeInformationChangedNotification,
+    FrameNodeStatePositionChangedNotification, FramePasswordEnterConfirmation,
+    FramePasswordEnterRequest, FrameSessionFinishedNotification,
+    FrameSetLimitationConfirmation, FrameSetLimitationRequest,
+    FrameSetNodeNameConfirmation, FrameSetNodeNameRequest,
+    FrameSetUTCConfirmation, FrameSetUTCRequest,
+    FrameStatusRequestConfirmation, FrameStatusRequestNotification,
+    FrameStatusRequestRequest, FrameSystemTableUpdateNotification,
+    FrameWinkSendConfirmation, FrameWinkSendNotification, FrameWinkSendRequest,
+    GatewayState, GatewaySubState, PasswordEnterConfirmationStatus,
+    SceneInformationStatus, SetLimitationRequestStatus,
+    SetNodeNameConfirmationStatus, SystemTableEntry,
+    WinkSendConfirmationStatus)
+from ..api.frames.frame_get_node_information import NodeInformationStatus
+from ..api.frames.frame_status_request import StatusRequestStatus
+from ..connection import SlipTokenizer
+from ..const import (
+    LimitationTime, NodeParameter, RunStatus, StatusReply, StatusType)
+from ..exception import PyVLXException
+from ..log import PYVLXLOG
+from ..parameter import Parameter
+from ..slip import slip_pack
+from .model import (
+    SimulatedGroup, SimulatedNode, SimulatedScene, create_nodes, create_scenes)
+
+SCENES_PER_NOTIFICATION = 3
+SCENE_NODES_PER_NOTIFICATION = 20
+SYSTEM_TABLE_ENTRIES_PER_NOTIFICATION = 20
+
+HandlerType = Callable[["SimulatorConnection", Any], Coroutine[Any, Any, None]]
+
+
+class SimulatorConnection(asyncio.Protocol):
+    """Class for one client connection of the simulator."""
+
+    def __init__(self, simulator: "KLF200Simulator"):
+        """Initialize SimulatorConnection."""
+        self.simulator = simulator
+        self.transport: asyncio.Transport | None = None
+        self.tokenizer = SlipTokenizer()
+        self.authenticated = False
+        self.house_status_monitor_enabled = False
+        self.tasks: Set[asyncio.Task[None]] = set()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Handle new client connection."""
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+        self.simulator.connections.add(self)
+        PYVLXLOG.debug("Simulator: client connected")
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Handle closed client connection."""
+        self.simulator.connections.discard(self)
+        self.transport = None
+        for task in self.tasks:
+            task.cancel()
+        PYVLXLOG.debug("Simulator: client disconnected")
+
+    def data_received(self, data: bytes) -> None:
+        """Handle data received from client."""
+        self.tokenizer.feed(data)
+        while self.tokenizer.has_tokens():
+            raw = self.tokenizer.get_next_token()
+            assert raw is not None
+            try:
+                frame = frame_from_raw(raw)
+            except PyVLXException:
+                PYVLXLOG.warning("Simulator: invalid frame %s", raw.hex())
+                self.send(FrameErrorNotification(ErrorType.ErrorOnFrameStructure))
+                continue
+            if frame is None:
+                self.send(FrameErrorNotification(ErrorType.UnknownCommand))
+                continue
+            task = asyncio.create_task(self.simulator.process_request(self, frame))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    def send(self, frame: FrameBase) -> None:
+        """Send frame to client."""
+        if self.transport is None or self.transport.is_closing():
+            return
+        self.transport.write(slip_pack(bytes(frame)))
+        self.simulator.frames_sent += 1
+
+    def close(self) -> None:
+        """Close client connection."""
+        if self.transport is not None:
+            self.transport.close()
+
+
+class KLF200Simulator:
+    """Class for simulating a KLF 200 gateway.
+
+    The simulator is an asyncio TLS server speaking the KLF 200 API. It
+    models nodes with motion timing, scenes, product groups, limitations and
+    house status monitor notifications. Nodes, scenes and groups can be
+    changed via the nodes, scenes and groups dicts before and while clients
+    are connected.
+
+    Without ssl_context, a self signed certificate is generated on start,
+    which requires the openssl command line tool.
+
+    response_latency delays the answers to every request, and
+    max_requests_per_second limits the rate of accepted requests; requests
+    exceeding the limit are answered with a bus busy error notification.
+    While nodes are moving, position notifications are sent every
+    notification_interval seconds to clients with enabled house status
+    monitor.
+    """
+
+    PROTOCOL_VERSION = (3, 18)
+    SOFTWARE_VERSION = "0.2.0.0.71.0"
+    HARDWARE_VERSION = 6
+
+    _self_signed_ssl_context: ClassVar[ssl.SSLContext | None] = None
+
+    def __init__(
+        self,
+        node_count: int = 10,
+        scene_count: int = 5,
+        *,
+        password: str = "velux123",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        travel_time: float = 20.0,
+        response_latency: float = 0.0,
+        max_requests_per_second: float | None = None,
+        notification_interval: float = 1.0,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """Initialize KLF200Simulator, port 0 selects a free port."""
+        self.password = password
+        self.host = host
+        self.port = port
+        self.response_latency = response_latency
+        self.max_requests_per_second = max_requests_per_second
+        self.notification_interval = notification_interval
+        self.ssl_context = ssl_context
+        nodes = create_nodes(node_count, travel_time=travel_time)
+        self.nodes: Dict[int, SimulatedNode] = {node.node_id: node for node in nodes}
+        self.scenes: Dict[int, SimulatedScene] = {scene.scene_id: scene for scene in create_scenes(scene_count, nodes)}
+        self.groups: Dict[int, SimulatedGroup] = {}
+        self.connections: Set[SimulatorConnection] = set()
+        self.requests_received = 0
+        self.requests_rejected = 0
+        self.frames_sent = 0
+        self._server: asyncio.Server | None = None
+        self._tokens = 0.0
+        self._tokens_updated = 0.0
+        self._handlers: Dict[Type[FrameBase], HandlerType] = {
+            FramePasswordEnterRequest: self._password_enter,
+            FrameGetVersionRequest: self._get_version,
+            FrameGetProtocolVersionRequest: self._get_protocol_version,
+            FrameGetStateRequest: self._get_state,
+            FrameSetUTCRequest: self._set_utc,
+            FrameGetLocalTimeRequest: self._get_local_time,
+            FrameGetNetworkSetupRequest: self._get_network_setup,
+            FrameHouseStatusMonitorEnableRequest: self._house_status_monitor_enable,
+            FrameHouseStatusMonitorDisableRequest: self._house_status_monitor_disable,
+            FrameGetAllNodesInformationRequest: self._get_all_nodes_information,
+            FrameGetNodeInformationRequest: self._get_node_information,
+            FrameGetSystemTableDataRequest: self._get_system_table_data,
+            FrameSetNodeNameRequest: self._set_node_name,
+            FrameGetSceneListRequest: self._get_scene_list,
+            FrameGetSceneInformationRequest: self._get_scene_information,
+            FrameActivateSceneRequest: self._activate_scene,
+            FrameActivateProductGroupRequest: self._activate_product_group,
+            FrameCommandSendRequest: self._command_send,
+            FrameStatusRequestRequest: self._status_request,
+            FrameWinkSendRequest: self._wink_send,
+            FrameGetLimitationStatus: self._get_limitation,
+            FrameSetLimitationRequest: self._set_limitation,
+            FrameGatewayRebootRequest: self._reboot,
+        }
+
+    @classmethod
+    async def self_signed_ssl_context(cls) -> ssl.SSLContext:
+        """Return server SSL context with a self signed certificate, only suitable for connecting to the simulator.
+
+        The certificate and its key are generated with the openssl command line
+        tool on first use, so no private key has to be shipped with the package.
+        """
+        if cls._self_signed_ssl_context is not None:
+            return cls._self_signed_ssl_context
+        with tempfile.TemporaryDirectory() as directory:
+            certificate_file = Path(directory) / "certificate.pem"
+            key_file = Path(directory) / "key.pem"
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "openssl", "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+                    "-keyout", str(key_file), "-out", str(certificate_file), "-days", "365", "-subj", "/CN=klf200-simulator",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                raise PyVLXException("simulator_requires_openssl_or_ssl_context") from None
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                raise PyVLXException("simulator_certificate_generation_failed", error=stderr.decode(errors="replace"))
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(certificate_file, key_file)
+        cls._self_signed_ssl_context = ssl_context
+        return ssl_context
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        ssl_context = self.ssl_context
+        if ssl_context is None:
+            ssl_context = await self.self_signed_ssl_context()
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: SimulatorConnection(self), self.host, self.port, ssl=ssl_context)
+        self.port = self._server.sockets[0].getsockname()[1]
+        PYVLXLOG.debug("Simulator: listening on %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Close all connections and stop listening."""
+        for connection in list(self.connections):
+            connection.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "KLF200Simulator":
+        """Start simulator in async with statement."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop simulator at the end of async with statement."""
+        await self.stop()
+
+    def _admit_request(self) -> bool:
+        """Return False if the request exceeds the rate limit."""
+        rate = self.max_requests_per_second
+        if rate is None:
+            return True
+        now = time.monotonic()
+        burst = max(rate, 1.0)
+        if not self._tokens_updated:
+            self._tokens = burst
+        self._tokens = min(burst, self._tokens + (now - self._tokens_updated) * rate)
+        self._tokens_updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def process_request(self, connection: SimulatorConnection, frame: FrameBase) -> None:
+        """Answer request frame of connection."""
+        self.requests_received += 1
+        if not connection.authenticated and not isinstance(frame, FramePasswordEnterRequest):
+            connection.send(FrameErrorNotification(ErrorType.NotAuthenticated))
+            return
+        if not self._admit_request():
+            self.requests_rejected += 1
+            connection.send(FrameErrorNotification(ErrorType.BusBusy))
+            return
+        handler = self._handlers.get(type(frame))
+        if handler is None:
+            connection.send(FrameErrorNotification(ErrorType.UnknownCommand))
+            return
+        if self.response_latency > 0:
+            await asyncio.sleep(self.response_latency)
+        await handler(connection, frame)
+
+    def notify_house_status_monitor(self, frames: Iterable[FrameBase]) -> None:
+        """Send frames to all connections with enabled house status monitor."""
+        frames = list(frames)
+        for connection in list(self.connections):
+            if connection.house_status_monitor_enabled:
+                for frame in frames:
+                    connection.send(frame)
+
+    def add_node(self, node: SimulatedNode) -> None:
+        """Add node to the system table, like pairing a new actuator, and notify all connections."""
+        self.nodes[node.node_id] = node
+        for connection in list(self.connections):
+            connection.send(FrameSystemTableUpdateNotification(added_node_ids=[node.node_id]))
+
+    def remove_node(self, node_id: int) -> None:
+        """Remove node from the system table and notify all connections."""
+        del self.nodes[node_id]
+        for connection in list(self.connections):
+            connection.send(FrameSystemTableUpdateNotification(removed_node_ids=[node_id]))
+
+    @staticmethod
+    def _position_notification(node: SimulatedNode, now: float) -> FrameNodeStatePositionChangedNotification:
+        """Return house status monitor notification of node."""
+        frame = FrameNodeStatePositionChangedNotification()
+        frame.node_id = node.node_id
+        frame.state = node.state(now)
+        frame.current_position = Parameter(Parameter.from_int(node.position(now)))
+        frame.target = Parameter(Parameter.from_int(node.target))
+        frame.remaining_time = math.ceil(node.remaining_time(now))
+        frame.timestamp = int(time.time()) & 0xFFFFFFFF
+        return frame
+
+    def _node_information(self, frame: FrameGetAllNodesInformationNotification | FrameGetNodeInformationNotification, node: SimulatedNode) -> None:
+        """Fill node information notification."""
+        now = time.monotonic()
+        frame.node_id = node.node_id
+        frame.order = node.node_id
+        frame.name = node.name
+        frame.node_type = node.node_type
+        if node.serial_number is not None:
+            frame.serial_number = node.serial_number
+        frame.state = node.state(now)
+        frame.current_position = Parameter(Parameter.from_int(node.position(now)))
+        frame.target = Parameter(Parameter.from_int(node.target))
+        frame.remaining_time = math.ceil(node.remaining_time(now))
+
+    async def _move(self, connection: SimulatorConnection, session_id: int, targets: Dict[int, int]) -> None:
+        """Move nodes to targets within session, reporting run status and positions until all nodes arrived."""
+        now = time.monotonic()
+        moving: List[SimulatedNode] = []
+        for node_id, target in targets.items():
+            node = self.nodes.get(node_id)
+            if node is None:
+                connection.send(FrameCommandRunStatusNotification(
+                    session_id=session_id, status_id=0, index_id=node_id, node_parameter=NodeParameter.MP.value,
+                    parameter_value=target, run_status=RunStatus.EXECUTION_FAILED, status_reply=StatusReply.NO_CONTACT))
+                continue
+            duration = node.move(target, now)
+            moving.append(node)
+            connection.send(FrameCommandRunStatusNotification(
+                session_id=session_id, status_id=0, index_id=node_id, node_parameter=NodeParameter.MP.value,
+                parameter_value=node.target, run_status=RunStatus.EXECUTION_ACTIVE, status_reply=StatusReply.COMMAND_COMPLETED_OK))
+            connection.send(FrameCommandRemainingTimeNotification(
+                session_id=session_id, index_id=node_id, node_parameter=NodeParameter.MP.value, seconds=math.ceil(duration)))
+        self.notify_house_status_monitor(self._position_notification(node, now) for node in moving)
+        while True:
+            now = time.monotonic()
+            remaining = max((node.remaining_time(now) for node in moving), default=0.0)
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(self.notification_interval, remaining))
+            self.notify_house_status_monitor(self._position_notification(node, time.monotonic()) for node in moving)
+        for node in moving:
+            connection.send(FrameCommandRunStatusNotification(
+                session_id=session_id, status_id=0, index_id=node.node_id, node_parameter=NodeParameter.MP.value,
+                parameter_value=node.target, run_status=RunStatus.EXECUTION_COMPLETED, status_reply=StatusReply.COMMAND_COMPLETED_OK))
+        connection.send(FrameSessionFinishedNotification(session_id=session_id))
+
+    async def _password_enter(self, connection: SimulatorConnection, frame: FramePasswordEnterRequest) -> None:
+        """Authenticate connection if the password matches."""
+        connection.authenticated = frame.password == self.password
+        status = PasswordEnterConfirmationStatus.SUCCESSFUL if connection.authenticated else PasswordEnterConfirmationStatus.FAILED
+        connection.send(FramePasswordEnterConfirmation(status=status))
+
+    async def _get_version(self, connection: SimulatorConnection, _frame: FrameGetVersionRequest) -> None:
+        """Answer version request."""
+        connection.send(FrameGetVersionConfirmation(software_version=self.SOFTWARE_VERSION, hardware_version=self.HARDWARE_VERSION))
+
+    async def _get_protocol_version(self, connection: SimulatorConnection, _frame: FrameGetProtocolVersionRequest) -> None:
+        """Answer protocol version request."""
+        connection.send(FrameGetProtocolVersionConfirmation(*self.PROTOCOL_VERSION))
+
+    async def _get_state(self, connection: SimulatorConnection, _frame: FrameGetStateRequest) -> None:
+        """Answer gateway state request."""
+        connection.send(FrameGetStateConfirmation(GatewayState.GATEWAY_MODE_WITH_ACTUATORS, GatewaySubState.IDLE))
+
+    async def _set_utc(self, connection: SimulatorConnection, _frame: FrameSetUTCRequest) -> None:
+        """Confirm setting of UTC time, the simulator uses the local clock."""
+        connection.send(FrameSetUTCConfirmation())
+
+    async def _get_local_time(self, connection: SimulatorConnection, _frame: FrameGetLocalTimeRequest) -> None:
+        """Answer local time request."""
+        connection.send(FrameGetLocalTimeConfirmation())
+
+    async def _get_network_setup(self, connection: SimulatorConnection, _frame: FrameGetNetworkSetupRequest) -> None:
+        """Answer network setup request with the listening address."""
+        connection.send(FrameGetNetworkSetupConfirmation(
+            ipaddress=socket.inet_aton(self.host), netmask=socket.inet_aton("255.255.255.0"), gateway=socket.inet_aton(self.host)))
+
+    async def _house_status_monitor_enable(self, connection: SimulatorConnection, _frame: FrameHouseStatusMonitorEnableRequest) -> None:
+        """Enable house status monitor notifications for connection."""
+        connection.house_status_monitor_enabled = True
+        connection.send(FrameHouseStatusMonitorEnableConfirmation())
+
+    async def _house_status_monitor_disable(self, connection: SimulatorConnection, _frame: FrameHouseStatusMonitorDisableRequest) -> None:
+        """Disable house status monitor notifications for connection."""
+        connection.house_status_monitor_enabled = False
+        connection.send(FrameHouseStatusMonitorDisableConfirmation())
+
+    async def _get_all_nodes_information(self, connection: SimulatorConnection, _frame: FrameGetAllNodesInformationRequest) -> None:
+        """Send information of all nodes."""
+        connection.send(FrameGetAllNodesInformationConfirmation(number_of_nodes=len(self.nodes)))
+        for node in list(self.nodes.values()):
+            notification = FrameGetAllNodesInformationNotification()
+            self._node_information(notification, node)
+            connection.send(notification)
+        connection.send(FrameGetAllNodesInformationFinishedNotification())
+
+    async def _get_node_information(self, connection: SimulatorConnection, frame: FrameGetNodeInformationRequest) -> None:
+        """Send information of one node."""
+        node = self.nodes.get(frame.node_id) if frame.node_id is not None else None
+        if node is None:
+            connection.send(FrameGetNodeInformationConfirmation(status=NodeInformationStatus.Error_Invalid_Node_Index, node_id=frame.node_id))
+            return
+        connection.send(FrameGetNodeInformationConfirmation(node_id=node.node_id))
+        notification = FrameGetNodeInformationNotification()
+        self._node_information(notification, node)
+        connection.send(notification)
+
+    async def _get_system_table_data(self, connection: SimulatorConnection, _frame: FrameGetSystemTableDataRequest) -> None:
+        """Send system table, the address of a node is derived from its node id."""
+        connection.send(FrameGetSystemTableDataConfirmation())
+        entries = [
+            SystemTableEntry(node_id=node.node_id, address=0x100000 | node.node_id, node_type=node.node_type)
+            for node in self.nodes.values()
+        ]
+        for start in range(0, max(len(entries), 1), SYSTEM_TABLE_ENTRIES_PER_NOTIFICATION):
+            chunk = entries[start:start + SYSTEM_TABLE_ENTRIES_PER_NOTIFICATION]
+            connection.send(FrameGetSystemTableDataNotification(entries=chunk, remaining_entries=len(entries) - start - len(chunk)))
+
+    async def _set_node_name(self, connection: SimulatorConnection, frame: FrameSetNodeNameRequest) -> None:
+        """Rename node and notify the change."""
+        node = self.nodes.get(frame.node_id)
+        if node is None or frame.name is None:
+            connection.send(FrameSetNodeNameConfirmation(status=SetNodeNameConfirmationStatus.ERROR_INVALID_SYSTEM_TABLE_INDEX, node_id=frame.node_id))
+            return
+        node.name = frame.name
+        connection.send(FrameSetNodeNameConfirmation(node_id=node.node_id))
+        self.notify_house_status_monitor([FrameNodeInformationChangedNotification(node_id=node.node_id, name=node.name, order=node.node_id)])
+
+    async def _get_scene_list(self, connection: SimulatorConnection, _frame: FrameGetSceneListRequest) -> None:
+        """Send scene list."""
+        scenes = [(scene.scene_id, scene.name) for scene in self.scenes.values()]
+        connection.send(FrameGetSceneListConfirmation(count_scenes=len(scenes)))
+        for first in range(0, len(scenes), SCENES_PER_NOTIFICATION):
+            notification = FrameGetSceneListNotification()
+            notification.scenes = scenes[first:first + SCENES_PER_NOTIFICATION]
+            notification.remaining_scenes = max(len(scenes) - first - SCENES_PER_NOTIFICATION, 0)
+            connection.send(notification)
+
+    async def _get_scene_information(self, connection: SimulatorConnection, frame: FrameGetSceneInformationRequest) -> None:
+        """Send the nodes of a scene and their stored main parameter."""
+        scene = self.scenes.get(frame.scene_id)
+        if scene is None:
+            connection.send(FrameGetSceneInformationConfirmation(status=SceneInformationStatus.ERROR_INVALID_SCENE_ID, scene_id=frame.scene_id))
+            return
+        connection.send(FrameGetSceneInformationConfirmation(status=SceneInformationStatus.OK, scene_id=scene.scene_id))
+        nodes = [(node_id, NodeParameter.MP, Parameter(Parameter.from_int(target))) for node_id, target in scene.targets.items()]
+        first = 0
+        while True:
+            remaining_nodes = max(len(nodes) - first - SCENE_NODES_PER_NOTIFICATION, 0)
+            connection.send(FrameGetSceneInformationNotification(
+                scene_id=scene.scene_id, name=scene.name, nodes=nodes[first:first + SCENE_NODES_PER_NOTIFICATION], remaining_nodes=remaining_nodes
+            ))
+            if not remaining_nodes:
+                return
+            first += SCENE_NODES_PER_NOTIFICATION
+
+    async def _activate_scene(self, connection: SimulatorConnection, frame: FrameActivateSceneRequest) -> None:
+        """Move the nodes of a scene."""
+        assert frame.session_id is not None
+        scene = self.scenes.get(frame.scene_id) if frame.scene_id is not None else None
+        if scene is None:
+            connection.send(FrameActivateSceneConfirmation(session_id=frame.session_id, status=ActivateSceneConfirmationStatus.ERROR_INVALID_PARAMETER))
+            return
+        connection.send(FrameActivateSceneConfirmation(session_id=frame.session_id, status=ActivateSceneConfirmationStatus.ACCEPTED))
+        await self._move(connection, frame.session_id, dict(scene.targets))
+
+    async def _activate_product_group(self, connection: SimulatorConnection, frame: FrameActivateProductGroupRequest) -> None:
+        """Move the nodes of a group, which have to be of the same node type, with one command."""
+        assert frame.session_id is not None
+        group = self.groups.get(frame.group_id)
+        if group is None:
+            status = ActivateProductGroupConfirmationStatus.ERROR_UNKNOWN_PRODUCT_GROUP
+        elif len({self.nodes[node_id].node_type for node_id in group.node_ids if node_id in self.nodes}) > 1:
+            status = ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE
+        else:
+            status = ActivateProductGroupConfirmationStatus.OK
+        connection.send(FrameActivateProductGroupConfirmation(session_id=frame.session_id, status=status))
+        if group is None or status != ActivateProductGroupConfirmationStatus.OK:
+            return
+        target = Parameter.to_int(frame.parameter.raw)
+        await self._move(connection, frame.session_id, {node_id: target for node_id in group.node_ids})
+
+    async def _command_send(self, connection: SimulatorConnection, frame: FrameCommandSendRequest) -> None:
+        """Move nodes to the main parameter of the command."""
+        assert frame.session_id is not None
+        if not frame.node_ids:
+            connection.send(FrameCommandSendConfirmation(session_id=frame.session_id, status=CommandSendConfirmationStatus.REJECTED))
+            return
+        connection.send(FrameCommandSendConfirmation(session_id=frame.session_id, status=CommandSendConfirmationStatus.ACCEPTED))
+        target = Parameter.to_int(frame.parameter.raw)
+        await self._move(connection, frame.session_id, {node_id: target for node_id in frame.node_ids})
+
+    async def _status_request(self, connection: SimulatorConnection, frame: FrameStatusRequestRequest) -> None:
+        """Send status of nodes."""
+        assert frame.session_id is not None
+        connection.send(FrameStatusRequestConfirmation(session_id=frame.session_id, status=StatusRequestStatus.ACCEPTED))
+        now = time.monotonic()
+        for node_id in frame.node_ids:
+            node = self.nodes.get(node_id)
+            notification = FrameStatusRequestNotification()
+            notification.session_id = frame.session_id
+            notification.node_id = node_id
+            notification.status_type = frame.status_type
+            if node is None:
+                notification.run_status = RunStatus.EXECUTION_FAILED
+                notification.status_reply = StatusReply.NO_CONTACT
+            elif frame.status_type == StatusType.REQUEST_MAIN_INFO:
+                notification.status_reply = StatusReply.COMMAND_COMPLETED_OK
+                notification.target_position = Parameter(Parameter.from_int(node.target))
+                notification.current_position = Parameter(Parameter.from_int(node.position(now)))
+                notification.remaining_time = math.ceil(node.remaining_time(now))
+                notification.last_master_execution_address = bytes(4)
+            else:
+                notification.status_reply = StatusReply.COMMAND_COMPLETED_OK
+                value = node.target if frame.status_type == StatusType.REQUEST_TARGET_POSITION else node.position(now)
+                notification.parameter_data = {
+                    NodeParameter.MP: Parameter(Parameter.from_int(value)),
+                    NodeParameter.FP1: Parameter(),
+                    NodeParameter.FP2: Parameter(),
+                    NodeParameter.FP3: Parameter(),
+                }
+                notification.status_count = len(notification.parameter_data)
+            connection.send(notification)
+        connection.send(FrameSessionFinishedNotification(session_id=frame.session_id))
+
+    async def _wink_send(self, connection: SimulatorConnection, frame: FrameWinkSendRequest) -> None:
+        """Confirm wink request."""
+        assert frame.session_id is not None
+        connection.send(FrameWinkSendConfirmation(session_id=frame.session_id, status=WinkSendConfirmationStatus.ACCEPTED))
+        connection.send(FrameWinkSendNotification(session_id=frame.session_id))
+        connection.send(FrameSessionFinishedNotification(session_id=frame.session_id))
+
+    def _limitation_notification(self, session_id: int, node: SimulatedNode) -> FrameGetLimitationStatusNotification:
+        """Return limitation status notification of node."""
+        notification = FrameGetLimitationStatusNotification()
+        notification.session_id = session_id
+        notification.node_id = node.node_id
+        notification.min_value = Parameter.from_int(node.limitation_min)
+        notification.max_value = Parameter.from_int(node.limitation_max)
+        notification.limit_originator = node.limitation_originator
+        notification.limit_time = node.limitation_time
+        return notification
+
+    async def _get_limitation(self, connection: SimulatorConnection, frame: FrameGetLimitationStatus) -> None:
+        """Send limitation status of nodes."""
+        assert frame.session_id is not None
+        connection.send(FrameGetLimitationStatusConfirmation(session_id=frame.session_id, data=1))
+        for node_id in frame.node_ids:
+            node = self.nodes.get(node_id)
+            if node is not None:
+                connection.send(self._limitation_notification(frame.session_id, node))
+        connection.send(FrameSessionFinishedNotification(session_id=frame.session_id))
+
+    async def _set_limitation(self, connection: SimulatorConnection, frame: FrameSetLimitationRequest) -> None:
+        """Set limitations of nodes, nodes outside new limitations move into range."""
+        assert frame.session_id is not None
+        nodes = [self.nodes[node_id] for node_id in frame.node_ids or [] if node_id in self.nodes]
+        if not nodes or frame.limitation_value_min is None or frame.limitation_value_max is None:
+            connection.send(FrameSetLimitationConfirmation(session_id=frame.session_id, status=SetLimitationRequestStatus.REJECTED))
+            return
+        connection.send(FrameSetLimitationConfirmation(session_id=frame.session_id, status=SetLimitationRequestStatus.ACCEPTED))
+        minimum = Parameter.to_int(frame.limitation_value_min.raw)
+        maximum = Parameter.to_int(frame.limitation_value_max.raw)
+        for node in nodes:
+            if frame.limitation_time == LimitationTime.CLEAR_ALL:
+                node.limitation_min, node.limitation_max = Parameter.MIN, Parameter.MAX
+            else:
+                if minimum <= Parameter.MAX:
+                    node.limitation_min = minimum
+                if maximum <= Parameter.MAX:
+                    node.limitation_max = maximum
+            node.limitation_originator = frame.originator
+            node.limitation_time = frame.limitation_time.value if frame.limitation_time is not None else node.limitation_time
+            connection.send(self._limitation_notification(frame.session_id, node))
+            if node.target != node.limit(node.target):
+                node.move(node.target, time.monotonic())
+                self.notify_house_status_monitor([self._position_notification(node, time.monotonic())])
+        connection.send(FrameSessionFinishedNotification(session_id=frame.session_id))
+
+    async def _reboot(self, connection: SimulatorConnection, _frame: FrameGatewayRebootRequest) -> None:
+        """Confirm reboot and close the connection like the gateway does."""
+        connection.send(FrameGatewayRebootConfirmation())
+        connection.close()
@@ -0,0 +1,161 @@
+"""Module for persisting nodes and scenes between runs."""
+import os
+import struct
+from typing import TYPE_CHECKING, List, Tuple
+
+from .api.frames import FrameGetAllNodesInformationNotification
+from .dimmable_device import DimmableDevice
+from .exception import PyVLXException
+from .log import PYVLXLOG
+from .node_helper import FrameNodeInformation, convert_frame_to_node
+from .on_off_switch import OnOffSwitch
+from .opening_device import OpeningDevice
+from .parameter import Intensity, Parameter, Position, SwitchParameter
+from .scene import Scene
+from .string_helper import bytes_to_string, string_to_bytes
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class Snapshot:
+    """Class for a snapshot of the node table, scene list and last known states of a KLF 200.
+
+    The binary format starts with a header of magic, format version, number
+    of nodes, number of scenes and the fingerprint of the system table the
+    nodes were loaded from, or zeros if unknown. It is followed by one node information
+    payload per node, as sent within GW_GET_ALL_NODES_INFORMATION_NTF, whose
+    current position and target hold the last known state of the node. The
+    scenes are stored as scene id and zero padded name.
+    """
+
+    MAGIC = b"PVLX"
+    VERSION = 2
+    HEADER = struct.Struct(">4sBHH8s")
+    SCENE = struct.Struct(">B64s")
+    NODE_SIZE = FrameGetAllNodesInformationNotification.PAYLOAD_LEN
+
+    def __init__(
+        self,
+        node_information: List[FrameNodeInformation] | None = None,
+        scenes: List[Tuple[int, str]] | None = None,
+        system_table_fingerprint: bytes | None = None,
+    ):
+        """Initialize Snapshot."""
+        self.node_information = node_information if node_information is not None else []
+        self.scenes = scenes if scenes is not None else []
+        self.system_table_fingerprint = system_table_fingerprint
+
+    @classmethod
+    def from_pyvlx(cls, pyvlx: "PyVLX") -> "Snapshot":
+        """Create snapshot of the nodes and scenes of pyvlx, nodes not loaded from the gateway are skipped."""
+        node_information: List[FrameNodeInformation] = []
+        for node in pyvlx.nodes:
+            loaded_frame = pyvlx.nodes.node_information.get(node.node_id)
+            if loaded_frame is None:
+                continue
+            frame = FrameGetAllNodesInformationNotification()
+            frame.from_payload(loaded_frame.get_payload())
+            frame.node_id = node.node_id
+            frame.name = node.name
+            if node.last_frame_state is not None:
+                frame.state = node.last_frame_state
+            if isinstance(node, OpeningDevice):
+                frame.current_position = Parameter(bytes(node.position))
+                frame.target = Parameter(bytes(node.target))
+            elif isinstance(node, DimmableDevice):
+                frame.current_position = Parameter(bytes(node.intensity))
+            elif isinstance(node, OnOffSwitch):
+                frame.current_position = Parameter(bytes(node.parameter))
+            node_information.append(frame)
+        return cls(
+            node_information,
+            [(scene.scene_id, scene.name) for scene in pyvlx.scenes],
+            pyvlx.nodes.system_table_fingerprint,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return snapshot in binary format."""
+        return b"".join([
+            self.HEADER.pack(
+                self.MAGIC,
+                self.VERSION,
+                len(self.node_information),
+                len(self.scenes),
+                self.system_table_fingerprint or bytes(8),
+            ),
+            *(frame.get_payload() for frame in self.node_information),
+            *(self.SCENE.pack(scene_id, string_to_bytes(name, 64)) for scene_id, name in self.scenes),
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Snapshot":
+        """Parse snapshot from binary format, raise PyVLXException if data is not a valid snapshot."""
+        if len(data) < cls.HEADER.size:
+            raise PyVLXException("snapshot_too_short", size=len(data))
+        magic, version, node_count, scene_count, fingerprint = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise PyVLXException("snapshot_invalid_magic")
+        if version != cls.VERSION:
+            raise PyVLXException("snapshot_version_unsupported", version=version)
+        expected_size = cls.HEADER.size + node_count * cls.NODE_SIZE + scene_count * cls.SCENE.size
+        if len(data) != expected_size:
+            raise PyVLXException("snapshot_size_mismatch", size=len(data), expected_size=expected_size)
+        offset = cls.HEADER.size
+        node_information: List[FrameNodeInformation] = []
+        for _ in range(node_count):
+            frame = FrameGetAllNodesInformationNotification()
+            frame.from_payload(data[offset:offset + cls.NODE_SIZE])
+            node_information.append(frame)
+            offset += cls.NODE_SIZE
+        scenes: List[Tuple[int, str]] = []
+        for _ in range(scene_count):
+            scene_id, name = cls.SCENE.unpack_from(data, offset)
+            scenes.append((scene_id, bytes_to_string(name)))
+            offset += cls.SCENE.size
+        return cls(node_information, scenes, fingerprint if fingerprint != bytes(8) else None)
+
+    def save(self, path: str) -> None:
+        """Write snapshot to path, the previous snapshot is replaced atomically."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as snapshot_file:
+            snapshot_file.write(self.to_bytes())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot | None":
+        """Read snapshot from path, return None if there is no usable snapshot."""
+        try:
+            with open(path, "rb") as snapshot_file:
+                return cls.from_bytes(snapshot_file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, PyVLXException) as error:
+            PYVLXLOG.warning("Ignoring snapshot %s: %s", path, error)
+            return None
+
+    def restore(self, pyvlx: "PyVLX") -> None:
+        """Replace nodes and scenes of pyvlx by the ones stored in the snapshot, including their last known state."""
+        pyvlx.nodes.clear()
+        for frame in self.node_information:
+            node = convert_frame_to_node(pyvlx, frame)
+            if node is None:
+                continue
+            node.last_frame_state = frame.state
+            if isinstance(node, OpeningDevice):
+                node.position = Position(frame.current_position)
+                node.target = Position(frame.target)
+            elif isinstance(node, DimmableDevice):
+                node.intensity = Intensity(frame.current_position)
+            elif isinstance(node, OnOffSwitch):
+                node.parameter = SwitchParameter(frame.current_position)
+            pyvlx.nodes.add(node)
+            pyvlx.nodes.node_information[frame.node_id] = frame
+        pyvlx.nodes.system_table_fingerprint = self.system_table_fingerprint
+        pyvlx.scenes.clear()
+        for scene_id, name in self.scenes:
+            pyvlx.scenes.add(Scene(pyvlx=pyvlx, scene_id=scene_id, name=name))
+
+    def __str__(self) -> str:
+        """Return human readable string."""
+        return f'<{type(self).__name__} nodes="{len(self.node_information)}" scenes="{len(self.scenes)}"/>'
@@ -0,0 +1,77 @@
+"""Module for keeping the nodes in sync with the system table of the gateway."""
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING, Iterable, Set
+
+from .api.frames import (
+    FrameBase, FrameNodeInformationChangedNotification,
+    FrameSystemTableUpdateNotification)
+from .exception import PyVLXException
+from .log import PYVLXLOG
+
+if TYPE_CHECKING:
+    from pyvlx import PyVLX
+
+
+class TopologySync:
+    """Class for incremental updates of the nodes, driven by notifications of the gateway.
+
+    Removed nodes are dropped right away. Nodes which were added, renamed or
+    otherwise changed are reloaded by node id via Nodes.refresh(). Notifications
+    received within delay seconds, e.g. while pairing several nodes, are
+    collected into one refresh. Nodes whose metadata changed are published to
+    their device updated callbacks.
+    """
+
+    FRAME_TYPES = (FrameNodeInformationChangedNotification, FrameSystemTableUpdateNotification)
+
+    def __init__(self, pyvlx: "PyVLX", delay: float = 0.1):
+        """Initialize TopologySync object."""
+        self.pyvlx = pyvlx
+        self.delay = delay
+        self.refreshes = 0
+        self._pending: Set[int] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    async def process_frame(self, frame: FrameBase) -> None:
+        """Update nodes from topology notification."""
+        if isinstance(frame, FrameSystemTableUpdateNotification):
+            for node_id in frame.removed_node_ids:
+                self._pending.discard(node_id)
+                if node_id in self.pyvlx.nodes:
+                    self.pyvlx.nodes.remove(node_id)
+            self._schedule(frame.added_node_ids)
+        elif isinstance(frame, FrameNodeInformationChangedNotification):
+            self._schedule([frame.node_id])
+
+    def _schedule(self, node_ids: Iterable[int]) -> None:
+        """Schedule refresh of node_ids."""
+        self._pending.update(node_ids)
+        if self._pending and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """Refresh pending nodes after collecting notifications for delay seconds."""
+        await asyncio.sleep(self.delay)
+        while self._pending:
+            node_ids = sorted(self._pending)
+            self._pending.clear()
+            self.refreshes += 1
+            try:
+                changed = await self.pyvlx.nodes.refresh(node_ids)
+            except (OSError, PyVLXException):
+                PYVLXLOG.exception("Unable to refresh nodes %s", node_ids)
+                continue
+            for node in changed:
+                await node.after_update()
+
+    async def stop(self) -> None:
+        """Cancel pending refresh."""
+        self._pending.clear()
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
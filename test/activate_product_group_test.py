@@ -0,0 +1,99 @@
+"""Unit tests for product group activation."""
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from pyvlx import Group, Position, PyVLX, PyVLXException
+from pyvlx.api import ActivateProductGroup
+from pyvlx.api.frames import (
+    ActivateProductGroupConfirmationStatus,
+    FrameActivateProductGroupConfirmation, FrameActivateProductGroupRequest,
+    FrameCommandRunStatusNotification, FrameSessionFinishedNotification)
+from pyvlx.api.session_id import set_session_id
+from pyvlx.const import RunStatus, Velocity
+from pyvlx.opening_device import OpeningDevice
+from pyvlx.simulator import KLF200Simulator, SimulatedGroup
+
+
+class TestActivateProductGroup(IsolatedAsyncioTestCase):
+    """Test class for ActivateProductGroup."""
+
+    async def test_handle_frame(self) -> None:
+        """Test confirmation status and run status per node are tracked."""
+        activate = ActivateProductGroup(pyvlx=MagicMock(), group_id=3, parameter=Position(position_percent=100))
+        activate.session_id = 7
+        self.assertFalse(await activate.handle_frame(
+            FrameActivateProductGroupConfirmation(session_id=8, status=ActivateProductGroupConfirmationStatus.OK)
+        ))
+        self.assertTrue(await activate.handle_frame(
+            FrameActivateProductGroupConfirmation(session_id=7, status=ActivateProductGroupConfirmationStatus.ERROR_BUSY)
+        ))
+        self.assertFalse(activate.success)
+        self.assertEqual(activate.status, ActivateProductGroupConfirmationStatus.ERROR_BUSY)
+
+        for node_id, run_status in ((1, RunStatus.EXECUTION_COMPLETED), (2, RunStatus.EXECUTION_FAILED)):
+            self.assertFalse(activate.handle_session_frame(FrameCommandRunStatusNotification(session_id=7, index_id=node_id, run_status=run_status)))
+        self.assertTrue(activate.handle_session_frame(FrameSessionFinishedNotification(session_id=7)))
+        self.assertEqual(activate.completed_node_ids, [1])
+        self.assertEqual(activate.failed_node_ids, [2])
+
+    @patch("pyvlx.api.activate_product_group.get_new_session_id", return_value=5)
+    def test_request_frame(self, _new_session_id: MagicMock) -> None:
+        """Test request_frame of ActivateProductGroup."""
+        activate = ActivateProductGroup(pyvlx=MagicMock(), group_id=3, parameter=Position(position_percent=0), velocity=Velocity.FAST)
+        frame = activate.request_frame()
+        assert isinstance(frame, FrameActivateProductGroupRequest)
+        self.assertEqual(frame.session_id, 5)
+        self.assertEqual(frame.group_id, 3)
+        self.assertEqual(frame.velocity, Velocity.FAST)
+
+
+class TestGroupActivation(IsolatedAsyncioTestCase):
+    """Test moving groups via the simulator."""
+
+    async def asyncSetUp(self) -> None:
+        """Connect PyVLX to simulator with one product group and one group of mixed node types."""
+        self.addCleanup(set_session_id, 0)
+        self.simulator = KLF200Simulator(node_count=10, scene_count=0, travel_time=0)
+        # Simulated node types cycle through five node types, nodes 0 and 5 are of the same kind
+        self.simulator.groups[1] = SimulatedGroup(1, "Product group", [0, 5])
+        self.simulator.groups[2] = SimulatedGroup(2, "Mixed", [0, 1])
+        await self.simulator.start()
+        self.addAsyncCleanup(self.simulator.stop)
+        self.pyvlx = PyVLX(host="127.0.0.1", password="velux123", port=self.simulator.port)
+        await self.pyvlx.connect()
+        self.addAsyncCleanup(self.pyvlx.disconnect)
+        await self.pyvlx.load_nodes()
+        await self.pyvlx.heartbeat.stop()
+
+    async def test_activate_product_group(self) -> None:
+        """Test all nodes of a product group are moved with one request."""
+        requests_received = self.simulator.requests_received
+        node_run_status = await self.pyvlx.activate_product_group(1, Position(position_percent=100))
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+        self.assertEqual(node_run_status, {node_id: RunStatus.EXECUTION_COMPLETED for node_id in (0, 5)})
+
+        with self.assertRaises(PyVLXException) as ctx:
+            await self.pyvlx.activate_product_group(9, Position(position_percent=100))
+        self.assertEqual(ctx.exception.parameter["status"], ActivateProductGroupConfirmationStatus.ERROR_UNKNOWN_PRODUCT_GROUP)
+
+    async def test_group_set_position(self) -> None:
+        """Test groups are activated as product group and fall back to command send for mixed node types."""
+        product_group = Group(self.pyvlx, 1, "Product group", node_ids=[0, 5])
+        requests_received = self.simulator.requests_received
+        await product_group.close()
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+        self.assertTrue(product_group.product_group)
+        nodes = [self.pyvlx.nodes[node_id] for node_id in (0, 5)]
+        async with asyncio.timeout(2):
+            while any(isinstance(node, OpeningDevice) and node.position != Position(position_percent=100) for node in nodes):
+                await asyncio.sleep(0.01)
+
+        mixed = Group(self.pyvlx, 2, "Mixed", node_ids=[0, 1])
+        node_run_status = await mixed.open()
+        self.assertFalse(mixed.product_group)
+        self.assertEqual(node_run_status, {0: RunStatus.EXECUTION_COMPLETED, 1: RunStatus.EXECUTION_COMPLETED})
+        # Product group activation is not tried again
+        requests_received = self.simulator.requests_received
+        await mixed.close()
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
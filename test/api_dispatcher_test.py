@@ -0,0 +1,424 @@
+"""Unit tests for api dispatcher module."""
+import asyncio
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from pyvlx import Position, PyVLX
+from pyvlx.api import ApiDispatcher, ApiEvent, CommandSend, RequestPriority
+from pyvlx.api.frames import (
+    CommandSendConfirmationStatus, FrameBase, FrameCommandSendConfirmation,
+    FrameCommandSendRequest, FrameGetStateConfirmation, FrameGetStateRequest,
+    FrameSessionFinishedNotification)
+from pyvlx.exception import PyVLXException
+
+
+class _SerialApiEvent(ApiEvent):
+    """Test helper for API calls without session id."""
+
+    async def handle_frame(self, frame: FrameBase) -> bool:
+        """Handle incoming frame."""
+        return True
+
+    def request_frame(self) -> FrameBase:
+        """Construct initiating frame."""
+        return FrameGetStateRequest()
+
+
+class _SessionApiEvent(_SerialApiEvent):
+    """Test helper for API calls matched by session id."""
+
+    SESSION_BASED = True
+
+
+class _OtherSessionApiEvent(_SerialApiEvent):
+    """Second test helper for API calls matched by session id."""
+
+    SESSION_BASED = True
+
+
+class _GetStateApiEvent(_SerialApiEvent):
+    """Test helper for API calls without session id interested in one frame class."""
+
+    RESPONSE_FRAMES = (FrameGetStateConfirmation,)
+
+
+class _SessionFinishedApiEvent(_SerialApiEvent):
+    """Test helper for API calls matched by session id interested in one frame class."""
+
+    SESSION_BASED = True
+    RESPONSE_FRAMES = (FrameSessionFinishedNotification,)
+
+
+class _PipelinedGetStateApiEvent(_GetStateApiEvent):
+    """Test helper for pipelinable API calls without session id."""
+
+    PIPELINABLE = True
+
+
+class _PipelinedSessionFinishedApiEvent(_SerialApiEvent):
+    """Second test helper for pipelinable API calls without session id."""
+
+    PIPELINABLE = True
+    RESPONSE_FRAMES = (FrameSessionFinishedNotification,)
+
+
+class TestApiDispatcher(IsolatedAsyncioTestCase):
+    """Test class for ApiDispatcher."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.pyvlx = MagicMock(spec=PyVLX)
+        self.started: List[ApiEvent] = []
+
+    def create(self, api_event_class: type, priority: RequestPriority | None = None) -> ApiEvent:
+        """Create API event with mocked frame queue."""
+        api_event = api_event_class(pyvlx=self.pyvlx)
+        api_event.frame_received = MagicMock()  # type: ignore[method-assign]
+        if priority is not None:
+            api_event.priority = priority
+        return api_event
+
+    async def run_call(self, dispatcher: ApiDispatcher, api_event: ApiEvent, release: asyncio.Event) -> None:
+        """Keep api_event in flight until release is set."""
+        async with dispatcher.api_call(api_event):
+            self.started.append(api_event)
+            await release.wait()
+
+    def test_invalid_window(self) -> None:
+        """Test windows have to allow at least one API call."""
+        with self.assertRaises(PyVLXException):
+            ApiDispatcher(max_in_flight=0)
+        with self.assertRaises(PyVLXException):
+            ApiDispatcher().set_window(_SessionApiEvent, 0)
+
+    def test_get_window(self) -> None:
+        """Test windows per API call class."""
+        dispatcher = ApiDispatcher(max_in_flight=5)
+        self.assertEqual(dispatcher.get_window(_SerialApiEvent), 1)
+        self.assertEqual(dispatcher.get_window(_SessionApiEvent), 5)
+        dispatcher.set_window(_SessionApiEvent, 2)
+        self.assertEqual(dispatcher.get_window(_SessionApiEvent), 2)
+        dispatcher.set_window(_SessionApiEvent, 10)
+        self.assertEqual(dispatcher.get_window(_SessionApiEvent), 5)
+        dispatcher.set_window(_SerialApiEvent, 3)
+        self.assertEqual(dispatcher.get_window(_SerialApiEvent), 1)
+
+    async def test_session_based_calls_pipelined(self) -> None:
+        """Test session based API calls are kept in flight up to the window."""
+        dispatcher = ApiDispatcher(max_in_flight=3)
+        release = asyncio.Event()
+        events = [self.create(_SessionApiEvent) for _ in range(4)]
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in events]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, events[:3])
+        self.assertEqual(dispatcher.in_flight, 3)
+        self.assertEqual(dispatcher.waiting, 1)
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, events)
+        self.assertEqual(dispatcher.in_flight, 0)
+
+    async def test_window_per_class(self) -> None:
+        """Test a full window of one class does not block other classes."""
+        dispatcher = ApiDispatcher(max_in_flight=4)
+        dispatcher.set_window(_SessionApiEvent, 1)
+        release = asyncio.Event()
+        first = self.create(_SessionApiEvent)
+        second = self.create(_SessionApiEvent)
+        other = self.create(_OtherSessionApiEvent)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in (first, second, other)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, [first, other])
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, [first, other, second])
+
+    async def test_serial_calls_exclusive(self) -> None:
+        """Test API calls without session id are not pipelined."""
+        dispatcher = ApiDispatcher(max_in_flight=4)
+        release_session = asyncio.Event()
+        release_serial = asyncio.Event()
+        session_event = self.create(_SessionApiEvent)
+        serial_event = self.create(_SerialApiEvent)
+        late_session_event = self.create(_SessionApiEvent)
+
+        tasks = [asyncio.create_task(self.run_call(dispatcher, session_event, release_session))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(self.run_call(dispatcher, serial_event, release_serial)))
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(self.run_call(dispatcher, late_session_event, release_session)))
+        await asyncio.sleep(0)
+        # Serial call waits for the session based call, later calls wait for the serial call
+        self.assertEqual(self.started, [session_event])
+
+        release_session.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.started, [session_event, serial_event])
+        self.assertEqual(dispatcher.in_flight, 1)
+
+        release_serial.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, [session_event, serial_event, late_session_event])
+
+    async def test_pipelined_serial_calls(self) -> None:
+        """Test pipelinable API calls are kept in flight together unless their response frames overlap."""
+        dispatcher = ApiDispatcher(max_in_flight=4)
+        release = asyncio.Event()
+        get_state = self.create(_PipelinedGetStateApiEvent)
+        session_finished = self.create(_PipelinedSessionFinishedApiEvent)
+        second_get_state = self.create(_PipelinedGetStateApiEvent)
+        session_event = self.create(_SessionApiEvent)
+        events = (get_state, session_finished, second_get_state, session_event)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in events]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, [get_state, session_finished])
+
+        dispatcher.process_frame(FrameSessionFinishedNotification(session_id=1))
+        session_finished.frame_received.assert_called_once()  # type: ignore[attr-defined]
+        get_state.frame_received.assert_not_called()  # type: ignore[attr-defined]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, list(events))
+
+    async def test_cancel_waiting_call(self) -> None:
+        """Test cancelling a waiting API call removes it from the queue."""
+        dispatcher = ApiDispatcher(max_in_flight=1)
+        release = asyncio.Event()
+        first = self.create(_SessionApiEvent)
+        second = self.create(_SessionApiEvent)
+        first_task = asyncio.create_task(self.run_call(dispatcher, first, release))
+        await asyncio.sleep(0)
+        second_task = asyncio.create_task(self.run_call(dispatcher, second, release))
+        await asyncio.sleep(0)
+        self.assertEqual(dispatcher.waiting, 1)
+        second_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await second_task
+        release.set()
+        await first_task
+        self.assertEqual(self.started, [first])
+        self.assertEqual(dispatcher.in_flight, 0)
+        self.assertEqual(dispatcher.waiting, 0)
+
+    async def test_priority_order(self) -> None:
+        """Test waiting interactive API calls are started before queued background API calls."""
+        dispatcher = ApiDispatcher(max_in_flight=1)
+        release = asyncio.Event()
+        blocker = self.create(_SessionApiEvent, RequestPriority.MAINTENANCE)
+        polls = [self.create(_SessionApiEvent, RequestPriority.MAINTENANCE) for _ in range(3)]
+        refresh = self.create(_SessionApiEvent, RequestPriority.STATE_REFRESH)
+        command = self.create(_SessionApiEvent)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in (blocker, *polls, refresh, command)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, [blocker])
+        self.assertEqual(dispatcher.waiting_with_priority(RequestPriority.MAINTENANCE), 3)
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, [blocker, command, refresh, *polls])
+
+    async def test_serial_call_preempts_lower_priority(self) -> None:
+        """Test a waiting serial API call only blocks API calls of lower priority."""
+        dispatcher = ApiDispatcher(max_in_flight=4)
+        release = asyncio.Event()
+        running = self.create(_SessionApiEvent)
+        serial = self.create(_SerialApiEvent, RequestPriority.SCENE)
+        poll = self.create(_SessionApiEvent, RequestPriority.MAINTENANCE)
+        command = self.create(_SessionApiEvent)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in (running, serial, poll, command)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, [running, command])
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.started, [running, command, serial, poll])
+
+    async def test_reserved_slots(self) -> None:
+        """Test background API calls leave slots for interactive API calls."""
+        dispatcher = ApiDispatcher(max_in_flight=3)
+        release = asyncio.Event()
+        polls = [self.create(_SessionApiEvent, RequestPriority.MAINTENANCE) for _ in range(3)]
+        command = self.create(_SessionApiEvent)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in polls]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, polls[:2])
+        tasks.append(asyncio.create_task(self.run_call(dispatcher, command, release)))
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, [*polls[:2], command])
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(dispatcher.in_flight, 0)
+
+    async def test_weighted_priority(self) -> None:
+        """Test weighted scheduling shares started API calls in proportion to the weights."""
+        with self.assertRaises(PyVLXException):
+            ApiDispatcher(weights={RequestPriority.INTERACTIVE: 1})
+        weights = {
+            RequestPriority.INTERACTIVE: 2,
+            RequestPriority.SCENE: 2,
+            RequestPriority.STATE_REFRESH: 1,
+            RequestPriority.MAINTENANCE: 1,
+        }
+        dispatcher = ApiDispatcher(max_in_flight=1, weights=weights)
+        release = asyncio.Event()
+        blocker = self.create(_SessionApiEvent)
+        commands = [self.create(_SessionApiEvent) for _ in range(4)]
+        polls = [self.create(_SessionApiEvent, RequestPriority.MAINTENANCE) for _ in range(4)]
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in (blocker, *commands, *polls)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+        order = ["command" if event in commands else "poll" for event in self.started[1:]]
+        # Background polling is not starved, but gets half the share of commands
+        self.assertEqual(order, ["poll", "command", "command", "poll", "command", "command", "poll", "poll"])
+
+    async def test_process_frame_routes_by_session_id(self) -> None:
+        """Test frames with session id are only delivered to the API call of this session."""
+        dispatcher = ApiDispatcher()
+        release = asyncio.Event()
+        first = self.create(_SessionApiEvent)
+        second = self.create(_SessionApiEvent)
+        tasks = [asyncio.create_task(self.run_call(dispatcher, event, release)) for event in (first, second)]
+        await asyncio.sleep(0)
+        dispatcher.bind_session(first, FrameSessionFinishedNotification(session_id=1))
+        dispatcher.bind_session(second, FrameSessionFinishedNotification(session_id=2))
+
+        frame = FrameSessionFinishedNotification(session_id=2)
+        dispatcher.process_frame(frame)
+        first.frame_received.assert_not_called()  # type: ignore[attr-defined]
+        second.frame_received.assert_called_once_with(frame)  # type: ignore[attr-defined]
+
+        # Frames of unknown sessions and without session are not delivered to session based API calls
+        dispatcher.process_frame(FrameSessionFinishedNotification(session_id=3))
+        dispatcher.process_frame(FrameGetStateConfirmation())
+        first.frame_received.assert_not_called()  # type: ignore[attr-defined]
+        second.frame_received.assert_called_once()  # type: ignore[attr-defined]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        # Sessions are unbound after the API call finished
+        dispatcher.process_frame(frame)
+        second.frame_received.assert_called_once()  # type: ignore[attr-defined]
+
+    async def test_process_frame_serial_call(self) -> None:
+        """Test frames are delivered to serial API calls."""
+        dispatcher = ApiDispatcher()
+        release = asyncio.Event()
+        serial_event = self.create(_SerialApiEvent)
+        task = asyncio.create_task(self.run_call(dispatcher, serial_event, release))
+        await asyncio.sleep(0)
+        frame: FrameBase = FrameGetStateConfirmation()
+        dispatcher.process_frame(frame)
+        serial_event.frame_received.assert_called_once_with(frame)  # type: ignore[attr-defined]
+        release.set()
+        await task
+
+    async def test_process_frame_response_frames(self) -> None:
+        """Test only frames of the classes in RESPONSE_FRAMES are delivered."""
+        dispatcher = ApiDispatcher()
+        release = asyncio.Event()
+        serial_event = self.create(_GetStateApiEvent)
+        task = asyncio.create_task(self.run_call(dispatcher, serial_event, release))
+        await asyncio.sleep(0)
+        dispatcher.process_frame(FrameSessionFinishedNotification(session_id=1))
+        serial_event.frame_received.assert_not_called()  # type: ignore[attr-defined]
+        frame: FrameBase = FrameGetStateConfirmation()
+        dispatcher.process_frame(frame)
+        serial_event.frame_received.assert_called_once_with(frame)  # type: ignore[attr-defined]
+        release.set()
+        await task
+
+        session_event = self.create(_SessionFinishedApiEvent)
+        task = asyncio.create_task(self.run_call(dispatcher, session_event, release))
+        await asyncio.sleep(0)
+        dispatcher.bind_session(session_event, FrameCommandSendRequest(node_ids=[1], parameter=Position(), session_id=7))
+        dispatcher.process_frame(FrameCommandSendConfirmation(session_id=7, status=CommandSendConfirmationStatus.ACCEPTED))
+        session_event.frame_received.assert_not_called()  # type: ignore[attr-defined]
+        frame = FrameSessionFinishedNotification(session_id=7)
+        dispatcher.process_frame(frame)
+        session_event.frame_received.assert_called_once_with(frame)  # type: ignore[attr-defined]
+        await task
+
+    async def test_wants_frame(self) -> None:
+        """Test only frame classes API calls in flight are interested in are wanted."""
+        dispatcher = ApiDispatcher()
+        release = asyncio.Event()
+        self.assertFalse(dispatcher.wants_frame(FrameGetStateConfirmation))
+        serial_event = self.create(_GetStateApiEvent)
+        task = asyncio.create_task(self.run_call(dispatcher, serial_event, release))
+        await asyncio.sleep(0)
+        self.assertTrue(dispatcher.wants_frame(FrameGetStateConfirmation))
+        self.assertFalse(dispatcher.wants_frame(FrameSessionFinishedNotification))
+        release.set()
+        await task
+        self.assertFalse(dispatcher.wants_frame(FrameGetStateConfirmation))
+
+        release.clear()
+        session_event = self.create(_SessionFinishedApiEvent)
+        task = asyncio.create_task(self.run_call(dispatcher, session_event, release))
+        await asyncio.sleep(0)
+        dispatcher.bind_session(session_event, FrameSessionFinishedNotification(session_id=7))
+        self.assertTrue(dispatcher.wants_frame(FrameSessionFinishedNotification))
+        self.assertFalse(dispatcher.wants_frame(FrameCommandSendConfirmation))
+        release.set()
+        await task
+        self.assertFalse(dispatcher.wants_frame(FrameSessionFinishedNotification))
+
+    @patch("pyvlx.api.command_send.get_new_session_id", side_effect=[101, 102, 103])
+    async def test_command_send_pipelined(self, _get_new_session_id: MagicMock) -> None:
+        """Test CommandSend calls are sent before the confirmation of the previous call arrived."""
+        pyvlx = PyVLX(host="192.168.1.10", password="velux123")
+        pyvlx.connection.connected = True
+        sent_frames: List[FrameBase] = []
+        pyvlx.connection.write = sent_frames.append  # type: ignore[method-assign]
+
+        commands = [
+            CommandSend(pyvlx=pyvlx, node_id=node_id, parameter=Position(position_percent=100), wait_for_completion=False)
+            for node_id in range(3)
+        ]
+        tasks = [asyncio.create_task(command.send()) for command in commands]
+        await asyncio.sleep(0)
+        self.assertEqual(len(sent_frames), 3)
+        self.assertEqual(pyvlx.api_dispatcher.in_flight, 3)
+
+        for frame in reversed(sent_frames):
+            assert isinstance(frame, FrameCommandSendRequest)
+            pyvlx.api_dispatcher.process_frame(
+                FrameCommandSendConfirmation(session_id=frame.session_id, status=CommandSendConfirmationStatus.ACCEPTED)
+            )
+        await asyncio.gather(*tasks)
+        self.assertTrue(all(command.success for command in commands))
+        self.assertEqual(pyvlx.api_dispatcher.in_flight, 0)
+
+    @patch("pyvlx.api.command_send.get_new_session_id", side_effect=[201, 202])
+    async def test_confirmation_releases_dispatcher(self, _get_new_session_id: MagicMock) -> None:
+        """Test a command waiting for completion frees its slot when the confirmation arrives."""
+        pyvlx = PyVLX(host="192.168.1.10", password="velux123", max_api_calls_in_flight=1)
+        pyvlx.connection.connected = True
+        sent_frames: List[FrameBase] = []
+        pyvlx.connection.write = sent_frames.append  # type: ignore[method-assign]
+
+        command = CommandSend(pyvlx=pyvlx, node_id=1, parameter=Position(position_percent=100), wait_for_completion=True)
+        task = asyncio.create_task(command.send())
+        await asyncio.sleep(0)
+        pyvlx.api_dispatcher.process_frame(FrameCommandSendConfirmation(session_id=201, status=CommandSendConfirmationStatus.ACCEPTED))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        self.assertEqual(pyvlx.api_dispatcher.in_flight, 0)
+        self.assertIn(201, pyvlx.api_dispatcher.sessions)
+        self.assertTrue(pyvlx.api_dispatcher.wants_frame(FrameSessionFinishedNotification))
+
+        # Unrelated API calls are not held back by the pending completion
+        other = CommandSend(pyvlx=pyvlx, node_id=2, parameter=Position(position_percent=0), wait_for_completion=False)
+        other_task = asyncio.create_task(other.send())
+        await asyncio.sleep(0)
+        self.assertEqual(len(sent_frames), 2)
+        pyvlx.api_dispatcher.process_frame(FrameCommandSendConfirmation(session_id=202, status=CommandSendConfirmationStatus.ACCEPTED))
+        await other_task
+
+        pyvlx.api_dispatcher.process_frame(FrameSessionFinishedNotification(session_id=201))
+        await task
+        assert command.completion is not None
+        self.assertTrue(command.completion.completed)
+        self.assertNotIn(201, pyvlx.api_dispatcher.sessions)
+        pyvlx.api_dispatcher.sessions.cancel_all()
@@ -0,0 +1,41 @@
+"""Smoke tests for benchmark suite."""
+from unittest import IsolatedAsyncioTestCase
+
+from benchmarks.fake_klf200 import FakeKLF200
+from benchmarks.scenarios import SCENARIOS, BenchmarkSettings
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import FrameGetAllNodesInformationNotification
+from pyvlx.api.session_id import set_session_id
+from pyvlx.connection import SlipTokenizer
+
+
+class TestBenchmarks(IsolatedAsyncioTestCase):
+    """Test class for benchmark suite."""
+
+    def test_fake_klf200_traffic(self) -> None:
+        """Test traffic of fake KLF 200 survives encoding and segmentation."""
+        klf200 = FakeKLF200(node_count=30, scene_count=7)
+        frames = [*klf200.nodes_information_burst(), *klf200.scene_list(), *klf200.position_notifications(10)]
+        tokenizer = SlipTokenizer()
+        for segment in klf200.segments(klf200.encode(frames), segment_size=50):
+            tokenizer.feed(segment)
+        decoded = []
+        while tokenizer.has_tokens():
+            raw = tokenizer.get_next_token()
+            assert raw is not None
+            decoded.append(frame_from_raw(raw))
+        self.assertEqual([str(frame) for frame in decoded], [str(frame) for frame in frames])
+        self.assertEqual(sum(isinstance(frame, FrameGetAllNodesInformationNotification) for frame in decoded), 30)
+
+    async def test_scenarios(self) -> None:
+        """Test all scenarios run with small sizes."""
+        # Other tests expect the global session id counter to be untouched
+        self.addCleanup(set_session_id, 0)
+        settings = BenchmarkSettings(node_count=25, scene_count=5, frame_count=20, repeat=1)
+        for name, scenario in SCENARIOS.items():
+            with self.subTest(name=name):
+                result = await scenario(settings)
+                self.assertGreater(result.count, 0)
+                self.assertGreater(result.fps, 0)
+                self.assertGreaterEqual(result.percentile(99), result.percentile(50))
+                self.assertIn(result.name, result.format())
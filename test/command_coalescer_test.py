@@ -0,0 +1,74 @@
+"""Unit tests for command coalescer module."""
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from pyvlx.command_coalescer import CommandCoalescer
+from pyvlx.const import NodeParameter
+from pyvlx.exception import PyVLXException
+from pyvlx.parameter import FunctionalParams, IgnorePosition, Position
+
+
+def _command(active_parameter: int = 0, node_ids: tuple = (1,), functional_parameter: FunctionalParams | None = None) -> MagicMock:
+    """Return mocked CommandSend."""
+    command = MagicMock()
+    command.node_ids = list(node_ids)
+    command.node_id = node_ids[0]
+    command.active_parameter = active_parameter
+    command.functional_parameter = functional_parameter
+    command.send = AsyncMock()
+    return command
+
+
+class TestCommandCoalescer(IsolatedAsyncioTestCase):
+    """Test class for CommandCoalescer."""
+
+    async def test_without_debounce(self) -> None:
+        """Test commands are sent right away without debounce window."""
+        coalescer = CommandCoalescer()
+        command = _command()
+        await coalescer.send(command)
+        command.send.assert_awaited_once()
+
+    async def test_last_writer_wins(self) -> None:
+        """Test commands within the debounce window are replaced by the latest one."""
+        coalescer = CommandCoalescer(debounce=0.01)
+        commands = [_command() for _ in range(3)]
+        other_parameter = _command(active_parameter=1)
+        await asyncio.gather(*(coalescer.send(command) for command in (*commands, other_parameter)))
+        for command in commands[:2]:
+            command.send.assert_not_awaited()
+        commands[2].send.assert_awaited_once()
+        other_parameter.send.assert_awaited_once()
+        self.assertEqual(coalescer.superseded, 2)
+        self.assertEqual(coalescer.pending, 0)
+
+    async def test_failure_reaches_all_callers(self) -> None:
+        """Test superseded callers get the outcome of the command which was sent."""
+        coalescer = CommandCoalescer(debounce=0.01)
+        first = _command()
+        last = _command()
+        last.send.side_effect = PyVLXException("command_rejected")
+        results = await asyncio.gather(coalescer.send(first), coalescer.send(last), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, PyVLXException) for result in results))
+        first.send.assert_not_awaited()
+
+    async def test_multiple_nodes_not_coalesced(self) -> None:
+        """Test commands addressing several nodes are not held back."""
+        coalescer = CommandCoalescer(debounce=10)
+        command = _command(node_ids=(1, 2))
+        await coalescer.send(command)
+        command.send.assert_awaited_once()
+        self.assertEqual(coalescer.pending, 0)
+
+    async def test_functional_parameters_not_coalesced(self) -> None:
+        """Test commands setting different functional parameters, e.g. position and orientation of a blind, are both sent."""
+        coalescer = CommandCoalescer(debounce=0.01)
+        orientation = _command(functional_parameter={NodeParameter.FP3: Position(position_percent=50)})
+        position = _command(functional_parameter={NodeParameter.FP3: IgnorePosition()})
+        other_position = _command()
+        await asyncio.gather(coalescer.send(orientation), coalescer.send(position), coalescer.send(other_position))
+        orientation.send.assert_awaited_once()
+        position.send.assert_not_awaited()
+        other_position.send.assert_awaited_once()
+        self.assertEqual(coalescer.superseded, 1)
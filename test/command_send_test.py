@@ -9,6 +9,7 @@ from pyvlx.api.frames import (
     FrameCommandSendRequest, FrameSessionFinishedNotification)
 from pyvlx.api.frames.frame_command_send import (
     FrameCommandRemainingTimeNotification, FrameCommandRunStatusNotification)
+from pyvlx.const import RunStatus
 
 
 class TestCommandSend(unittest.IsolatedAsyncioTestCase):
@@ -33,7 +34,7 @@ class TestCommandSend(unittest.IsolatedAsyncioTestCase):
         self.command_send.success = False
         self.command_send.wait_for_completion = True
         frame.status = CommandSendConfirmationStatus.ACCEPTED
-        self.assertFalse(await self.command_send.handle_frame(frame=frame))
+        self.assertTrue(await self.command_send.handle_frame(frame=frame))
         self.assertTrue(self.command_send.success)
 
         self.command_send.success = False
@@ -98,3 +99,36 @@ class TestCommandSend(unittest.IsolatedAsyncioTestCase):
         assert isinstance(self.command_send.request_frame(), FrameCommandSendRequest)
         assert new_session_id_request.called
         assert self.command_send.session_id == 5
+
+    async def test_handle_frame_run_status(self) -> None:
+        """Test run status notifications are tracked per node."""
+        command_send = CommandSend(pyvlx=MagicMock(), node_ids=[1, 2, 3], parameter=Parameter())
+        command_send.session_id = 1
+        for node_id, run_status in ((1, RunStatus.EXECUTION_ACTIVE), (2, RunStatus.EXECUTION_FAILED), (1, RunStatus.EXECUTION_COMPLETED)):
+            frame = FrameCommandRunStatusNotification(session_id=1, index_id=node_id, run_status=run_status)
+            self.assertFalse(await command_send.handle_frame(frame=frame))
+        self.assertFalse(await command_send.handle_frame(
+            frame=FrameCommandRunStatusNotification(session_id=2, index_id=3, run_status=RunStatus.EXECUTION_COMPLETED)
+        ))
+        self.assertEqual(command_send.node_run_status, {1: RunStatus.EXECUTION_COMPLETED, 2: RunStatus.EXECUTION_FAILED})
+        self.assertEqual(command_send.completed_node_ids, [1])
+        self.assertEqual(command_send.failed_node_ids, [2])
+
+    @patch("pyvlx.api.command_send.get_new_session_id", return_value=5)
+    def test_request_frame_node_ids(self, _new_session_id_request: MagicMock) -> None:
+        """Test request_frame with several node ids."""
+        command_send = CommandSend(pyvlx=MagicMock(), node_ids=[4, 8, 15], parameter=Parameter())
+        frame = command_send.request_frame()
+        self.assertEqual(frame.node_ids, [4, 8, 15])
+        self.assertEqual(frame.session_id, 5)
+
+    def test_invalid_node_ids(self) -> None:
+        """Test CommandSend requires either node_id or 1 to 20 node_ids."""
+        with self.assertRaises(PyVLXException):
+            CommandSend(pyvlx=MagicMock(), parameter=Parameter())
+        with self.assertRaises(PyVLXException):
+            CommandSend(pyvlx=MagicMock(), node_id=1, node_ids=[2], parameter=Parameter())
+        with self.assertRaises(PyVLXException):
+            CommandSend(pyvlx=MagicMock(), node_ids=[], parameter=Parameter())
+        with self.assertRaises(PyVLXException):
+            CommandSend(pyvlx=MagicMock(), node_ids=list(range(21)), parameter=Parameter())
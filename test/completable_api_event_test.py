@@ -50,12 +50,12 @@ class TestCompletableApiEvent(IsolatedAsyncioTestCase):
         self.assertTrue(self.event.success)
 
     async def test_handle_frame_confirmation_accepted_wait(self) -> None:
-        """Test handle_frame on accepted confirmation with completion wait."""
+        """Test accepted confirmation completes the API call also with completion wait, completion is tracked afterwards."""
         self.event.wait_for_completion = True
         frame = MagicMock(spec=FrameBase)
         frame.confirmation = True
 
-        self.assertFalse(await self.event.handle_frame(frame))
+        self.assertTrue(await self.event.handle_frame(frame))
         self.assertTrue(self.event.success)
 
     async def test_handle_frame_confirmation_rejected(self) -> None:
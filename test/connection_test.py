@@ -1,11 +1,14 @@
 """Unit tests for connection module."""
 import asyncio
 import ssl
+import unittest
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from pyvlx.api.frames import (
+    FrameGetStateConfirmation, FrameSessionFinishedNotification)
 from pyvlx.config import Config
-from pyvlx.connection import Connection
+from pyvlx.connection import Connection, SendQueue, SlipTokenizer, TCPTransport
 from pyvlx.exception import PyVLXException
 
 
@@ -105,3 +108,155 @@ class TestConnection(IsolatedAsyncioTestCase):
 
         fake_transport.close.assert_called_once()
         callback.assert_not_called()
+
+    async def test_frame_received_routes_by_frame_type(self) -> None:
+        """Test frames are only delivered to handlers and callbacks subscribed to their type."""
+        handler = MagicMock()
+        all_frames_handler = MagicMock()
+        callback = AsyncMock()
+        self.connection.register_frame_handler(handler, [FrameGetStateConfirmation])
+        self.connection.register_frame_handler(all_frames_handler)
+        self.connection.register_frame_received_cb(callback, [FrameSessionFinishedNotification])
+
+        frame = FrameGetStateConfirmation()
+        self.connection.frame_received_cb(frame)
+        handler.assert_called_once_with(frame)
+        all_frames_handler.assert_called_once_with(frame)
+        self.assertFalse(self.connection.tasks)
+
+        session_finished = FrameSessionFinishedNotification(session_id=1)
+        self.connection.frame_received_cb(session_finished)
+        handler.assert_called_once()
+        self.assertEqual(len(self.connection.tasks), 1)
+        await asyncio.gather(*self.connection.tasks)
+        callback.assert_awaited_once_with(session_finished)
+
+        self.connection.unregister_frame_handler(handler)
+        self.connection.unregister_frame_received_cb(callback)
+        self.connection.frame_received_cb(session_finished)
+        self.assertFalse(self.connection.tasks)
+
+    def test_frame_handler_exception_does_not_stop_delivery(self) -> None:
+        """Test an exception in a frame handler is logged and other handlers are still called."""
+        failing_handler = MagicMock(side_effect=ValueError)
+        handler = MagicMock()
+        self.connection.register_frame_handler(failing_handler)
+        self.connection.register_frame_handler(handler)
+        frame = FrameGetStateConfirmation()
+        with self.assertLogs("pyvlx", level="ERROR"):
+            self.connection.frame_received_cb(frame)
+        handler.assert_called_once_with(frame)
+
+
+class TestSendQueue(IsolatedAsyncioTestCase):
+    """Test class for SendQueue."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.writelines = MagicMock()
+        self.send_queue = SendQueue(self.writelines)
+
+    async def test_coalesce_packets_of_one_loop_iteration(self) -> None:
+        """Test packets queued within the same loop iteration are written with one call."""
+        self.send_queue.put(b"a")
+        self.send_queue.put(b"b")
+        self.assertEqual(self.send_queue.depth, 2)
+        self.writelines.assert_not_called()
+        await self.send_queue.flush()
+        self.writelines.assert_called_once_with([b"a", b"b"])
+        self.send_queue.put(b"c")
+        await self.send_queue.flush()
+        self.assertEqual(self.writelines.call_count, 2)
+        self.assertEqual(self.send_queue.packets_written, 3)
+        self.assertEqual(self.send_queue.writes, 2)
+        self.assertEqual(self.send_queue.max_depth, 2)
+        self.assertEqual(self.send_queue.depth, 0)
+        self.assertGreaterEqual(self.send_queue.max_wait, self.send_queue.average_wait)
+
+    async def test_flow_control(self) -> None:
+        """Test packets are held back and flush() waits while the transport is paused."""
+        self.send_queue.pause_writing()
+        self.send_queue.put(b"a")
+        flush_task = asyncio.create_task(self.send_queue.flush())
+        await asyncio.sleep(0.01)
+        self.writelines.assert_not_called()
+        self.assertFalse(flush_task.done())
+        self.send_queue.resume_writing()
+        await asyncio.wait_for(flush_task, 1)
+        self.writelines.assert_called_once_with([b"a"])
+
+    async def test_close(self) -> None:
+        """Test closing writes or drops pending packets and releases flush() calls."""
+        self.send_queue.put(b"a")
+        self.send_queue.close()
+        self.writelines.assert_called_once_with([b"a"])
+        self.send_queue.pause_writing()
+        self.send_queue.put(b"b")
+        flush_task = asyncio.create_task(self.send_queue.flush())
+        await asyncio.sleep(0)
+        self.send_queue.close(write_pending=False)
+        await asyncio.wait_for(flush_task, 1)
+        self.assertEqual(self.writelines.call_count, 1)
+        self.assertEqual(self.send_queue.depth, 0)
+
+    async def test_connection_write(self) -> None:
+        """Test frames written to the connection are coalesced and flow control is forwarded."""
+        connection = Connection(config=Config(pyvlx=MagicMock(), host="192.168.1.10", password="velux123"))
+        connection.transport = MagicMock(spec=asyncio.Transport)
+        protocol = TCPTransport(MagicMock(), MagicMock(), send_queue=connection.send_queue)
+        protocol.pause_writing()
+        connection.write(FrameGetStateConfirmation())
+        connection.write(FrameSessionFinishedNotification(session_id=1))
+        await asyncio.sleep(0)
+        connection.transport.writelines.assert_not_called()
+        protocol.resume_writing()
+        await connection.flush()
+        connection.transport.writelines.assert_called_once()
+        self.assertEqual(len(connection.transport.writelines.call_args[0][0]), 2)
+
+
+class TestSlipTokenizer(unittest.TestCase):
+    """Test class for SlipTokenizer."""
+
+    def test_single_packet(self) -> None:
+        """Test tokenizing one complete packet."""
+        tokenizer = SlipTokenizer()
+        tokenizer.feed(b"\xc0abc\xc0")
+        self.assertTrue(tokenizer.has_tokens())
+        self.assertEqual(tokenizer.get_next_token(), b"abc")
+        self.assertFalse(tokenizer.has_tokens())
+        self.assertIsNone(tokenizer.get_next_token())
+
+    def test_multiple_packets_in_one_chunk(self) -> None:
+        """Test tokenizing a burst of packets received within one chunk."""
+        tokenizer = SlipTokenizer()
+        tokenizer.feed(b"\xc0abc\xc0\xc0def\xc0\xc0gh")
+        self.assertEqual(tokenizer.get_next_token(), b"abc")
+        self.assertEqual(tokenizer.get_next_token(), b"def")
+        self.assertFalse(tokenizer.has_tokens())
+        tokenizer.feed(b"i\xc0")
+        self.assertEqual(tokenizer.get_next_token(), b"ghi")
+        self.assertFalse(tokenizer.has_tokens())
+
+    def test_packet_split_over_chunks(self) -> None:
+        """Test tokenizing a packet received byte by byte."""
+        tokenizer = SlipTokenizer()
+        for byte in b"\xc0\xdb\xdcab\xdb\xdd\xc0":
+            self.assertFalse(tokenizer.has_tokens())
+            tokenizer.feed(bytes([byte]))
+        self.assertEqual(tokenizer.get_next_token(), b"\xc0ab\xdb")
+
+    def test_garbage_before_first_slip_end(self) -> None:
+        """Test data received before the first SLIP_END is skipped."""
+        tokenizer = SlipTokenizer()
+        tokenizer.feed(b"zz")
+        self.assertFalse(tokenizer.has_tokens())
+        tokenizer.feed(b"z\xc0abc\xc0")
+        self.assertEqual(tokenizer.get_next_token(), b"abc")
+        self.assertFalse(tokenizer.has_tokens())
+
+    def test_empty_chunk(self) -> None:
+        """Test feeding empty chunk."""
+        tokenizer = SlipTokenizer()
+        tokenizer.feed(b"")
+        self.assertFalse(tokenizer.has_tokens())
@@ -0,0 +1,54 @@
+"""Unit tests for product group activation frames."""
+import unittest
+
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import (
+    ActivateProductGroupConfirmationStatus,
+    FrameActivateProductGroupConfirmation,
+    FrameActivateProductGroupNotification, FrameActivateProductGroupRequest)
+from pyvlx.const import NodeParameter, Originator, Priority, Velocity
+from pyvlx.parameter import Position
+
+
+class TestFrameActivateProductGroup(unittest.TestCase):
+    """Test class for product group activation frames."""
+
+    EXAMPLE_REQUEST = b"\x00\x10\x04\x47\x12\x34\x01\x03\x02\x00\xc8\x00\x01\x00\x00\x00\x00\xbc"
+    EXAMPLE_CONFIRMATION = b"\x00\x06\x04\x48\x12\x34\x04\x68"
+
+    def test_request(self) -> None:
+        """Test FrameActivateProductGroupRequest."""
+        frame = FrameActivateProductGroupRequest(
+            group_id=2, parameter=Position(position_percent=100), velocity=Velocity.SILENT, session_id=0x1234
+        )
+        self.assertEqual(bytes(frame), self.EXAMPLE_REQUEST)
+        parsed = frame_from_raw(self.EXAMPLE_REQUEST)
+        assert isinstance(parsed, FrameActivateProductGroupRequest)
+        self.assertEqual(parsed.session_id, 0x1234)
+        self.assertEqual(parsed.originator, Originator.USER)
+        self.assertEqual(parsed.priority, Priority.USER_LEVEL_2)
+        self.assertEqual(parsed.group_id, 2)
+        self.assertEqual(parsed.node_parameter, NodeParameter.MP)
+        self.assertEqual(Position(parsed.parameter), Position(position_percent=100))
+        self.assertEqual(parsed.velocity, Velocity.SILENT)
+
+    def test_confirmation(self) -> None:
+        """Test FrameActivateProductGroupConfirmation."""
+        frame = FrameActivateProductGroupConfirmation(session_id=0x1234, status=ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE)
+        self.assertEqual(bytes(frame), self.EXAMPLE_CONFIRMATION)
+        parsed = frame_from_raw(self.EXAMPLE_CONFIRMATION)
+        assert isinstance(parsed, FrameActivateProductGroupConfirmation)
+        self.assertEqual(parsed.session_id, 0x1234)
+        self.assertEqual(parsed.status, ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE)
+        self.assertEqual(
+            str(parsed),
+            '<FrameActivateProductGroupConfirmation session_id="4660" status="ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE"/>',
+        )
+
+    def test_notification(self) -> None:
+        """Test FrameActivateProductGroupNotification keeps data following the session id."""
+        parsed = frame_from_raw(b"\x00\x06\x04\x49\x12\x34\x01\x6c")
+        assert isinstance(parsed, FrameActivateProductGroupNotification)
+        self.assertEqual(parsed.session_id, 0x1234)
+        self.assertEqual(parsed.data, b"\x01")
+        self.assertEqual(bytes(parsed), b"\x00\x06\x04\x49\x12\x34\x01\x6c")
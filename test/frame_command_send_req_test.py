@@ -38,6 +38,22 @@ class TestFrameCommandSendRequest(unittest.TestCase):
         self.assertEqual(frame.session_id, 1000)
         self.assertEqual(frame.originator, Originator.RAIN)
 
+    def test_frame_from_raw_node_ids(self) -> None:
+        """Test parse FrameCommandSendRequest with non consecutive node ids."""
+        frame = FrameCommandSendRequest(node_ids=[7, 2, 19], parameter=Position(position_percent=50), session_id=1)
+        parsed = frame_from_raw(bytes(frame))
+        assert isinstance(parsed, FrameCommandSendRequest)
+        self.assertEqual(parsed.node_ids, [7, 2, 19])
+
+    def test_frame_from_raw_functional_parameter(self) -> None:
+        """Test parse FrameCommandSendRequest with functional parameters."""
+        functional_parameter: FunctionalParams = {NodeParameter.FP2: Position(position_percent=30)}
+        frame = FrameCommandSendRequest(node_ids=[1], parameter=Position(position_percent=50), functional_parameter=functional_parameter, session_id=1)
+        parsed = frame_from_raw(bytes(frame))
+        assert isinstance(parsed, FrameCommandSendRequest)
+        self.assertEqual(parsed.fpi1, 0x40)
+        self.assertEqual(Position(parsed.functional_parameter[NodeParameter.FP2]).position_percent, 30)
+
     def test_str(self) -> None:
         """Test string representation of FrameCommandSendRequest."""
         functional_parameter: FunctionalParams = {NodeParameter.FP3: Position(position=12345)}
@@ -0,0 +1,161 @@
+"""Unit tests for frame_creation module."""
+import struct
+import unittest
+from enum import EnumMeta
+
+from pyvlx.api.frame_creation import (
+    FRAME_CLASSES, create_frame, frame_from_raw, register_frame_class,
+    unregister_frame_class)
+from pyvlx.api.frames import (
+    FrameBase, FrameGetStateRequest, FrameNewGroupConfirmation,
+    FrameNewGroupRequest, FrameNodeStatePositionChangedNotification)
+from pyvlx.api.frames.frame_layout import FrameLayout
+from pyvlx.const import Command, OperatingState
+from pyvlx.exception import PyVLXException
+from pyvlx.parameter import Position
+
+
+def _valid_payload(layout: FrameLayout) -> bytes:
+    """Return payload for layout with the first member of enums and non-zero bytes for the other fields."""
+    payload = b""
+    for field in layout.fields:
+        size = struct.calcsize(">" + field.fmt)
+        if field.name is None or field.strict and not isinstance(field.decode, EnumMeta):
+            payload += bytes(size)
+        elif isinstance(field.decode, EnumMeta):
+            payload += next(iter(field.decode)).value.to_bytes(size, "big")
+        else:
+            payload += bytes([1] * size)
+    return payload
+
+
+class FrameDeleteGroupRequest(FrameBase):
+    """Frame class only used for testing registration of frame classes."""
+
+    COMMAND = Command.GW_DELETE_GROUP_REQ
+    PAYLOAD_LEN = 2
+
+    def __init__(self) -> None:
+        """Init Frame."""
+        super().__init__()
+        self.payload = b""
+
+    def get_payload(self) -> bytes:
+        """Return Payload."""
+        return self.payload
+
+    def from_payload(self, payload: bytes) -> None:
+        """Init frame from binary data."""
+        self.payload = payload
+
+
+class TestFrameCreation(unittest.TestCase):
+    """Test class for frame_creation module."""
+
+    def test_frame_classes_commands_unique(self) -> None:
+        """Test that every command is handled by one frame class only."""
+        commands = [frame_class.COMMAND for frame_class in FRAME_CLASSES]
+        self.assertEqual(len(commands), len(set(commands)))
+
+    def test_create_frame(self) -> None:
+        """Test creating frames from commands."""
+        for frame_class in FRAME_CLASSES:
+            frame = create_frame(frame_class.COMMAND)
+            self.assertIsInstance(frame, frame_class)
+            assert frame is not None
+            self.assertEqual(frame.command, frame_class.COMMAND)
+
+    def test_create_frame_not_implemented(self) -> None:
+        """Test creating frame for command without frame class."""
+        self.assertIsNone(create_frame(Command.GW_DELETE_GROUP_REQ))
+
+    def test_frame_from_raw_not_implemented(self) -> None:
+        """Test frame_from_raw with known and unknown commands without frame class."""
+        self.assertIsNone(frame_from_raw(b"\x00\x05\x02\x25\x00\x00\x22"))
+        self.assertIsNone(frame_from_raw(b"\x00\x04\xff\xff\x02\x06"))
+
+    def test_register_frame_class(self) -> None:
+        """Test registering and unregistering frame classes at runtime."""
+        register_frame_class(FrameDeleteGroupRequest)
+        try:
+            frame = frame_from_raw(b"\x00\x05\x02\x25\x01\x02\x21")
+            self.assertIsInstance(frame, FrameDeleteGroupRequest)
+            assert isinstance(frame, FrameDeleteGroupRequest)
+            self.assertEqual(frame.payload, b"\x01\x02")
+        finally:
+            unregister_frame_class(FrameDeleteGroupRequest)
+        self.assertIsNone(create_frame(Command.GW_DELETE_GROUP_REQ))
+
+    def test_register_frame_class_replaces_existing(self) -> None:
+        """Test registering a frame class replaces the former frame class of the command."""
+
+        class CustomFrameGetStateRequest(FrameGetStateRequest):
+            """Derived frame class for testing."""
+
+        register_frame_class(CustomFrameGetStateRequest)
+        try:
+            self.assertIsInstance(create_frame(Command.GW_GET_STATE_REQ), CustomFrameGetStateRequest)
+        finally:
+            register_frame_class(FrameGetStateRequest)
+        self.assertIs(type(create_frame(Command.GW_GET_STATE_REQ)), FrameGetStateRequest)
+
+    def test_register_frame_class_without_command(self) -> None:
+        """Test registering frame class without COMMAND."""
+        with self.assertRaises(PyVLXException):
+            register_frame_class(FrameBase)
+
+    def test_frame_from_raw_lazy(self) -> None:
+        """Test frames with LAYOUT decode their fields on first access only."""
+        frame = FrameNodeStatePositionChangedNotification()
+        frame.node_id = 5
+        frame.state = OperatingState.EXECUTING
+        frame.current_position = Position(position_percent=20)
+        parsed = frame_from_raw(bytes(frame))
+        assert isinstance(parsed, FrameNodeStatePositionChangedNotification)
+        self.assertNotIn("current_position", vars(parsed))
+        self.assertEqual(parsed.node_id, 5)
+        self.assertEqual(parsed.current_position, Position(position_percent=20))
+        self.assertIs(vars(parsed)["current_position"], parsed.current_position)
+        self.assertNotIn("target", vars(parsed))
+        self.assertEqual(parsed.state, OperatingState.EXECUTING)
+        self.assertEqual(bytes(parsed), bytes(frame))
+        with self.assertRaises(AttributeError):
+            getattr(parsed, "unknown_field")
+
+    def test_frame_from_raw_layout_roundtrip(self) -> None:
+        """Test every frame with LAYOUT keeps all its attributes when created out of raw bytes."""
+        for frame_class in FRAME_CLASSES:
+            if frame_class.LAYOUT is None:
+                continue
+            with self.subTest(frame_class=frame_class.__name__):
+                payload = _valid_payload(frame_class.LAYOUT)
+                frame = frame_class()
+                frame.from_payload(payload)
+                raw = FrameBase.build_frame(frame_class.COMMAND, payload)
+                parsed = frame_from_raw(raw)
+                assert parsed is not None
+                self.assertIs(type(parsed), frame_class)
+                for name, value in vars(frame).items():
+                    if type(value).__eq__ is object.__eq__:
+                        # e.g. AliasArray, compared by its string representation
+                        self.assertEqual(str(getattr(parsed, name)), str(value), name)
+                    else:
+                        self.assertEqual(getattr(parsed, name), value, name)
+                self.assertEqual(bytes(parsed), bytes(frame))
+                self.assertEqual(str(parsed), str(frame))
+
+    def test_frame_from_raw_lazy_invalid_payload(self) -> None:
+        """Test invalid values of lazily decoded frames are rejected by frame_from_raw."""
+        self.assertTrue(FrameNewGroupConfirmation.decodes_lazily())
+        with self.assertRaises(ValueError):
+            frame_from_raw(FrameBase.build_frame(Command.GW_NEW_GROUP_CFM, b"\x07\x01"))
+
+    def test_frame_with_state_besides_layout_not_lazy(self) -> None:
+        """Test frames setting attributes besides the fields of their LAYOUT are decoded eagerly."""
+        self.assertFalse(FrameNewGroupRequest.decodes_lazily())
+
+    def test_frame_from_raw_not_wanted(self) -> None:
+        """Test frames of unwanted classes are dropped before decoding."""
+        raw = bytes(FrameGetStateRequest())
+        self.assertIsNone(frame_from_raw(raw, wanted=lambda frame_class: frame_class is not FrameGetStateRequest))
+        self.assertIsInstance(frame_from_raw(raw, wanted=lambda frame_class: True), FrameGetStateRequest)
@@ -24,6 +24,15 @@ class TestFrameGetLimitationStatus(unittest.TestCase):
         frame = frame_from_raw(b'\x00\x1c\x03\x12\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
                                b'\x0c')
         self.assertIsInstance(frame, FrameGetLimitationStatus)
+        assert isinstance(frame, FrameGetLimitationStatus)
+        self.assertEqual(frame.session_id, 1)
+        self.assertEqual(frame.node_ids, [1])
+        self.assertEqual(frame.limitation_type, LimitationType.MIN_LIMITATION)
+
+        frame = frame_from_raw(bytes(FrameGetLimitationStatus(node_ids=[1, 2], session_id=2, limitation_type=LimitationType.MAX_LIMITATION)))
+        assert isinstance(frame, FrameGetLimitationStatus)
+        self.assertEqual(frame.node_ids, [1, 2])
+        self.assertEqual(frame.limitation_type, LimitationType.MAX_LIMITATION)
 
     def test_str(self) -> None:
         """Test string representation of FrameGetLimitationStatus."""
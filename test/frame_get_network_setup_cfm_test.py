@@ -16,7 +16,14 @@ class TestFrameGetNetworkSetupConfirmation(unittest.TestCase):
             ipaddress=b'\xc0\xa8\r\xe3', netmask=b'\xff\xff\xff\x00',
             gateway=b'\xc0\xa8\r\x01', dhcp=DHCPParameter.ENABLE)
         self.assertEqual(bytes(frame),
-                         b"\x00\x10\x00\xe1\xc0\xa8\r\xe3\xff\xff\xff\x00\xc0\xa8\r\x01\x00\xec")
+                         b"\x00\x10\x00\xe1\xc0\xa8\r\xe3\xff\xff\xff\x00\xc0\xa8\r\x01\x01\xed")
+
+    def test_bytes_dhcp_disabled(self) -> None:
+        """Test FrameGetNetworkSetupConfirmation with disabled DHCP has the full payload length."""
+        frame = FrameGetNetworkSetupConfirmation(
+            ipaddress=b'\xc0\xa8\r\xe3', netmask=b'\xff\xff\xff\x00',
+            gateway=b'\xc0\xa8\r\x01', dhcp=DHCPParameter.DISABLE)
+        self.assertEqual(bytes(frame), self.TESTFRAME)
 
     def test_frame_from_raw(self) -> None:
         """Test parse FrameGetNetworkSetupConfirmation from raw."""
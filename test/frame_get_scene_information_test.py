@@ -0,0 +1,77 @@
+"""Unit tests for get scene information frames."""
+import unittest
+
+from pyvlx import PyVLXException
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import (
+    FrameGetSceneInformationConfirmation, FrameGetSceneInformationNotification,
+    FrameGetSceneInformationRequest, FrameSceneInformationChangedNotification,
+    SceneInformationStatus)
+from pyvlx.const import ChangeType, NodeParameter
+from pyvlx.parameter import Position
+
+
+class TestFrameGetSceneInformation(unittest.TestCase):
+    """Test class for get scene information frames."""
+
+    EXAMPLE_REQUEST = b"\x00\x04\x04\x0f\x03\x0c"
+    EXAMPLE_CONFIRMATION = b"\x00\x05\x04\x10\x01\x03\x13"
+    EXAMPLE_NOTIFICATION = (
+        b"\x00\x4e\x04\x11\x03All windows closed"
+        + bytes(46)
+        + b"\x02\x01\x00\xc8\x00\x04\x01\x00\x00\x02\xb8"
+    )
+    EXAMPLE_CHANGED_NOTIFICATION = b"\x00\x05\x04\x19\x00\x03\x1b"
+
+    def test_request(self) -> None:
+        """Test FrameGetSceneInformationRequest."""
+        self.assertEqual(bytes(FrameGetSceneInformationRequest(scene_id=3)), self.EXAMPLE_REQUEST)
+        frame = frame_from_raw(self.EXAMPLE_REQUEST)
+        assert isinstance(frame, FrameGetSceneInformationRequest)
+        self.assertEqual(frame.scene_id, 3)
+        self.assertEqual(str(frame), '<FrameGetSceneInformationRequest scene_id="3"/>')
+
+    def test_confirmation(self) -> None:
+        """Test FrameGetSceneInformationConfirmation."""
+        frame = FrameGetSceneInformationConfirmation(status=SceneInformationStatus.ERROR_INVALID_SCENE_ID, scene_id=3)
+        self.assertEqual(bytes(frame), self.EXAMPLE_CONFIRMATION)
+        parsed = frame_from_raw(self.EXAMPLE_CONFIRMATION)
+        assert isinstance(parsed, FrameGetSceneInformationConfirmation)
+        self.assertEqual(parsed.status, SceneInformationStatus.ERROR_INVALID_SCENE_ID)
+        self.assertEqual(parsed.scene_id, 3)
+
+    def test_notification(self) -> None:
+        """Test FrameGetSceneInformationNotification."""
+        frame = FrameGetSceneInformationNotification(
+            scene_id=3,
+            name="All windows closed",
+            nodes=[(1, NodeParameter.MP, Position(position_percent=100)), (4, NodeParameter.FP1, Position(position_percent=0))],
+            remaining_nodes=2,
+        )
+        self.assertEqual(bytes(frame), self.EXAMPLE_NOTIFICATION)
+        parsed = frame_from_raw(self.EXAMPLE_NOTIFICATION)
+        assert isinstance(parsed, FrameGetSceneInformationNotification)
+        self.assertEqual(parsed.scene_id, 3)
+        self.assertEqual(parsed.name, "All windows closed")
+        self.assertEqual([(node_id, node_parameter) for node_id, node_parameter, _ in parsed.nodes], [(1, NodeParameter.MP), (4, NodeParameter.FP1)])
+        self.assertEqual(Position(parsed.nodes[0][2]), Position(position_percent=100))
+        self.assertEqual(parsed.remaining_nodes, 2)
+        self.assertEqual(
+            str(parsed),
+            '<FrameGetSceneInformationNotification scene_id="3" name="All windows closed" nodes="1/MP: 100 %, 4/FP1: 0 %" remaining_nodes="2"/>',
+        )
+
+    def test_notification_wrong_length(self) -> None:
+        """Test FrameGetSceneInformationNotification with a number of nodes not matching the payload."""
+        frame = FrameGetSceneInformationNotification()
+        with self.assertRaises(PyVLXException):
+            frame.from_payload(b"\x03" + bytes(64) + b"\x02\x01\x00\xc8\x00\x00")
+
+    def test_changed_notification(self) -> None:
+        """Test FrameSceneInformationChangedNotification."""
+        frame = FrameSceneInformationChangedNotification(change_type=ChangeType.DELETED, scene_id=3)
+        self.assertEqual(bytes(frame), self.EXAMPLE_CHANGED_NOTIFICATION)
+        parsed = frame_from_raw(self.EXAMPLE_CHANGED_NOTIFICATION)
+        assert isinstance(parsed, FrameSceneInformationChangedNotification)
+        self.assertEqual(parsed.change_type, ChangeType.DELETED)
+        self.assertEqual(parsed.scene_id, 3)
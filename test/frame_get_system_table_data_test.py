@@ -0,0 +1,60 @@
+"""Unit tests for get system table data frames."""
+import unittest
+
+from pyvlx import PyVLXException
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import (
+    FrameGetSystemTableDataConfirmation, FrameGetSystemTableDataNotification,
+    FrameGetSystemTableDataRequest, SystemTableEntry)
+from pyvlx.const import NodeTypeWithSubtype
+
+
+class TestFrameGetSystemTableData(unittest.TestCase):
+    """Test class for get system table data frames."""
+
+    EXAMPLE_NOTIFICATION = (
+        b"\x00\x10\x01\x02\x01"
+        b"\x05\x12\x34\x56\x00\x80\x4d\x01\x00\x00\x07"
+        b"\x02\xae"
+    )
+
+    def test_request(self) -> None:
+        """Test FrameGetSystemTableDataRequest."""
+        self.assertEqual(bytes(FrameGetSystemTableDataRequest()), b"\x00\x03\x01\x00\x02")
+        self.assertTrue(isinstance(frame_from_raw(b"\x00\x03\x01\x00\x02"), FrameGetSystemTableDataRequest))
+        self.assertTrue(isinstance(frame_from_raw(bytes(FrameGetSystemTableDataConfirmation())), FrameGetSystemTableDataConfirmation))
+
+    def test_notification(self) -> None:
+        """Test FrameGetSystemTableDataNotification."""
+        entry = SystemTableEntry(
+            node_id=5, address=0x123456, node_type=NodeTypeWithSubtype.ROLLER_SHUTTER, flags=0x4D, manufacturer_id=1, backbone_reference_number=7
+        )
+        frame = FrameGetSystemTableDataNotification(entries=[entry], remaining_entries=2)
+        self.assertEqual(bytes(frame), self.EXAMPLE_NOTIFICATION)
+        parsed = frame_from_raw(self.EXAMPLE_NOTIFICATION)
+        assert isinstance(parsed, FrameGetSystemTableDataNotification)
+        self.assertEqual(parsed.entries, [entry])
+        self.assertEqual(parsed.remaining_entries, 2)
+
+    def test_entry_flags(self) -> None:
+        """Test decoding of power mode and other flags of a system table entry."""
+        entry = SystemTableEntry(flags=0x4D)
+        self.assertEqual(entry.power_mode, 1)
+        self.assertTrue(entry.io_membership)
+        self.assertTrue(entry.rf_support)
+        self.assertEqual(entry.turnaround_time, 1)
+
+    def test_wrong_length(self) -> None:
+        """Test notification with wrong number of entries is rejected."""
+        frame = FrameGetSystemTableDataNotification()
+        with self.assertRaises(PyVLXException):
+            frame.from_payload(b"\x02" + bytes(12))
+
+    def test_str(self) -> None:
+        """Test string representation of FrameGetSystemTableDataNotification."""
+        frame = frame_from_raw(self.EXAMPLE_NOTIFICATION)
+        self.assertEqual(
+            str(frame),
+            '<FrameGetSystemTableDataNotification entries="[<SystemTableEntry node_id="5" address="123456" '
+            'node_type="NodeTypeWithSubtype.ROLLER_SHUTTER" power_mode="1" manufacturer_id="1"/>]" remaining_entries="2"/>',
+        )
@@ -0,0 +1,88 @@
+"""Unit tests for group information frames."""
+import unittest
+
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import (
+    AllGroupsInformationStatus, FrameGetAllGroupsInformationConfirmation,
+    FrameGetAllGroupsInformationNotification,
+    FrameGetAllGroupsInformationRequest, FrameGetGroupInformationNotification,
+    FrameGetGroupInformationRequest, FrameGroupDeletedNotification,
+    FrameGroupInformationChangedNotification, FrameNewGroupConfirmation,
+    FrameNewGroupRequest)
+from pyvlx.const import ChangeType, GroupType
+
+
+class TestFrameGroupInformation(unittest.TestCase):
+    """Test class for group information frames."""
+
+    def test_get_group_information_request(self) -> None:
+        """Test FrameGetGroupInformationRequest."""
+        self.assertEqual(bytes(FrameGetGroupInformationRequest(group_id=3)), b"\x00\x04\x02\x20\x03\x25")
+        frame = frame_from_raw(b"\x00\x04\x02\x20\x03\x25")
+        assert isinstance(frame, FrameGetGroupInformationRequest)
+        self.assertEqual(frame.group_id, 3)
+
+    def test_get_all_groups_information_request(self) -> None:
+        """Test FrameGetAllGroupsInformationRequest with and without filter."""
+        self.assertEqual(bytes(FrameGetAllGroupsInformationRequest()), b"\x00\x05\x02\x29\x00\x00\x2e")
+        self.assertEqual(bytes(FrameGetAllGroupsInformationRequest(group_type=GroupType.ROOM)), b"\x00\x05\x02\x29\x01\x01\x2e")
+        frame = frame_from_raw(b"\x00\x05\x02\x29\x01\x01\x2e")
+        assert isinstance(frame, FrameGetAllGroupsInformationRequest)
+        self.assertEqual(frame.group_type, GroupType.ROOM)
+
+    def test_get_all_groups_information_confirmation(self) -> None:
+        """Test FrameGetAllGroupsInformationConfirmation."""
+        frame = frame_from_raw(bytes(FrameGetAllGroupsInformationConfirmation(status=AllGroupsInformationStatus.ERROR_NO_GROUPS)))
+        assert isinstance(frame, FrameGetAllGroupsInformationConfirmation)
+        self.assertEqual(frame.status, AllGroupsInformationStatus.ERROR_NO_GROUPS)
+
+    def test_group_information_notification(self) -> None:
+        """Test node membership bitmap of group information notifications."""
+        for frame_class in (FrameGetGroupInformationNotification, FrameGetAllGroupsInformationNotification):
+            frame = frame_class(group_id=7, name="Floor", group_type=GroupType.ROOM, node_ids=[0, 9, 199])
+            raw = bytes(frame)
+            self.assertEqual(len(raw), 5 + 99)
+            # Number of nodes followed by the bitmap with bit 0 of the first byte for node 0
+            self.assertEqual(raw[75:80], b"\x03\x01\x02\x00\x00")
+            parsed = frame_from_raw(raw)
+            assert isinstance(parsed, frame_class)
+            self.assertEqual(parsed.group_id, 7)
+            self.assertEqual(parsed.name, "Floor")
+            self.assertEqual(parsed.group_type, GroupType.ROOM)
+            self.assertEqual(parsed.node_ids, [0, 9, 199])
+
+    def test_new_group(self) -> None:
+        """Test FrameNewGroupRequest and FrameNewGroupConfirmation."""
+        raw = bytes(FrameNewGroupRequest(name="Floor", group_type=GroupType.ROOM, node_ids=[1, 2]))
+        self.assertEqual(len(raw), 5 + 98)
+        parsed = frame_from_raw(raw)
+        assert isinstance(parsed, FrameNewGroupRequest)
+        self.assertEqual(parsed.node_ids, [1, 2])
+        self.assertEqual(str(parsed), '<FrameNewGroupRequest name="Floor" group_type="GroupType.ROOM" node_ids="[1, 2]"/>')
+        confirmation = frame_from_raw(bytes(FrameNewGroupConfirmation(group_id=12)))
+        assert isinstance(confirmation, FrameNewGroupConfirmation)
+        self.assertEqual(confirmation.group_id, 12)
+
+    def test_group_information_changed(self) -> None:
+        """Test FrameGroupInformationChangedNotification for modified and deleted groups."""
+        raw = bytes(FrameGroupInformationChangedNotification(group_id=7, name="Floor", node_ids=[4]))
+        self.assertEqual(len(raw), 5 + 100)
+        parsed = frame_from_raw(raw)
+        assert isinstance(parsed, FrameGroupInformationChangedNotification)
+        self.assertEqual(parsed.change_type, ChangeType.MODIFIED)
+        self.assertEqual(parsed.node_ids, [4])
+
+        raw = bytes(FrameGroupInformationChangedNotification(change_type=ChangeType.DELETED, group_id=7))
+        self.assertEqual(len(raw), 5 + 2)
+        parsed = frame_from_raw(raw)
+        assert isinstance(parsed, FrameGroupInformationChangedNotification)
+        self.assertEqual(parsed.change_type, ChangeType.DELETED)
+        self.assertEqual(parsed.group_id, 7)
+        self.assertEqual(str(parsed), '<FrameGroupInformationChangedNotification change_type="ChangeType.DELETED" group_id="7"/>')
+
+    def test_group_deleted(self) -> None:
+        """Test FrameGroupDeletedNotification."""
+        self.assertEqual(bytes(FrameGroupDeletedNotification(group_id=4)), b"\x00\x04\x02\x2d\x04\x2f")
+        frame = frame_from_raw(b"\x00\x04\x02\x2d\x04\x2f")
+        assert isinstance(frame, FrameGroupDeletedNotification)
+        self.assertEqual(frame.group_id, 4)
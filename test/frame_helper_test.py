@@ -1,7 +1,8 @@
 """Unit tests frame_creation module."""
 import unittest
 
-from pyvlx.api.frames import calc_crc, extract_from_frame
+from pyvlx.api.frames import (
+    calc_crc, extract_command_value_from_frame, extract_from_frame)
 from pyvlx.exception import PyVLXException
 
 
@@ -28,3 +29,17 @@ class TestFrameHelper(unittest.TestCase):
             extract_from_frame(bytes(b"\x00\x04\x00\x00\x02\x07"))  # invalid crc
         with self.assertRaises(PyVLXException):
             extract_from_frame(bytes(b"\x00\x04\xFF\xFF\x02\x06"))  # invalid crc
+
+    def test_extract_command_value_from_frame(self) -> None:
+        """Test extract_command_value_from_frame method."""
+        self.assertEqual(
+            extract_command_value_from_frame(bytes(b"\x00\x04\x00\x00\x02\x06")),
+            (0x0000, b"\x02"),
+        )
+        # unknown commands are not rejected
+        self.assertEqual(
+            extract_command_value_from_frame(bytes(b"\x00\x04\xFF\xFF\x02\x06")),
+            (0xFFFF, b"\x02"),
+        )
+        with self.assertRaises(PyVLXException):
+            extract_command_value_from_frame(bytes(b"\x00\x04\x00\x00\x02\x07"))  # invalid crc
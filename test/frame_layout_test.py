@@ -0,0 +1,108 @@
+"""Unit tests for declarative frame layouts."""
+import unittest
+from typing import List
+
+from pyvlx import PyVLXException
+from pyvlx.api.frames.frame import FrameBase
+from pyvlx.api.frames.frame_layout import (
+    FrameLayout, enum8, node_array, padding, param, string, uint16, uint32)
+from pyvlx.const import Command, OperatingState
+from pyvlx.parameter import Parameter, Position
+
+
+class LayoutFrame(FrameBase):
+    """Frame declaring its payload within LAYOUT."""
+
+    COMMAND = Command.GW_GET_STATE_REQ
+    PAYLOAD_LEN = 20
+    LAYOUT = FrameLayout(
+        uint16("session_id"),
+        enum8("state", OperatingState),
+        padding(1),
+        param("position"),
+        string("name", 4),
+        uint32("timestamp"),
+        node_array("node_ids", 5, "too_many_node_ids"),
+    )
+
+    def __init__(self) -> None:
+        """Init Frame."""
+        super().__init__()
+        self.session_id = 0
+        self.state = OperatingState.UNKNOWN
+        self.position = Parameter()
+        self.name = ""
+        self.timestamp = 0
+        self.node_ids: List[int] = []
+
+
+class TestFrameLayout(unittest.TestCase):
+    """Test class for FrameLayout."""
+
+    def test_compiled_struct(self) -> None:
+        """Test fields are compiled into one big endian struct."""
+        self.assertEqual(LayoutFrame.LAYOUT.struct.format, ">HB1x2s4sI6s")  # type: ignore[union-attr]
+        self.assertEqual(LayoutFrame.LAYOUT.size, 20)  # type: ignore[union-attr]
+
+    def test_pack(self) -> None:
+        """Test payload is packed from the attributes of the frame."""
+        frame = LayoutFrame()
+        frame.session_id = 0x1234
+        frame.state = OperatingState.EXECUTING
+        frame.position = Position(position_percent=50)
+        frame.name = "ab"
+        frame.timestamp = 0x01020304
+        frame.node_ids = [3, 7]
+        self.assertEqual(
+            frame.get_payload(),
+            b"\x12\x34\x04\x00\x64\x00ab\x00\x00\x01\x02\x03\x04\x02\x03\x07\x00\x00\x00",
+        )
+
+    def test_unpack_memoryview(self) -> None:
+        """Test attributes are decoded from a memoryview at an offset."""
+        frame = LayoutFrame()
+        raw = b"\xff\xff\x12\x34\x04\x00\x64\x00ab\x00\x00\x01\x02\x03\x04\x02\x03\x07\x00\x00\x00"
+        LayoutFrame.LAYOUT.unpack_into(frame, memoryview(raw), offset=2)  # type: ignore[union-attr]
+        self.assertEqual(frame.session_id, 0x1234)
+        self.assertEqual(frame.state, OperatingState.EXECUTING)
+        self.assertEqual(frame.position, Position(position_percent=50))
+        self.assertEqual(frame.name, "ab")
+        self.assertEqual(frame.timestamp, 0x01020304)
+        self.assertEqual(frame.node_ids, [3, 7])
+
+    def test_round_trip(self) -> None:
+        """Test bytes() and from_payload() are inverse."""
+        frame = LayoutFrame()
+        frame.node_ids = [1, 2, 3, 4, 5]
+        frame.name = "xyz"
+        parsed = LayoutFrame()
+        parsed.from_payload(bytes(frame)[4:-1])
+        self.assertEqual(parsed.node_ids, [1, 2, 3, 4, 5])
+        self.assertEqual(parsed.name, "xyz")
+
+    def test_node_array_overflow(self) -> None:
+        """Test node arrays exceeding their size raise the declared exception."""
+        frame = LayoutFrame()
+        frame.node_ids = [1, 2, 3, 4, 5, 6]
+        with self.assertRaises(PyVLXException) as ctx:
+            frame.get_payload()
+        self.assertEqual(ctx.exception.description, "too_many_node_ids")
+        with self.assertRaises(PyVLXException):
+            frame.from_payload(bytes(14) + b"\x06" + bytes(5))
+
+    def test_size_mismatch(self) -> None:
+        """Test layouts not matching PAYLOAD_LEN are rejected when the frame class is created."""
+        with self.assertRaises(PyVLXException) as ctx:
+
+            class BrokenFrame(FrameBase):  # pylint: disable=unused-variable
+                """Frame with wrong PAYLOAD_LEN."""
+
+                COMMAND = Command.GW_GET_STATE_REQ
+                PAYLOAD_LEN = 3
+                LAYOUT = FrameLayout(uint16("session_id"))
+
+        self.assertEqual(ctx.exception.description, "frame_layout_size_mismatch")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Unit tests for frame router module."""
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from pyvlx.api.frames import (
+    FrameBase, FrameGetStateConfirmation, FrameSessionFinishedNotification)
+from pyvlx.frame_router import FrameRouter
+
+
+class _DerivedGetStateConfirmation(FrameGetStateConfirmation):
+    """Test helper for frames derived from other frame classes."""
+
+
+class TestFrameRouter(unittest.TestCase):
+    """Test class for FrameRouter."""
+
+    def test_no_subscribers(self) -> None:
+        """Test frame types without subscribers."""
+        router = FrameRouter()
+        self.assertEqual(router.subscribers(FrameGetStateConfirmation), ((), ()))
+
+    def test_subscribe_frame_types(self) -> None:
+        """Test subscribers only receive frames of the subscribed types."""
+        router = FrameRouter()
+        handler = MagicMock()
+        callback = AsyncMock()
+        router.add_handler(handler, [FrameGetStateConfirmation])
+        router.add_callback(callback, [FrameSessionFinishedNotification])
+        self.assertEqual(router.subscribers(FrameGetStateConfirmation), ((handler,), ()))
+        self.assertEqual(router.subscribers(FrameSessionFinishedNotification), ((), (callback,)))
+
+    def test_subscribe_all_frames(self) -> None:
+        """Test subscribers to all frames come first and are not duplicated."""
+        router = FrameRouter()
+        handler = MagicMock()
+        all_frames_handler = MagicMock()
+        router.add_handler(handler, [FrameGetStateConfirmation])
+        router.add_handler(all_frames_handler)
+        router.add_handler(handler, [FrameBase])
+        self.assertEqual(router.subscribers(FrameGetStateConfirmation), ((all_frames_handler, handler), ()))
+        self.assertEqual(router.subscribers(FrameSessionFinishedNotification), ((all_frames_handler, handler), ()))
+
+    def test_derived_frame_types(self) -> None:
+        """Test subscribers receive frames of derived frame classes."""
+        router = FrameRouter()
+        handler = MagicMock()
+        router.add_handler(handler, [FrameGetStateConfirmation])
+        self.assertEqual(router.subscribers(_DerivedGetStateConfirmation), ((handler,), ()))
+
+    def test_remove(self) -> None:
+        """Test removing subscribers invalidates cached routes."""
+        router = FrameRouter()
+        handler = MagicMock()
+        callback = AsyncMock()
+        router.add_handler(handler, [FrameGetStateConfirmation, FrameSessionFinishedNotification])
+        router.add_callback(callback)
+        self.assertEqual(router.subscribers(FrameGetStateConfirmation), ((handler,), (callback,)))
+        router.remove_handler(handler)
+        router.remove_callback(callback)
+        self.assertEqual(router.subscribers(FrameGetStateConfirmation), ((), ()))
+        self.assertEqual(router.subscribers(FrameSessionFinishedNotification), ((), ()))
+
+    def test_remove_not_subscribed(self) -> None:
+        """Test removing subscribers which are not subscribed raises ValueError."""
+        router = FrameRouter()
+        with self.assertRaises(ValueError):
+            router.remove_handler(MagicMock())
+        with self.assertRaises(ValueError):
+            router.remove_callback(AsyncMock())
+
+    def test_wants(self) -> None:
+        """Test frames are wanted by subscribers without accepts or whose accepts agrees."""
+        router = FrameRouter()
+        self.assertFalse(router.wants(FrameGetStateConfirmation))
+        accepted = {FrameSessionFinishedNotification}
+        handler = MagicMock()
+        router.add_handler(handler, accepts=lambda frame_type: frame_type in accepted)
+        self.assertFalse(router.wants(FrameGetStateConfirmation))
+        self.assertTrue(router.wants(FrameSessionFinishedNotification))
+        accepted.clear()
+        self.assertFalse(router.wants(FrameSessionFinishedNotification))
+        router.add_callback(AsyncMock(), [FrameGetStateConfirmation])
+        self.assertTrue(router.wants(FrameGetStateConfirmation))
+        self.assertTrue(router.wants(_DerivedGetStateConfirmation))
+        router.remove_handler(handler)
+        router.add_handler(handler)
+        self.assertTrue(router.wants(FrameSessionFinishedNotification))
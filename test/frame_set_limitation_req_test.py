@@ -31,6 +31,23 @@ class TestFrameSetLimitation(unittest.TestCase):
         frame = frame_from_raw(b'\x00\x22\x03\x10\x00\x02\x01\x03\x02\x01\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
                                b'\x00\x00\x00\x00\x00\xD4\x00\xD4\x00\x00\x30')
         self.assertTrue(isinstance(frame, FrameSetLimitationRequest))
+        assert isinstance(frame, FrameSetLimitationRequest)
+        self.assertEqual(frame.session_id, 2)
+        self.assertEqual(frame.node_ids, [1, 2])
+        self.assertEqual(frame.limitation_value_min, IgnorePosition())
+        self.assertIsNone(frame.limitation_time)
+
+    def test_frame_from_raw_roundtrip(self) -> None:
+        """Test parse FrameSetLimitationRequest from its own bytes."""
+        frame = frame_from_raw(bytes(FrameSetLimitationRequest(
+            node_ids=[3, 4], session_id=1000, limitation_value_min=Position(position_percent=30),
+            limitation_value_max=Position(position_percent=70), limitation_time=LimitationTime.UNLIMITED)))
+        assert isinstance(frame, FrameSetLimitationRequest)
+        self.assertEqual(frame.session_id, 1000)
+        self.assertEqual(frame.node_ids, [3, 4])
+        self.assertEqual(frame.limitation_value_min, Position(position_percent=30))
+        self.assertEqual(frame.limitation_value_max, Position(position_percent=70))
+        self.assertEqual(frame.limitation_time, LimitationTime.UNLIMITED)
 
     def test_str(self) -> None:
         """Test string representation of FrameSetLimitationRequest."""
@@ -0,0 +1,34 @@
+"""Unit tests for FrameSystemTableUpdateNotification."""
+import unittest
+
+from pyvlx.api.frame_creation import frame_from_raw
+from pyvlx.api.frames import FrameSystemTableUpdateNotification
+
+
+class TestFrameSystemTableUpdateNotification(unittest.TestCase):
+    """Test class for FrameSystemTableUpdateNotification."""
+
+    EXAMPLE_FRAME = (
+        b"\x00\x37\x01\x12\x82" + bytes(24) + b"\x80" + b"\x00\x01" + bytes(24) + b"\x27"
+    )
+
+    def test_bytes(self) -> None:
+        """Test FrameSystemTableUpdateNotification."""
+        frame = FrameSystemTableUpdateNotification(added_node_ids=[1, 7, 207], removed_node_ids=[8])
+        self.assertEqual(bytes(frame), self.EXAMPLE_FRAME)
+
+    def test_frame_from_raw(self) -> None:
+        """Test parse FrameSystemTableUpdateNotification from raw."""
+        frame = frame_from_raw(self.EXAMPLE_FRAME)
+        self.assertTrue(isinstance(frame, FrameSystemTableUpdateNotification))
+        assert isinstance(frame, FrameSystemTableUpdateNotification)
+        self.assertEqual(frame.added_node_ids, [1, 7, 207])
+        self.assertEqual(frame.removed_node_ids, [8])
+
+    def test_str(self) -> None:
+        """Test string representation of FrameSystemTableUpdateNotification."""
+        frame = FrameSystemTableUpdateNotification(added_node_ids=[1, 7], removed_node_ids=[8])
+        self.assertEqual(
+            str(frame),
+            '<FrameSystemTableUpdateNotification added_node_ids="[1, 7]" removed_node_ids="[8]"/>',
+        )
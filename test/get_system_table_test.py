@@ -0,0 +1,71 @@
+"""Unit tests for retrieving the system table and skipping unchanged node reloads."""
+from unittest import IsolatedAsyncioTestCase
+
+from pyvlx import PyVLX
+from pyvlx.api import GetSystemTable
+from pyvlx.api.frames import SystemTableEntry
+from pyvlx.api.session_id import set_session_id
+from pyvlx.const import NodeTypeWithSubtype
+from pyvlx.nodes import Nodes
+from pyvlx.simulator import KLF200Simulator, SimulatedNode
+
+
+class TestGetSystemTable(IsolatedAsyncioTestCase):
+    """Test class for GetSystemTable and Nodes.load(only_if_changed=True)."""
+
+    async def asyncSetUp(self) -> None:
+        """Connect PyVLX to simulator."""
+        self.addCleanup(set_session_id, 0)
+        self.simulator = KLF200Simulator(node_count=25, scene_count=0, travel_time=0)
+        await self.simulator.start()
+        self.addAsyncCleanup(self.simulator.stop)
+        self.pyvlx = PyVLX(host="127.0.0.1", password="velux123", port=self.simulator.port)
+        await self.pyvlx.connect()
+        self.addAsyncCleanup(self.pyvlx.disconnect)
+        await self.pyvlx.heartbeat.stop()
+
+    async def test_get_system_table(self) -> None:
+        """Test system table split into several notifications is collected."""
+        get_system_table = GetSystemTable(pyvlx=self.pyvlx)
+        await get_system_table.do_api_call()
+        self.assertTrue(get_system_table.success)
+        self.assertEqual([entry.node_id for entry in get_system_table.entries], list(range(25)))
+        self.assertEqual(get_system_table.entries[3].address, 0x100003)
+
+    def test_fingerprint(self) -> None:
+        """Test fingerprint depends on node ids, addresses, types and power modes, but not on order."""
+        entries = [
+            SystemTableEntry(node_id=1, address=0x10, node_type=NodeTypeWithSubtype.ROLLER_SHUTTER),
+            SystemTableEntry(node_id=2, address=0x20, node_type=NodeTypeWithSubtype.WINDOW_OPENER),
+        ]
+        fingerprint = Nodes.fingerprint(entries)
+        self.assertEqual(len(fingerprint), 8)
+        self.assertEqual(Nodes.fingerprint(reversed(entries)), fingerprint)
+        entries[1].flags = 0x01
+        self.assertNotEqual(Nodes.fingerprint(entries), fingerprint)
+        entries[1].flags = 0x08
+        entries[1].manufacturer_id = 5
+        self.assertEqual(Nodes.fingerprint(entries), fingerprint)
+
+    async def test_load_only_if_changed(self) -> None:
+        """Test all nodes are only reloaded if the system table changed."""
+        await self.pyvlx.load_nodes(only_if_changed=True)
+        self.assertEqual(len(self.pyvlx.nodes), 25)
+        self.assertIsNotNone(self.pyvlx.nodes.system_table_fingerprint)
+
+        requests_received = self.simulator.requests_received
+        await self.pyvlx.load_nodes(only_if_changed=True)
+        # Only GetSystemTable
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+
+        self.simulator.nodes[30] = SimulatedNode(node_id=30, serial_number="53:4e:00:00:00:00:00:30")
+        await self.pyvlx.load_nodes(only_if_changed=True)
+        # GetSystemTable and GetAllNodesInformation
+        self.assertEqual(self.simulator.requests_received, requests_received + 3)
+        self.assertIn(30, self.pyvlx.nodes)
+
+    async def test_full_load_resets_fingerprint(self) -> None:
+        """Test loading without fingerprint does not keep an outdated fingerprint."""
+        await self.pyvlx.load_nodes(only_if_changed=True)
+        await self.pyvlx.load_nodes()
+        self.assertIsNone(self.pyvlx.nodes.system_table_fingerprint)
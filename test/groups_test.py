@@ -0,0 +1,121 @@
+"""Unit tests for Groups object."""
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pyvlx import Group, Position, PyVLX, PyVLXException
+from pyvlx.api.frames import (
+    ActivateProductGroupConfirmationStatus,
+    FrameGetAllGroupsInformationNotification, FrameGroupDeletedNotification,
+    FrameGroupInformationChangedNotification)
+from pyvlx.const import ChangeType, GroupType, NodeParameter, Velocity
+from pyvlx.parameter import Parameter
+
+
+class TestGroups(IsolatedAsyncioTestCase):
+    """Test class for groups object."""
+
+    def setUp(self) -> None:
+        """Set up groups with two overlapping groups."""
+        self.pyvlx = PyVLX()
+        self.groups = self.pyvlx.groups
+        self.ground_floor = Group(self.pyvlx, 1, "Ground floor", GroupType.ROOM, [0, 1, 2])
+        self.south = Group(self.pyvlx, 2, "South", node_ids=[2, 3])
+        self.groups.add(self.ground_floor)
+        self.groups.add(self.south)
+
+    def test_get_item(self) -> None:
+        """Test access by group id and by name."""
+        self.assertIs(self.groups[1], self.ground_floor)
+        self.assertIs(self.groups["South"], self.south)
+        self.assertIn("South", self.groups)
+        self.assertNotIn(3, self.groups)
+        with self.assertRaises(KeyError):
+            self.groups[3]  # pylint: disable=pointless-statement
+        with self.assertRaises(TypeError):
+            self.groups.add(MagicMock())  # type: ignore
+
+    def test_groups_of_node(self) -> None:
+        """Test index of groups by member node."""
+        self.assertEqual(self.groups.groups_of_node(2), [self.ground_floor, self.south])
+        self.assertEqual(self.groups.groups_of_node(0), [self.ground_floor])
+        self.assertEqual(self.groups.groups_of_node(9), [])
+
+    async def test_modified_notification(self) -> None:
+        """Test membership and name are updated in place from notification."""
+        frame = FrameGroupInformationChangedNotification(group_id=2, name="South side", node_ids=[3, 4])
+        await self.groups.process_frame(frame)
+        self.assertIs(self.groups["South side"], self.south)
+        self.assertNotIn("South", self.groups)
+        self.assertEqual(self.south.node_ids, [3, 4])
+        self.assertEqual(self.groups.groups_of_node(2), [self.ground_floor])
+        self.assertEqual(self.groups.groups_of_node(4), [self.south])
+
+        await self.groups.process_frame(FrameGroupInformationChangedNotification(group_id=5, name="New", node_ids=[4]))
+        self.assertEqual(self.groups[5].name, "New")
+        self.assertEqual(self.groups.groups_of_node(4), [self.south, self.groups[5]])
+
+    async def test_deleted_notifications(self) -> None:
+        """Test groups are removed on both kinds of delete notification."""
+        await self.groups.process_frame(FrameGroupInformationChangedNotification(change_type=ChangeType.DELETED, group_id=2))
+        self.assertNotIn(2, self.groups)
+        self.assertEqual(self.groups.groups_of_node(3), [])
+        await self.groups.process_frame(FrameGroupDeletedNotification(group_id=1))
+        self.assertEqual(len(self.groups), 0)
+        # Unknown groups are ignored
+        await self.groups.process_frame(FrameGroupDeletedNotification(group_id=1))
+
+    async def test_load(self) -> None:
+        """Test loading replaces all groups and keeps references of groups still present."""
+        frame = FrameGetAllGroupsInformationNotification(group_id=1, name="Ground floor", group_type=GroupType.ROOM, node_ids=[0, 1])
+        api_call = MagicMock(success=True, notification_frames=[frame], do_api_call=AsyncMock())
+        with patch("pyvlx.groups.GetAllGroupsInformation", return_value=api_call):
+            await self.pyvlx.load_groups()
+        self.assertEqual(list(self.groups), [self.ground_floor])
+        self.assertEqual(self.ground_floor.node_ids, [0, 1])
+        self.assertEqual(self.groups.groups_of_node(2), [])
+
+        api_call.success = False
+        with patch("pyvlx.groups.GetAllGroupsInformation", return_value=api_call):
+            with self.assertRaises(PyVLXException):
+                await self.pyvlx.load_groups()
+
+    async def test_create(self) -> None:
+        """Test created group is added with the group id assigned by the gateway."""
+        api_call = MagicMock(success=True, group_id=7, do_api_call=AsyncMock())
+        with patch("pyvlx.groups.NewGroup", return_value=api_call) as new_group:
+            group = await self.groups.create("Attic", [5, 6])
+        new_group.assert_called_once_with(pyvlx=self.pyvlx, name="Attic", node_ids=[5, 6], group_type=GroupType.USER_GROUP)
+        self.assertIs(self.groups[7], group)
+        self.assertEqual(self.groups.groups_of_node(6), [group])
+
+    async def test_set_position(self) -> None:
+        """Test groups are moved as product group with one command."""
+        with patch.object(self.pyvlx, "activate_product_group", AsyncMock(return_value={})) as activate_product_group:
+            await self.ground_floor.close()
+        activate_product_group.assert_awaited_once_with(
+            1, Position(position_percent=100), velocity=Velocity.DEFAULT, wait_for_completion=True, timeout_in_seconds=2
+        )
+        self.assertTrue(self.ground_floor.product_group)
+
+    async def test_set_position_mixed_node_types(self) -> None:
+        """Test members of a group of different node types are moved together via Nodes.set_position."""
+        rejected = PyVLXException("activate_product_group_rejected", status=ActivateProductGroupConfirmationStatus.ERROR_WRONG_GROUP_TYPE)
+        with patch.object(self.pyvlx, "activate_product_group", AsyncMock(side_effect=rejected)), \
+                patch.object(self.pyvlx.nodes, "set_position", AsyncMock(return_value={})) as set_position:
+            await self.south.set_position(Position(position_percent=50), velocity=Velocity.SILENT, wait_for_completion=False)
+            set_position.assert_awaited_once_with(
+                [2, 3],
+                Position(position_percent=50),
+                functional_parameter={NodeParameter.FP1: Parameter(raw=b"\x00\x00")},
+                wait_for_completion=False,
+                timeout_in_seconds=2,
+            )
+        self.assertFalse(self.south.product_group)
+        # Changed members may form a product group
+        await self.groups.process_frame(FrameGroupInformationChangedNotification(group_id=2, name="South", node_ids=[3]))
+        self.assertIsNone(self.south.product_group)
+
+        rejected = PyVLXException("activate_product_group_rejected", status=ActivateProductGroupConfirmationStatus.ERROR_BUSY)
+        with patch.object(self.pyvlx, "activate_product_group", AsyncMock(side_effect=rejected)):
+            with self.assertRaises(PyVLXException):
+                await self.south.open()
@@ -1,10 +1,12 @@
 """Unit tests for heartbeat module."""
 import asyncio
+import time
 from collections.abc import Coroutine
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from pyvlx import PyVLX
+from pyvlx.api import RequestPriority
 from pyvlx.exception import PyVLXException
 from pyvlx.heartbeat import Heartbeat
 from pyvlx.opening_device import Blind, Gate
@@ -147,7 +149,8 @@ class TestHeartbeat(IsolatedAsyncioTestCase):
 
         status_request_cls.assert_called_once_with(self.pyvlx, 1)
         status_request.do_api_call.assert_awaited_once()
-        sleep_mock.assert_awaited_once_with(0.5)
+        self.assertEqual(status_request.priority, RequestPriority.MAINTENANCE)
+        sleep_mock.assert_not_awaited()
 
     @patch("pyvlx.heartbeat.asyncio.sleep", new_callable=AsyncMock)
     @patch("pyvlx.heartbeat.StatusRequest")
@@ -185,7 +188,8 @@ class TestHeartbeat(IsolatedAsyncioTestCase):
         )
         status_request_1.do_api_call.assert_awaited_once()
         status_request_2.do_api_call.assert_awaited_once()
-        self.assertEqual(sleep_mock.await_count, 2)
+        self.assertEqual(get_state.priority, RequestPriority.MAINTENANCE)
+        sleep_mock.assert_not_awaited()
 
     @patch("pyvlx.heartbeat.asyncio.sleep", new_callable=AsyncMock)
     @patch("pyvlx.heartbeat.StatusRequest")
@@ -224,4 +228,180 @@ class TestHeartbeat(IsolatedAsyncioTestCase):
         # Only the idle node was polled; the moving gate was skipped.
         status_request_cls.assert_called_once_with(self.pyvlx, 17)
         status_request.do_api_call.assert_awaited_once()
-        sleep_mock.assert_awaited_once_with(0.5)
+        self.assertEqual(status_request.priority, RequestPriority.MAINTENANCE)
+        sleep_mock.assert_not_awaited()
+
+    @patch("pyvlx.heartbeat.StatusRequest")
+    @patch("pyvlx.heartbeat.GetState")
+    async def test_pulse_sweep_batches_node_ids(
+        self,
+        get_state_cls: MagicMock,
+        status_request_cls: MagicMock,
+    ) -> None:
+        """Test pulse() requests the status of up to 20 nodes per status request in sweep mode."""
+        nodes = []
+        for node_id in range(45):
+            node = MagicMock()
+            node.node_id = node_id
+            nodes.append(node)
+        self.pyvlx.nodes = nodes
+
+        get_state = MagicMock()
+        get_state.do_api_call = AsyncMock()
+        get_state.success = True
+        get_state_cls.return_value = get_state
+
+        status_request = MagicMock()
+        status_request.do_api_call = AsyncMock()
+        status_request.notification_frames = {}
+        status_request_cls.return_value = status_request
+        status_request_cls.MAX_NODE_IDS = 20
+
+        heartbeat = Heartbeat(self.pyvlx, batch_status_requests=True)
+        await heartbeat.pulse()
+
+        self.assertEqual(
+            status_request_cls.call_args_list,
+            [
+                call(self.pyvlx, node_ids=list(range(20))),
+                call(self.pyvlx, node_ids=list(range(20, 40))),
+                call(self.pyvlx, node_ids=list(range(40, 45))),
+            ],
+        )
+        self.assertEqual(status_request.do_api_call.await_count, 3)
+
+    @patch("pyvlx.heartbeat.StatusRequest")
+    async def test_sweep_time_budget(self, status_request_cls: MagicMock) -> None:
+        """Test sweep() is aborted when it exceeds its time budget."""
+        nodes = []
+        for node_id in range(30):
+            node = MagicMock()
+            node.node_id = node_id
+            nodes.append(node)
+
+        first_request = MagicMock()
+        first_request.do_api_call = AsyncMock()
+        first_request.notification_frames = {node_id: MagicMock() for node_id in range(20)}
+
+        async def wait_for_gateway() -> None:
+            await asyncio.sleep(10)
+
+        slow_request = MagicMock()
+        slow_request.do_api_call = AsyncMock(side_effect=wait_for_gateway)
+        slow_request.notification_frames = {}
+        status_request_cls.side_effect = [first_request, slow_request]
+        status_request_cls.MAX_NODE_IDS = 20
+
+        heartbeat = Heartbeat(self.pyvlx, batch_status_requests=True, sweep_time_budget=0.01)
+        received = await heartbeat.sweep(nodes)
+
+        self.assertEqual(received, list(range(20)))
+        slow_request.do_api_call.assert_awaited_once()
+
+    def _adaptive_heartbeat(self, last_seen: dict, last_status_received: dict) -> Heartbeat:
+        """Return adaptive heartbeat with given node timestamps relative to now."""
+        now = time.monotonic()
+        self.pyvlx.node_updater = MagicMock()
+        self.pyvlx.node_updater.last_seen = {node_id: now - age for node_id, age in last_seen.items()}
+        self.pyvlx.node_updater.last_status_received = {node_id: now - age for node_id, age in last_status_received.items()}
+        self.pyvlx.api_dispatcher = MagicMock(in_flight=0, waiting=0)
+        return Heartbeat(self.pyvlx, interval=30, max_state_age=60, min_interval=5)
+
+    def test_stale_nodes(self) -> None:
+        """Test only stale nodes are polled, stalest first, blinds need a full status."""
+        fresh = MagicMock(node_id=1)
+        stale = MagicMock(node_id=2)
+        never_seen = MagicMock(node_id=3)
+        blind = Blind(self.pyvlx, node_id=4, name="Blind", serial_number=None)
+        heartbeat = self._adaptive_heartbeat(
+            last_seen={1: 10, 2: 100, 4: 10},
+            last_status_received={1: 100, 4: 70},
+        )
+        self.assertEqual(heartbeat.stale_nodes([fresh, stale, never_seen, blind]), [never_seen, stale, blind])
+
+    def test_next_delay(self) -> None:
+        """Test adaptive heartbeat wakes up when the next node gets stale."""
+        self.pyvlx.nodes = [MagicMock(node_id=1), MagicMock(node_id=2)]
+        heartbeat = self._adaptive_heartbeat(last_seen={1: 50, 2: 10}, last_status_received={})
+        self.assertAlmostEqual(heartbeat.next_delay(), 10, delta=1)
+        heartbeat = self._adaptive_heartbeat(last_seen={1: 100, 2: 10}, last_status_received={})
+        self.assertEqual(heartbeat.next_delay(), 5)
+        heartbeat = self._adaptive_heartbeat(last_seen={1: 0, 2: 0}, last_status_received={})
+        self.assertEqual(heartbeat.next_delay(), 30)
+        self.assertEqual(Heartbeat(self.pyvlx, interval=30).next_delay(), 30)
+
+    @patch("pyvlx.heartbeat.asyncio.sleep", new_callable=AsyncMock)
+    @patch("pyvlx.heartbeat.StatusRequest")
+    @patch("pyvlx.heartbeat.GetState")
+    async def test_pulse_adaptive(
+        self,
+        get_state_cls: MagicMock,
+        status_request_cls: MagicMock,
+        _sleep_mock: AsyncMock,
+    ) -> None:
+        """Test adaptive pulse polls stale nodes only and sends get state once per interval."""
+        self.pyvlx.nodes = [MagicMock(node_id=1), MagicMock(node_id=2)]
+        heartbeat = self._adaptive_heartbeat(last_seen={1: 10, 2: 100}, last_status_received={})
+
+        get_state = MagicMock()
+        get_state.do_api_call = AsyncMock()
+        get_state.success = True
+        get_state_cls.return_value = get_state
+        status_request = MagicMock()
+        status_request.do_api_call = AsyncMock()
+        status_request_cls.return_value = status_request
+
+        await heartbeat.pulse()
+        status_request_cls.assert_called_once_with(self.pyvlx, 2)
+        await heartbeat.pulse()
+        get_state.do_api_call.assert_awaited_once()
+
+    @patch("pyvlx.heartbeat.asyncio.sleep", new_callable=AsyncMock)
+    @patch("pyvlx.heartbeat.StatusRequest")
+    @patch("pyvlx.heartbeat.GetState")
+    async def test_pulse_adaptive_unresponsive_node(
+        self,
+        get_state_cls: MagicMock,
+        status_request_cls: MagicMock,
+        _sleep_mock: AsyncMock,
+    ) -> None:
+        """Test a node which never answers is polled once per max_state_age, not on every pulse."""
+        self.pyvlx.nodes = [MagicMock(node_id=1)]
+        heartbeat = self._adaptive_heartbeat(last_seen={}, last_status_received={})
+
+        get_state = MagicMock()
+        get_state.do_api_call = AsyncMock()
+        get_state.success = True
+        get_state_cls.return_value = get_state
+        status_request = MagicMock()
+        status_request.do_api_call = AsyncMock()
+        status_request_cls.return_value = status_request
+
+        self.assertEqual(heartbeat.next_delay(), 5)
+        await heartbeat.pulse()
+        status_request_cls.assert_called_once_with(self.pyvlx, 1)
+        self.assertAlmostEqual(heartbeat.next_delay(), 30, delta=1)
+        await heartbeat.pulse()
+        status_request_cls.assert_called_once()
+
+    @patch("pyvlx.heartbeat.asyncio.sleep", new_callable=AsyncMock)
+    @patch("pyvlx.heartbeat.StatusRequest")
+    @patch("pyvlx.heartbeat.GetState")
+    async def test_pulse_adaptive_backs_off(
+        self,
+        get_state_cls: MagicMock,
+        status_request_cls: MagicMock,
+        _sleep_mock: AsyncMock,
+    ) -> None:
+        """Test adaptive pulse does not poll while other API calls are pending."""
+        self.pyvlx.nodes = [MagicMock(node_id=1)]
+        heartbeat = self._adaptive_heartbeat(last_seen={}, last_status_received={})
+        self.pyvlx.api_dispatcher.waiting = 1
+
+        get_state = MagicMock()
+        get_state.do_api_call = AsyncMock()
+        get_state.success = True
+        get_state_cls.return_value = get_state
+
+        await heartbeat.pulse()
+        status_request_cls.assert_not_called()
@@ -0,0 +1,94 @@
+"""Unit tests for indexed items module."""
+import unittest
+
+from pyvlx.indexed_items import IndexedItems
+
+
+class _Item:
+    """Test helper for indexed items."""
+
+    def __init__(self, item_id: int, name: str, serial: str | None = None):
+        """Initialize item."""
+        self.item_id = item_id
+        self.name = name
+        self.serial = serial
+
+
+class TestIndexedItems(unittest.TestCase):
+    """Test class for IndexedItems."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.items: IndexedItems[_Item] = IndexedItems("item_id", "name", "serial")
+        self.first = _Item(1, "First", "aa")
+        self.second = _Item(2, "Second")
+        self.items.add(self.first)
+        self.items.add(self.second)
+
+    def test_lookup(self) -> None:
+        """Test lookup by key and secondary attributes."""
+        self.assertIs(self.items.get(1), self.first)
+        self.assertIsNone(self.items.get(3))
+        self.assertIs(self.items.get_by("name", "Second"), self.second)
+        self.assertIs(self.items.get_by("serial", "aa"), self.first)
+        self.assertIsNone(self.items.get_by("serial", None))
+        self.assertEqual(len(self.items), 2)
+        self.assertEqual(list(self.items), [self.first, self.second])
+
+    def test_add_replaces_item_in_place(self) -> None:
+        """Test adding an item with an existing key replaces the item and keeps the order."""
+        replacement = _Item(1, "Replacement")
+        self.assertIs(self.items.add(replacement), self.first)
+        self.assertEqual(list(self.items), [replacement, self.second])
+        self.assertIsNone(self.items.get_by("name", "First"))
+        self.assertIsNone(self.items.get_by("serial", "aa"))
+        self.assertIs(self.items.get_by("name", "Replacement"), replacement)
+
+    def test_duplicate_secondary_values(self) -> None:
+        """Test secondary lookups return the first item with the value."""
+        third = _Item(3, "First")
+        self.items.add(third)
+        self.assertIs(self.items.get_by("name", "First"), self.first)
+        self.items.remove(self.first)
+        self.assertIs(self.items.get_by("name", "First"), third)
+
+    def test_rename(self) -> None:
+        """Test secondary lookups skip changed attributes and follow them after reindex."""
+        self.assertIs(self.items.get_by("name", "First"), self.first)
+        self.first.name = "Renamed"
+        self.assertIsNone(self.items.get_by("name", "First"))
+        self.assertIsNone(self.items.get_by("name", "Renamed"))
+        self.items.reindex()
+        self.assertIs(self.items.get_by("name", "Renamed"), self.first)
+
+    def test_changed_key(self) -> None:
+        """Test changed keys are found after reindex."""
+        self.first.item_id = 5
+        self.assertIsNone(self.items.get(1))
+        self.items.reindex()
+        self.assertIs(self.items.get(5), self.first)
+        self.assertEqual(list(self.items), [self.first, self.second])
+
+    def test_remove(self) -> None:
+        """Test removing items."""
+        self.items.remove(self.first)
+        self.assertIsNone(self.items.get(1))
+        self.assertIsNone(self.items.get_by("name", "First"))
+        with self.assertRaises(KeyError):
+            self.items.remove(self.first)
+
+    def test_replace_all(self) -> None:
+        """Test replacing all items."""
+        third = _Item(3, "Third")
+        self.items.replace_all([third, self.first])
+        self.assertEqual(list(self.items), [third, self.first])
+        self.assertIsNone(self.items.get(2))
+        self.assertIs(self.items.get_by("name", "Third"), third)
+
+    def test_replace_all_duplicate_keys(self) -> None:
+        """Test replacing all items keeps the first item of duplicate keys and logs the others."""
+        duplicate = _Item(1, "Duplicate")
+        with self.assertLogs("pyvlx", level="WARNING"):
+            self.items.replace_all([self.first, duplicate])
+        self.assertEqual(list(self.items), [self.first])
+        self.assertIsNone(self.items.get_by("name", "Duplicate"))
@@ -60,6 +60,24 @@ class TestNodeUpdater(IsolatedAsyncioTestCase):
         # Verify that last_frame_state was set
         self.assertEqual(opening_device.last_frame_state, OperatingState.EXECUTING)
 
+    async def test_process_frame_records_last_seen(self) -> None:
+        """Test that the time a frame for a node was received is recorded."""
+        position_changed = FrameNodeStatePositionChangedNotification()
+        position_changed.node_id = 1
+        await self.node_updater.process_frame(position_changed)
+        self.assertIn(1, self.node_updater.last_seen)
+        self.assertNotIn(1, self.node_updater.last_status_received)
+
+        status = FrameStatusRequestNotification()
+        status.node_id = 2
+        await self.node_updater.process_frame(status)
+        self.assertIn(2, self.node_updater.last_seen)
+        self.assertIn(2, self.node_updater.last_status_received)
+
+        run_status = FrameCommandRunStatusNotification(index_id=3, run_status=RunStatus.EXECUTION_ACTIVE)
+        await self.node_updater.process_frame(run_status)
+        self.assertIn(3, self.node_updater.last_seen)
+
     async def test_last_frame_state_set_on_all_nodes_information(self) -> None:
         """Test that last_frame_state is set when FrameGetAllNodesInformationNotification is received."""
         # Create a test node
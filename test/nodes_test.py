@@ -1,11 +1,16 @@
 """Unit test for Nodes object."""
 import asyncio
 import unittest
+from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from pyvlx import Blind, Nodes, PyVLX, RollerShutter, Window
+from pyvlx import Blind, Nodes, Position, PyVLX, RollerShutter, Window
+from pyvlx.api.frames import (
+    CommandSendConfirmationStatus, FrameBase,
+    FrameCommandRunStatusNotification, FrameCommandSendConfirmation,
+    FrameCommandSendRequest)
 from pyvlx.connection import Connection
-from pyvlx.const import OperatingState, StatusReply
+from pyvlx.const import OperatingState, RunStatus, StatusReply
 from pyvlx.node import Node
 
 
@@ -311,3 +316,116 @@ class TestNodesLoadNode(unittest.TestCase):
         # Only the temporary loaded object should be unregistered, not the kept existing one.
         self.pyvlx.connection.unregister_connection_opened_cb.assert_called_once_with(loaded.after_update)
         self.pyvlx.connection.unregister_connection_closed_cb.assert_called_once_with(loaded.after_update)
+
+    def test_load_node_drops_node_information_of_former_node_id(self) -> None:
+        """Node information stored for the former node id of a node which got a new node id is dropped."""
+        nodes = Nodes(self.pyvlx)
+        existing = Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01")
+        nodes.add(existing)
+        nodes.node_information[1] = MagicMock()
+
+        loaded = Window(self.pyvlx, 2, "Window", "aa:bb:aa:bb:aa:bb:aa:01")
+        get_node_information = self._mock_get_node_information(loaded)
+        with patch("pyvlx.nodes.GetNodeInformation", return_value=get_node_information), patch(
+            "pyvlx.nodes.convert_frame_to_node", return_value=loaded
+        ):
+            asyncio.run(nodes._load_node(node_id=2))  # pylint: disable=protected-access
+
+        self.assertIs(nodes[2], existing)
+        self.assertEqual(nodes.node_information, {2: get_node_information.notification_frame})
+
+
+class TestNodesSetPosition(unittest.IsolatedAsyncioTestCase):
+    """Test class for moving several nodes at once."""
+
+    @patch("pyvlx.api.command_send.get_new_session_id", side_effect=[101, 102])
+    async def test_set_position_batches_node_ids(self, _get_new_session_id: MagicMock) -> None:
+        """Test nodes are split into commands of at most 20 nodes sharing one parameter."""
+        pyvlx = PyVLX(host="192.168.1.10", password="velux123")
+        pyvlx.connection.connected = True
+        sent_frames: List[FrameBase] = []
+        pyvlx.connection.write = sent_frames.append  # type: ignore[method-assign]
+        window = Window(pyvlx, 0, "Window", "aa:bb:aa:bb:aa:bb:aa:00")
+        pyvlx.nodes.add(window)
+
+        task = asyncio.create_task(
+            pyvlx.nodes.set_position([window, *range(1, 25), 3], Position(position_percent=100), wait_for_completion=False)
+        )
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(sent_frames), 2)
+        assert isinstance(sent_frames[0], FrameCommandSendRequest)
+        assert isinstance(sent_frames[1], FrameCommandSendRequest)
+        self.assertEqual(sent_frames[0].node_ids, list(range(20)))
+        self.assertEqual(sent_frames[1].node_ids, list(range(20, 25)))
+        self.assertEqual(Position(sent_frames[1].parameter).position_percent, 100)
+
+        for session_id in (101, 102):
+            pyvlx.api_dispatcher.process_frame(FrameCommandRunStatusNotification(
+                session_id=session_id, status_id=1, index_id=session_id - 100, node_parameter=0,
+                parameter_value=0, run_status=RunStatus.EXECUTION_ACTIVE, status_reply=StatusReply.COMMAND_COMPLETED_OK))
+            pyvlx.api_dispatcher.process_frame(
+                FrameCommandSendConfirmation(session_id=session_id, status=CommandSendConfirmationStatus.ACCEPTED))
+        self.assertEqual(await task, {1: RunStatus.EXECUTION_ACTIVE, 2: RunStatus.EXECUTION_ACTIVE})
+
+
+class TestNodesIndex(unittest.TestCase):
+    """Test class for the indexes of Nodes."""
+
+    def setUp(self) -> None:
+        """Set up TestNodesIndex."""
+        self.pyvlx = MagicMock(spec=PyVLX)
+        connection = MagicMock(spec=Connection)
+        self.pyvlx.attach_mock(mock=connection, attribute="connection")
+
+    def test_get_by_serial_number(self) -> None:
+        """Test lookup by serial number."""
+        nodes = Nodes(self.pyvlx)
+        window = Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01")
+        nodes.add(window)
+        nodes.add(Window(self.pyvlx, 2, "Window without serial", None))
+        self.assertIs(nodes.get_by_serial_number("aa:bb:aa:bb:aa:bb:aa:01"), window)
+        self.assertIsNone(nodes.get_by_serial_number("aa:bb:aa:bb:aa:bb:aa:02"))
+
+    def test_lookup_after_rename(self) -> None:
+        """Test lookup by name follows renamed nodes once reindexed."""
+        nodes = Nodes(self.pyvlx)
+        window = Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01")
+        nodes.add(window)
+        self.assertIs(nodes["Window"], window)
+        window.name = "Renamed window"
+        self.assertNotIn("Window", nodes)
+        nodes.reindex()
+        self.assertIs(nodes["Renamed window"], window)
+
+    def test_contains_equal_node(self) -> None:
+        """Test contains operator finds equal node objects."""
+        nodes = Nodes(self.pyvlx)
+        nodes.add(Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01"))
+        self.assertIn(Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01"), nodes)
+        self.assertNotIn(Window(self.pyvlx, 1, "Other window", "aa:bb:aa:bb:aa:bb:aa:01"), nodes)
+
+    def test_load_all_nodes_keeps_order_and_matches_by_identity(self) -> None:
+        """Test reload merge keeps existing instances and follows the order of the snapshot."""
+        nodes = Nodes(self.pyvlx)
+        window = Window(self.pyvlx, 1, "Window", "aa:bb:aa:bb:aa:bb:aa:01")
+        no_serial = Blind(self.pyvlx, 2, "Blind", None)
+        nodes.add(window)
+        nodes.add(no_serial)
+
+        loaded = [
+            Blind(self.pyvlx, 2, "Blind", None),
+            Window(self.pyvlx, 5, "Window", "aa:bb:aa:bb:aa:bb:aa:01"),
+            RollerShutter(self.pyvlx, 3, "Roller shutter", None),
+        ]
+        event = MagicMock()
+        event.success = True
+        event.notification_frames = loaded
+        event.do_api_call = AsyncMock()
+        with patch("pyvlx.nodes.GetAllNodesInformation", return_value=event), patch(
+            "pyvlx.nodes.convert_frame_to_node", side_effect=lambda pyvlx, frame: frame
+        ):
+            asyncio.run(nodes._load_all_nodes())  # pylint: disable=protected-access
+
+        self.assertEqual(list(nodes), [no_serial, window, loaded[2]])
+        self.assertIs(nodes[5], window)
+        self.assertNotIn(1, nodes)
@@ -1,7 +1,8 @@
 """Test for Position class."""
 import unittest
 
-from pyvlx import Parameter, Position
+from pyvlx import (
+    Intensity, Parameter, Position, SwitchParameterOn, UnknownPosition)
 from pyvlx.exception import PyVLXException
 
 
@@ -98,3 +99,27 @@ class TestParameterPosition(unittest.TestCase):
         self.assertEqual(param1.__eq__(wrong_object), NotImplemented)  # pylint: disable=C2801
         self.assertFalse(param1 == param2)
         self.assertTrue(param1 == param3)
+
+    def test_compact_representation(self) -> None:
+        """Test parameters are stored as a single int without instance dict."""
+        for parameter in (Parameter(), Position(position_percent=50), Intensity(intensity_percent=20), SwitchParameterOn(), UnknownPosition()):
+            with self.subTest(parameter=type(parameter).__name__):
+                self.assertFalse(hasattr(parameter, "__dict__"))
+        self.assertEqual(Position(position_percent=50).position, 0x6400)
+
+    def test_raw(self) -> None:
+        """Test raw bytes are created on demand and can be assigned."""
+        param = Parameter(raw=b'\x12\x34')
+        self.assertEqual(param.raw, b'\x12\x34')
+        self.assertEqual(bytes(param), b'\x12\x34')
+        param.raw = b'\xd2\x00'
+        self.assertEqual(str(param), "CURRENT")
+        self.assertEqual(Parameter(raw=b'\xd8\x08').raw, b'\xf7\xff')
+
+    def test_str_special_values(self) -> None:
+        """Test string representation of special values."""
+        self.assertEqual(str(Parameter()), "UNKNOWN")
+        self.assertEqual(str(Position(position=Parameter.TARGET)), "TARGET")
+        self.assertEqual(str(Position(position=Parameter.DUAL_SHUTTER_CURTAINS)), "DUAL")
+        self.assertEqual(str(Intensity(intensity=Parameter.IGNORE)), "IGNORE")
+        self.assertEqual(str(Position(position_percent=30)), "30 %")
@@ -0,0 +1,18 @@
+"""Unit tests for PyVLX object."""
+from unittest import IsolatedAsyncioTestCase
+
+from pyvlx import PyVLX
+
+
+class TestPyVLX(IsolatedAsyncioTestCase):
+    """Test class for PyVLX."""
+
+    async def test_api_call_semaphore_deprecated(self) -> None:
+        """Test the former api_call_semaphore is still available, with a deprecation warning."""
+        pyvlx = PyVLX(host="192.168.1.10", password="velux123")
+        with self.assertWarns(DeprecationWarning):
+            semaphore = pyvlx.api_call_semaphore
+        async with semaphore:
+            pass
+        with self.assertWarns(DeprecationWarning):
+            self.assertIs(pyvlx.api_call_semaphore, semaphore)
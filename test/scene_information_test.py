@@ -0,0 +1,120 @@
+"""Unit tests for scene members and predicted node states on scene activation."""
+import asyncio
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+
+from pyvlx import Position, PyVLX, PyVLXException
+from pyvlx.api import SessionHandle
+from pyvlx.api.frames import (
+    FrameBase, FrameSceneInformationChangedNotification,
+    FrameStatusRequestNotification)
+from pyvlx.api.session_id import set_session_id
+from pyvlx.const import ChangeType, NodeParameter
+from pyvlx.opening_device import OpeningDevice
+from pyvlx.parameter import Parameter
+from pyvlx.simulator import KLF200Simulator, SimulatedScene
+
+
+class TestSceneInformation(IsolatedAsyncioTestCase):
+    """Test scene members and scene activation via the simulator."""
+
+    async def asyncSetUp(self) -> None:
+        """Connect PyVLX to simulator with a scene closing node 1 and opening node 2."""
+        self.addCleanup(set_session_id, 0)
+        self.simulator = KLF200Simulator(node_count=10, scene_count=0, travel_time=0)
+        self.simulator.scenes[0] = SimulatedScene(0, "Bath", targets={1: Parameter.MAX, 2: Parameter.MIN})
+        await self.simulator.start()
+        self.addAsyncCleanup(self.simulator.stop)
+        self.pyvlx = PyVLX(host="127.0.0.1", password="velux123", port=self.simulator.port)
+        await self.pyvlx.connect()
+        self.addAsyncCleanup(self.pyvlx.disconnect)
+        await self.pyvlx.load_nodes()
+        await self.pyvlx.load_scenes()
+        await self.pyvlx.heartbeat.stop()
+
+    def opening_device(self, node_id: int) -> OpeningDevice:
+        """Return opening device node_id."""
+        node = self.pyvlx.nodes[node_id]
+        assert isinstance(node, OpeningDevice)
+        return node
+
+    async def test_members(self) -> None:
+        """Test members of a scene are loaded once and cached."""
+        self.assertIsNone(self.pyvlx.scenes.cached_members(0))
+        requests_received = self.simulator.requests_received
+        members = await self.pyvlx.scenes.members(0)
+        self.assertEqual(sorted(members), [1, 2])
+        self.assertEqual(Position(members[1][NodeParameter.MP]), Position(position_percent=100))
+        self.assertEqual(Position(members[2][NodeParameter.MP]), Position(position_percent=0))
+        self.assertIs(await self.pyvlx.scenes.members(0), members)
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+
+        with self.assertRaises(PyVLXException):
+            await self.pyvlx.scenes.members(9)
+
+    async def test_run_predicts_node_states(self) -> None:
+        """Test members of the scene get motion flags as soon as the scene is accepted, targets are left to the gateway."""
+        for node in self.simulator.nodes.values():
+            node.travel_time = 20
+        await self.pyvlx.scenes.members(0)
+        targets = {node_id: self.opening_device(node_id).target for node_id in (1, 2)}
+        requests_received = self.simulator.requests_received
+        await self.pyvlx.scenes[0].run(wait_for_completion=False)
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+        self.assertTrue(self.opening_device(1).is_closing)
+        self.assertTrue(self.opening_device(2).is_opening)
+        self.assertEqual({node_id: self.opening_device(node_id).target for node_id in (1, 2)}, targets)
+        self.assertFalse(self.opening_device(3).is_moving())
+
+    async def test_run_refreshes_members(self) -> None:
+        """Test members are loaded on first activation and only their status is requested after the scene finished."""
+        status_node_ids: List[int] = []
+
+        async def status_received(frame: FrameBase) -> None:
+            assert isinstance(frame, FrameStatusRequestNotification)
+            status_node_ids.append(frame.node_id)
+
+        self.pyvlx.connection.register_frame_received_cb(status_received, (FrameStatusRequestNotification,))
+        requests_received = self.simulator.requests_received
+        await self.pyvlx.scenes[0].run()
+        async with asyncio.timeout(2):
+            # Activation, scene information and one status request
+            while self.simulator.requests_received < requests_received + 3 or len(status_node_ids) < 2:
+                await asyncio.sleep(0.01)
+        self.assertEqual(sorted(status_node_ids), [1, 2])
+        self.assertIsNotNone(self.pyvlx.scenes.cached_members(0))
+        async with asyncio.timeout(2):
+            while self.opening_device(1).position != Position(position_percent=100) or self.opening_device(2).position != Position(position_percent=0):
+                await asyncio.sleep(0.01)
+        self.assertFalse(self.opening_device(1).is_moving())
+        self.assertFalse(self.opening_device(2).is_moving())
+
+    async def test_unfinished_scene_is_not_refreshed(self) -> None:
+        """Test neither scene information nor status is requested if the scene did not finish, and predicted flags are cleared."""
+        await self.pyvlx.scenes.members(0)
+        requests_received = self.simulator.requests_received
+        completion = SessionHandle(42, (), lambda frame: False)
+        self.pyvlx.scenes.scene_activated(0, completion)
+        self.assertTrue(self.opening_device(1).is_closing)
+        self.pyvlx.scenes.invalidate(0)
+        completion.resolve(False)
+        async with asyncio.timeout(2):
+            while self.opening_device(1).is_moving():
+                await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.simulator.requests_received, requests_received)
+        self.assertIsNone(self.pyvlx.scenes.cached_members(0))
+
+    async def test_scene_information_changed(self) -> None:
+        """Test cached members are dropped when the scene is modified and the scene is removed when deleted."""
+        await self.pyvlx.scenes.members(0)
+        self.simulator.notify_house_status_monitor([FrameSceneInformationChangedNotification(change_type=ChangeType.MODIFIED, scene_id=0)])
+        async with asyncio.timeout(2):
+            while self.pyvlx.scenes.cached_members(0) is not None:
+                await asyncio.sleep(0.01)
+        self.assertEqual(len(self.pyvlx.scenes), 1)
+
+        self.simulator.notify_house_status_monitor([FrameSceneInformationChangedNotification(change_type=ChangeType.DELETED, scene_id=0)])
+        async with asyncio.timeout(2):
+            while len(self.pyvlx.scenes):
+                await asyncio.sleep(0.01)
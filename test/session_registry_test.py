@@ -0,0 +1,67 @@
+"""Unit tests for session registry module."""
+import asyncio
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+
+from pyvlx.api import SessionHandle, SessionRegistry
+from pyvlx.api.frames import (
+    FrameBase, FrameCommandRunStatusNotification, FrameGetStateConfirmation,
+    FrameSessionFinishedNotification)
+
+
+class TestSessionRegistry(IsolatedAsyncioTestCase):
+    """Test class for SessionRegistry."""
+
+    def setUp(self) -> None:
+        """Set up registry tracking frames of session 7."""
+        self.registry = SessionRegistry()
+        self.frames: List[FrameBase] = []
+
+    def handle(self, frame: FrameBase) -> bool:
+        """Record frame, the session is finished by a session finished notification."""
+        self.frames.append(frame)
+        return isinstance(frame, FrameSessionFinishedNotification)
+
+    async def test_complete(self) -> None:
+        """Test frames of the session are routed until it is finished."""
+        handle = self.registry.track(7, (FrameCommandRunStatusNotification, FrameSessionFinishedNotification), self.handle, timeout=10)
+        self.assertTrue(self.registry.wants_frame(FrameSessionFinishedNotification))
+        self.assertFalse(self.registry.wants_frame(FrameGetStateConfirmation))
+
+        self.assertFalse(self.registry.process_frame(FrameSessionFinishedNotification(session_id=8)))
+        self.assertFalse(self.registry.process_frame(FrameGetStateConfirmation()))
+        self.assertTrue(self.registry.process_frame(FrameCommandRunStatusNotification(session_id=7)))
+        self.assertFalse(handle.done)
+        self.assertTrue(self.registry.process_frame(FrameSessionFinishedNotification(session_id=7)))
+
+        self.assertTrue(await handle)
+        self.assertTrue(handle.completed)
+        self.assertEqual(len(self.frames), 2)
+        self.assertEqual(len(self.registry), 0)
+        self.assertFalse(self.registry.wants_frame(FrameSessionFinishedNotification))
+
+    async def test_expire(self) -> None:
+        """Test sessions are dropped after their timeout."""
+        handle = self.registry.track(7, (FrameSessionFinishedNotification,), self.handle, timeout=0.01)
+        self.assertFalse(await handle)
+        self.assertFalse(handle.completed)
+        self.assertNotIn(7, self.registry)
+        self.assertFalse(self.registry.process_frame(FrameSessionFinishedNotification(session_id=7)))
+
+    async def test_cancel_all(self) -> None:
+        """Test cancelling resolves all handles and awaiting tasks may be cancelled without affecting the handle."""
+        handle = self.registry.track(7, (FrameSessionFinishedNotification,), self.handle, timeout=10)
+        waiter = asyncio.create_task(self.wait(handle))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertFalse(handle.done)
+        self.registry.cancel_all()
+        self.assertFalse(await handle)
+        self.assertEqual(len(self.registry), 0)
+
+    @staticmethod
+    async def wait(handle: SessionHandle) -> None:
+        """Await handle."""
+        await handle
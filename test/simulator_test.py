@@ -0,0 +1,171 @@
+"""Unit tests for KLF 200 simulator."""
+import asyncio
+import unittest
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+
+from pyvlx import Position, PyVLX
+from pyvlx.api.frames import (
+    ErrorType, FrameBase, FrameErrorNotification, FrameGetStateRequest)
+from pyvlx.api.get_limitation import GetLimitation
+from pyvlx.api.session_id import set_session_id
+from pyvlx.api.status_request import StatusRequest
+from pyvlx.const import OperatingState
+from pyvlx.exception import PyVLXException
+from pyvlx.opening_device import OpeningDevice
+from pyvlx.parameter import Parameter
+from pyvlx.simulator import KLF200Simulator, SimulatedNode
+
+
+class TestSimulatedNode(unittest.TestCase):
+    """Test class for SimulatedNode."""
+
+    def test_move(self) -> None:
+        """Test linear motion to target."""
+        node = SimulatedNode(node_id=1, position=Parameter.MAX, travel_time=10)
+        self.assertEqual(node.move(Parameter.MIN, now=100.0), 10.0)
+        self.assertEqual(node.state(100.0), OperatingState.EXECUTING)
+        self.assertEqual(node.position(105.0), Parameter.MAX // 2)
+        self.assertEqual(node.remaining_time(105.0), 5.0)
+        self.assertEqual(node.position(110.0), Parameter.MIN)
+        self.assertEqual(node.state(110.0), OperatingState.DONE)
+
+    def test_move_within_limitation(self) -> None:
+        """Test targets are restricted by limitations and special values stop the node."""
+        node = SimulatedNode(node_id=1, position=Parameter.MAX, travel_time=10)
+        node.limitation_min = Parameter.MAX // 4
+        node.move(Parameter.MIN, now=0.0)
+        self.assertEqual(node.target, Parameter.MAX // 4)
+        node.move(Parameter.CURRENT, now=5.0)
+        self.assertEqual(node.target, node.position(5.0))
+        self.assertEqual(node.state(5.0), OperatingState.DONE)
+
+
+class TestKLF200Simulator(IsolatedAsyncioTestCase):
+    """Test class for KLF200Simulator."""
+
+    async def asyncSetUp(self) -> None:
+        """Start simulator."""
+        # Other tests expect the global session id counter to be untouched
+        self.addCleanup(set_session_id, 0)
+        self.simulator = KLF200Simulator(node_count=4, scene_count=2, travel_time=0.2, notification_interval=0.05)
+        await self.simulator.start()
+        self.addAsyncCleanup(self.simulator.stop)
+
+    async def connect(self, password: str = "velux123") -> PyVLX:
+        """Connect PyVLX to simulator."""
+        pyvlx = PyVLX(host="127.0.0.1", password=password, port=self.simulator.port)
+        await pyvlx.connect()
+        self.addAsyncCleanup(pyvlx.disconnect)
+        return pyvlx
+
+    async def test_connect_and_load(self) -> None:
+        """Test handshake and loading of nodes and scenes."""
+        pyvlx = await self.connect()
+        self.assertEqual(pyvlx.klf200.protocol_version.majorversion, 3)  # type: ignore[union-attr]
+        self.assertTrue(pyvlx.klf200.house_status_monitor_enabled)
+        await pyvlx.load_nodes()
+        await pyvlx.load_scenes()
+        self.assertEqual(len(pyvlx.nodes), 4)
+        self.assertEqual(len(pyvlx.scenes), 2)
+        self.assertEqual(pyvlx.nodes[1].serial_number, self.simulator.nodes[1].serial_number)
+        self.assertEqual(len(self.simulator.connections), 1)
+
+    async def test_rename_node(self) -> None:
+        """Test a renamed node is found by its new name right away."""
+        pyvlx = await self.connect()
+        await pyvlx.load_nodes()
+        node = pyvlx.nodes[1]
+        await node.rename("Renamed")
+        self.assertIs(pyvlx.nodes["Renamed"], node)
+        self.assertEqual(self.simulator.nodes[1].name, "Renamed")
+
+    async def test_self_signed_certificate(self) -> None:
+        """Test the self signed certificate is generated once and shared by all simulators."""
+        ssl_context = await KLF200Simulator.self_signed_ssl_context()
+        self.assertIs(await KLF200Simulator.self_signed_ssl_context(), ssl_context)
+
+    async def test_fast_reconnect(self) -> None:
+        """Test reconnecting skips requests for immutable gateway facts and pipelines the handshake."""
+        pyvlx = PyVLX(host="127.0.0.1", password="velux123", port=self.simulator.port, fast_reconnect=True)
+        await pyvlx.connect()
+        self.addAsyncCleanup(pyvlx.disconnect)
+        self.assertEqual(self.simulator.requests_received, 8)
+        self.assertIsNotNone(pyvlx.klf200.network_setup)
+        self.assertTrue(pyvlx.klf200.house_status_monitor_enabled)
+        assert pyvlx.time_to_ready is not None
+
+        await pyvlx.heartbeat.stop()
+        pyvlx.connection.disconnect()
+        await pyvlx.connect()
+        # Password, house status monitor disable and enable, get state and set utc
+        self.assertEqual(self.simulator.requests_received, 13)
+        self.assertTrue(pyvlx.klf200.house_status_monitor_enabled)
+        self.assertEqual(pyvlx.klf200.protocol_version.majorversion, 3)  # type: ignore[union-attr]
+
+    async def test_tls_session_resumption(self) -> None:
+        """Test the TLS session of the previous connection is resumed when reconnecting."""
+        pyvlx = await self.connect()
+        ssl_context = pyvlx.connection.ssl_context
+        self.assertFalse(pyvlx.connection.session_reused)
+        assert pyvlx.connection.handshake_duration is not None
+
+        await pyvlx.heartbeat.stop()
+        pyvlx.connection.disconnect()
+        await pyvlx.connect()
+        self.assertIs(pyvlx.connection.ssl_context, ssl_context)
+        self.assertTrue(pyvlx.connection.session_reused)
+        self.assertEqual(pyvlx.connection.sessions_reused, 1)
+
+    async def test_wrong_password(self) -> None:
+        """Test connecting with wrong password fails."""
+        pyvlx = PyVLX(host="127.0.0.1", password="wrong", port=self.simulator.port)
+        with self.assertRaises(PyVLXException):
+            await pyvlx.connect()
+        pyvlx.connection.disconnect()
+
+    async def test_motion_and_house_status_monitor(self) -> None:
+        """Test nodes move over time and report their position via house status monitor."""
+        pyvlx = await self.connect()
+        await pyvlx.load_nodes()
+        node = pyvlx.nodes[0]
+        assert isinstance(node, OpeningDevice)
+        await node.set_position(Position(position_percent=0), wait_for_completion=True)
+        await asyncio.sleep(0.1)
+        self.assertEqual(node.position, Position(position_percent=0))
+        self.assertEqual(self.simulator.nodes[0].target, Parameter.MIN)
+
+    async def test_status_request_and_limitation(self) -> None:
+        """Test status requests and limitations."""
+        pyvlx = await self.connect()
+        await pyvlx.load_nodes()
+        status_request = StatusRequest(pyvlx, node_ids=[0, 1, 2])
+        await status_request.do_api_call()
+        self.assertTrue(status_request.success)
+        self.assertEqual(sorted(status_request.notification_frames), [0, 1, 2])
+
+        node = pyvlx.nodes[1]
+        assert isinstance(node, OpeningDevice)
+        await node.set_position_limitations(position_min=Position(position_percent=20), position_max=Position(position_percent=80))
+        limitation = GetLimitation(pyvlx, 1)
+        await limitation.do_api_call()
+        self.assertTrue(limitation.success)
+        self.assertEqual(limitation.min_value, 20)
+        self.assertEqual(limitation.max_value, 80)
+
+    async def test_rate_limit(self) -> None:
+        """Test requests exceeding the rate limit are answered with bus busy errors."""
+        pyvlx = await self.connect()
+        errors: List[FrameBase] = []
+        pyvlx.connection.register_frame_handler(errors.append, [FrameErrorNotification])
+        self.simulator.max_requests_per_second = 1
+        for _ in range(3):
+            pyvlx.connection.write(FrameGetStateRequest())
+        await asyncio.sleep(0.1)
+        self.simulator.max_requests_per_second = None
+        self.assertEqual(self.simulator.requests_rejected, 2)
+        self.assertEqual([frame.error_type for frame in errors], [ErrorType.BusBusy] * 2)  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
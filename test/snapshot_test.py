@@ -0,0 +1,149 @@
+"""Unit tests for node and scene snapshots."""
+import os
+import tempfile
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from pyvlx import PyVLX, PyVLXException
+from pyvlx.api.frames import FrameGetAllNodesInformationNotification
+from pyvlx.api.session_id import set_session_id
+from pyvlx.const import NodeTypeWithSubtype
+from pyvlx.node import Node
+from pyvlx.opening_device import OpeningDevice, Window
+from pyvlx.parameter import Position
+from pyvlx.simulator import KLF200Simulator, SimulatedNode
+from pyvlx.snapshot import Snapshot
+
+
+class TestSnapshot(IsolatedAsyncioTestCase):
+    """Test class for Snapshot."""
+
+    def setUp(self) -> None:
+        """Create directory for snapshot files."""
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "pyvlx.snapshot")
+
+    @staticmethod
+    def window_frame() -> FrameGetAllNodesInformationNotification:
+        """Return node information of a window."""
+        frame = FrameGetAllNodesInformationNotification()
+        frame.node_id = 23
+        frame.name = "Window"
+        frame.node_type = NodeTypeWithSubtype.WINDOW_OPENER
+        frame.serial_number = "01:02:03:04:05:06:07:08"
+        frame.current_position = Position(position_percent=30)
+        frame.target = Position(position_percent=40)
+        return frame
+
+    def test_round_trip(self) -> None:
+        """Test binary format of snapshot."""
+        snapshot = Snapshot([self.window_frame()], [(3, "Evening")], b"\x01" * 8)
+        data = snapshot.to_bytes()
+        self.assertEqual(data[:17], b"PVLX\x02\x00\x01\x00\x01" + b"\x01" * 8)
+        self.assertEqual(len(data), 17 + 124 + 65)
+        parsed = Snapshot.from_bytes(data)
+        self.assertEqual(parsed.scenes, [(3, "Evening")])
+        self.assertEqual(parsed.system_table_fingerprint, b"\x01" * 8)
+        self.assertIsNone(Snapshot.from_bytes(Snapshot().to_bytes()).system_table_fingerprint)
+        self.assertEqual(parsed.node_information[0].get_payload(), self.window_frame().get_payload())
+
+    def test_invalid_data(self) -> None:
+        """Test snapshots of other versions or with wrong size are rejected."""
+        data = Snapshot([self.window_frame()], []).to_bytes()
+        with self.assertRaises(PyVLXException) as ctx:
+            Snapshot.from_bytes(data[:4] + b"\x01" + data[5:])
+        self.assertEqual(ctx.exception.description, "snapshot_version_unsupported")
+        with self.assertRaises(PyVLXException) as ctx:
+            Snapshot.from_bytes(data[:-1])
+        self.assertEqual(ctx.exception.description, "snapshot_size_mismatch")
+        with self.assertRaises(PyVLXException):
+            Snapshot.from_bytes(b"XXXX" + data[4:])
+
+    def test_load_ignores_unusable_files(self) -> None:
+        """Test missing and corrupt snapshots are ignored."""
+        self.assertIsNone(Snapshot.load(self.path))
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"PVLX")
+        with self.assertLogs("pyvlx", level="WARNING"):
+            self.assertIsNone(Snapshot.load(self.path))
+        pyvlx = PyVLX(snapshot_path=self.path)
+        self.assertFalse(pyvlx.restore_snapshot())
+
+    def test_restore(self) -> None:
+        """Test nodes are created with their last known state without connecting."""
+        Snapshot([self.window_frame()], [(3, "Evening")]).save(self.path)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+        pyvlx = PyVLX(snapshot_path=self.path)
+        self.assertTrue(pyvlx.restore_snapshot())
+        node = pyvlx.nodes[23]
+        assert isinstance(node, Window)
+        self.assertEqual(node.serial_number, "01:02:03:04:05:06:07:08")
+        self.assertEqual(node.position, Position(position_percent=30))
+        self.assertEqual(node.target, Position(position_percent=40))
+        self.assertEqual(pyvlx.scenes[3].name, "Evening")
+        self.assertFalse(pyvlx.get_connected())
+
+    async def test_warm_start_reconciles_changes_only(self) -> None:
+        """Test warm start from snapshot and reconciling with the gateway, publishing changed nodes only."""
+        self.addCleanup(set_session_id, 0)
+        async with KLF200Simulator(node_count=4, scene_count=2, travel_time=0) as simulator:
+            pyvlx = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port, snapshot_path=self.path)
+            self.assertFalse(await pyvlx.warm_start())
+            await pyvlx.disconnect()
+            self.assertTrue(os.path.exists(self.path))
+
+            simulator.nodes[1].move(0, now=0.0)
+            simulator.nodes[3].name = "Renamed"
+            restored = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port, snapshot_path=self.path)
+            self.assertTrue(restored.restore_snapshot())
+            self.assertEqual([node.name for node in restored.nodes], [node.name for node in pyvlx.nodes])
+            await restored.connect()
+            # Keep heartbeat status updates out of the published changes
+            await restored.heartbeat.stop()
+            updated: List[Node] = []
+
+            async def device_updated(node: Node) -> None:
+                updated.append(node)
+
+            for node in restored.nodes:
+                node.register_device_updated_cb(AsyncMock(side_effect=device_updated))
+            # Fingerprint of the system table the snapshot was taken from
+            restored.nodes.system_table_fingerprint = bytes(range(8))
+            await restored.reconcile()
+            self.assertEqual(sorted(node.node_id for node in updated), [1, 3])
+            self.assertIsNone(restored.nodes.system_table_fingerprint)
+            await restored.disconnect()
+
+        assert isinstance(restored.nodes[1], OpeningDevice)
+        self.assertEqual(restored.nodes[1].position, Position(position=0))
+        self.assertEqual(restored.nodes[3].name, "Renamed")
+
+    async def test_reconcile_reports_added_and_removed_nodes(self) -> None:
+        """Test reconciling reports added and removed nodes to the nodes reconciled callbacks and drops vanished scenes."""
+        self.addCleanup(set_session_id, 0)
+        async with KLF200Simulator(node_count=4, scene_count=2, travel_time=0) as simulator:
+            pyvlx = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port, snapshot_path=self.path)
+            self.assertFalse(await pyvlx.warm_start())
+            await pyvlx.disconnect()
+
+            del simulator.nodes[2]
+            simulator.nodes[5] = SimulatedNode(5, "New", serial_number="53:4e:00:00:00:00:00:05")
+            del simulator.scenes[1]
+            restored = PyVLX(host=simulator.host, password=simulator.password, port=simulator.port, snapshot_path=self.path)
+            self.assertTrue(restored.restore_snapshot())
+            self.assertEqual(len(restored.scenes), 2)
+            await restored.connect()
+            await restored.heartbeat.stop()
+            nodes_reconciled_cb = AsyncMock()
+            restored.register_nodes_reconciled_cb(nodes_reconciled_cb)
+            changes = await restored.reconcile()
+            await restored.disconnect()
+
+        nodes_reconciled_cb.assert_awaited_once_with(changes)
+        self.assertEqual([node.node_id for node in changes.added], [5])
+        self.assertEqual([node.node_id for node in changes.removed], [2])
+        self.assertEqual(changes.changed, [])
+        self.assertEqual(sorted(node.node_id for node in restored.nodes), [0, 1, 3, 5])
+        self.assertEqual([scene.scene_id for scene in restored.scenes], [0])
@@ -0,0 +1,69 @@
+"""Unit test for status request module."""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyvlx import PyVLXException
+from pyvlx.api.frames import (
+    FrameSessionFinishedNotification, FrameStatusRequestConfirmation,
+    FrameStatusRequestNotification)
+from pyvlx.api.status_request import StatusRequest
+
+
+def _notification(session_id: int, node_id: int) -> FrameStatusRequestNotification:
+    """Return status request notification of node."""
+    frame = FrameStatusRequestNotification()
+    frame.session_id = session_id
+    frame.node_id = node_id
+    return frame
+
+
+class TestStatusRequest(unittest.IsolatedAsyncioTestCase):
+    """Test class for StatusRequest."""
+
+    async def test_handle_frame_single_node(self) -> None:
+        """Test status request of a single node is completed by its notification."""
+        status_request = StatusRequest(MagicMock(), 3)
+        status_request.session_id = 1
+        self.assertFalse(await status_request.handle_frame(FrameStatusRequestConfirmation(session_id=1)))
+        self.assertFalse(await status_request.handle_frame(_notification(2, 3)))
+        frame = _notification(1, 3)
+        self.assertTrue(await status_request.handle_frame(frame))
+        self.assertTrue(status_request.success)
+        self.assertIs(status_request.notification_frame, frame)
+
+    async def test_handle_frame_node_ids(self) -> None:
+        """Test status request of several nodes waits for the notifications of all nodes."""
+        status_request = StatusRequest(MagicMock(), node_ids=[3, 4, 5])
+        status_request.session_id = 1
+        self.assertFalse(await status_request.handle_frame(_notification(1, 3)))
+        self.assertFalse(await status_request.handle_frame(_notification(1, 5)))
+        self.assertFalse(status_request.success)
+        self.assertTrue(await status_request.handle_frame(_notification(1, 4)))
+        self.assertTrue(status_request.success)
+        self.assertEqual(sorted(status_request.notification_frames), [3, 4, 5])
+
+    async def test_handle_frame_session_finished(self) -> None:
+        """Test status request is completed when the session finished before all nodes answered."""
+        status_request = StatusRequest(MagicMock(), node_ids=[3, 4])
+        status_request.session_id = 1
+        self.assertFalse(await status_request.handle_frame(_notification(1, 3)))
+        self.assertFalse(await status_request.handle_frame(FrameSessionFinishedNotification(session_id=2)))
+        self.assertTrue(await status_request.handle_frame(FrameSessionFinishedNotification(session_id=1)))
+        self.assertFalse(status_request.success)
+        self.assertEqual(list(status_request.notification_frames), [3])
+
+    @patch("pyvlx.api.status_request.get_new_session_id", return_value=7)
+    def test_request_frame(self, _get_new_session_id: MagicMock) -> None:
+        """Test request frame contains all node ids."""
+        frame = StatusRequest(MagicMock(), node_ids=[3, 4]).request_frame()
+        self.assertEqual(frame.node_ids, [3, 4])
+        self.assertEqual(frame.session_id, 7)
+
+    def test_invalid_node_ids(self) -> None:
+        """Test StatusRequest requires either node_id or 1 to 20 node_ids."""
+        with self.assertRaises(PyVLXException):
+            StatusRequest(MagicMock())
+        with self.assertRaises(PyVLXException):
+            StatusRequest(MagicMock(), 1, node_ids=[2])
+        with self.assertRaises(PyVLXException):
+            StatusRequest(MagicMock(), node_ids=list(range(21)))
@@ -0,0 +1,85 @@
+"""Unit tests for incremental topology updates."""
+import asyncio
+from typing import Callable
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, patch
+
+from pyvlx import PyVLX
+from pyvlx.api.frames import (
+    FrameNodeInformationChangedNotification,
+    FrameSystemTableUpdateNotification)
+from pyvlx.api.session_id import set_session_id
+from pyvlx.node_helper import convert_frame_to_node
+from pyvlx.simulator import KLF200Simulator, SimulatedNode
+
+
+class TestTopologySync(IsolatedAsyncioTestCase):
+    """Test class for TopologySync."""
+
+    async def asyncSetUp(self) -> None:
+        """Connect PyVLX to simulator and load nodes."""
+        self.addCleanup(set_session_id, 0)
+        self.simulator = KLF200Simulator(node_count=4, scene_count=0, travel_time=0)
+        await self.simulator.start()
+        self.addAsyncCleanup(self.simulator.stop)
+        self.pyvlx = PyVLX(host="127.0.0.1", password="velux123", port=self.simulator.port)
+        self.pyvlx.topology_sync.delay = 0
+        await self.pyvlx.connect()
+        self.addAsyncCleanup(self.pyvlx.disconnect)
+        await self.pyvlx.load_nodes()
+        await self.pyvlx.heartbeat.stop()
+
+    async def wait_until(self, condition: Callable[[], bool]) -> None:
+        """Wait until condition is met."""
+        async with asyncio.timeout(2):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    async def test_rename(self) -> None:
+        """Test a renamed node is reloaded by node id and published."""
+        node = self.pyvlx.nodes[1]
+        device_updated = AsyncMock()
+        node.register_device_updated_cb(device_updated)
+        requests_received = self.simulator.requests_received
+        self.simulator.nodes[1].name = "Kitchen"
+        self.simulator.notify_house_status_monitor([FrameNodeInformationChangedNotification(node_id=1, name="Kitchen")])
+        await self.wait_until(lambda: device_updated.await_count > 0)
+        self.assertIs(self.pyvlx.nodes["Kitchen"], node)
+        # One GetNodeInformation, no GetAllNodesInformation
+        self.assertEqual(self.simulator.requests_received, requests_received + 1)
+
+    async def test_unchanged_node_is_not_constructed(self) -> None:
+        """Test node information is compared before Node objects are created."""
+        with patch("pyvlx.nodes.convert_frame_to_node", wraps=convert_frame_to_node) as convert:
+            changed = await self.pyvlx.nodes.refresh([1, 2])
+        self.assertEqual(changed, [])
+        convert.assert_not_called()
+
+    async def test_burst_is_collected(self) -> None:
+        """Test notifications received together cause one refresh."""
+        await asyncio.gather(*(
+            self.pyvlx.topology_sync.process_frame(FrameNodeInformationChangedNotification(node_id=node_id, name=""))
+            for node_id in range(4)
+        ))
+        await self.wait_until(lambda: self.pyvlx.topology_sync.refreshes > 0)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.pyvlx.topology_sync.refreshes, 1)
+
+    async def test_system_table_update(self) -> None:
+        """Test paired nodes are added and removed nodes are dropped."""
+        removed = self.pyvlx.nodes[2]
+        self.simulator.add_node(SimulatedNode(node_id=9, name="Garage", serial_number="53:4e:00:00:00:00:00:09"))
+        self.simulator.remove_node(2)
+        await self.wait_until(lambda: 9 in self.pyvlx.nodes)
+        self.assertEqual(self.pyvlx.nodes[9].name, "Garage")
+        self.assertNotIn(2, self.pyvlx.nodes)
+        self.assertNotIn(removed, self.pyvlx.nodes)
+        self.assertEqual(sorted(self.pyvlx.nodes.node_information), [0, 1, 3, 9])
+
+    async def test_removed_node_id_is_not_refreshed(self) -> None:
+        """Test node ids removed from the system table are not requested anymore."""
+        await self.pyvlx.topology_sync.process_frame(FrameNodeInformationChangedNotification(node_id=3, name=""))
+        await self.pyvlx.topology_sync.process_frame(FrameSystemTableUpdateNotification(removed_node_ids=[3]))
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.pyvlx.topology_sync.refreshes, 0)
+        self.assertNotIn(3, self.pyvlx.nodes)